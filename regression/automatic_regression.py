@@ -42,18 +42,28 @@ modules = [
     'scripts/aerodynamics/control_surfaces_vlm.py',
     'scripts/aerodynamics/sears_haack.py',
     'scripts/aerodynamics/sideslip_and_rotation_vlm.py',
+    'scripts/aerodynamics/vlm_influence_matrix_cache.py',
+    'scripts/aerodynamics/vlm_memory_budget.py',
+    'scripts/aerodynamics/vortex_distribution_cache.py',
+    'scripts/aerodynamics/vortex_lattice_training_cache.py',
     'scripts/airfoil_import/airfoil_import_test.py',
     'scripts/airfoil_import/airfoil_interpolation_test.py',
     'scripts/airfoil_analysis/airfoil_panel_method_test.py', 
+    'scripts/airfoil_analysis/airfoil_boundary_layer_batch.py',
     'scripts/atmosphere/atmosphere.py',
+    'scripts/atmosphere/atmosphere_lookup.py',
     'scripts/atmosphere/constant_temperature.py',
     'scripts/AVL/test_AVL.py',
+    'scripts/AVL/avl_pool.py',
+    'scripts/AVL/avl_result_cache.py',
     'scripts/B737/mission_B737.py',
     'scripts/battery/aircraft_discharge_comparisons.py',
     'scripts/battery/battery_cell_discharge_tests.py',
     'scripts/cmalpha/cmalpha.py',
     'scripts/cnbeta/cnbeta.py',
     'scripts/concorde/concorde.py',
+    'scripts/data_structures/data_attribute_access.py',
+    'scripts/data_structures/data_layout.py',
     'scripts/ducted_fan/ducted_fan_network.py',
     'scripts/ducted_fan/battery_ducted_fan_network.py',
     'scripts/ducted_fan/serial_hybrid_ducted_fan_network.py',
@@ -75,17 +85,27 @@ modules = [
     'scripts/mission_range_and_weight_sizing/landing_field_length.py',
     'scripts/mission_range_and_weight_sizing/take_off_field_length.py',
     'scripts/mission_range_and_weight_sizing/take_off_weight_from_tofl.py',
+    'scripts/missions/parallel_missions.py',
+    'scripts/missions/sparse_jacobian.py',
+    'scripts/missions/warm_start_cache.py',
     'scripts/motor/motor_test.py',
     'scripts/multifidelity/optimize_mf.py',
     'scripts/noise_optimization/Noise_Test.py',
     'scripts/noise_fidelity_zero/DC_10_noise.py', 
     'scripts/noise_fidelity_one/propeller_noise.py',
     'scripts/noise_fidelity_one/aircraft_noise.py',
+    'scripts/noise_fidelity_one/third_octave_spectrum.py',
+    'scripts/noise_fidelity_one/microphone_culling.py',
+    'scripts/noise_fidelity_one/broadband_boundary_layer_batch.py',
+    'scripts/noise_fidelity_one/jet_noise_batch.py',
     'scripts/nonuniform_propeller_inflow/nonuniform_propeller_inflow.py',
     'scripts/optimization_packages/optimization_packages.py',
     'scripts/payload_range/payload_range.py',
     'scripts/plots/plot_test.py',
     'scripts/propeller/propeller_test.py',
+    'scripts/propeller/airfoil_polar_interpolant.py',
+    'scripts/propeller/batched_rotor_spin.py',
+    'scripts/propeller/rotor_wake_reuse.py',
     'scripts/propeller_speeds/range_endurance_speeds.py',
     'scripts/propulsion_surrogate/propulsion_surrogate.py',
     'scripts/ramjet_network/ramjet_network.py',
@@ -97,6 +117,8 @@ modules = [
     'scripts/segments/transition_segment_test.py',
     'scripts/slipstream/slipstream_test.py',
     'scripts/slipstream/propeller_interactions.py',
+    'scripts/slipstream/wake_induced_velocity_blocks.py',
+    'scripts/slipstream/wake_tree_code.py',
     'scripts/solar_network/solar_network.py',
     'scripts/solar_network/solar_low_fidelity_network.py',
     'scripts/solar_radiation/solar_radiation.py',
@@ -104,6 +126,7 @@ modules = [
     'scripts/sweeps/test_sweeps.py',
     'scripts/test_input_output/test_xml_read_write.py',
     'scripts/test_input_output/test_freemind_write.py',
+    'scripts/test_input_output/test_binary_archive.py',
     'scripts/turboelectric_HTS_ducted_fan_network/turboelectric_HTS_ducted_fan_network.py',
     'scripts/turboelectric_HTS_dynamo_ducted_fan_network/turboelectric_HTS_dynamo_ducted_fan_network.py',
     'scripts/variable_cruise_distance/variable_cruise_distance.py',
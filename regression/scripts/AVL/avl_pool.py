@@ -0,0 +1,95 @@
+# avl_pool.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" Runs the AVL surrogate training in a pool of AVL processes, with a stub executable that
+    returns the stored regression results
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+import numpy as np
+import copy
+import os
+import stat
+import sys
+import time
+
+sys.path.append('../Vehicles')
+
+from Boeing_737 import vehicle_setup, configs_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle = vehicle_setup()
+    configs = configs_setup(vehicle)
+    avl_bin = write_stub_avl('stub_avl.py',os.path.abspath('avl_files'),delay=0.3)
+
+    for analysis in [SUAVE.Analyses.Aerodynamics.AVL_Inviscid,SUAVE.Analyses.Stability.AVL]:
+        training = []
+        for number_of_workers in [1,3]:
+            avl                                    = analysis()
+            avl.geometry                           = copy.deepcopy(configs.cruise)
+            avl.settings.number_spanwise_vortices  = 30
+            avl.settings.number_of_workers         = number_of_workers
+            avl.settings.filenames.avl_bin_name    = avl_bin
+            avl.settings.filenames.run_folder      = 'avl_pool_files'
+
+            t0 = time.time()
+            avl.sample_training()
+            print(analysis.__name__ + ', ' + str(number_of_workers) + ' workers: ' + str(time.time()-t0) + ' s')
+            training.append(avl.training.coefficients)
+
+            # the run folders have been removed
+            assert(not [f for f in os.listdir('.') if f.startswith('avl_pool_files')])
+
+        # the pool reads the same results as the sequential runs
+        error = np.max(np.abs(training[1] - training[0]))
+        print(analysis.__name__ + ' difference: ' + str(error))
+        assert(error == 0.)
+
+        # the lift, drag and span efficiency of the pool match the stored training data
+        if analysis is SUAVE.Analyses.Aerodynamics.AVL_Inviscid:
+            stored = np.loadtxt('cruise_aero_data.txt')
+            error  = np.max(np.abs(training[1] - stored.T.reshape(training[1].shape)))
+            print('stored training data difference: ' + str(error))
+            assert(error < 1E-8)
+
+    os.remove(avl_bin)
+
+    return
+
+def write_stub_avl(filename,source_folder,delay):
+    """ Writes an executable that stands in for AVL. It follows the input deck and copies the
+        requested result files from a folder of stored results.
+    """
+
+    stub = '''#!{0}
+import os, shutil, sys, time
+time.sleep({1})
+commands = ['st','fn','fs','sb']
+previous = ''
+for line in sys.stdin:
+    line = line.strip()
+    if line == 'QUIT':
+        break
+    if previous in commands:
+        shutil.copy(os.path.join({2!r},line),line)
+    previous = line
+'''
+    with open(filename,'w') as f:
+        f.write(stub.format(sys.executable,delay,source_folder))
+    os.chmod(filename,os.stat(filename).st_mode | stat.S_IEXEC)
+
+    return os.path.abspath(filename)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+# avl_result_cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" Trains the AVL surrogates twice on the same aircraft with a result cache, the second
+    training loads every case from the cache without calling AVL
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+import numpy as np
+import copy
+import os
+import sys
+import time
+from shutil import rmtree
+
+sys.path.append('../Vehicles')
+
+from Boeing_737 import vehicle_setup, configs_setup
+from avl_pool   import write_stub_avl
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle   = vehicle_setup()
+    configs   = configs_setup(vehicle)
+    avl_bin   = write_stub_avl('stub_avl_cache.py',os.path.abspath('avl_files'),delay=0.1)
+    cache_dir = 'avl_result_cache'
+
+    for analysis in [SUAVE.Analyses.Aerodynamics.AVL_Inviscid,SUAVE.Analyses.Stability.AVL]:
+        for number_of_workers in [1,3]:
+            geometry = copy.deepcopy(configs.cruise)
+            if os.path.exists(cache_dir):
+                rmtree(cache_dir)
+
+            # the first training runs AVL and fills the cache
+            t0         = time.time()
+            avl        = setup_avl(analysis,geometry,avl_bin,cache_dir,number_of_workers)
+            avl.sample_training()
+            t1         = time.time()
+            n_cached   = len(os.listdir(cache_dir))
+            reference  = avl.training.coefficients
+
+            # the second training can not call AVL
+            avl        = setup_avl(analysis,geometry,'no/avl/here',cache_dir,number_of_workers)
+            avl.sample_training()
+            t2         = time.time()
+            print(analysis.__name__ + ', ' + str(number_of_workers) + ' workers, AVL: ' + str(t1-t0) + ' s, cache: ' + str(t2-t1) + ' s')
+
+            error = np.max(np.abs(avl.training.coefficients - reference))
+            print(analysis.__name__ + ' cached difference: ' + str(error))
+            assert(error == 0.)
+            assert(len(os.listdir(cache_dir)) == n_cached)
+
+        # a different aircraft misses the cache
+        geometry = copy.deepcopy(configs.cruise)
+        geometry.mass_properties.center_of_gravity[0][0] += 1.0
+        avl      = setup_avl(analysis,geometry,avl_bin,cache_dir,1)
+        avl.sample_training()
+        assert(len(os.listdir(cache_dir)) == n_cached + 36)
+
+        rmtree(cache_dir)
+
+    os.remove(avl_bin)
+
+    return
+
+def setup_avl(analysis,geometry,avl_bin,cache_dir,number_of_workers):
+    """ Sets up an AVL analysis of the cruise configuration """
+
+    avl                                    = analysis()
+    avl.geometry                           = geometry
+    avl.settings.number_spanwise_vortices  = 30
+    avl.settings.number_of_workers         = number_of_workers
+    avl.settings.result_cache_directory    = cache_dir
+    avl.settings.filenames.avl_bin_name    = avl_bin
+    avl.settings.filenames.run_folder      = 'avl_cache_files'
+
+    return avl
+
+if __name__ == '__main__':
+    main()
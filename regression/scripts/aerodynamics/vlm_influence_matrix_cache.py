@@ -0,0 +1,104 @@
+# vlm_influence_matrix_cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" solves the B737 VLM with the influence matrix cache and checks it against fresh solves, after a change to the
+    geometry too
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift import VLM as VLM
+
+import numpy as np
+import importlib
+import copy
+import sys
+
+sys.path.append('../Vehicles')
+
+from Boeing_737 import vehicle_setup
+from sideslip_and_rotation_vlm import get_conditions, get_settings
+
+# the module, not the function of the same name
+VLM_module = importlib.import_module('SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.VLM')
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    conditions = get_conditions()
+    geometry   = vehicle_setup()
+
+    # one factorization per Mach number, 0.4 and 1.4
+    settings = get_settings()
+    settings.influence_matrix_cache_size = 2
+
+    # the first solve fills the cache
+    data, builds = solve(conditions,settings,geometry)
+    assert builds == 1
+    assert len(settings.influence_matrix_cache) == 2
+    check_results(data,fresh_solve(conditions,geometry))
+
+    # the second is solved from it
+    cache = list(settings.influence_matrix_cache.values())
+    data, builds = solve(conditions,settings,geometry)
+    assert builds == 0
+    assert list(settings.influence_matrix_cache.values()) == cache
+    check_results(data,fresh_solve(conditions,geometry))
+
+    # a changed geometry misses, and pushes the old factorizations out
+    changed = copy.deepcopy(geometry)
+    changed.wings.main_wing.spans.projected *= 1.01
+    data, builds = solve(conditions,settings,changed)
+    assert builds == 1
+    assert len(settings.influence_matrix_cache) == 2
+    assert not any([entry is old_entry for entry in settings.influence_matrix_cache.values() for old_entry in cache])
+    check_results(data,fresh_solve(conditions,changed))
+
+    # the changed results are not those of the first geometry
+    assert np.max(np.abs(data.CL - fresh_solve(conditions,geometry).CL)) > 1e-4
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def solve(conditions,settings,geometry):
+
+    # count the builds of the influence matrices
+    compute_wing_induced_velocity = VLM_module.compute_wing_induced_velocity
+    builds = []
+    def counting_induced_velocity(*args,**kwargs):
+        builds.append(1)
+        return compute_wing_induced_velocity(*args,**kwargs)
+
+    VLM_module.compute_wing_induced_velocity = counting_induced_velocity
+    try:
+        data = VLM(conditions,settings,geometry)
+    finally:
+        VLM_module.compute_wing_induced_velocity = compute_wing_induced_velocity
+
+    return data, len(builds)
+
+def fresh_solve(conditions,geometry):
+    return VLM(conditions,get_settings(),copy.deepcopy(geometry))
+
+def check_results(data,fresh):
+
+    for key in ['CL','CDi','CM']:
+        error = np.max(np.abs(data[key] - fresh[key]))
+        print(key, error)
+        assert error < 1e-12
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+# vlm_memory_budget.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" evaluates the B737 induced velocity matrices in blocks under memory budgets and in both precisions, and checks
+    them against a single block evaluation
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift import generate_vortex_distribution, VLM
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_wing_induced_velocity import compute_wing_induced_velocity
+
+import numpy as np
+import copy
+import sys
+
+sys.path.append('../Vehicles')
+
+from Boeing_737 import vehicle_setup
+from sideslip_and_rotation_vlm import get_conditions, get_settings
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    geometry = vehicle_setup()
+    VD       = generate_vortex_distribution(copy.deepcopy(geometry),get_settings())
+    mach     = np.array([[0.3],[0.8],[1.4],[2.0]])
+
+    # subsonic and supersonic Mach numbers, alone and together
+    for machs in [mach[:2], mach[2:], mach]:
+        single  = compute_wing_induced_velocity(VD,machs,compute_EW=True,return_memory=True)
+        outputs = single[-1].outputs
+        blocks  = single[-1].peak - outputs
+
+        # the blocks give the same matrices bit for bit, with a half down to a twentieth of the temporaries
+        for budget in [outputs + blocks/2, outputs + blocks/5, outputs + blocks/20]:
+            blocked = compute_wing_induced_velocity(VD,machs,compute_EW=True,memory_budget=budget,return_memory=True)
+            memory  = blocked[-1]
+            print('Mach ' + str(machs[:,0]) + ', budget ' + str(int(budget)) + ' B, peak ' + str(memory.peak) +
+                  ' B, blocks of ' + str(memory.mach_block) + ' Mach numbers and ' + str(memory.row_block) + ' control points')
+            assert memory.peak <= budget
+            assert memory.row_block < len(VD.XC)
+            for single_matrix, blocked_matrix in zip(single[:4],blocked[:4]):
+                assert np.array_equal(single_matrix,blocked_matrix)
+
+        # the whole Mach sweep splits the Mach numbers once a control point does not fit
+        if len(machs) == len(mach):
+            budget  = outputs + blocks/len(VD.XC)/2
+            blocked = compute_wing_induced_velocity(VD,machs,compute_EW=True,memory_budget=budget,return_memory=True)
+            memory  = blocked[-1]
+            assert memory.peak <= budget
+            assert memory.row_block == 1
+            assert memory.mach_block < len(machs)
+            for single_matrix, blocked_matrix in zip(single[:4],blocked[:4]):
+                assert np.array_equal(single_matrix,blocked_matrix)
+
+    # the matrices are built in the precision asked for
+    C_mn_32, _, _, EW_32 = compute_wing_induced_velocity(VD,mach,compute_EW=True)
+    C_mn_64, _, _, EW_64 = compute_wing_induced_velocity(VD,mach,compute_EW=True,precision=np.float64)
+    assert C_mn_32.dtype == np.float32 and EW_32.dtype == np.float32
+    assert C_mn_64.dtype == np.float64 and EW_64.dtype == np.float64
+    for matrix_32, matrix_64 in [(C_mn_32,C_mn_64),(EW_32,EW_64)]:
+        error = np.max(np.abs(matrix_32 - matrix_64))/np.max(np.abs(matrix_64))
+        print('float32 error', error)
+        assert error < 1e-4
+
+    # a budget that cannot fit the outputs raises
+    try:
+        compute_wing_induced_velocity(VD,mach,memory_budget=single[-1].outputs/2)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('a budget smaller than the outputs did not raise')
+
+    # VLM passes the budget on and reports the peak memory
+    conditions = get_conditions()
+    settings   = get_settings()
+    results    = VLM(conditions,settings,copy.deepcopy(geometry))
+    budget     = results.influence_matrix_memory/5
+    settings.influence_matrix_memory_budget = budget
+    blocked    = VLM(conditions,settings,copy.deepcopy(geometry))
+    assert 0 < blocked.influence_matrix_memory <= budget
+    for key in ['CL','CDi','CM']:
+        assert np.array_equal(results[key],blocked[key])
+
+    return
+
+if __name__ == '__main__':
+    main()
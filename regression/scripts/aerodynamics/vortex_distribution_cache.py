@@ -0,0 +1,159 @@
+# vortex_distribution_cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" discretizes variants of the B737 through the vortex distribution cache, and checks the hits, the misses and the
+    eviction of the least recently used geometry against fresh vortex distributions, also with one cache shared by
+    the analyses of the configs
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift import generate_vortex_distribution
+
+import numpy as np
+import importlib
+import copy
+import sys
+
+sys.path.append('../Vehicles')
+
+from Boeing_737 import vehicle_setup, configs_setup
+from sideslip_and_rotation_vlm import get_settings
+
+# the module, not the function of the same name
+VD_module = importlib.import_module('SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.generate_vortex_distribution')
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    base    = vehicle_setup()
+    longer  = copy.deepcopy(base)
+    longer.wings.main_wing.spans.projected *= 1.01
+    swept   = copy.deepcopy(base)
+    swept.wings.main_wing.sweeps.quarter_chord *= 1.01
+
+    # off unless asked for
+    settings = get_settings()
+    generate_vortex_distribution(copy.deepcopy(base),settings)
+    assert settings.vortex_distribution_cache is None
+
+    settings = get_settings()
+    settings.vortex_distribution_cache_size = 2
+
+    # the first geometry misses
+    VD, builds = discretize(base,settings)
+    assert builds == 1
+    assert len(settings.vortex_distribution_cache) == 1
+    check_results(VD,base)
+
+    # and the same geometry again hits, with a copy that is the caller's to change
+    VD, builds = discretize(base,settings)
+    assert builds == 0
+    check_results(VD,base)
+    VD.XC[:] = 0.
+    VD, builds = discretize(base,settings)
+    check_results(VD,base)
+
+    # a change to the geometry misses
+    VD, builds = discretize(longer,settings)
+    assert builds == 1
+    check_results(VD,longer)
+
+    # using the base geometry again keeps it over the longer wing
+    VD, builds = discretize(base,settings)
+    assert builds == 0
+    VD, builds = discretize(swept,settings)
+    assert builds == 1
+    assert len(settings.vortex_distribution_cache) == 2
+    check_results(VD,swept)
+
+    VD, builds = discretize(base,settings)
+    assert builds == 0
+    check_results(VD,base)
+    VD, builds = discretize(longer,settings)
+    assert builds == 1
+    check_results(VD,longer)
+
+    # a change to the discretization misses too
+    settings.number_spanwise_vortices += 1
+    VD, builds = discretize(base,settings)
+    assert builds == 1
+
+    # the analyses of the configs of one vehicle share a cache when it is set in each of them
+    configs  = configs_setup(vehicle_setup())
+    shared   = Data()
+    analyses = Data()
+    for tag in ['base','cruise','takeoff']:
+        analyses[tag] = vortex_lattice(configs[tag])
+        analyses[tag].settings.vortex_distribution_cache = shared
+
+    VD, builds = discretize(configs.base,analyses.base.settings)
+    assert builds == 1
+    VD, builds = discretize(configs.cruise,analyses.cruise.settings)
+    assert builds == 0
+    assert len(shared) == 1
+    check_results(VD,configs.cruise)
+
+    # a deflected flap is another geometry
+    VD, builds = discretize(configs.takeoff,analyses.takeoff.settings)
+    assert builds == 1
+    assert len(shared) == 2
+
+    # while an analysis with a cache of its own misses
+    VD, builds = discretize(configs.cruise,vortex_lattice(configs.cruise).settings)
+    assert builds == 1
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def vortex_lattice(config):
+
+    aerodynamics          = SUAVE.Analyses.Aerodynamics.Vortex_Lattice()
+    aerodynamics.geometry = config
+    aerodynamics.settings = get_settings()
+    aerodynamics.settings.vortex_distribution_cache_size = 4
+
+    return aerodynamics
+
+def discretize(geometry,settings):
+
+    # count the discretizations of the wings
+    make_VLM_wings = VD_module.make_VLM_wings
+    builds = []
+    def counting_VLM_wings(*args):
+        builds.append(1)
+        return make_VLM_wings(*args)
+
+    VD_module.make_VLM_wings = counting_VLM_wings
+    try:
+        geometry = copy.deepcopy(geometry)
+        VD       = generate_vortex_distribution(geometry,settings)
+    finally:
+        VD_module.make_VLM_wings = make_VLM_wings
+
+    assert geometry.vortex_distribution is VD
+
+    return VD, len(builds)
+
+def check_results(VD,geometry):
+
+    fresh = generate_vortex_distribution(copy.deepcopy(geometry),get_settings())
+    for key in ['XAH','YAH','ZAH','XBH','YBH','ZBH','XC','YC','ZC','chord_lengths','leading_edge_indices']:
+        assert np.array_equal(VD[key],fresh[key]), key
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+# vortex_lattice_training_cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" trains the Vortex_Lattice surrogate of the B737 twice through the training cache, and checks that changes to the
+    geometry, the settings or the training grid miss the cache
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, hash_data
+
+import numpy as np
+import importlib
+import subprocess
+import tempfile
+import copy
+import sys
+import os
+
+sys.path.append('../Vehicles')
+
+from Boeing_737 import vehicle_setup
+
+# the module, not the class of the same name
+vortex_lattice_module = importlib.import_module('SUAVE.Analyses.Aerodynamics.Vortex_Lattice')
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle = vehicle_setup()
+
+    with tempfile.TemporaryDirectory() as directory:
+
+        # the first training is saved
+        cold, runs = train(vehicle,directory)
+        assert runs == 1
+        assert len(os.listdir(directory)) == 1
+
+        # the same geometry again is loaded, with the vortex distribution still in the geometry
+        warm, runs = train(copy.deepcopy(vehicle),directory)
+        assert runs == 0
+        assert len(os.listdir(directory)) == 1
+        assert 'vortex_distribution' in warm.geometry
+        for key in ['lift_coefficient_sub','lift_coefficient_sup','drag_coefficient_sub','drag_coefficient_sup']:
+            assert np.array_equal(cold.training[key],warm.training[key])
+        for key in ['wing_lift_coefficient_sub','wing_drag_coefficient_sub']:
+            for wing in vehicle.wings.keys():
+                assert np.array_equal(cold.training[key][wing],warm.training[key][wing])
+
+        # so are the surrogates built on it
+        for key in ['lift_coefficient_sub','drag_coefficient_sub']:
+            assert np.array_equal(cold.surrogates[key](1.,0.3),warm.surrogates[key](1.,0.3))
+
+        # a change to the geometry misses
+        changed = copy.deepcopy(vehicle)
+        changed.wings.main_wing.spans.projected *= 1.01
+        _, runs = train(changed,directory)
+        assert runs == 1
+        assert len(os.listdir(directory)) == 2
+
+        # so does a change to the settings
+        _, runs = train(vehicle,directory,number_spanwise_vortices=6)
+        assert runs == 1
+        assert len(os.listdir(directory)) == 3
+
+        # or to the training grid
+        _, runs = train(vehicle,directory,Mach=np.array([[0.1, 0.3, 0.5, 0.7, 1.3, 1.5, 2.0, 3.0]]).T)
+        assert runs == 1
+        assert len(os.listdir(directory)) == 4
+
+        # settings that do not change the training data still hit
+        _, runs = train(vehicle,directory,influence_matrix_cache_size=2)
+        assert runs == 0
+        assert len(os.listdir(directory)) == 4
+
+        # the file name is the same in a new session
+        command = 'import sys; sys.path.append("../Vehicles"); import vortex_lattice_training_cache as test; '\
+                  'print(test.cache_file(test.vehicle_setup(),"' + directory + '"))'
+        other_session = subprocess.check_output([sys.executable,'-c',command]).decode().split()[-1]
+        assert other_session == cache_file(vehicle,directory)
+
+    # objects that are not data are keyed by their attributes
+    first        = Stand_In()
+    second       = Stand_In()
+    second.value = 2.
+    assert hash_data(first) == hash_data(Stand_In())
+    assert hash_data(first) != hash_data(second)
+
+    # and an object that contains itself does not recurse forever
+    first.parent = first
+    assert hash_data(first) != hash_data(Stand_In())
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+class Stand_In():
+    def __init__(self):
+        self.value = 1.
+
+def setup_vortex_lattice(vehicle,directory,Mach=None,**settings):
+
+    aerodynamics = SUAVE.Analyses.Aerodynamics.Vortex_Lattice()
+    aerodynamics.geometry                            = vehicle
+    aerodynamics.settings.training_cache_directory   = directory
+    aerodynamics.settings.number_spanwise_vortices   = 5
+    aerodynamics.settings.number_chordwise_vortices  = 2
+    for key, value in settings.items():
+        aerodynamics.settings[key] = value
+
+    # a smaller grid than the default keeps the test short
+    aerodynamics.training.angle_of_attack = np.array([[-2., 0.0, 2.0, 5.0, 8.0]]).T * Units.deg
+    aerodynamics.training.Mach            = np.array([[0.1, 0.3, 0.5, 0.7, 1.3, 1.5, 2.0, 2.5]]).T
+    if Mach is not None:
+        aerodynamics.training.Mach = Mach
+
+    return aerodynamics
+
+def cache_file(vehicle,directory):
+    return os.path.basename(setup_vortex_lattice(vehicle,directory).training_cache_file())
+
+def train(vehicle,directory,**settings):
+
+    aerodynamics = setup_vortex_lattice(vehicle,directory,**settings)
+
+    # count the runs of the vortex lattice over the training grid
+    calculate_VLM = vortex_lattice_module.calculate_VLM
+    runs          = []
+    def counting_VLM(*args):
+        runs.append(1)
+        return calculate_VLM(*args)
+
+    vortex_lattice_module.calculate_VLM = counting_VLM
+    try:
+        settings = aerodynamics.settings
+        aerodynamics.initialize(True,settings.number_spanwise_vortices,settings.number_chordwise_vortices,False,False,False,False)
+    finally:
+        vortex_lattice_module.calculate_VLM = calculate_VLM
+
+    return aerodynamics, len(runs)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+# airfoil_boundary_layer_batch.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+from SUAVE.Methods.Aerodynamics.Airfoil_Panel_Method.airfoil_analysis import airfoil_analysis
+from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.compute_naca_4series \
+     import  compute_naca_4series
+import numpy as np
+import time
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    # a boundary layer table of a rotor airfoil
+    airfoil_geometry = compute_naca_4series('2412',npoints = 200)
+    AoA_sweep        = np.linspace(-4,12,12)*Units.degrees
+    Re_sweep         = np.linspace(1E5,2E6,12)
+    AoA_vals         = np.tile(AoA_sweep[None,:],(len(Re_sweep),1))
+    Re_vals          = np.tile(Re_sweep[:,None],(1,len(AoA_sweep)))
+
+    t0               = time.time()
+    batch            = airfoil_analysis(airfoil_geometry,AoA_vals,Re_vals)
+    batch_time       = time.time() - t0
+    print('Batch of ' + str(AoA_vals.size) + ' cases: ' + str(round(batch_time,3)) + ' s')
+
+    # every case is integrated on its own, a case solved alone only differs by the round off of the panel
+    # solve, which the tolerance of the integration can grow to a few parts in 1e5 of the coefficients, up to
+    # 2.6e-5 at the last case
+    for re_idx, aoa_idx in [(0,0),(3,7),(11,11)]:
+        single = airfoil_analysis(airfoil_geometry,AoA_vals[re_idx:re_idx+1,aoa_idx:aoa_idx+1],
+                                  Re_vals[re_idx:re_idx+1,aoa_idx:aoa_idx+1])
+        for key in ['cl','cd']:
+            single_val = single[key][0,0]
+            batch_val  = batch[key][re_idx,aoa_idx]
+            error      = np.abs(single_val - batch_val)/np.abs(batch_val)
+            print(key + ' difference at case ' + str((re_idx,aoa_idx)) + ': ' + str(error))
+            assert(error < 1E-4)
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+# atmosphere_lookup.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+from SUAVE.Core.Arrays import atleast_2d_col
+from SUAVE.Attributes.Gases import Air
+from SUAVE.Attributes.Planets import Earth
+from SUAVE.Analyses.Mission.Segments.Conditions import Conditions
+from warnings import warn
+import numpy as np
+import time
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    atm = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+
+    # random altitudes, the breaks and the edges of the model
+    Rad    = atm.planet.mean_radius
+    breaks = atm.breaks.altitude
+    np.random.seed(0)
+    z      = np.concatenate([np.random.uniform(-1.9,84.,500)*Units.km,breaks*Rad/(Rad - breaks)])
+
+    for delta_isa in [0.,15.,-10.]:
+        data      = atm.compute_values(z,delta_isa)
+        reference = layer_by_layer(atm,z,delta_isa)
+        for key in ['pressure','temperature','density','speed_of_sound','dynamic_viscosity','kinematic_viscosity',
+                    'thermal_conductivity','prandtl_number']:
+            error = np.max(np.abs(data[key] - reference[key])/np.abs(reference[key]))
+            print('delta ISA ' + str(delta_isa) + ' ' + key + ' difference: ' + str(error))
+            assert(error < 1E-12)
+
+    # cost per call
+    number = 200
+    for ctrl_pts in [1,16,64,256,4096]:
+        z  = np.linspace(0.,15.,ctrl_pts)*Units.km
+        t0 = time.time()
+        for i in range(number):
+            atm.compute_values(z)
+        t1 = time.time()
+        for i in range(number):
+            layer_by_layer(atm,z,0.)
+        t2 = time.time()
+        print(str(ctrl_pts) + ' control points: ' + str((t1-t0)/number*1E6) + ' us per call, layer by layer: ' + str((t2-t1)/number*1E6) + ' us')
+
+    return
+
+def layer_by_layer(atm,altitude,delta_isa):
+    """ The masks of each layer of the atmosphere, as compute_values evaluated them, kept for comparison. """
+
+    gas  = atm.fluid_properties
+    grav = atm.planet.sea_level_gravity
+    Rad  = atm.planet.mean_radius
+    R    = gas.gas_specific_constant
+    if not gas == Air():
+        warn('US Standard Atmosphere not using Air fluid properties')
+    if not atm.planet == Earth():
+        warn('US Standard Atmosphere not using Earth planet properties')
+
+    zs = atleast_2d_col(altitude)
+    zs = zs/(1 + zs/Rad)
+    zs = np.clip(zs,atm.breaks.altitude[0],atm.breaks.altitude[-1])
+
+    z0    = np.zeros_like(zs)
+    T0    = np.zeros_like(zs)
+    p0    = np.zeros_like(zs)
+    alpha = np.zeros_like(zs)
+    for i in range( len(atm.breaks.altitude)-1 ):
+        i_inside = (zs >= atm.breaks.altitude[i]) & (zs <= atm.breaks.altitude[i+1])
+        z0[ i_inside ]    = atm.breaks.altitude[i]
+        T0[ i_inside ]    = atm.breaks.temperature[i]
+        p0[ i_inside ]    = atm.breaks.pressure[i]
+        alpha[ i_inside ] = -(atm.breaks.temperature[i+1] - atm.breaks.temperature[i])/ \
+                             (atm.breaks.altitude[i+1]    - atm.breaks.altitude[i])
+
+    dz = zs-z0
+    p  = np.zeros_like(zs)
+    i_isoth = (alpha == 0.)
+    i_adiab = (alpha != 0.)
+    p[i_isoth] = p0[i_isoth] * np.exp(-1.*dz[i_isoth]*grav/(R*T0[i_isoth]))
+    p[i_adiab] = p0[i_adiab] * ( (1.-alpha[i_adiab]*dz[i_adiab]/T0[i_adiab]) **(1.*grav/(alpha[i_adiab]*R)) )
+    T  = T0 - dz*alpha + delta_isa
+
+    reference                      = Conditions()
+    reference.expand_rows(zs.shape[0])
+    reference.pressure             = p
+    reference.temperature          = T
+    reference.density              = gas.compute_density(T,p)
+    reference.speed_of_sound       = gas.compute_speed_of_sound(T,p)
+    reference.dynamic_viscosity    = gas.compute_absolute_viscosity(T)
+    reference.thermal_conductivity = gas.compute_thermal_conductivity(T)
+    reference.kinematic_viscosity  = reference.dynamic_viscosity/reference.density
+    reference.prandtl_number       = gas.compute_prandtl_number(T)
+
+    return reference
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+# data_attribute_access.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+import numpy as np
+import timeit
+from SUAVE.Core import Data
+
+dictgetitem  = dict.__getitem__
+objgetattrib = object.__getattribute__
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    # ------------------------------------------------------------------
+    #   Semantics
+    # ------------------------------------------------------------------
+
+    for klass in [Data,Try_Except_Data]:
+        check_semantics(klass)
+
+    # ------------------------------------------------------------------
+    #   Throughput
+    # ------------------------------------------------------------------
+
+    number = 200000
+    for klass in [Try_Except_Data,Data]:
+        get_key, get_method, set_key = throughput(klass,number)
+        print(klass.__name__)
+        print('  key get      : %.2e per second' % get_key)
+        print('  method get   : %.2e per second' % get_method)
+        print('  key set      : %.2e per second' % set_key)
+
+    return
+
+def check_semantics(klass):
+
+    d = klass()
+
+    # keys are set and found as attributes
+    d.velocity = np.array([1.,2.])
+    assert( 'velocity' in d.keys() )
+    assert( np.all(d.velocity == d['velocity']) )
+
+    # methods are found when there is no key
+    assert( callable(d.pack_array) )
+
+    # keys shadow methods
+    d['items'] = 3.
+    assert( d.items == 3. )
+    del d['items']
+    assert( callable(d.items) )
+
+    # object attributes are set on the object and not as keys
+    d.__doc__ = 'test'
+    assert( not '__doc__' in d.keys() )
+    assert( d.__doc__ == 'test' )
+
+    # deleting
+    del d.velocity
+    assert( not 'velocity' in d.keys() )
+
+    # missing attributes
+    try:
+        d.velocity
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError('missing attribute did not raise')
+    try:
+        del d.velocity
+    except KeyError:
+        pass
+    else:
+        raise AssertionError('missing attribute did not raise')
+
+    return
+
+def throughput(klass,number):
+
+    d = klass()
+    d.velocity = 1.
+
+    get_key    = number/timeit.timeit(lambda: d.velocity  , number=number)
+    get_method = number/timeit.timeit(lambda: d.pack_array, number=number)
+    set_key    = number/timeit.timeit(lambda: setattr(d,'altitude',1.), number=number)
+
+    return get_key, get_method, set_key
+
+# ----------------------------------------------------------------------
+#   Reference access path
+# ----------------------------------------------------------------------
+
+class Try_Except_Data(Data):
+    """ The attribute access of Data before the class attributes were cached, kept for comparison. """
+
+    def __getattribute__(self, k):
+        try:
+            return dictgetitem(self,k)
+        except:
+            return objgetattrib(self,k)
+
+    def __setattr__(self, k, v):
+        try:
+            objgetattrib(self, k)
+        except:
+            self[k] = v
+        else:
+            object.__setattr__(self, k, v)
+
+    def __delattr__(self, k):
+        try:
+            objgetattrib(self, k)
+        except:
+            del self[k]
+        else:
+            object.__delattr__(self, k)
+
+if __name__ == '__main__':
+    main()
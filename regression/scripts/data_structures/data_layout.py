@@ -0,0 +1,102 @@
+# data_layout.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" packs and unpacks a nested state with a compiled Data_Layout, and checks it against Data.pack_array and
+    Data.unpack_array
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data, Data_Layout
+
+import numpy as np
+import copy
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    state  = setup_state()
+    layout = Data_Layout()
+
+    # the layout packs what pack_array packs, in the same order
+    vector = layout.pack(state)
+    assert layout.data is state
+    assert np.array_equal(vector,state.pack_array())
+    assert len(vector) == 1 + 1 + 4 + 8 + 3 + 2
+
+    # and unpacks like unpack_array, leaving the values it does not pack alone
+    new_vector = np.arange(len(vector),dtype=float) + 0.5
+    unpacked   = copy.deepcopy(state)
+    unpacked.unpack_array(new_vector)
+    layout.unpack(state,new_vector)
+    check_results(state,unpacked)
+    assert state.conditions.tag == 'cruise'
+    assert np.array_equal(state.conditions.frames.rank_3,np.ones((2,2,2)))
+
+    # so packing again gives the vector back, without a rebuild
+    entries = layout.entries
+    assert np.array_equal(layout.pack(state),new_vector)
+    assert layout.entries is entries
+
+    # another data object rebuilds the layout
+    other = setup_state()
+    other.conditions.weights.total_mass = np.ones((5,1))
+    del other.unknowns.throttle
+    vector = layout.pack(other)
+    assert layout.data is other
+    assert layout.entries is not entries
+    assert np.array_equal(vector,other.pack_array())
+
+    new_vector = -np.arange(len(vector),dtype=float)
+    unpacked   = copy.deepcopy(other)
+    unpacked.unpack_array(new_vector)
+    layout.unpack(other,new_vector)
+    check_results(other,unpacked)
+    assert np.array_equal(layout.pack(other),new_vector)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def setup_state():
+
+    state = Data()
+    state.unknowns                         = Data()
+    state.unknowns.count                   = 3
+    state.unknowns.throttle                = 0.75
+    state.unknowns.body_angle              = np.array([0.1,0.2,0.3,0.4])
+    state.conditions                       = Data()
+    state.conditions.tag                   = 'cruise'
+    state.conditions.frames                = Data()
+    state.conditions.frames.velocity       = np.array([[1.,2.],[3.,4.],[5.,6.],[7.,8.]])
+    state.conditions.frames.rank_3         = np.ones((2,2,2))
+    state.conditions.weights               = Data()
+    state.conditions.weights.total_mass    = np.array([[10.],[20.],[30.]])
+    state.residuals                        = Data()
+    state.residuals.forces                 = np.array([[0.5,-0.5]])
+
+    return state
+
+def check_results(data,reference):
+
+    for (key, value), (reference_key, reference_value) in zip(data.items(),reference.items()):
+        assert key == reference_key
+        if isinstance(value,dict):
+            check_results(value,reference_value)
+        else:
+            assert np.array_equal(value,reference_value), key
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+# parallel_missions.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" evaluates two E190 missions in one process and in a pool of two, and compares the segment states
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data
+
+import numpy as np
+import copy
+import sys
+
+sys.path.append('../payload_range')
+
+from mission_Embraer_E190_constThr_payload_range import full_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    configs, analyses = full_setup()
+
+    configs.finalize()
+    analyses.finalize()
+
+    # two missions that differ in takeoff weight
+    missions = SUAVE.Analyses.Mission.Mission.Container()
+    for tag, takeoff in [('heavy',51800.),('light',45000.)]:
+        mission = copy.deepcopy(analyses.missions)
+        mission.tag = tag
+        mission.segments[0].analyses.weights.vehicle.mass_properties.takeoff = takeoff
+        missions[tag] = mission
+
+    serial   = copy.deepcopy(missions)
+    parallel = copy.deepcopy(missions)
+
+    serial_results   = SUAVE.Methods.Missions.evaluate_missions(serial,1)
+    parallel_results = parallel.evaluate_parallel(2)
+
+    # keyed and ordered as the container
+    assert list(serial_results.keys())   == ['heavy','light']
+    assert list(parallel_results.keys()) == ['heavy','light']
+
+    for tag in missions.keys():
+        for segment_tag in missions[tag].segments.keys():
+            serial_segment   = serial_results[tag].segments[segment_tag]
+            parallel_segment = parallel_results[tag].segments[segment_tag]
+
+            assert serial_segment.converged and parallel_segment.converged
+
+            # the merged conditions are those of the state
+            assert parallel_segment.conditions is parallel_segment.state.conditions
+
+            check_results(serial_segment.state,parallel_segment.state,tag + '.' + segment_tag)
+
+    # a list of missions comes back as a list
+    mission_list = [copy.deepcopy(missions.heavy)]
+    assert SUAVE.Methods.Missions.evaluate_missions(mission_list,2) == mission_list
+
+    return
+
+def check_results(serial_state,parallel_state,tag):
+
+    # the same code on the same inputs, but numpy's round off can depend on where the arrays sit in memory and the
+    # root finder carries it up to its tolerance
+    for key in ['conditions','unknowns']:
+        serial_values   = np.nan_to_num(serial_state[key].pack_array())
+        parallel_values = np.nan_to_num(parallel_state[key].pack_array())
+        error = np.max(np.abs(serial_values - parallel_values))/np.max(np.abs(serial_values))
+        print(tag, key, error)
+        assert error < 1e-6
+
+    return
+
+if __name__ == '__main__':
+    main()
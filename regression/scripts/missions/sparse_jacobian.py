@@ -0,0 +1,87 @@
+# sparse_jacobian.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" converges the E190 mission with plain and with sparse finite difference Jacobians
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+
+import numpy as np
+import scipy.optimize
+import copy
+import sys
+
+sys.path.append('../payload_range')
+
+from mission_Embraer_E190_constThr_payload_range import full_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    configs, analyses = full_setup()
+
+    configs.finalize()
+    analyses.finalize()
+
+    plain  = analyses.missions
+    sparse = copy.deepcopy(plain)
+    for segment in sparse.segments.values():
+        segment.state.numerics.solver_jacobian = "sparse"
+
+    # solve twice, the second time for a lighter vehicle as an optimizer would
+    plain_evaluations  = []
+    sparse_evaluations = []
+    for takeoff in [51800., 50000.]:
+        for mission, evaluations in [(plain,plain_evaluations),(sparse,sparse_evaluations)]:
+            mission.segments[0].analyses.weights.vehicle.mass_properties.takeoff = takeoff
+            mission.evaluate()
+            evaluations.append(np.array([segment.state.numerics.number_of_evaluations for segment in mission.segments.values()]))
+
+            for segment in mission.segments.values():
+                assert segment.converged, segment.tag + ' did not converge'
+
+        check_results(plain,sparse)
+
+    print('segment           plain          sparse')
+    for i, tag in enumerate(plain.segments.keys()):
+        print('%-16s %4d %4d      %4d %4d' % (tag,plain_evaluations[0][i],plain_evaluations[1][i],sparse_evaluations[0][i],sparse_evaluations[1][i]))
+
+    # once colored, the sparse Jacobian costs fewer evaluations
+    assert np.sum(sparse_evaluations[1]) < np.sum(plain_evaluations[1])
+
+    # other root finders are not given the Jacobian
+    def root_finder(*args,**kwargs):
+        assert 'fprime' not in kwargs
+        return scipy.optimize.fsolve(*args,**kwargs)
+
+    for segment in sparse.segments.values():
+        segment.settings.root_finder = root_finder
+    sparse.evaluate()
+    check_results(plain,sparse)
+
+    return
+
+def check_results(plain,sparse):
+
+    for tag in plain.segments.keys():
+        for key in ['weights.total_mass','frames.inertial.position_vector','propulsion.throttle']:
+            plain_value  = plain.segments[tag].state.conditions.deep_get(key)
+            sparse_value = sparse.segments[tag].state.conditions.deep_get(key)
+            error        = np.max(np.abs(plain_value - sparse_value))/np.max(np.abs(plain_value))
+            print(tag, key, error)
+            assert error < 1e-6
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,222 @@
+# warm_start_cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" converges the E190 mission warm started from a heavier design, directly and through a Nexus, and checks the
+    results against cold solves
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Analyses import Process
+from SUAVE.Analyses.Mission import Warm_Start_Cache
+from SUAVE.Optimization import Nexus
+
+import numpy as np
+import scipy.optimize
+import copy
+import sys
+
+sys.path.append('../payload_range')
+
+from mission_Embraer_E190_constThr_payload_range import full_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    configs, analyses = full_setup()
+
+    configs.finalize()
+    analyses.finalize()
+
+    mission = analyses.missions
+
+    converge_root_test(mission)
+    fallback_test(mission)
+    nexus_test(mission)
+
+    return
+
+def converge_root_test(mission):
+
+    cold = copy.deepcopy(mission)
+    warm = copy.deepcopy(mission)
+
+    cache = Warm_Start_Cache()
+    cache.attach(warm)
+
+    # the first solve has nothing to start from
+    set_takeoff(warm,51800.)
+    warm.evaluate()
+    assert cache.cold_starts == len(warm.segments)
+    assert cache.warm_starts == 0
+
+    set_takeoff(cold,50000.)
+    set_takeoff(warm,50000.)
+    cold.evaluate()
+    warm.evaluate()
+    assert cache.warm_starts == len(warm.segments)
+    assert cache.fallbacks   == 0
+
+    check_results(cold,warm)
+
+    # the savings are against the cold solve of each segment
+    saved = 0
+    for tag in warm.segments.keys():
+        entry = cache.segments[warm.tag + '.' + tag]
+        saved += entry.cold_evaluations - warm.segments[tag].state.numerics.number_of_evaluations
+    print('evaluations saved', cache.evaluations_saved)
+    assert cache.evaluations_saved == saved
+    assert cache.evaluations_saved > 0
+
+    return
+
+def fallback_test(mission):
+
+    cold = copy.deepcopy(mission)
+    warm = copy.deepcopy(mission)
+
+    cache = Recording_Cache()
+    cache.attach(warm)
+
+    set_takeoff(warm,51800.)
+    warm.evaluate()
+
+    # a root finder that fails every warm start, and records where every solve starts from
+    starts = Data()
+    def root_finder(function,x0,args,**kwargs):
+        tag = args.settings.warm_start_tag
+        starts.setdefault(tag,[]).append(x0*1.)
+        if len(starts[tag]) == 1:
+            function(x0,args)
+            return x0, {}, 0, 'failed on purpose'
+        return scipy.optimize.fsolve(function,x0,args=args,**kwargs)
+
+    for segment in warm.segments.values():
+        segment.settings.root_finder = root_finder
+
+    set_takeoff(cold,50000.)
+    set_takeoff(warm,50000.)
+    cold.evaluate()
+    warm.evaluate()
+    assert cache.fallbacks == len(warm.segments)
+
+    for tag, segment in warm.segments.items():
+        key = warm.tag + '.' + tag
+        assert segment.converged
+
+        # started from the cache, then from what the segment held before it was seeded
+        assert np.array_equal(starts[key][0],cache.segments[key].unknowns[-2])
+        assert np.array_equal(starts[key][1],cache.guesses[key])
+
+        # the failed warm start is not a cold solve
+        assert cache.segments[key].cold_evaluations == segment.state.numerics.number_of_evaluations - 1
+
+    # the failed warm starts were lost
+    assert cache.evaluations_saved == -len(warm.segments)
+
+    check_results(cold,warm)
+
+    return
+
+def nexus_test(mission):
+
+    cold = setup_nexus(mission)
+    warm = setup_nexus(mission)
+    warm.warm_start = Warm_Start_Cache()
+
+    warm.objective(np.array([51800.]))
+    warm.objective(np.array([50000.]))
+    cold.objective(np.array([50000.]))
+
+    # the cache was attached to the missions of the nexus and given the design
+    assert warm.missions.base.segments[0].settings.warm_start is warm.warm_start
+    assert np.all(warm.warm_start.design_variables == [50000.])
+    assert warm.warm_start.warm_starts == len(warm.missions.base.segments)
+
+    check_results(cold.missions.base,warm.missions.base)
+    assert np.abs(cold.summary.landing_weight - warm.summary.landing_weight) < 1e-6*cold.summary.landing_weight
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+class Recording_Cache(Warm_Start_Cache):
+    """ Remembers the guesses of every segment before they are seeded
+    """
+
+    def __defaults__(self):
+        self.guesses = Data()
+
+    def seed(self,segment):
+        self.guesses[segment.settings.warm_start_tag] = segment.state._unknowns_layout.pack(segment.state.unknowns)
+        return Warm_Start_Cache.seed(self,segment)
+
+def set_takeoff(mission,takeoff):
+    mission.segments[0].analyses.weights.vehicle.mass_properties.takeoff = takeoff
+    return
+
+def setup_nexus(mission):
+
+    nexus = Nexus()
+    problem = Data()
+    nexus.optimization_problem = problem
+
+    problem.inputs = np.array([
+        [ 'takeoff' , 51800. , 40000. , 52000. , 1. , 1*Units.kg],
+    ],dtype=object)
+
+    problem.objective = np.array([
+        [ 'landing_weight' , 1. , 1*Units.kg],
+    ],dtype=object)
+
+    problem.constraints = np.array([],dtype=object)
+
+    problem.aliases = [
+        [ 'takeoff'        , 'missions.base.segments.climb_250kcas.analyses.weights.vehicle.mass_properties.takeoff' ],
+        [ 'landing_weight' , 'summary.landing_weight'                                                           ],
+    ]
+
+    nexus.vehicle_configurations = None
+    nexus.analyses               = None
+
+    nexus.missions      = SUAVE.Analyses.Mission.Mission.Container()
+    nexus.missions.base = copy.deepcopy(mission)
+
+    nexus.procedure         = Process()
+    nexus.procedure.mission = evaluate_mission
+
+    nexus.summary = Data()
+    nexus.total_number_of_iterations = 0
+
+    return nexus
+
+def evaluate_mission(nexus):
+    results = nexus.missions.base.evaluate()
+    nexus.summary.landing_weight = results.segments[-1].conditions.weights.total_mass[-1,0]
+    return nexus
+
+def check_results(cold,warm):
+
+    for tag in cold.segments.keys():
+        for key in ['weights.total_mass','frames.inertial.position_vector','propulsion.throttle']:
+            cold_value = cold.segments[tag].state.conditions.deep_get(key)
+            warm_value = warm.segments[tag].state.conditions.deep_get(key)
+            error      = np.max(np.abs(cold_value - warm_value))/np.max(np.abs(cold_value))
+            print(tag, key, error)
+            assert error < 1e-6
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+# broadband_boundary_layer_batch.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" looks up the trailing edge boundary layer properties of a two airfoil blade in one call per airfoil, and checks
+    them against the lookup of each property, airfoil and azimuth on its own
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+from SUAVE.Core.Utilities import interp2d
+from SUAVE.Methods.Noise.Fidelity_One.Propeller.compute_broadband_noise import boundary_layer_properties
+from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.import_airfoil_geometry \
+     import import_airfoil_geometry
+from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.compute_airfoil_properties \
+     import compute_airfoil_properties
+import numpy as np
+import time
+import os
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    ospath    = os.path.abspath(__file__)
+    separator = os.path.sep
+    rel_path  = os.path.dirname(ospath) + separator + '..' + separator + 'Vehicles' + separator + 'Airfoils' + separator
+
+    # the boundary layer tables come from the polars
+    airfoils = SUAVE.Core.ContainerOrdered()
+    for name in ['Clark_y','NACA_4412']:
+        airfoil             = SUAVE.Components.Airfoils.Airfoil()
+        airfoil.tag         = name
+        airfoil.polar_files = [rel_path + 'Polars' + separator + name + '_polar_Re_' + str(Re) + '.txt'
+                               for Re in [100000,200000,500000,1000000]]
+        airfoil.geometry    = import_airfoil_geometry(rel_path + name + '.txt',airfoil.number_of_points)
+        airfoil.polars      = compute_airfoil_properties(airfoil.geometry,airfoil.polar_files,boundary_layer_calcs=True)
+        airfoils.append(airfoil)
+
+    # blade sections, including some outside of the tables
+    num_cpt, num_sec, num_azi = 3, 20, 36
+    a_loc = list(np.repeat([0,1],num_sec//2))
+    np.random.seed(0)
+    Re    = 10**np.random.uniform(3.8,6.2,(num_cpt,num_sec,num_azi))
+    aoa   = np.random.uniform(-6,16,(num_cpt,num_sec,num_azi))*Units.degrees
+
+    # a nonuniform freestream looks up every azimuth, a uniform one only the first
+    t0        = time.time()
+    BL        = boundary_layer_properties(airfoils,a_loc,Re,aoa)
+    t1        = time.time()
+    BL_ref    = azimuth_by_azimuth(airfoils,a_loc,Re,aoa)
+    t2        = time.time()
+    BL_2d     = boundary_layer_properties(airfoils,a_loc,Re[:,:,0],aoa[:,:,0])
+    BL_2d_ref = azimuth_by_azimuth(airfoils,a_loc,Re[:,:,0:1],aoa[:,:,0:1])[:,:,0]
+
+    print('Stacked lookup     : ' + str(t1-t0) + ' s')
+    print('Azimuth by azimuth : ' + str(t2-t1) + ' s')
+    assert np.shape(BL) == (num_cpt,num_sec,num_azi,12)
+    assert np.array_equal(BL,BL_ref)
+    assert np.array_equal(BL_2d,BL_2d_ref)
+
+    # each airfoil is looked up in its own table
+    assert np.max(np.abs(BL[:,a_loc.index(0)] - BL[:,a_loc.index(1)])) > 0.
+
+    return
+
+def azimuth_by_azimuth(airfoils,a_loc,Re,aoa):
+    """ The lookup of each property for each airfoil and azimuth, kept for comparison. """
+
+    bstei = 1      # bottom surface trailing edge index
+    ustei = -bstei # upper surface trailing edge index
+
+    BL = np.zeros(np.shape(Re) + (12,))
+    for i_azi in range(np.shape(Re)[2]):
+        for jj,airfoil in enumerate(airfoils):
+            bl        = airfoil.polars.boundary_layer
+            local_Re  = Re[:,:,i_azi]
+            local_aoa = aoa[:,:,i_azi]
+            tables    = [bl.theta_lower_surface[:,:,bstei],
+                         bl.delta_lower_surface[:,:,bstei],
+                         bl.delta_star_lower_surface[:,:,bstei],
+                         bl.Ue_Vinf_lower_surface[:,:,bstei],
+                         bl.cf_lower_surface[:,:,bstei],
+                         bl.dcp_dx_lower_surface[:,:,bstei],
+                         bl.theta_upper_surface[:,:,ustei],
+                         bl.delta_upper_surface[:,:,ustei],
+                         bl.delta_star_upper_surface[:,:,ustei],
+                         bl.Ue_Vinf_upper_surface[:,:,ustei],
+                         bl.cf_upper_surface[:,:,ustei],
+                         bl.dcp_dx_upper_surface[:,:,ustei]]
+            locs      = np.where(np.array(a_loc) == jj )
+            for k, table in enumerate(tables):
+                data               = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, table)
+                BL[:,locs,i_azi,k] = data[:,locs]
+
+    return BL
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,291 @@
+# jet_noise_batch.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" evaluates the SAE jet noise of the B737 turbofan over a flyover trajectory, and checks it against the step by
+    step evaluation of the model
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Methods.Noise.Fidelity_One.Engine import noise_SAE
+from SUAVE.Methods.Noise.Fidelity_One.Engine.angle_of_attack_effect    import angle_of_attack_effect
+from SUAVE.Methods.Noise.Fidelity_One.Engine.external_plug_effect      import external_plug_effect
+from SUAVE.Methods.Noise.Fidelity_One.Engine.ground_proximity_effect   import ground_proximity_effect
+from SUAVE.Methods.Noise.Fidelity_One.Engine.jet_installation_effect   import jet_installation_effect
+from SUAVE.Methods.Noise.Fidelity_One.Engine.mixed_noise_component     import mixed_noise_component
+from SUAVE.Methods.Noise.Fidelity_One.Engine.secondary_noise_component import secondary_noise_component
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import atmospheric_attenuation, dbA_noise
+
+import numpy as np
+import time
+import sys
+
+sys.path.append('../Vehicles')
+
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle  = vehicle_setup()
+    turbofan = vehicle.networks.turbofan
+    settings = SUAVE.Analyses.Noise.Fidelity_One().settings
+
+    # the exit velocities of the engine model, and the fixed speeds of the configurations
+    for core_speed, fan_speed in [(np.linspace(400.,380.,20)[:,None],np.linspace(300.,290.,20)[:,None]),(415.,315.)]:
+        turbofan.core_nozzle.noise_speed = core_speed
+        turbofan.fan_nozzle.noise_speed  = fan_speed
+        turbofan.fan.rotation            = 0.
+        segment                          = flyover_segment(20)
+
+        t0     = time.time()
+        batch  = noise_SAE(turbofan,segment,None,vehicle,settings)
+        t1     = time.time()
+        loop   = step_by_step_SAE(turbofan,segment,settings)
+        t2     = time.time()
+        print('Batched: ' + str(t1-t0) + ' s, step by step: ' + str(t2-t1) + ' s')
+
+        for key in ['SPL_spectrum','SPL_dBA']:
+            error = np.max(np.abs(batch[key] - loop[key]))
+            print(key + ' difference: ' + str(error))
+            assert error < 1e-10
+
+        # the 10 kHz band too
+        assert np.max(np.abs(batch.SPL_spectrum[:,-1] - loop.SPL_spectrum[:,-1])) < 1e-10
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def flyover_segment(nsteps):
+    """ A climb out over a microphone 2000 m from the start of the segment. """
+
+    segment    = Data()
+    conditions = Data()
+    segment.conditions = conditions
+
+    altitude = np.linspace(50.,600.,nsteps)
+    s        = np.linspace(0.,4000.,nsteps)
+    x0       = 2000.
+
+    atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    atmo_data  = atmosphere.compute_values(altitude)
+
+    conditions.freestream = Data()
+    conditions.freestream.velocity          = np.ones((nsteps,1))*80.
+    conditions.freestream.altitude          = altitude[:,None]
+    conditions.freestream.speed_of_sound    = atmo_data.speed_of_sound
+    conditions.freestream.density           = atmo_data.density
+    conditions.freestream.dynamic_viscosity = atmo_data.dynamic_viscosity
+    conditions.freestream.temperature       = atmo_data.temperature
+    conditions.freestream.pressure          = atmo_data.pressure
+
+    conditions.aerodynamics = Data()
+    conditions.aerodynamics.angle_of_attack = np.linspace(8.,6.,nsteps)[:,None]*Units.deg
+
+    conditions.frames = Data()
+    conditions.frames.inertial = Data()
+    conditions.frames.inertial.time = np.linspace(0.,50.,nsteps)[:,None]
+
+    sources = Data()
+    sources.core = Data()
+    sources.core.exit_stagnation_temperature = np.linspace(800.,780.,nsteps)[:,None]
+    sources.core.exit_stagnation_pressure    = np.linspace(160000.,150000.,nsteps)[:,None]
+    sources.fan  = Data()
+    sources.fan.exit_stagnation_temperature  = np.linspace(330.,320.,nsteps)[:,None]
+    sources.fan.exit_stagnation_pressure     = np.linspace(150000.,140000.,nsteps)[:,None]
+    conditions.noise = Data()
+    conditions.noise.sources = Data()
+    conditions.noise.sources.turbofan = sources
+
+    # the microphone on the ground below the flight path
+    segment.dist  = np.sqrt(altitude**2+(s-x0)**2)
+    segment.theta = np.arctan(np.abs(altitude/(s-x0)))
+    flag          = (s-x0) < 0
+    segment.theta[flag] = np.pi - np.arctan(np.abs(altitude/(s-x0)))[flag]
+    segment.phi   = np.zeros(nsteps)
+
+    return segment
+
+def step_by_step_SAE(turbofan,segment,settings):
+    """ The SAE jet noise model evaluated one step and one frequency at a time, kept for comparison. The source
+        angles of a step start from those of the last step, and the primary component leaves out the highest band.
+    """
+
+    Velocity_primary      = turbofan.core_nozzle.noise_speed * 0.92*(turbofan.design_thrust/52700.)
+    Temperature_primary   = segment.conditions.noise.sources.turbofan.core.exit_stagnation_temperature[:,0]
+    Pressure_primary      = segment.conditions.noise.sources.turbofan.core.exit_stagnation_pressure[:,0]
+    Velocity_secondary    = turbofan.fan_nozzle.noise_speed * (turbofan.design_thrust/52700.)
+    Temperature_secondary = segment.conditions.noise.sources.turbofan.fan.exit_stagnation_temperature[:,0]
+    Pressure_secondary    = segment.conditions.noise.sources.turbofan.fan.exit_stagnation_pressure[:,0]
+
+    N1                 = turbofan.fan.rotation* 0.92*(turbofan.design_thrust/52700.)
+    Diameter_primary   = turbofan.core_nozzle_diameter
+    Diameter_secondary = turbofan.fan_nozzle_diameter
+    EXA                = turbofan.exa
+
+    Velocity_aircraft  = float(segment.conditions.freestream.velocity[0,0])
+    AOA                = np.mean(segment.conditions.aerodynamics.angle_of_attack / Units.deg)
+    nsteps             = len(segment.conditions.frames.inertial.time[:,0])
+
+    Velocity_primary   = np.ones(nsteps)*np.ravel(Velocity_primary)
+    Velocity_secondary = np.ones(nsteps)*np.ravel(Velocity_secondary)
+
+    sound_ambient   = segment.conditions.freestream.speed_of_sound[:,0]
+    density_ambient = segment.conditions.freestream.density[:,0]
+    pressure_amb    = segment.conditions.freestream.pressure[:,0]
+
+    R_gas          = 287.1
+    Cpp            = R_gas/(1-1/1.37)
+    Cp             = R_gas/(1-1/1.4)
+    Area_primary   = np.pi*(Diameter_primary/2)**2
+    Area_secondary = np.pi*(Diameter_secondary/2)**2
+
+    frequency = settings.center_frequencies[5:]
+    num_f     = len(frequency)
+    theta_p   = np.ones(num_f)*np.pi/2
+    theta_s   = np.ones(num_f)*np.pi/2
+    theta_m   = np.ones(num_f)*np.pi/2
+    SPL_p     = np.zeros(num_f)
+
+    SPL_total_history = np.zeros((nsteps,num_f))
+    SPLt_dBA_max      = np.zeros(nsteps)
+
+    for id in range(nsteps):
+        V_p = Velocity_primary[id]
+        V_s = Velocity_secondary[id]
+        a   = sound_ambient[id]
+        r   = segment.dist[id]
+
+        density_primary     = Pressure_primary[id]/(R_gas*Temperature_primary[id]-(0.5*R_gas*V_p**2/Cpp))
+        density_secondary   = Pressure_secondary[id]/(R_gas*Temperature_secondary[id]-(0.5*R_gas*V_s**2/Cp))
+        mass_flow_primary   = Area_primary*V_p*density_primary
+        mass_flow_secondary = Area_secondary*V_s*density_secondary
+        Mach_aircraft       = Velocity_aircraft/a
+
+        Velocity_mixed    = (mass_flow_primary*V_p+mass_flow_secondary*V_s)/(mass_flow_primary+mass_flow_secondary)
+        Temperature_mixed = (mass_flow_primary*Temperature_primary[id]+mass_flow_secondary*Temperature_secondary[id])/ \
+            (mass_flow_primary+mass_flow_secondary)
+        density_mixed  = pressure_amb[id]/(R_gas*Temperature_mixed-(0.5*R_gas*Velocity_mixed**2/Cp))
+        Area_mixed     = Area_primary*density_primary*V_p*(1+(mass_flow_secondary/mass_flow_primary))/(density_mixed*Velocity_mixed)
+        Diameter_mixed = (4*Area_mixed/np.pi)**0.5
+
+        XBPR = min(max(mass_flow_secondary/mass_flow_primary - 5.5,0),4)
+        DVPS = max(np.abs(V_p - (V_s*Area_secondary+Velocity_aircraft*Area_primary)/(Area_secondary+Area_primary)),0.3)
+
+        Str_p = frequency*Diameter_primary/(DVPS)
+        Str_s = frequency*Diameter_mixed/(V_s-Velocity_aircraft)
+        Str_m = frequency*Diameter_mixed/(Velocity_mixed-Velocity_aircraft)
+
+        excitation_Strouhal = (N1/60)*(Diameter_mixed/Velocity_mixed)
+        if (excitation_Strouhal > 0.25 and excitation_Strouhal < 0.5):
+            SX = 0.0
+        else:
+            SX = 50*(excitation_Strouhal-0.25)*(excitation_Strouhal-0.5)
+        exps = np.exp(-SX)
+        exs  = 5*exps*np.exp(-(np.log10(Str_m/(2*excitation_Strouhal+0.00001)))**2)
+        exd  = np.exp(0.6-(EXA)**0.5)
+        zk   = 1-0.4*(exd)*(exps)
+
+        theta = segment.theta[id]
+        for i in range(num_f):
+            theta_p[i] = step_source_angle(theta_p[i],theta,r,Diameter_primary/200.,lambda t:
+                (zk*Diameter_primary)*(4.+4.*np.arctan((18.*t/np.pi)-9.)+(Area_secondary/Area_primary)))
+            theta_s[i] = step_source_angle(theta_s[i],theta,r,Diameter_mixed/200.,lambda t,D=Diameter_mixed:
+                (zk*D)*(2.+1.6*np.arctan((4.5*t/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s[i]))* \
+                np.sqrt(1.+(0.7*V_s/a))*(V_s/(V_s-Velocity_aircraft)),
+                (zk*Diameter_secondary)*(2.+1.6*np.arctan((4.5*theta_s[i]/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s[i]))* \
+                np.sqrt(1.+(0.7*V_s/a))*(V_s/(V_s-Velocity_aircraft)))
+            theta_m[i] = step_source_angle(theta_m[i],theta,r,Diameter_mixed/200.,lambda t:
+                (zk*Diameter_mixed)*(3.+np.exp(-Str_m[i])+(2.+1.1*np.arctan((18.*t/np.pi)-13.))+ \
+                (1.+0.5/np.sqrt(Str_m[i])))*np.sqrt(0.5+0.5*Velocity_mixed/a)*(Velocity_mixed/(Velocity_mixed-Velocity_aircraft)))
+
+        exc  = np.where(theta_m <= 1.4, a/Velocity_mixed, (a/Velocity_mixed)*(1-(1.8/np.pi)*(theta_m-1.4)))
+        EX_m = exd*exs*exc
+        EX_p = +5*exd*exps
+        EX_s = 2*a/(V_s*(zk))
+
+        dspl_ambient_pressure = 20*np.log10(pressure_amb[id]/101325)
+        dspl_attenuation      = -atmospheric_attenuation(r)
+        DSPL_p = dspl_ambient_pressure + 20*np.log10((density_primary+density_secondary)/(2*density_ambient[id])) + \
+            dspl_attenuation + 20*np.log10(Diameter_primary/r)
+        DSPL_s = dspl_ambient_pressure + 20*np.log10((density_secondary+density_ambient[id])/(2*density_ambient[id])) + \
+            dspl_attenuation + 20*np.log10(Diameter_mixed/r)
+        DSPL_m = dspl_ambient_pressure + 20*np.log10((density_mixed+density_ambient[id])/(2*density_ambient[id])) + \
+            dspl_attenuation + 20*np.log10(Diameter_mixed/r)
+
+        ATK_m   = angle_of_attack_effect(AOA,Mach_aircraft,theta_m)
+        INST_s  = jet_installation_effect(turbofan.geometry_xe,turbofan.geometry_ye,turbofan.geometry_Ce,theta_s,Diameter_mixed)
+        Plug    = external_plug_effect(V_p,V_s,Velocity_mixed,Diameter_primary,Diameter_secondary,Diameter_mixed,
+                                       turbofan.plug_diameter,a,theta_p,theta_s,theta_m)
+        GPROX_m = ground_proximity_effect(Velocity_mixed,a,theta_m,turbofan.engine_height,Diameter_mixed,frequency)
+
+        # the primary component, one band at a time and without the highest band
+        sound_primary    = np.sqrt(1.4*R_gas*Temperature_primary[id])
+        Mach_primary_jet = V_p/sound_primary
+        for i in range(0,num_f-1):
+            if theta_p[i] <= 2.2:
+                velocity_exponent = 1.56
+            else:
+                velocity_exponent = 1.5*np.exp(-10*(theta_p[i] - 2.2)**2)
+            FV = Mach_primary_jet*(DVPS/a)**0.6*((V_p+V_s)/a)**0.4*(np.abs(V_p-Velocity_aircraft)/V_p)**velocity_exponent
+            Z1 = -18*((1.8*theta_p[i]/np.pi)-0.6)**2
+            Z2 = -18-18*((1.8*theta_p[i]/np.pi)-0.6)**2
+            Z4 = -0.1 - 0.75*((V_p-V_s-Velocity_aircraft)/a) * \
+                ((1.8*theta_p[i]/np.pi)-0.6)**3. + 0.8*(0.6-np.log10(1+Area_secondary/Area_primary))
+            Z5 = 50 + 20*np.exp(-(theta_p[i]-2.6)**2.)
+            Z6 = 94 + 46*np.exp(-(theta_p[i]-2.5)**2.) - 26.*(0.6-np.log10(1+Area_secondary/Area_primary))/ \
+                np.exp(5*(theta_p[i]-2.3)**2) + DSPL_p[i] + EX_p
+            SPL_p[i] = (Z1*np.log10(FV)+Z2) * (np.log10(Str_p[i])-Z4)**2 + Z5*np.log10(FV) + Z6
+        SPL_p = SPL_p + Plug.PG_p
+
+        SPL_s = secondary_noise_component(None,V_p,theta_s,a,V_s,Velocity_aircraft,Area_primary,Area_secondary,
+                                          DSPL_s,EX_s,Str_s) + Plug.PG_s + INST_s
+        SPL_m = mixed_noise_component(None,V_p,theta_m,a,V_s,Velocity_aircraft,Area_primary,Area_secondary,
+                                      DSPL_m,EX_m,Str_m,Velocity_mixed,XBPR) + Plug.PG_m + ATK_m + GPROX_m
+
+        SPL_total             = 10 * np.log10(10**(0.1*SPL_p)+10**(0.1*SPL_s)+10**(0.1*SPL_m))
+        SPL_total_history[id] = SPL_total
+        SPLt_dBA_max[id]      = max(dbA_noise(SPL_total))
+
+    results              = Data()
+    results.SPL_spectrum = SPL_total_history
+    results.SPL_dBA      = SPLt_dBA_max
+
+    return results
+
+def step_source_angle(theta_j,theta,distance,tolerance,source_location,XJ=None):
+    """ Converges the polar angle of one source, starting from the last angle. """
+
+    def polar_angle(XJ):
+        B = (1./np.sin(theta))*((XJ/distance)+np.cos(theta))
+        if B>=0.:
+            return np.arcsin(((B)**2.+1.)**(-0.5))
+        return np.pi-np.arcsin(((B)**2.+1.)**(-0.5))
+
+    if XJ is None:
+        XJ = source_location(theta_j)
+    theta_j  = polar_angle(XJ)
+    XJ       = source_location(theta_j)
+    residual = 2*tolerance
+    while residual > tolerance:
+        XJ_old   = XJ
+        theta_j  = (theta_j + polar_angle(XJ))/2.
+        XJ       = source_location(theta_j)
+        residual = np.abs(XJ_old-XJ)
+
+    return theta_j
+
+if __name__ == '__main__':
+    main()
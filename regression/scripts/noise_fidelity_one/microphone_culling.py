@@ -0,0 +1,114 @@
+# microphone_culling.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+from SUAVE.Components.Energy.Networks.Battery_Propeller                                       import Battery_Propeller
+from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.compute_airfoil_properties  import compute_airfoil_properties
+from SUAVE.Methods.Noise.Fidelity_One.Propeller.propeller_mid_fidelity                        import propeller_mid_fidelity
+from SUAVE.Methods.Noise.Fidelity_One.Propeller.propeller_mid_fidelity_culled                 import propeller_mid_fidelity_culled
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.generate_microphone_points                  import generate_ground_microphone_points
+from SUAVE.Analyses.Mission.Segments.Conditions                                               import Aerodynamics
+from SUAVE.Analyses.Mission.Segments.Segment                                                  import Segment
+import numpy as np
+import time
+import sys
+
+sys.path.append('../Vehicles/Propellers')
+
+from F8745_D4_Propeller  import F8745_D4_Propeller
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    net                                = Battery_Propeller()
+    net.number_of_propeller_engines    = 1
+    prop                               = F8745_D4_Propeller()
+    net.identical_propellers           = True
+    net.propellers.append(prop)
+
+    # broadband noise needs the boundary layer of the blade airfoil
+    airfoil        = prop.Airfoils[list(prop.Airfoils.keys())[0]]
+    airfoil.polars = compute_airfoil_properties(airfoil.geometry,airfoil.polar_files,boundary_layer_calcs=True)
+
+    # one flight condition
+    ctrl_pts                                               = 1
+    conditions                                             = Aerodynamics()
+    conditions.freestream.density                          = np.ones((ctrl_pts,1)) * 1.2250
+    conditions.freestream.dynamic_viscosity                = np.ones((ctrl_pts,1)) * 1.81E-5
+    conditions.freestream.speed_of_sound                   = np.ones((ctrl_pts,1)) * 343.376
+    conditions.freestream.temperature                      = np.ones((ctrl_pts,1)) * 288.16889478
+    conditions.frames.inertial.velocity_vector             = np.array([[77.2, 0. ,0.]])
+    conditions.propulsion.throttle                         = np.ones((ctrl_pts,1))*1.0
+    conditions.frames.body.transform_to_inertial           = np.array([[[1., 0., 0.],[0., 1., 0.],[0., 0., 1.]]])
+    prop.inputs.omega                                      = np.ones((ctrl_pts,1)) * 2390 * Units.rpm
+    prop.inputs.y_axis_rotation                            = np.ones_like(prop.inputs.omega)
+    F, Q, P, Cp , noise_data , etap                        = prop.spin(conditions)
+
+    # ground microphones under a rotor flying at 100 m
+    ground_mics                                            = generate_ground_microphone_points(-8000,8000,-4000,4000,20,10)
+    aircraft                                               = np.array([0.,0.,100.])
+    conditions.noise.total_microphone_locations            = (aircraft - ground_mics)[np.newaxis,:,:]
+    conditions.aerodynamics.angle_of_attack                = np.ones((ctrl_pts,1))* 0. * Units.degrees
+    segment                                                = Segment()
+    segment.state.conditions                               = conditions
+    segment.state.conditions.expand_rows(ctrl_pts)
+
+    noise                                      = SUAVE.Analyses.Noise.Fidelity_One()
+    settings                                   = noise.settings
+    settings.microphone_culling_floor          = 45.
+
+    t0          = time.time()
+    culled      = propeller_mid_fidelity_culled(net.propellers,noise_data,segment,settings)
+    t1          = time.time()
+    full        = microphone_by_microphone(net.propellers,noise_data,segment,settings)
+    t2          = time.time()
+
+    culling     = culled.microphone_culling
+    print('Microphones evaluated : ' + str(culling.number_evaluated) + ' of ' + str(culling.number_of_microphones))
+    print('Evaluations saved     : ' + str(culling.evaluation_savings))
+    print('Culled   : ' + str(t1-t0) + ' s')
+    print('Full grid: ' + str(t2-t1) + ' s')
+
+    keep = culling.SPL_estimate >= settings.microphone_culling_floor
+    assert(culling.number_culled > 0)
+    assert(culling.number_evaluated == np.sum(keep))
+
+    # the evaluated microphones do not change with the batches
+    for key in ['SPL','SPL_dBA','SPL_1_3_spectrum','SPL_harmonic_bpf_spectrum']:
+        error = np.max(np.abs(culled[key][:,keep] - full[key][:,keep]))
+        print(key + ' difference: ' + str(error))
+        assert(error < 1E-10)
+
+    # the culled microphones are below the floor and are zero
+    print('Loudest culled microphone: ' + str(np.max(full.SPL[:,~keep])) + ' dB')
+    assert(np.max(full.SPL[:,~keep]) < settings.microphone_culling_floor)
+    assert(np.all(culled.SPL[:,~keep] == 0.))
+
+    # the estimate bounds every evaluated microphone
+    assert(np.all(culling.SPL_estimate[keep] >= np.max(full.SPL[:,keep],axis=0)))
+
+    return
+
+def microphone_by_microphone(rotors,noise_data,segment,settings):
+    """ Every microphone evaluated on its own, kept for comparison. """
+
+    microphone_locations = segment.state.conditions.noise.total_microphone_locations
+    results = [propeller_mid_fidelity(rotors,noise_data,segment,settings,microphone_locations[:,i:i+1,:])
+               for i in range(len(microphone_locations[0]))]
+    full = SUAVE.Core.Data()
+    for key in ['SPL','SPL_dBA','SPL_1_3_spectrum','SPL_harmonic_bpf_spectrum']:
+        full[key] = np.concatenate([res[key] for res in results],axis=1)
+
+    return full
+
+if __name__ == '__main__':
+    main()
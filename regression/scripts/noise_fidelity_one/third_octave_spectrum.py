@@ -0,0 +1,56 @@
+# third_octave_spectrum.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import SPL_arithmetic
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.SPL_harmonic_to_third_octave import SPL_harmonic_to_third_octave
+import numpy as np
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    settings = SUAVE.Analyses.Noise.Fidelity_One().settings
+
+    # blade passing harmonics of rotors at different speeds
+    np.random.seed(0)
+    ctrl_pts, mics, props, harmonics = 6, 20, 2, 200
+    f   = np.arange(1,harmonics + 1)[None,:]*np.random.uniform(40,120,(ctrl_pts,1))
+
+    # a harmonic on the edge between two bands, and frequencies in decreasing order
+    f[0,3] = settings.upper_frequencies[5]
+    f[1]   = np.sort(np.random.uniform(10,30000,harmonics))[::-1]
+    SPL    = np.random.uniform(0,100,(ctrl_pts,mics,props,harmonics))
+
+    SPL_third_octave     = SPL_harmonic_to_third_octave(SPL,f,settings)
+    SPL_third_octave_ref = harmonic_to_third_octave_loop(SPL,f,settings)
+
+    error = np.max(np.abs(SPL_third_octave - SPL_third_octave_ref))
+    print('1/3 octave spectrum difference: ' + str(error) + ' dB')
+    assert(error < 1E-10)
+
+    return
+
+def harmonic_to_third_octave_loop(SPL,f,settings):
+    """ Sums the harmonics of each band one by one, kept for comparison. """
+
+    lf               = settings.lower_frequencies
+    uf               = settings.upper_frequencies
+    SPL_third_octave = np.zeros(SPL.shape[:3] + (len(lf),))
+    for i in range(len(f)):
+        for j in range(len(lf)):
+            in_range = (lf[j] <= f[i]) & (f[i] <= uf[j])
+            if np.any(in_range):
+                SPL_third_octave[i,:,:,j] = SPL_arithmetic(SPL[i][:,:,in_range])
+
+    return SPL_third_octave
+
+if __name__ == '__main__':
+    main()
@@ -58,6 +58,20 @@ def main():
 
 def check_results(new_results):
 
+    # ranges of the secant iterations on the cruise distance, which stopped once the landing weight was within 1 kg
+    secant_ranges = np.array([0., 3588531.995782152, 4497258.56405198, 5416286.485449738])
+
+    # 1 kg of fuel is worth about 500 m of cruise at the E190 specific range
+    error = np.max(np.abs(np.array(new_results.range) - secant_ranges))
+    print('Range difference to the secant iterations (m): ' + str(error))
+    assert error < 500.
+
+    # and the landing weight residual converges the ranges to well below that
+    ranges = np.array([0., 3588345.8982496136, 4497689.979316727, 5416679.757341804])
+    error  = np.max(np.abs(np.array(new_results.range) - ranges)/np.maximum(ranges,1.))
+    print('Range error: ' + str(error))
+    assert error < 1e-6
+
     return
 
 
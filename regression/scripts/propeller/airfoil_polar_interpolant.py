@@ -0,0 +1,133 @@
+# airfoil_polar_interpolant.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+from SUAVE.Core.Utilities import interp2d
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.BET_calculations import compute_airfoil_aerodynamics, \
+     interpolate_airfoil_polars, fuse_airfoil_polars, compile_rotor_airfoil_polars
+from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.import_airfoil_geometry \
+     import import_airfoil_geometry
+from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.compute_airfoil_properties \
+     import compute_airfoil_properties
+import numpy as np
+import time
+import copy
+import os
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    ospath    = os.path.abspath(__file__)
+    separator = os.path.sep
+    rel_path  = os.path.dirname(ospath) + separator + '..' + separator + 'Vehicles' + separator + 'Airfoils' + separator
+
+    # two airfoils on the same polar grid and one on a different grid
+    airfoils = SUAVE.Core.ContainerOrdered()
+    for name, Re_vals in [('Clark_y',[50000,100000,200000,500000,1000000]),
+                          ('NACA_63_412',[50000,100000,200000,500000,1000000]),
+                          ('NACA_4412',[100000,200000,500000,1000000,3500000])]:
+        airfoil             = SUAVE.Components.Airfoils.Airfoil()
+        airfoil.tag         = name
+        airfoil.polar_files = [rel_path + 'Polars' + separator + name + '_polar_Re_' + str(Re) + '.txt' for Re in Re_vals]
+        airfoil.geometry    = import_airfoil_geometry(rel_path + name + '.txt',airfoil.number_of_points)
+        airfoil.polars      = compute_airfoil_properties(airfoil.geometry,airfoil.polar_files)
+        airfoils.append(airfoil)
+
+    # blade sections, including some outside of the polars
+    ctrl_pts, Nr, Na = 8, 30, 24
+    np.random.seed(0)
+    Re    = 10**np.random.uniform(4.5,6.8,(ctrl_pts,Nr,Na))
+    alpha = np.random.uniform(-30,30,(ctrl_pts,Nr,Na))*Units.degrees
+
+    for a_loc in [list(np.repeat([0,1],Nr//2)),list(np.repeat([0,1,2],Nr//3))]:
+        for use_2d_analysis in [True,False]:
+            Re_i    = Re    if use_2d_analysis else Re[:,:,0]
+            alpha_i = alpha if use_2d_analysis else alpha[:,:,0]
+
+            Cl, Cdval         = interpolate_airfoil_polars(airfoils,a_loc,Re_i,alpha_i)
+            Cl_ref, Cdval_ref = section_polars(airfoils,a_loc,Re_i,alpha_i)
+
+            Cl_error = np.max(np.abs(Cl - Cl_ref))
+            Cd_error = np.max(np.abs(Cdval - Cdval_ref))
+            print('airfoils: ' + str(len(set(a_loc))) + ', 2d: ' + str(use_2d_analysis) + ', Cl difference: ' + str(Cl_error) + ', Cd difference: ' + str(Cd_error))
+            assert(Cl_error < 1E-12)
+            assert(Cd_error < 1E-12)
+
+    # the fused table is kept on the rotor, and rebuilt when the polars change
+    rotor                        = SUAVE.Components.Energy.Converters.Rotor()
+    rotor.Airfoils               = airfoils
+    rotor.airfoil_polar_stations = a_loc
+    interpolant = airfoils.clark_y.polar_interpolant
+    fused       = compile_rotor_airfoil_polars(rotor)
+    assert(rotor.fused_polar_interpolant is fused)
+    assert(compile_rotor_airfoil_polars(rotor) is fused)
+    assert(airfoils.clark_y.polar_interpolant is interpolant)
+    airfoils.clark_y.polars = compute_airfoil_properties(airfoils.clark_y.geometry,airfoils.clark_y.polar_files)
+    Cl, Cdval = interpolate_airfoil_polars(airfoils,a_loc,Re,alpha,compile_rotor_airfoil_polars(rotor))
+    assert(airfoils.clark_y.polar_interpolant is not interpolant)
+    assert(rotor.fused_polar_interpolant is not fused)
+    Cl_ref, Cdval_ref = section_polars(airfoils,a_loc,Re,alpha)
+    assert(np.max(np.abs(Cl - Cl_ref)) < 1E-12)
+
+    # a copy of the rotor keeps its table, and a table of other airfoils is not reused
+    other = copy.deepcopy(rotor)
+    assert(compile_rotor_airfoil_polars(other) is other.fused_polar_interpolant)
+    assert(other.fused_polar_interpolant is not rotor.fused_polar_interpolant)
+    assert(fuse_airfoil_polars(list(airfoils)[:2],rotor.fused_polar_interpolant) is not rotor.fused_polar_interpolant)
+    assert(fuse_airfoil_polars(other.Airfoils,rotor.fused_polar_interpolant) is not rotor.fused_polar_interpolant)
+
+    # without polar stations there is no table
+    rotor.airfoil_polar_stations = None
+    assert(compile_rotor_airfoil_polars(rotor) is None)
+
+    # rotor spin lookups
+    beta = np.zeros((ctrl_pts,Nr,Na))
+    Wa   = Re*1.5E-5/0.1*np.sin(alpha)
+    Wt   = Re*1.5E-5/0.1*np.cos(alpha)
+    args = (beta,0.1,None,None,None,Wa,Wt,340.,1.5E-5,airfoils,a_loc,ctrl_pts,Nr,Na,None,True)
+    Cl, Cdval, alpha_s, _, W = compute_airfoil_aerodynamics(*args)
+    Cl_ref, Cdval_ref  = section_polars(airfoils,a_loc,W*0.1/1.5E-5,alpha_s)
+    Cl_ref[Cl_ref==0]  = 1e-6
+    assert(np.max(np.abs(Cl - Cl_ref)) < 1E-12)
+    assert(np.max(np.abs(Cdval - Cdval_ref)) < 1E-12)
+
+    number = 20
+    fused  = fuse_airfoil_polars(airfoils)
+    t0     = time.time()
+    for i in range(number):
+        interpolate_airfoil_polars(airfoils,a_loc,Re,alpha,fused)
+    t1     = time.time()
+    for i in range(number):
+        section_polars(airfoils,a_loc,Re,alpha)
+    t2     = time.time()
+    print('Interpolant    : ' + str((t1-t0)/number) + ' s per lookup')
+    print('Airfoil by airfoil: ' + str((t2-t1)/number) + ' s per lookup')
+
+    return
+
+def section_polars(airfoils,a_loc,Re,alpha):
+    """ The lookup of each airfoil over all sections, kept for comparison. """
+
+    Cl    = np.zeros_like(Re)
+    Cdval = np.zeros_like(Re)
+    for jj,airfoil in enumerate(airfoils):
+        pd              = airfoil.polars
+        Cl_af           = interp2d(Re,alpha,pd.reynolds_numbers, pd.angle_of_attacks, pd.lift_coefficients)
+        Cdval_af        = interp2d(Re,alpha,pd.reynolds_numbers, pd.angle_of_attacks, pd.drag_coefficients)
+        locs            = np.where(np.array(a_loc) == jj )
+        Cl[:,locs]      = Cl_af[:,locs]
+        Cdval[:,locs]   = Cdval_af[:,locs]
+
+    return Cl, Cdval
+
+if __name__ == '__main__':
+    main()
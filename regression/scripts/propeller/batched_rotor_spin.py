@@ -0,0 +1,78 @@
+# batched_rotor_spin.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+from SUAVE.Methods.Propulsion import spin_rotors
+from SUAVE.Analyses.Mission.Segments.Conditions import Aerodynamics
+import numpy as np
+import copy
+import time
+import sys
+
+sys.path.append('../Vehicles/Propellers')
+
+from F8745_D4_Propeller     import F8745_D4_Propeller
+from APC_11x4_Propeller     import APC_11x4_Propeller
+from APC_10x7_thin_electric import propeller_geometry
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    # the networks spin their props one at a time unless asked for
+    assert not SUAVE.Components.Energy.Networks.Battery_Propeller().batched_propeller_spin
+
+    # three different propellers
+    props = [F8745_D4_Propeller(),APC_11x4_Propeller(),propeller_geometry()]
+    rpms  = [2400.,6000.,7000.]
+
+    for V in [1E-6,20.,40.]:
+        ctrl_pts   = 6
+        conditions = flight_conditions(ctrl_pts,V)
+        for prop, rpm in zip(props,rpms):
+            prop.inputs.omega = np.linspace(rpm,1.1*rpm,ctrl_pts)[:,None]*Units.rpm
+
+        t0      = time.time()
+        batched = spin_rotors(props,conditions)
+        t1      = time.time()
+        single  = [copy.deepcopy(prop).spin(conditions) for prop in props]
+        t2      = time.time()
+
+        print('V = ' + str(V) + ' m/s, batched: ' + str(t1-t0) + ' s, rotor by rotor: ' + str(t2-t1) + ' s')
+        for prop, res_batched, res_single in zip(props,batched,single):
+            for key in ['thrust_coefficient','torque_coefficient','disc_axial_induced_velocity','disc_circulation']:
+                ref   = res_single[4][key]
+                error = np.max(np.abs(res_batched[4][key] - ref))/np.maximum(np.max(np.abs(ref)),1E-12)
+                print('    ' + prop.tag + ' ' + key + ' difference: ' + str(error))
+                assert(error < 1E-6)
+
+            # the outputs are stored on each rotor
+            assert(prop.outputs is res_batched[4])
+
+    return
+
+def flight_conditions(ctrl_pts,V):
+    """ Sea level conditions in axial flight. """
+
+    conditions                                   = Aerodynamics()
+    conditions.expand_rows(ctrl_pts)
+    conditions.freestream.density                = np.ones((ctrl_pts,1)) * 1.2250
+    conditions.freestream.dynamic_viscosity      = np.ones((ctrl_pts,1)) * 1.81E-5
+    conditions.freestream.speed_of_sound         = np.ones((ctrl_pts,1)) * 343.376
+    conditions.freestream.temperature            = np.ones((ctrl_pts,1)) * 288.16889478
+    conditions.frames.inertial.velocity_vector   = np.array([[V,0.,0.]])*np.ones((ctrl_pts,1))
+    conditions.propulsion.throttle               = np.ones((ctrl_pts,1))
+    conditions.frames.body.transform_to_inertial = np.repeat(np.eye(3)[None,:,:],ctrl_pts,axis=0)
+
+    return conditions
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+# rotor_wake_reuse.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" spins the APC 10x7 propeller with the Fidelity One wake reused between spins, and checks the reused, the missed
+    and the seeded wakes against cold solves
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+from SUAVE.Analyses.Propulsion.Rotor_Wake_Fidelity_One import Rotor_Wake_Fidelity_One
+
+import numpy as np
+import importlib
+import copy
+import sys
+
+sys.path.append('../Vehicles/Propellers')
+
+from APC_10x7_thin_electric import propeller_geometry
+from batched_rotor_spin     import flight_conditions
+
+# the module, not the function of the same name
+convergence_module = importlib.import_module('SUAVE.Methods.Propulsion.Rotor_Wake.Fidelity_One.fidelity_one_wake_convergence')
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # off unless asked for
+    prop      = propeller_geometry()
+    prop.Wake = Rotor_Wake_Fidelity_One()
+    prop.Wake.wake_settings.number_rotor_rotations      = 2
+    prop.Wake.wake_settings.number_steps_per_rotation   = 24
+    spin(prop,10.,7000.)
+    assert prop.Wake.converged_wake is None
+
+    prescribed_test()
+    semi_prescribed_test()
+
+    return
+
+def prescribed_test():
+
+    prop = setup_propeller(False)
+
+    # the first spin has nothing to reuse
+    outputs, shapes = spin(prop,10.,7000.)
+    assert shapes == 2
+    check_results(outputs,cold_spin(prop,10.,7000.),0.)
+
+    # the same spin again reuses the wake
+    outputs, shapes = spin(prop,10.,7000.)
+    assert shapes == 0
+    check_results(outputs,cold_spin(prop,10.,7000.),0.)
+
+    # a different speed misses, and the prescribed wake does not start from the last one
+    outputs, shapes = spin(prop,12.,7000.)
+    assert shapes == 2
+    check_results(outputs,cold_spin(prop,12.,7000.),0.)
+
+    return
+
+def semi_prescribed_test():
+
+    # a converged wake is kept as the last shape of the loop, without generating it again
+    prop = setup_propeller(True)
+    outputs, shapes = spin(prop,10.,7000.)
+    cold = setup_propeller(True)
+    cold.Wake.reuse_converged_wake = False
+    cold, cold_shapes = spin(cold,10.,7000.)
+    assert shapes == cold_shapes - 1
+    check_results(outputs,cold,1e-3)
+
+    # a 2% faster rotor starts from the inflow of the last wake
+    outputs, shapes = spin(prop,10.,7140.)
+    cold,    cold_shapes = spin(setup_propeller(True),10.,7140.)
+    print('wake shapes, seeded: ' + str(shapes) + ', cold: ' + str(cold_shapes))
+    assert shapes < cold_shapes
+
+    # both converged on the inflow to within the tolerance
+    check_results(outputs,cold,1e-3)
+
+    # and the seeded wake is reused as is
+    again, shapes = spin(prop,10.,7140.)
+    assert shapes == 0
+    check_results(again,outputs,0.)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def setup_propeller(semi_prescribed):
+
+    prop      = propeller_geometry()
+    prop.Wake = Rotor_Wake_Fidelity_One()
+    prop.Wake.semi_prescribed_converge                  = semi_prescribed
+    prop.Wake.reuse_converged_wake                      = True
+    prop.Wake.wake_settings.number_rotor_rotations      = 2
+    prop.Wake.wake_settings.number_steps_per_rotation   = 24
+
+    return prop
+
+def spin(prop,V,rpm):
+
+    # count the wake shapes generated
+    generate_wake_shape = convergence_module.generate_fidelity_one_wake_shape
+    shapes = []
+    def counting_wake_shape(*args):
+        shapes.append(1)
+        return generate_wake_shape(*args)
+
+    conditions        = flight_conditions(1,V)
+    prop.inputs.omega = np.array([[rpm]])*Units.rpm
+
+    convergence_module.generate_fidelity_one_wake_shape = counting_wake_shape
+    try:
+        outputs = copy.deepcopy(prop.spin(conditions)[4])
+    finally:
+        convergence_module.generate_fidelity_one_wake_shape = generate_wake_shape
+
+    return outputs, len(shapes)
+
+def cold_spin(prop,V,rpm):
+
+    prop = copy.deepcopy(prop)
+    prop.Wake.reuse_converged_wake = False
+    prop.Wake.converged_wake       = None
+
+    return spin(prop,V,rpm)[0]
+
+def check_results(outputs,cold,tolerance):
+
+    for key in ['thrust_coefficient','torque_coefficient','disc_axial_induced_velocity','disc_circulation']:
+        error = np.max(np.abs(outputs[key] - cold[key]))/np.max(np.abs(cold[key]))
+        print(key, error)
+        assert error <= tolerance
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+# wake_induced_velocity_blocks.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+from SUAVE.Methods.Propulsion.Rotor_Wake.Fidelity_One.compute_wake_induced_velocity import compute_wake_induced_velocity
+import numpy as np
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    # a wake of 3 blades, 9 rings per blade and 40 time steps at 3 control points
+    Na, ctrl_pts, B, Nr, nts = 4, 3, 3, 9, 40
+    np.random.seed(1)
+
+    WD               = Data()
+    WD.reshaped_wake = Data()
+    WD.reshaped_wake.XA1 = np.zeros((Na,ctrl_pts,B,Nr,nts))
+    for key in ['XA1','YA1','ZA1','XA2','YA2','ZA2','XB1','YB1','ZB1','XB2','YB2','ZB2','GAMMA']:
+        WD[key] = np.random.randn(Na,ctrl_pts,B*Nr*nts)
+
+    # evaluation points on a lifting surface
+    VD      = Data()
+    VD.n_cp = 500
+    VD.XC   = np.random.randn(VD.n_cp)
+    VD.YC   = np.random.randn(VD.n_cp)
+    VD.ZC   = np.random.randn(VD.n_cp)
+
+    # all evaluation points in one block
+    V_ind_truth = compute_wake_induced_velocity(WD,VD,ctrl_pts,azi_start_idx=2,block_size=VD.n_cp)
+
+    # the blocks give the same velocities
+    for block_size in [None,1,37]:
+        V_ind = compute_wake_induced_velocity(WD,VD,ctrl_pts,azi_start_idx=2,block_size=block_size)
+        error = np.max(np.abs(V_ind - V_ind_truth))
+        print('Block size ' + str(block_size) + ', difference: ' + str(error))
+        assert(error < 1E-12)
+
+    return
+
+if __name__ == '__main__':
+    main()
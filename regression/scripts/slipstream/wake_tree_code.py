@@ -0,0 +1,78 @@
+# wake_tree_code.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+from SUAVE.Methods.Propulsion.Rotor_Wake.Fidelity_One.compute_wake_induced_velocity import compute_wake_induced_velocity
+from SUAVE.Methods.Propulsion.Rotor_Wake.Fidelity_One.tree_code_induced_velocity import tree_code_induced_velocity
+import numpy as np
+import time
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    # a helical wake of 3 blades, 12 rings per blade and two rotations
+    ctrl_pts = 2
+    WD       = helical_wake(2,ctrl_pts,3,12,48)
+
+    # evaluation points on a wing behind the rotor
+    y       = np.linspace(-2,2,200)
+    VD      = Data()
+    VD.XC   = np.tile(0.5 + 0*y,2)
+    VD.YC   = np.tile(y,2)
+    VD.ZC   = np.concatenate([0.05 + 0*y,-0.3 + 0*y])
+    VD.n_cp = len(VD.XC)
+
+    t0          = time.time()
+    V_ind_truth = compute_wake_induced_velocity(WD,VD,ctrl_pts,azi_start_idx=1)
+    print('Direct sum: ' + str(round(time.time() - t0,3)) + ' s')
+
+    # without far clusters the tree code is the direct sum
+    V_ind = tree_code_induced_velocity(WD,VD,ctrl_pts,azi_start_idx=1,tolerance=0.)
+    error = np.max(np.abs(V_ind - V_ind_truth))/np.max(np.abs(V_ind_truth))
+    print('Tolerance 0, difference: ' + str(error))
+    assert(error < 1E-12)
+
+    # the error shrinks with the tolerance
+    for tolerance, max_error in [(0.1,5E-4),(0.3,5E-3),(0.5,1E-2)]:
+        t0    = time.time()
+        V_ind = tree_code_induced_velocity(WD,VD,ctrl_pts,azi_start_idx=1,tolerance=tolerance)
+        error = np.max(np.abs(V_ind - V_ind_truth))/np.max(np.abs(V_ind_truth))
+        print('Tolerance ' + str(tolerance) + ', difference: ' + str(error) + ', ' + str(round(time.time() - t0,3)) + ' s')
+        assert(error < max_error)
+
+    return
+
+def helical_wake(Na,ctrl_pts,B,Nr,nts,R=1.,pitch=0.3):
+    """ A prescribed helical wake of rings with an elliptic circulation along the blade. """
+
+    shape = (Na,ctrl_pts,B,Nr,nts)
+    r     = np.linspace(0.2,1.,Nr + 1)*R
+    psi   = np.linspace(0.,2*np.pi*nts/24,nts + 1)
+
+    WD                   = Data()
+    WD.reshaped_wake     = Data()
+    WD.reshaped_wake.XA1 = np.zeros(shape)
+    for corner, (i_r, i_t) in [('A1',(0,0)),('B1',(1,0)),('A2',(0,1)),('B2',(1,1))]:
+        radius = r[i_r:i_r + Nr][None,None,None,:,None]
+        angle  = psi[i_t:i_t + nts][None,None,None,None,:] + 2*np.pi*np.arange(B)[None,None,:,None,None]/B \
+            + 0.1*np.arange(Na)[:,None,None,None,None]
+        X      = pitch*angle/(2*np.pi) + 0.01*np.arange(ctrl_pts)[None,:,None,None,None] + 0*radius
+        WD['X' + corner] = np.reshape(np.broadcast_to(X,shape),(Na,ctrl_pts,-1))
+        WD['Y' + corner] = np.reshape(np.broadcast_to(radius*np.cos(angle),shape),(Na,ctrl_pts,-1))
+        WD['Z' + corner] = np.reshape(np.broadcast_to(radius*np.sin(angle),shape),(Na,ctrl_pts,-1))
+
+    GAMMA    = np.sin(np.pi*(np.arange(Nr) + 0.5)/Nr)[None,None,None,:,None]
+    WD.GAMMA = np.reshape(np.broadcast_to(GAMMA,shape),(Na,ctrl_pts,-1))
+
+    return WD
+
+if __name__ == '__main__':
+    main()
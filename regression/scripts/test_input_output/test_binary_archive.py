@@ -0,0 +1,123 @@
+# test_binary_archive.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data
+import numpy as np
+import time
+import os
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    results = results_tree()
+
+    SUAVE.Input_Output.SUAVE.archive(results,'binary_archive_test.res')
+    SUAVE.Input_Output.SUAVE.archive_binary(results,'binary_archive_test.bin')
+    json_results   = SUAVE.Input_Output.SUAVE.load('binary_archive_test.res')
+
+    # the binary archive loads the same data structure as the JSON archive
+    for mmap_mode in ['r',None]:
+        binary_results = SUAVE.Input_Output.SUAVE.load_binary('binary_archive_test.bin',mmap_mode=mmap_mode)
+        compare(json_results,binary_results)
+        compare(results,binary_results)
+
+    # arrays keep their type and are plain numpy arrays
+    binary_results = SUAVE.Input_Output.SUAVE.load_binary('binary_archive_test.bin')
+    assert(type(binary_results.segments.cruise.conditions.flags) == np.ndarray)
+    assert(binary_results.segments.cruise.conditions.flags.dtype == bool)
+    assert(binary_results.segments.cruise.conditions.counts.dtype == np.int32)
+    assert(binary_results.segments.cruise.conditions.empty.shape == (0,3))
+
+    # a loaded binary archive can be archived again
+    SUAVE.Input_Output.SUAVE.archive(binary_results,'binary_archive_test.res')
+    compare(results,SUAVE.Input_Output.SUAVE.load('binary_archive_test.res'))
+
+    # single branches
+    branch = SUAVE.Input_Output.SUAVE.load_binary('binary_archive_test.bin','segments.climb.conditions')
+    compare(results.segments.climb.conditions,branch)
+    CL     = SUAVE.Input_Output.SUAVE.load_binary('binary_archive_test.bin','segments.climb.conditions.aerodynamics.lift_coefficient')
+    assert(np.all(CL == results.segments.climb.conditions.aerodynamics.lift_coefficient))
+    try:
+        SUAVE.Input_Output.SUAVE.load_binary('binary_archive_test.bin','segments.descent')
+        raise AssertionError('missing branch was loaded')
+    except KeyError:
+        pass
+
+    # a large result
+    results.segments.cruise.conditions.wake = np.random.rand(40,30,24,50)
+    t0 = time.time()
+    SUAVE.Input_Output.SUAVE.archive(results,'binary_archive_test.res')
+    t1 = time.time()
+    SUAVE.Input_Output.SUAVE.load('binary_archive_test.res')
+    t2 = time.time()
+    SUAVE.Input_Output.SUAVE.archive_binary(results,'binary_archive_test.bin')
+    t3 = time.time()
+    wake = SUAVE.Input_Output.SUAVE.load_binary('binary_archive_test.bin').segments.cruise.conditions.wake
+    t4 = time.time()
+    assert(np.all(wake == results.segments.cruise.conditions.wake))
+    print('JSON   archive: ' + str(t1-t0) + ' s, load: ' + str(t2-t1) + ' s, size: ' + str(os.path.getsize('binary_archive_test.res')) + ' bytes')
+    print('Binary archive: ' + str(t3-t2) + ' s, load: ' + str(t4-t3) + ' s, size: ' + str(os.path.getsize('binary_archive_test.bin')) + ' bytes')
+
+    del binary_results, branch, wake
+    os.remove('binary_archive_test.res')
+    os.remove('binary_archive_test.bin')
+
+    return
+
+def results_tree():
+    """ Mission like results with the data types that can be archived. """
+
+    results = Data()
+    results.tag      = 'results'
+    results.segments = Data()
+    for tag, n in [('climb',4),('cruise',6)]:
+        segment                                    = Data()
+        segment.tag                                = tag
+        segment.battery_energy                     = np.float64(1.5E7)
+        segment.number_of_points                   = n
+        segment.converged                          = True
+        segment.note                               = None
+        segment.conditions                         = Data()
+        segment.conditions.aerodynamics            = Data()
+        segment.conditions.aerodynamics.lift_coefficient = np.linspace(0.3,0.6,n)[:,None]
+        segment.conditions.aerodynamics.sectional_cl     = np.asfortranarray(np.random.rand(n,20))
+        segment.conditions.aerodynamics.spanwise_cl      = np.random.rand(20,n)[:,::2].T
+        segment.conditions.frames                  = Data()
+        segment.conditions.frames.position_vector  = np.random.rand(n,3)
+        segment.conditions.counts                  = np.arange(n,dtype=np.int32)
+        segment.conditions.flags                   = np.arange(n) > 1
+        segment.conditions.empty                   = np.zeros((0,3))
+        segment.conditions.tags                    = ['a','b']
+        results.segments[tag]                      = segment
+
+    return results
+
+def compare(a,b):
+    """ Checks that two data structures hold the same values. """
+
+    assert(list(a.keys()) == list(b.keys()))
+    for k in a.keys():
+        if isinstance(a[k],np.ndarray) or isinstance(a[k],list):
+            # the JSON archive does not keep the shape of empty arrays
+            if np.size(a[k]) == np.size(b[k]) == 0:
+                continue
+            assert(np.shape(a[k]) == np.shape(b[k]))
+            assert(np.all(np.array(a[k]) == np.array(b[k])))
+        elif hasattr(a[k],'keys'):
+            compare(a[k],b[k])
+        else:
+            assert(a[k] == b[k])
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -73,6 +73,8 @@ class AVL(Markup):
         settings.regression_flag                    = False   
         settings.trim_aircraft                      = False 
         settings.print_output                       = False   
+        settings.number_of_workers                  = 1
+        settings.result_cache_directory             = None
         
         settings.maximum_lift_coefficient           = np.inf  
         settings.side_slip_angle                    = 0.0
@@ -141,11 +143,13 @@ class AVL(Markup):
         rrc = self.settings.roll_rate_coefficient
         pra = self.settings.pitch_rate_coefficient
         lc  = self.settings.lift_coefficient              
+        nw  = self.settings.number_of_workers
+        rcd = self.settings.result_cache_directory
         
         self.process.compute.lift.inviscid.geometry = self.geometry
         
         # Generate the surrogate
-        self.process.compute.lift.inviscid.initialize(sv,cv,kf,srr,rf,po,ta,ssa,rrc,pra,lc)
+        self.process.compute.lift.inviscid.initialize(sv,cv,kf,srr,rf,po,ta,ssa,rrc,pra,lc,nw,rcd)
         
     finalize = initialize
     
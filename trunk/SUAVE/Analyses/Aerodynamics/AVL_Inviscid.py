@@ -24,6 +24,8 @@ from SUAVE.Methods.Aerodynamics.AVL.write_mass_file           import write_mass_
 from SUAVE.Methods.Aerodynamics.AVL.write_run_cases           import write_run_cases
 from SUAVE.Methods.Aerodynamics.AVL.write_input_deck          import write_input_deck
 from SUAVE.Methods.Aerodynamics.AVL.run_analysis              import run_analysis
+from SUAVE.Methods.Aerodynamics.AVL.run_analysis_pool         import run_analysis_pool
+from SUAVE.Methods.Aerodynamics.AVL.cache_results             import compute_cache_files
 from SUAVE.Methods.Aerodynamics.AVL.translate_data            import translate_conditions_to_cases, translate_results_to_conditions
 from SUAVE.Methods.Aerodynamics.AVL.purge_files               import purge_files
 from SUAVE.Methods.Aerodynamics.AVL.Data.Settings             import Settings
@@ -35,6 +37,7 @@ from SUAVE.Components.Wings.Control_Surfaces import Aileron , Elevator , Slat ,
 import os 
 import numpy as np
 import sys
+import tempfile
 from shutil import rmtree 
 from scipy.interpolate import  RectBivariateSpline 
 
@@ -89,6 +92,8 @@ class AVL_Inviscid(Aerodynamics):
         self.settings.pitch_rate_coefficient    = 0.0
         self.settings.lift_coefficient          = None
         self.settings.print_output              = False 
+        self.settings.number_of_workers         = 1      # AVL processes run at once in separate folders, None for all the cores
+        self.settings.result_cache_directory    = None   # directory where parsed AVL results are saved and reused, None turns the cache off
         
         # Regression Status
         self.settings.keep_files                = False
@@ -111,7 +116,8 @@ class AVL_Inviscid(Aerodynamics):
         self.surrogates                         = Data()
 
     def initialize(self,number_spanwise_vortices,number_chordwise_vortices,keep_files,save_regression_results,regression_flag,
-                   print_output,trim_aircraft,side_slip_angle,roll_rate_coefficient,pitch_rate_coefficient,lift_coefficient):
+                   print_output,trim_aircraft,side_slip_angle,roll_rate_coefficient,pitch_rate_coefficient,lift_coefficient,
+                   number_of_workers=1,result_cache_directory=None):
         """Drives functions to get training samples and build a surrogate.
 
         Assumptions:
@@ -142,6 +148,8 @@ class AVL_Inviscid(Aerodynamics):
         self.settings.roll_rate_coefficient     = roll_rate_coefficient 
         self.settings.pitch_rate_coefficient    = pitch_rate_coefficient
         self.settings.lift_coefficient          =  lift_coefficient
+        self.settings.number_of_workers         = number_of_workers
+        self.settings.result_cache_directory    = result_cache_directory
         
         self.tag     = 'avl_analysis_of_{}'.format(geometry.tag)  
         
@@ -262,10 +270,11 @@ class AVL_Inviscid(Aerodynamics):
         e  = np.zeros_like(CL)
         
         # remove old files in run directory
-        if os.path.exists('avl_files'):
+        if os.path.exists(run_folder):
             if not self.settings.regression_flag:
                 rmtree(run_folder)
                 
+        run_conditions_list = []
         for i,_ in enumerate(Mach):
             # Set training conditions
             run_conditions = Aerodynamics()
@@ -279,11 +288,15 @@ class AVL_Inviscid(Aerodynamics):
             run_conditions.aerodynamics.roll_rate_coefficient  = roll_rate_coefficient
             run_conditions.aerodynamics.lift_coefficient       = lift_coefficient
             run_conditions.aerodynamics.pitch_rate_coefficient = pitch_rate_coefficient
+            run_conditions_list.append(run_conditions)
             
+        #Run Analysis at AoA[i] and Mach[j]
+        if self.settings.number_of_workers != 1 and not self.settings.regression_flag:
+            results_list = self.evaluate_conditions_in_pool(run_conditions_list, trim_aircraft)
+        else:
+            results_list = [self.evaluate_conditions(run_conditions, trim_aircraft) for run_conditions in run_conditions_list]
             
-            #Run Analysis at AoA[i] and Mach[j]
-            results =  self.evaluate_conditions(run_conditions, trim_aircraft)
-            
+        for i,results in enumerate(results_list):
             # Obtain CD , CL and e
             CL[:,i] = results.aerodynamics.lift_coefficient[:,0]
             CD[:,i] = results.aerodynamics.drag_breakdown.induced.total[:,0]      
@@ -391,6 +404,98 @@ class AVL_Inviscid(Aerodynamics):
           cases
         """           
         
+        # unpack
+        run_folder   = os.path.abspath(self.settings.filenames.run_folder)
+        print_output = self.settings.print_output 
+        
+        # write the input files
+        cases = self.write_input_files(run_conditions, trim_aircraft, run_folder)
+
+        # RUN AVL!
+        with redirect.folder(run_folder,force=False):
+            results_avl = run_analysis(self,print_output)
+    
+        # translate results
+        results = translate_results_to_conditions(cases,results_avl)
+    
+        if not self.settings.keep_files:
+            rmtree( run_folder )
+            
+        return results
+
+    def evaluate_conditions_in_pool(self,run_conditions_list, trim_aircraft ):
+        """Writes the input files of each set of conditions in its own folder and runs AVL on them
+        concurrently.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        run_conditions_list <list of SUAVE data type> aerodynamic conditions, see evaluate_conditions
+
+        Outputs:
+        results_list        <list of SUAVE data type>
+
+        Properties Used:
+        self.settings.filenames.run_folder
+        self.settings.number_of_workers
+        """           
+        
+        # unpack
+        run_folder = os.path.abspath(self.settings.filenames.run_folder)
+            
+        # write the input files of each batch in a folder of its own, next to the run folder as 
+        # the airfoil files are found from the parent folder
+        batches = []
+        for run_conditions in run_conditions_list:
+            folder = tempfile.mkdtemp(prefix=os.path.basename(run_folder)+'_',dir=os.path.dirname(run_folder))
+            cases  = self.write_input_files(run_conditions, trim_aircraft, folder)
+            batches.append(Data(folder    = folder,
+                                deck_file = self.current_status.deck_file,
+                                features  = self.settings.filenames.features,
+                                cases     = cases))
+            
+        # RUN AVL!
+        results_avl = run_analysis_pool(self,batches,self.settings.number_of_workers)
+    
+        # translate results
+        results_list = [translate_results_to_conditions(batch.cases,res) for batch,res in zip(batches,results_avl)]
+            
+        return results_list
+        
+    def write_input_files(self,run_conditions, trim_aircraft, folder ):
+        """Writes the geometry, mass, run case and input deck files of a set of conditions in a 
+        folder.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        run_conditions <SUAVE data type> aerodynamic conditions, see evaluate_conditions
+        folder         <string> folder the files are written in
+
+        Outputs:
+        cases          <SUAVE data type> run cases, also stored in self.current_status.cases
+
+        Properties Used:
+        self.settings.filenames.
+          run_folder
+          output_template
+          batch_template
+          deck_template
+        self.current_status.
+          batch_index
+          batch_file
+          deck_file
+          cases
+        """           
+        
         # unpack
         run_folder                       = os.path.abspath(self.settings.filenames.run_folder)
         run_script_path                  = run_folder.rstrip('avl_files').rstrip('/')   
@@ -402,7 +507,7 @@ class AVL_Inviscid(Aerodynamics):
         dynamic_results_template_2       = self.settings.filenames.dynamic_output_template_2    # 'system_matrix_{}.dat'
         batch_template                   = self.settings.filenames.batch_template
         deck_template                    = self.settings.filenames.deck_template 
-        print_output                     = self.settings.print_output 
+        cache_directory                  = self.settings.result_cache_directory
  
         # rename defaul avl aircraft tag
         self.tag                         = 'avl_analysis_of_{}'.format(self.geometry.tag) 
@@ -458,20 +563,17 @@ class AVL_Inviscid(Aerodynamics):
             case.eigen_result_filename_1    = dynamic_results_template_1.format(case.tag)     # 'eigen_mode_{}.dat'
             case.eigen_result_filename_2    = dynamic_results_template_2.format(case.tag)     # 'system_matrix_{}.dat'
         
-        # write the input files
-        with redirect.folder(run_folder,force=False):
+        # write the input files, the paths are resolved before moving into the folder 
+        if cache_directory is not None:
+            cache_directory = os.path.abspath(cache_directory)
+        with redirect.folder(folder,force=False):
             write_geometry(self,run_script_path)
             write_mass_file(self,run_conditions)
             write_run_cases(self,trim_aircraft)
             write_input_deck(self, trim_aircraft,control_surfaces)
-
-            # RUN AVL!
-            results_avl = run_analysis(self,print_output)
-    
-        # translate results
-        results = translate_results_to_conditions(cases,results_avl)
-    
-        if not self.settings.keep_files:
-            rmtree( run_folder )
-            
-        return results
+        
+            # key the cases by their input files
+            if cache_directory is not None:
+                compute_cache_files(self,trim_aircraft,control_surfaces,cache_directory)
+ 
+        return cases
@@ -23,8 +23,10 @@ import SUAVE
 
 from SUAVE.Core import Data
 from SUAVE.Core import Units
+from SUAVE.Core import hash_data
  
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.VLM import VLM
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.generate_vortex_distribution import generate_vortex_distribution
 
 # local imports
 from .Aerodynamics import Aerodynamics
@@ -32,6 +34,7 @@ from SUAVE.Methods.Aerodynamics.Supersonic_Zero.Drag.Cubic_Spline_Blender import
 
 # package imports
 import numpy as np 
+import os
 from scipy.interpolate import RectBivariateSpline, RegularGridInterpolator
 
 # ----------------------------------------------------------------------
@@ -85,7 +88,21 @@ class Vortex_Lattice(Aerodynamics):
         self.settings.discretize_control_surfaces     = False
         self.settings.use_VORLAX_matrix_calculation   = False
         self.settings.floating_point_precision        = np.float32
+        self.settings.influence_matrix_memory_budget  = None
+        
+        # number of factored AIC matrices kept for reuse at the same Mach number, 0 turns the cache off
+        self.settings.influence_matrix_cache_size     = 0
+        self.settings.influence_matrix_cache          = None
+        
+        # number of vortex distributions kept for reuse on identical geometries, 0 turns the cache off. Each analysis
+        # starts its own cache, so for configs built from one base vehicle to reuse each other's vortex distributions
+        # set the same Data() as the vortex_distribution_cache of all of their analyses
+        self.settings.vortex_distribution_cache_size  = 0
+        self.settings.vortex_distribution_cache       = None
         self.settings.use_surrogate                   = True
+        
+        # directory where the training data is saved and reused, None turns the cache off
+        self.settings.training_cache_directory        = None
 
         # conditions table, used for surrogate model training
         self.training                                = Data()
@@ -399,6 +416,15 @@ class Vortex_Lattice(Aerodynamics):
         self.settings                 (passed to calculate vortex lattice)
         self.training.angle_of_attack [radians]
         """
+        # reuse the training data of an identical geometry
+        cache_file = self.training_cache_file()
+        if cache_file is not None and os.path.isfile(cache_file):
+            self.load_training(cache_file)
+            
+            # the vortex distribution is still packed into the geometry
+            generate_vortex_distribution(self.geometry,self.settings)
+            return
+        
         # unpack
         geometry      = self.geometry
         settings      = self.settings
@@ -479,6 +505,133 @@ class Vortex_Lattice(Aerodynamics):
         training.wing_drag_coefficient_sub    = CDi_w_sub        
         training.wing_drag_coefficient_sup    = CDi_w_sup
         
+        if cache_file is not None:
+            self.save_training(cache_file)
+        
+        return
+    
+    def training_cache_file(self):
+        """Finds the file that the training data of this geometry is cached in. The file is keyed by a hash of the
+        geometry, the settings and the training grid, so any change to them gives a new file.
+
+        Assumptions:
+        Only the wings, fuselages, nacelles, reference area and center of gravity of the geometry change the 
+        training data, plus the networks when the propeller wake is modeled
+
+        Source:
+        N/A
+
+        Inputs:
+        see properties used
+
+        Outputs:
+        cache_file                             [string], None if the cache is off
+
+        Properties Used:
+        self.geometry
+        self.settings
+        self.training.angle_of_attack          [radians]
+        self.training.Mach                     [-]
+        """
+        settings  = self.settings
+        directory = settings.training_cache_directory
+        if directory is None:
+            return None
+        
+        geometry = self.geometry
+        parts    = [geometry.wings, geometry.fuselages, geometry.nacelles, geometry.reference_area, \
+                    geometry.mass_properties.center_of_gravity]
+        if settings.propeller_wake_model:
+            parts.append(geometry.networks)
+        
+        # the settings which do not change the training data are left out
+        skip     = ['vortex_distribution','training_cache_directory','use_surrogate','influence_matrix_memory_budget',
+                    'influence_matrix_cache_size','influence_matrix_cache','vortex_distribution_cache_size',
+                    'vortex_distribution_cache']
+        vlm_settings = Data()
+        for key, value in settings.items():
+            if key not in skip:
+                vlm_settings[key] = value
+        
+        key = hash_data(parts,vlm_settings,self.training.angle_of_attack,self.training.Mach)
+        
+        return os.path.join(directory,'vortex_lattice_' + key + '.npz')
+    
+    def save_training(self,cache_file):
+        """Saves the training data to a numpy archive.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        cache_file                      [string]
+
+        Outputs:
+        None
+
+        Properties Used:
+        self.training.
+          lift_coefficient            [-] 
+          wing_lift_coefficient       [-] (wing specific)
+          drag_coefficient            [-] 
+          wing_drag_coefficient       [-] (wing specific)
+        """
+        training = self.training
+        arrays   = Data()
+        for key in ['lift_coefficient_sub','lift_coefficient_sup','drag_coefficient_sub','drag_coefficient_sup']:
+            arrays[key] = training[key]
+        for key in ['wing_lift_coefficient_sub','wing_lift_coefficient_sup','wing_drag_coefficient_sub','wing_drag_coefficient_sup']:
+            for wing, values in training[key].items():
+                arrays[key + '/' + wing] = values
+        
+        directory = os.path.dirname(cache_file)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory,exist_ok=True)
+        
+        # write to a temporary file first so that a process reading the cache never sees a partial file
+        temp_file = cache_file + '.' + str(os.getpid()) + '.tmp.npz'
+        np.savez(temp_file,**arrays)
+        os.replace(temp_file,cache_file)
+        
+        return
+    
+    def load_training(self,cache_file):
+        """Loads the training data saved by save_training.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        cache_file                      [string]
+
+        Outputs:
+        self.training.
+          lift_coefficient            [-] 
+          wing_lift_coefficient       [-] (wing specific)
+          drag_coefficient            [-] 
+          wing_drag_coefficient       [-] (wing specific)
+
+        Properties Used:
+        None
+        """
+        training = self.training
+        for key in ['wing_lift_coefficient_sub','wing_lift_coefficient_sup','wing_drag_coefficient_sub','wing_drag_coefficient_sup']:
+            training[key] = Data()
+        
+        with np.load(cache_file) as arrays:
+            for name in arrays.files:
+                if '/' in name:
+                    key, wing = name.split('/',1)
+                    training[key][wing] = arrays[name]
+                else:
+                    training[name] = arrays[name]
+        
         return
         
     def build_surrogate(self):
@@ -24,6 +24,10 @@ from SUAVE.Analyses.Mission.Segments.Conditions import Conditions
 from SUAVE.Core import Units
 from SUAVE.Core.Arrays import atleast_2d_col
 
+# properties the model is defined with, the fluid and the planet of an analysis are compared with them
+standard_air   = Air()
+standard_earth = Earth()
+
 
 # ----------------------------------------------------------------------
 #  Classes
@@ -106,19 +110,22 @@ class US_Standard_1976(Atmospheric):
         Rad       = self.planet.mean_radius
         R         = gas.gas_specific_constant
         delta_isa = temperature_deviation
+        z_breaks  = np.asarray(self.breaks.altitude)
+        T_breaks  = np.asarray(self.breaks.temperature)
+        p_breaks  = np.asarray(self.breaks.pressure)
         
         # check properties
-        if not gas == Air():
+        if not gas == standard_air:
             warn('US Standard Atmosphere not using Air fluid properties')
-        if not planet == Earth():
+        if not planet == standard_earth:
             warn('US Standard Atmosphere not using Earth planet properties')          
         
         # convert input if necessary
         zs = atleast_2d_col(zs)
 
         # get model altitude bounds
-        zmin = self.breaks.altitude[0]
-        zmax = self.breaks.altitude[-1]   
+        zmin = z_breaks[0]
+        zmax = z_breaks[-1]   
         
         # convert geometric to geopotential altitude
         zs = zs/(1 + zs/Rad)
@@ -131,30 +138,19 @@ class US_Standard_1976(Atmospheric):
             print("Warning: altitude requested above maximum for this atmospheric model; returning values for h = 86.0 km")   
             zs[zs > zmax] = zmax        
 
-        # initialize return data
-        zeros = np.zeros_like(zs)
-        p     = zeros * 0.0
-        T     = zeros * 0.0
-        rho   = zeros * 0.0
-        a     = zeros * 0.0
-        mu    = zeros * 0.0
-        z0    = zeros * 0.0
-        T0    = zeros * 0.0
-        p0    = zeros * 0.0
-        alpha = zeros * 0.0
-        
-        # populate the altitude breaks
-        # this uses >= and <= to capture both edges and because values should be the same at the edges
-        for i in range( len(self.breaks.altitude)-1 ): 
-            i_inside = (zs >= self.breaks.altitude[i]) & (zs <= self.breaks.altitude[i+1])
-            z0[ i_inside ]    = self.breaks.altitude[i]
-            T0[ i_inside ]    = self.breaks.temperature[i]
-            p0[ i_inside ]    = self.breaks.pressure[i]
-            alpha[ i_inside ] = -(self.breaks.temperature[i+1] - self.breaks.temperature[i])/ \
-                                 (self.breaks.altitude[i+1]    - self.breaks.altitude[i])
+        # find the layer of each altitude
+        # an altitude on a break is in the layer above it, except at the top, the values are the same on both sides
+        i_layer = np.searchsorted(z_breaks,zs,side='right') - 1
+        i_layer = np.minimum(np.maximum(i_layer,0),len(z_breaks)-2)
+        lapse   = -(T_breaks[1:] - T_breaks[:-1])/(z_breaks[1:] - z_breaks[:-1])
+        z0      = z_breaks[i_layer]
+        T0      = T_breaks[i_layer]
+        p0      = p_breaks[i_layer]
+        alpha   = lapse[i_layer]
         
         # interpolate the breaks
         dz = zs-z0
+        p  = np.zeros_like(zs)
         i_isoth = (alpha == 0.)
         i_adiab = (alpha != 0.)
         p[i_isoth] = p0[i_isoth] * np.exp(-1.*dz[i_isoth]*grav/(R*T0[i_isoth]))
@@ -114,6 +114,28 @@ class Container(ContainerBase):
             
         return results
     
+    def evaluate_parallel(self,number_of_processes=None):
+        """ Go through the missions concurrently in a pool of processes, save the results
+    
+            Assumptions:
+            The missions are independent of each other. Only the segment states and convergence flags come back
+            from the workers, so changes that the missions make to their vehicles or analyses while they are
+            evaluated are lost.
+    
+            Source:
+            N/A
+    
+            Inputs:
+            number_of_processes   [int]
+    
+            Outputs:
+            Results [Data()]
+    
+            Properties Used:
+            None
+        """
+        return SUAVE.Methods.Missions.evaluate_missions(self,number_of_processes)
+    
     def finalize(self):
         """ Stub
     
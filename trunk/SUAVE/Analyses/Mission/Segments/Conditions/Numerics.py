@@ -56,6 +56,7 @@ class Numerics(Conditions):
         self.tolerance_solution               = 1e-8
         self.converged                        = None
         self.max_evaluations                  = 0.
+        self.number_of_evaluations            = 0
         self.step_size                        = None
         
         self.dimensionless = Conditions()
@@ -0,0 +1,107 @@
+## @ingroup Analyses-Mission-Variable_Range_Cruise
+# Given_Weight_Sequential.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Methods import Missions as Methods
+from SUAVE.Analyses import Process
+from SUAVE.Analyses.Mission import Sequential_Segments
+
+# ----------------------------------------------------------------------
+#   Class
+# ----------------------------------------------------------------------
+
+## @ingroup Analyses-Mission-Vary_Cruise
+class Given_Weight_Sequential(Sequential_Segments):
+    """ Given a target landing weight, select the cruise distance by adding a residual to the mission. Unlike
+        Given_Weight the segments are still converged one at a time, and only the cruise distance is solved for
+        on top of them.
+    
+        Assumptions:
+        None
+        
+        Source:
+        None
+    """
+    
+    def __defaults__(self):
+        """This sets the default flow of methods for the mission.
+    
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            None
+        """           
+        
+        self.tag = 'vary_cruise_given_weight_sequential'
+        
+        # --------------------------------------------------------------
+        #   User inputs
+        # --------------------------------------------------------------
+        self.cruise_tag  = 'cruise'
+        self.target_landing_weight = 1000.0
+        
+        
+        # --------------------------------------------------------------
+        #   State
+        # --------------------------------------------------------------
+        
+        # the only unknown and residual, the segments converge their own
+        self.state.unknowns.cruise_distance  = 1000.0
+        self.state.residuals.landing_weight  = 0.0
+        
+        # the landing weight carries the round off of the segment solutions, so take finite difference steps
+        # well above it and stop once the distance is within a few meters
+        self.state.numerics.step_size          = 1e-6
+        self.state.numerics.tolerance_solution = 1e-6
+        
+        
+        # --------------------------------------------------------------
+        #   The Solving Process
+        # --------------------------------------------------------------
+        
+        # --------------------------------------------------------------
+        #   Initialize
+        # --------------------------------------------------------------
+        self.process.initialize = Process()
+        self.process.initialize.expand_sub_segments = Methods.Segments.Common.Sub_Segments.expand_sub_segments
+        self.process.initialize.cruise_distance     = Methods.Segments.Cruise.Variable_Cruise_Distance.initialize_cruise_distance
+        self.process.initialize.before_cruise       = Methods.Segments.Cruise.Variable_Cruise_Distance.initialize_segments_before_cruise
+        
+        # --------------------------------------------------------------
+        #   Converge
+        # --------------------------------------------------------------
+        self.process.converge = Process()
+        self.process.converge.converge_root         = Methods.Segments.converge_root
+        
+        # --------------------------------------------------------------
+        #   Iterate
+        # --------------------------------------------------------------        
+        self.process.iterate = Process()
+        iterate = self.process.iterate
+        
+        # unpack the unknown
+        iterate.unpack_distance              = Methods.Segments.Cruise.Variable_Cruise_Distance.unknown_cruise_distance
+        
+        # Run the Segments, the ones before the cruise were run in the initialization
+        iterate.sub_segments                 = Methods.Segments.Cruise.Variable_Cruise_Distance.sequential_segments_from_cruise
+        
+        # Solve Residuals
+        iterate.residual_weight              = Methods.Segments.Cruise.Variable_Cruise_Distance.residual_landing_weight
+        
+        return
@@ -3,4 +3,5 @@
 # @ingroup Analyses-Mission
 
 from .Given_Weight import Given_Weight
+from .Given_Weight_Sequential import Given_Weight_Sequential
 from .Given_State_of_Charge import Given_State_of_Charge
\ No newline at end of file
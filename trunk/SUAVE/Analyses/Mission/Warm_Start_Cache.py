@@ -0,0 +1,251 @@
+## @ingroup Analyses-Mission
+# Warm_Start_Cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#   Class
+# ----------------------------------------------------------------------
+
+## @ingroup Analyses-Mission
+class Warm_Start_Cache(Data):
+    """ Remembers the converged unknowns of every segment so the next solve, usually for a nearby design, starts
+        from them instead of the user's initial guesses. If a warm started segment does not converge it is solved
+        again from the initial guesses.
+
+        Assumptions:
+        The shape of the unknowns of a segment does not change between designs, otherwise it is cold started
+
+        Source:
+        None
+    """
+
+    def __defaults__(self):
+        """This sets the default values.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+        self.tag                = 'warm_start_cache'
+
+        # extrapolate the unknowns from the last two designs
+        self.extrapolate        = False
+        self.design_variables   = None
+
+        self.segments           = Data()
+
+        self.cold_starts        = 0
+        self.warm_starts        = 0
+        self.fallbacks          = 0
+        self.evaluations_saved  = 0
+
+    def attach(self,missions):
+        """ Turns on warm starting for every segment of the missions, keyed by mission and segment tag.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            missions   [Mission.Container() or Mission()]
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+        if 'segments' in missions:
+            missions = [missions]
+        else:
+            missions = missions.values()
+
+        for mission in missions:
+            attach_segments(self,mission,mission.tag)
+
+        return
+
+    def seed(self,segment):
+        """ Puts the cached unknowns into a segment before it is converged.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            segment                        [Segment()]
+            segment.settings.warm_start_tag [string]
+
+            Outputs:
+            warm_started                   [bool]
+            segment.state.unknowns         [Data()]
+
+            Properties Used:
+            None
+        """
+
+        key      = segment.settings.warm_start_tag
+        layout   = segment.state._unknowns_layout
+        unknowns = layout.pack(segment.state.unknowns)
+
+        entry = self.segments.get(key)
+        if entry is None or len(entry.initial_unknowns) != len(unknowns):
+            entry = Data()
+            entry.unknowns          = np.zeros((0,len(unknowns)))
+            entry.designs           = None
+            entry.cold_evaluations  = None
+            self.segments[key]      = entry
+
+        # this solve's own guess, for a fallback
+        entry.initial_unknowns   = unknowns
+        entry.wasted_evaluations = 0
+
+        if len(entry.unknowns) == 0:
+            self.cold_starts += 1
+            return False
+
+        guess = entry.unknowns[-1]
+
+        # linear extrapolation along the step between the last two designs
+        design = self.design_variables
+        if self.extrapolate and design is not None and len(entry.designs) == 2 and entry.designs.shape[1] == len(design):
+            x0, x1 = entry.designs
+            step   = x1 - x0
+            if np.dot(step,step) > 0.:
+                t     = np.dot(design - x1,step)/np.dot(step,step)
+                guess = entry.unknowns[-1] + t*(entry.unknowns[-1] - entry.unknowns[-2])
+
+        layout.unpack(segment.state.unknowns,guess)
+        self.warm_starts += 1
+
+        return True
+
+    def fallback(self,segment):
+        """ Puts the guesses the segment had before it was seeded back into a segment whose warm start failed.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            segment                        [Segment()]
+
+            Outputs:
+            segment.state.unknowns         [Data()]
+
+            Properties Used:
+            None
+        """
+        entry = self.segments[segment.settings.warm_start_tag]
+        segment.state._unknowns_layout.unpack(segment.state.unknowns,entry.initial_unknowns)
+        entry.wasted_evaluations = segment.state.numerics.number_of_evaluations
+        self.fallbacks += 1
+
+        return
+
+    def store(self,segment,warm_started):
+        """ Saves the unknowns of a converged segment and counts the evaluations saved by warm starting. The
+            savings are measured against the latest cold solve of the segment, and the evaluations of a warm start
+            that fell back are counted as lost.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            segment                               [Segment()]
+            segment.state.numerics.number_of_evaluations [int]
+            warm_started                          [bool]
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+        entry       = self.segments[segment.settings.warm_start_tag]
+        wasted      = entry.wasted_evaluations
+        evaluations = segment.state.numerics.number_of_evaluations - wasted
+
+        if not warm_started:
+            entry.cold_evaluations  = evaluations
+            self.evaluations_saved -= wasted
+        elif entry.cold_evaluations is not None:
+            self.evaluations_saved += entry.cold_evaluations - evaluations
+
+        design = self.design_variables
+        if design is None:
+            design = np.array([])
+
+        unknowns = segment.state._unknowns_layout.pack(segment.state.unknowns)
+        design   = np.atleast_1d(np.array(design,dtype=float))
+        if entry.designs is None or entry.designs.shape[1] != len(design):
+            entry.designs = np.zeros((0,len(design)))
+
+        # keep the last two designs
+        entry.unknowns = np.vstack([entry.unknowns[-1:],unknowns])
+        entry.designs  = np.vstack([entry.designs[-1:] ,design])
+
+        return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Analyses-Mission
+def attach_segments(cache,segment,tag):
+    """ Points a segment and its sub segments to the cache.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        cache      [Warm_Start_Cache()]
+        segment    [Segment()]
+        tag        [string]
+
+        Outputs:
+        None
+
+        Properties Used:
+        None
+    """
+    segment.settings.warm_start     = cache
+    segment.settings.warm_start_tag = tag
+
+    if 'segments' in segment:
+        for sub_tag, sub_segment in segment.segments.items():
+            attach_segments(cache,sub_segment,tag + '.' + sub_tag)
+
+    return
@@ -6,6 +6,7 @@
 from .All_At_Once import All_At_Once
 from .Mission import Mission
 from .Sequential_Segments import Sequential_Segments
+from .Warm_Start_Cache import Warm_Start_Cache
 
 # packages
 from . import Segments
@@ -25,6 +25,7 @@ from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.generate_microphone_points
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.compute_noise_evaluation_locations import compute_ground_noise_evaluation_locations
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.compute_noise_evaluation_locations import compute_building_noise_evaluation_locations
 from SUAVE.Methods.Noise.Fidelity_One.Propeller.propeller_mid_fidelity               import propeller_mid_fidelity 
+from SUAVE.Methods.Noise.Fidelity_One.Propeller.propeller_mid_fidelity_culled        import propeller_mid_fidelity_culled
 
 # package imports
 import numpy as np
@@ -89,6 +90,14 @@ class Fidelity_One(Noise):
         settings.level_ground_microphone_max_y        = 450   # sideline microphone distance
         settings.level_ground_microphone_x_resolution = 5
         settings.level_ground_microphone_y_resolution = 5
+        
+        # microphones that cannot hear the rotors above the floor are not evaluated 
+        settings.microphone_culling                   = False
+        settings.microphone_culling_floor             = 40.   # [dB]
+        settings.microphone_culling_margin            = 6.    # [dB] directivity allowance between probe points
+        settings.microphone_culling_probe_distance    = 100.  # [m]
+        settings.microphone_culling_probe_points      = 32
+        settings.microphone_batch_size                = 20
         settings.center_frequencies                   = np.array([16,20,25,31.5,40, 50, 63, 80, 100, 125, 160, 200, 250, 315, 400, \
                                                                   500, 630, 800, 1000, 1250, 1600, 2000, 2500, 3150,
                                                                   4000, 5000, 6300, 8000, 10000])        
@@ -166,6 +175,9 @@ class Fidelity_One(Noise):
         conditions.noise.total_number_of_microphones      = num_mic
          
         
+        if settings.microphone_culling:
+            conditions.noise.microphone_culling = Data()
+        
         # create empty arrays for results  
         num_src            = len(config.networks) + 1 
         if ('lift_cruise') in config.networks.keys():
@@ -208,9 +220,16 @@ class Fidelity_One(Noise):
                             rotors        = net.lift_rotors 
                             identity_flag = net.identical_lift_rotors
                              
+                        if settings.microphone_culling:
+                            rotor_noise = propeller_mid_fidelity_culled
+                        else:
+                            rotor_noise = propeller_mid_fidelity
+                             
                         if identity_flag:
                             aeroacoustic_data  = acoustic_data[list(acoustic_data.keys())[0]] 
-                            propeller_noise    = propeller_mid_fidelity(rotors,aeroacoustic_data,segment,settings) 
+                            propeller_noise    = rotor_noise(rotors,aeroacoustic_data,segment,settings) 
+                            if settings.microphone_culling:
+                                conditions.noise.microphone_culling[source] = propeller_noise.microphone_culling
                         else:
                             distributed_rotors                       = Container()
                             num_rotors                               = len(rotors)
@@ -219,7 +238,9 @@ class Fidelity_One(Noise):
                             for r_idx , rotor  in enumerate(rotors): 
                                 aeroacoustic_data                               = acoustic_data[rotor.tag]                                    
                                 distributed_rotors.append(rotors[rotor.tag])       
-                                propeller_noise                                 = propeller_mid_fidelity(distributed_rotors,aeroacoustic_data,segment,settings) 
+                                propeller_noise                                 = rotor_noise(distributed_rotors,aeroacoustic_data,segment,settings) 
+                                if settings.microphone_culling:
+                                    conditions.noise.microphone_culling[rotor.tag] = propeller_noise.microphone_culling
                                 distributed_prop_noise_SPL_dBA[r_idx]           = propeller_noise.SPL_dBA 
                                 distributed_prop_noise_SPL_1_3_spectrum[r_idx]  = propeller_noise.SPL_1_3_spectrum     
                             propeller_noise.SPL_dBA          = SPL_arithmetic(distributed_prop_noise_SPL_dBA ,sum_axis=0)
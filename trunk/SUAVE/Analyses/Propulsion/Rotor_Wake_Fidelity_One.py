@@ -13,6 +13,7 @@ from SUAVE.Components.Energy.Energy_Component import Energy_Component
 from SUAVE.Analyses.Propulsion.Rotor_Wake_Fidelity_Zero import Rotor_Wake_Fidelity_Zero
 from SUAVE.Methods.Propulsion.Rotor_Wake.Fidelity_One.fidelity_one_wake_convergence import fidelity_one_wake_convergence
 from SUAVE.Methods.Propulsion.Rotor_Wake.Fidelity_One.compute_wake_induced_velocity import compute_wake_induced_velocity 
+from SUAVE.Methods.Propulsion.Rotor_Wake.Fidelity_One.tree_code_induced_velocity import tree_code_induced_velocity
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.extract_wing_VD import extract_wing_collocation_points
 
 # package imports
@@ -70,6 +71,16 @@ class Rotor_Wake_Fidelity_One(Energy_Component):
         self.maximum_convergence_iteration            = 10
         self.axial_velocity_convergence_tolerance     = 1e-2
         
+        # reuse the wake of the last evaluation when the inputs are the same, and start the convergence from its inflow
+        self.reuse_converged_wake                     = False
+        self.converged_wake                           = None
+        
+        # evaluation points per block of the wake induced velocity, None bounds the memory of each block
+        self.induced_velocity_block_size              = None
+        
+        # opening angle of the tree code for the wake induced velocity, None sums every filament directly
+        self.induced_velocity_tree_tolerance          = None
+        
         # flags for slipstream interaction
         self.slipstream                 = False
         self.verbose                    = False
@@ -236,7 +247,12 @@ class Rotor_Wake_Fidelity_One(Energy_Component):
     
         # compute the induced velocity from the rotor wake on the lifting surfaces
         VD.Wake         = wake_vortex_distribution
-        rot_V_wake_ind  = compute_wake_induced_velocity(wake_vortex_distribution,VD,num_ctrl_pts)        
+        if self.induced_velocity_tree_tolerance is None:
+            rot_V_wake_ind = compute_wake_induced_velocity(wake_vortex_distribution,VD,num_ctrl_pts,
+                                                           block_size=self.induced_velocity_block_size)        
+        else:
+            rot_V_wake_ind = tree_code_induced_velocity(wake_vortex_distribution,VD,num_ctrl_pts,
+                                                        tolerance=self.induced_velocity_tree_tolerance)
         
         return rot_V_wake_ind
     
@@ -280,6 +296,53 @@ class Rotor_Wake_Fidelity_One(Energy_Component):
         # update wake distribution
         self.vortex_distribution = wVD
         return
+    
+    def shifted_copy(self,offset):
+        """
+        This copies the wake and shifts the copy by the (x,y,z) coordinates of the offset. 
+        Only the coordinates of the vortex distribution are new arrays, the rest of the wake is
+        shared with this wake, so identical rotors can reuse a wake without a deep copy.
+        
+        Assumptions
+        The shared arrays of the wake are not modified in place
+        
+        Source:
+        N/A
+        
+        Inputs:
+        offset - (x,y,z) offset distances
+        
+        Outputs
+        wake   - shifted copy of the wake
+        
+        Properties Used
+        None
+        
+        """
+        wake               = copy.copy(self)
+        wake.wake_settings = copy.copy(self.wake_settings)
+        
+        wVD = Data()
+        for mat, value in self.vortex_distribution.items():
+            wVD[mat] = value
+        wVD.reshaped_wake = Data()
+        for mat, value in self.vortex_distribution.reshaped_wake.items():
+            wVD.reshaped_wake[mat] = value
+        
+        # the coordinates are shifted out of place
+        for VD in [wVD, wVD.reshaped_wake]:
+            for mat in VD.keys():
+                if mat == 'reshaped_wake':
+                    continue
+                elif 'X' in mat:
+                    VD[mat] = VD[mat] + offset[0]
+                elif 'Y' in mat:
+                    VD[mat] = VD[mat] + offset[1]
+                elif 'Z' in mat:
+                    VD[mat] = VD[mat] + offset[2]
+        
+        wake.vortex_distribution = wVD
+        return wake
         
         
 
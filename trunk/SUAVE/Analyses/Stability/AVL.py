@@ -21,6 +21,8 @@ from SUAVE.Methods.Aerodynamics.AVL.write_mass_file          import write_mass_f
 from SUAVE.Methods.Aerodynamics.AVL.write_run_cases          import write_run_cases
 from SUAVE.Methods.Aerodynamics.AVL.write_input_deck         import write_input_deck
 from SUAVE.Methods.Aerodynamics.AVL.run_analysis             import run_analysis
+from SUAVE.Methods.Aerodynamics.AVL.run_analysis_pool        import run_analysis_pool
+from SUAVE.Methods.Aerodynamics.AVL.cache_results            import compute_cache_files
 from SUAVE.Methods.Aerodynamics.AVL.translate_data           import translate_conditions_to_cases, translate_results_to_conditions
 from SUAVE.Methods.Aerodynamics.AVL.purge_files              import purge_files
 from SUAVE.Methods.Aerodynamics.AVL.Data.Settings            import Settings
@@ -36,6 +38,7 @@ from .Stability import Stability
 import os
 import numpy as np
 import sys  
+import tempfile
 from shutil import rmtree 
 from scipy.interpolate import  RectBivariateSpline 
 
@@ -89,6 +92,8 @@ class AVL(Stability):
         self.settings.number_chordwise_vortices     = 10
         self.settings.trim_aircraft                 = False 
         self.settings.print_output                  = False
+        self.settings.number_of_workers             = 1      # AVL processes run at once in separate folders, None for all the cores
+        self.settings.result_cache_directory        = None   # directory where parsed AVL results are saved and reused, None turns the cache off
                                                     
         # Regression Status      
         self.settings.keep_files                    = False
@@ -267,10 +272,11 @@ class AVL(Stability):
         NP                     = np.zeros_like(CM)
        
         # remove old files in run directory  
-        if os.path.exists('avl_files'):
+        if os.path.exists(run_folder):
             if not self.settings.regression_flag:
                 rmtree(run_folder)
                 
+        run_conditions_list = []
         for i,_ in enumerate(Mach):
             # Set training conditions
             run_conditions = Aerodynamics()
@@ -284,10 +290,15 @@ class AVL(Stability):
             run_conditions.aerodynamics.roll_rate_coefficient  = roll_rate_coefficient
             run_conditions.aerodynamics.lift_coefficient       = lift_coefficient
             run_conditions.aerodynamics.pitch_rate_coefficient = pitch_rate_coefficient
+            run_conditions_list.append(run_conditions)
             
-            #Run Analysis at AoA[i] and Mach[i]
-            results =  self.evaluate_conditions(run_conditions, trim_aircraft)
+        #Run Analysis at AoA[i] and Mach[i]
+        if self.settings.number_of_workers != 1 and not self.settings.regression_flag:
+            results_list = self.evaluate_conditions_in_pool(run_conditions_list, trim_aircraft)
+        else:
+            results_list = [self.evaluate_conditions(run_conditions, trim_aircraft) for run_conditions in run_conditions_list]
 
+        for i,results in enumerate(results_list):
             # Obtain CM Cm_alpha, Cn_beta and the Neutral Point 
             CM[:,i]       = results.aerodynamics.Cmtot[:,0]
             Cm_alpha[:,i] = results.stability.static.Cm_alpha[:,0]
@@ -406,6 +417,112 @@ class AVL(Stability):
           cases
         """           
         
+        # unpack
+        run_folder   = os.path.abspath(self.settings.filenames.run_folder)
+        print_output = self.settings.print_output 
+        
+        # write the input files
+        cases = self.write_input_files(run_conditions, trim_aircraft, run_folder)
+
+        # RUN AVL!
+        with redirect.folder(run_folder,force=False):
+            results_avl = run_analysis(self,print_output)
+    
+        # translate results
+        results = translate_results_to_conditions(cases,results_avl)
+        
+        # -----------------------------------------------------------------------------------------------------------------------                     
+        # Dynamic Stability & System Matrix Computation
+        # -----------------------------------------------------------------------------------------------------------------------      
+        # Dynamic Stability
+        if np.count_nonzero(self.geometry.mass_properties.moments_of_inertia.tensor) > 0:  
+                results = compute_dynamic_flight_modes(results,self.geometry,run_conditions,cases)        
+             
+        if not self.settings.keep_files:
+            rmtree( run_folder )           
+ 
+        return results
+
+    def evaluate_conditions_in_pool(self,run_conditions_list, trim_aircraft ):
+        """Writes the input files of each set of conditions in its own folder and runs AVL on them
+        concurrently.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        run_conditions_list <list of SUAVE data type> aerodynamic conditions, see evaluate_conditions
+
+        Outputs:
+        results_list        <list of SUAVE data type>
+
+        Properties Used:
+        self.settings.filenames.run_folder
+        self.settings.number_of_workers
+        """           
+        
+        # unpack
+        run_folder = os.path.abspath(self.settings.filenames.run_folder)
+            
+        # write the input files of each batch in a folder of its own, next to the run folder as 
+        # the airfoil files are found from the parent folder
+        batches = []
+        for run_conditions in run_conditions_list:
+            folder = tempfile.mkdtemp(prefix=os.path.basename(run_folder)+'_',dir=os.path.dirname(run_folder))
+            cases  = self.write_input_files(run_conditions, trim_aircraft, folder)
+            batches.append(Data(folder    = folder,
+                                deck_file = self.current_status.deck_file,
+                                features  = self.settings.filenames.features,
+                                cases     = cases))
+            
+        # RUN AVL!
+        results_avl = run_analysis_pool(self,batches,self.settings.number_of_workers)
+    
+        # translate results
+        results_list = []
+        for run_conditions, batch, res in zip(run_conditions_list,batches,results_avl):
+            results = translate_results_to_conditions(batch.cases,res)
+            
+            # Dynamic Stability
+            if np.count_nonzero(self.geometry.mass_properties.moments_of_inertia.tensor) > 0:  
+                results = compute_dynamic_flight_modes(results,self.geometry,run_conditions,batch.cases)    
+            results_list.append(results)
+            
+        return results_list
+        
+    def write_input_files(self,run_conditions, trim_aircraft, folder ):
+        """Writes the geometry, mass, run case and input deck files of a set of conditions in a 
+        folder.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        run_conditions <SUAVE data type> aerodynamic conditions, see evaluate_conditions
+        folder         <string> folder the files are written in
+
+        Outputs:
+        cases          <SUAVE data type> run cases, also stored in self.current_status.cases
+
+        Properties Used:
+        self.settings.filenames.
+          run_folder
+          output_template
+          batch_template
+          deck_template
+        self.current_status.
+          batch_index
+          batch_file
+          deck_file
+          cases
+        """           
+        
         # unpack
         run_folder                       = os.path.abspath(self.settings.filenames.run_folder)
         run_script_path                  = run_folder.rstrip('avl_files').rstrip('/')
@@ -417,7 +534,7 @@ class AVL(Stability):
         dynamic_results_template_2       = self.settings.filenames.dynamic_output_template_2    # 'system_matrix_{}.dat'
         batch_template                   = self.settings.filenames.batch_template
         deck_template                    = self.settings.filenames.deck_template 
-        print_output                     = self.settings.print_output 
+        cache_directory                  = self.settings.result_cache_directory
         
         # rename defaul avl aircraft tag
         self.tag                         = 'avl_analysis_of_{}'.format(self.geometry.tag) 
@@ -471,27 +588,17 @@ class AVL(Stability):
             case.eigen_result_filename_1    = dynamic_results_template_1.format(case.tag)   # 'eigen_mode_{}.dat'
             case.eigen_result_filename_2    = dynamic_results_template_2.format(case.tag)   # 'system_matrix_{}.dat'
         
-        # write the input files
-        with redirect.folder(run_folder,force=False):
+        # write the input files, the paths are resolved before moving into the folder 
+        if cache_directory is not None:
+            cache_directory = os.path.abspath(cache_directory)
+        with redirect.folder(folder,force=False):
             write_geometry(self,run_script_path)
             write_mass_file(self,run_conditions)
             write_run_cases(self,trim_aircraft)
             write_input_deck(self, trim_aircraft,control_surfaces)
-
-            # RUN AVL!
-            results_avl = run_analysis(self,print_output)
-    
-        # translate results
-        results = translate_results_to_conditions(cases,results_avl)
         
-        # -----------------------------------------------------------------------------------------------------------------------                     
-        # Dynamic Stability & System Matrix Computation
-        # -----------------------------------------------------------------------------------------------------------------------      
-        # Dynamic Stability
-        if np.count_nonzero(self.geometry.mass_properties.moments_of_inertia.tensor) > 0:  
-                results = compute_dynamic_flight_modes(results,self.geometry,run_conditions,cases)        
-             
-        if not self.settings.keep_files:
-            rmtree( run_folder )           
+            # key the cases by their input files
+            if cache_directory is not None:
+                compute_cache_files(self,trim_aircraft,control_surfaces,cache_directory)
  
-        return results
+        return cases
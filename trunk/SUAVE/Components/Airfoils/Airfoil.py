@@ -44,5 +44,6 @@ class Airfoil(Lofted_Body.Section):
         self.geometry                   = None
         self.polar_files                = None
         self.polars                     = None
+        self.polar_interpolant          = None    # compiled from the polars on first use
         self.number_of_points           = 200
        
\ No newline at end of file
@@ -30,6 +30,7 @@ from SUAVE.Core import ContainerOrdered, Data
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.BET_calculations import (
     compute_airfoil_aerodynamics,
     compute_inflow_and_tip_loss,
+    compile_rotor_airfoil_polars,
 )
 from SUAVE.Methods.Geometry.Three_Dimensional import (
     orientation_product,
@@ -95,6 +96,7 @@ class Rotor(Energy_Component):
         
         self.Airfoils                          = ContainerOrdered()
         self.airfoil_polar_stations            = None
+        self.fused_polar_interpolant           = None     # compiled from the polars of the Airfoils on first use
 
         self.use_2d_analysis                   = False    # True if rotor is at an angle relative to freestream or nonuniform freestream
         self.nonuniform_freestream             = False
@@ -212,6 +214,40 @@ class Rotor(Energy_Component):
           orientation_euler_angles           [rad, rad, rad]
         """
 
+        # Blade element inputs, the wake-induced inflow and the resulting rotor performance
+        bet    = self.compute_blade_element_inputs(conditions)
+        va, vt = self.Wake.evaluate(self,bet.wake_inputs,conditions)
+
+        return self.compute_blade_element_loads(conditions,bet,va,vt)
+
+    def compute_blade_element_inputs(self,conditions):
+        """Computes the velocities and the blade geometry at the blade elements of the rotor, these
+        are the inputs of the wake evaluation in spin.
+
+        Assumptions:
+        per source
+
+        Source:
+        N/A
+
+        Inputs:
+        self.inputs.omega                    [radian/s]
+        conditions                           (see spin)
+
+        Outputs:
+        bet.
+          wake_inputs                        (inputs of the wake evaluation)
+          rotor and freestream properties at the blade elements used by compute_blade_element_loads
+
+        Properties Used:
+        self.
+          number_of_blades                   [-]
+          tip_radius                         [m]
+          twist_distribution                 [radians]
+          chord_distribution                 [m]
+          orientation_euler_angles           [rad, rad, rad]
+        """
+
         # Unpack rotor blade parameters
         B        = self.number_of_blades
         R        = self.tip_radius
@@ -404,8 +440,89 @@ class Rotor(Energy_Component):
         wake_inputs.speed_of_sounds       = a
         wake_inputs.dynamic_viscosities   = nu
 
-        va, vt = self.Wake.evaluate(self,wake_inputs,conditions)
-        
+        # pack the blade elements
+        bet                    = Data()
+        bet.wake_inputs        = wake_inputs
+        bet.number_of_blades   = B
+        bet.tip_radius         = R
+        bet.omega              = omega
+        bet.rotation_rate      = n
+        bet.velocity           = V
+        bet.velocity_vector    = Vv
+        bet.omegar             = omegar
+        bet.deltar             = deltar
+        bet.chord_2d           = c_2d
+        bet.radius_2d          = r_dim_2d
+        bet.azimuth            = psi
+        bet.azimuth_2d         = psi_2d
+        bet.density            = rho
+        bet.freestream_density = rho_0
+        bet.temperature        = T
+        bet.body_to_thrust     = T_body2thrust
+
+        return bet
+
+    def compute_blade_element_loads(self,conditions,bet,va,vt):
+        """Computes the blade loads and the rotor performance once the wake-induced inflow at the
+        blade elements is known.
+
+        Assumptions:
+        per source
+
+        Source:
+        Drela, M. "Qprop Formulation", MIT AeroAstro, June 2006
+        http://web.mit.edu/drela/Public/web/qprop/qprop_theory.pdf
+
+        Inputs:
+        conditions                           (see spin)
+        bet                                  blade elements from compute_blade_element_inputs
+        va                                   axial wake-induced velocity          [m/s]
+        vt                                   tangential wake-induced velocity     [m/s]
+
+        Outputs:
+        see spin
+
+        Properties Used:
+        self.
+          hub_radius                         [m]
+          thickness_to_chord                 [-]
+          airfoil_polar_stations             [-]
+          Airfoils                           [-]
+        """
+
+        # Unpack the blade elements
+        wake_inputs     = bet.wake_inputs
+        Ua              = wake_inputs.velocity_axial
+        Ut              = wake_inputs.velocity_tangential
+        ctrl_pts        = wake_inputs.ctrl_pts
+        Nr              = wake_inputs.Nr
+        Na              = wake_inputs.Na
+        use_2d_analysis = wake_inputs.use_2d_analysis
+        beta            = wake_inputs.twist_distribution
+        c               = wake_inputs.chord_distribution
+        r               = wake_inputs.radius_distribution
+        a               = wake_inputs.speed_of_sounds
+        nu              = wake_inputs.dynamic_viscosities
+        B               = bet.number_of_blades
+        R               = bet.tip_radius
+        omega           = bet.omega
+        n               = bet.rotation_rate
+        V               = bet.velocity
+        Vv              = bet.velocity_vector
+        omegar          = bet.omegar
+        deltar          = bet.deltar
+        c_2d            = bet.chord_2d
+        r_dim_2d        = bet.radius_2d
+        psi             = bet.azimuth
+        psi_2d          = bet.azimuth_2d
+        rho             = bet.density
+        rho_0           = bet.freestream_density
+        T               = bet.temperature
+        T_body2thrust   = bet.body_to_thrust
+        tc              = self.thickness_to_chord
+        a_loc           = self.airfoil_polar_stations
+        airfoils        = self.Airfoils
+
         # compute new blade velocities
         Wa   = va + Ua
         Wt   = Ut - vt
@@ -413,7 +530,8 @@ class Rotor(Energy_Component):
         lamdaw, F, _ = compute_inflow_and_tip_loss(r,R,Wa,Wt,B)
 
         # Compute aerodynamic forces based on specified input airfoil or surrogate
-        Cl, Cdval, alpha, Ma,W = compute_airfoil_aerodynamics(beta,c,r,R,B,Wa,Wt,a,nu,airfoils,a_loc,ctrl_pts,Nr,Na,tc,use_2d_analysis)
+        fused_polars           = compile_rotor_airfoil_polars(self)
+        Cl, Cdval, alpha, Ma,W = compute_airfoil_aerodynamics(beta,c,r,R,B,Wa,Wt,a,nu,airfoils,a_loc,ctrl_pts,Nr,Na,tc,use_2d_analysis,fused_polars)
         
         
         # compute HFW circulation at the blade
@@ -23,8 +23,8 @@ from SUAVE.Analyses.Mission.Segments.Conditions import Residuals
 from SUAVE.Components.Physical_Component import Container 
 from SUAVE.Methods.Power.Battery.pack_battery_conditions import pack_battery_conditions
 from SUAVE.Methods.Power.Battery.append_initial_battery_conditions import append_initial_battery_conditions
+from SUAVE.Methods.Propulsion.spin_rotors import spin_rotors
 from SUAVE.Core import Data , Units 
-import copy
 
 # ----------------------------------------------------------------------
 #  Network
@@ -79,6 +79,7 @@ class Battery_Propeller(Network):
         self.generative_design_minimum    = 0 
         self.identical_propellers         = True
         self.y_axis_rotation              = 0.
+        self.batched_propeller_spin       = False # converge the Fidelity Zero wakes of non-identical props together
     
     # manage process with a driver function
     def evaluate_thrust(self,state):
@@ -170,7 +171,7 @@ class Battery_Propeller(Network):
             total_thrust        = 0. * state.ones_row(3)
             total_power         = 0.
             
-            # Iterate over motor/props
+            # Run the motors for the speed of the props
             for ii in range(n_evals):
                 
                 # Unpack the motor and props
@@ -196,9 +197,24 @@ class Battery_Propeller(Network):
                 
                 # link
                 prop.inputs.omega           = motor.outputs.omega 
+            
+            # step 4, the wakes of non-identical props are converged together if asked for
+            if self.batched_propeller_spin:
+                prop_results = spin_rotors([props[prop_key] for prop_key in list(props.keys())[:n_evals]],conditions)
+            
+            # Iterate over motor/props
+            for ii in range(n_evals):
+                
+                # Unpack the motor and props
+                motor_key = list(motors.keys())[ii]
+                prop_key  = list(props.keys())[ii]
+                motor     = self.propeller_motors[motor_key]
+                prop      = self.propellers[prop_key]
                 
-                # step 4
-                F, Q, P, Cp, outputs, etap = prop.spin(conditions)
+                if self.batched_propeller_spin:
+                    F, Q, P, Cp, outputs, etap = prop_results[ii]
+                else:
+                    F, Q, P, Cp, outputs, etap = prop.spin(conditions)
                     
                 # Check to see if magic thrust is needed, the ESC caps throttle at 1.1 already
                 eta        = conditions.propulsion.throttle[:,0,None]
@@ -233,14 +249,12 @@ class Battery_Propeller(Network):
             if identical_flag and prop.Wake.wake_method=="Fidelity_One":
                 # append wakes to all propellers, shifted by new origin
                 for p in props:
-                    # make copy of prop wake and vortex distribution
-                    base_wake = copy.deepcopy(prop.Wake)
-                    wake_vd   = base_wake.vortex_distribution
+                    if p is prop:
+                        continue
                     
-                    # apply offset 
+                    # share the prop wake, only the vortex distribution is shifted by the offset
                     origin_offset = np.array(p.origin[0]) - np.array(prop.origin[0])
-                    p.Wake = base_wake
-                    p.Wake.shift_wake_VD(wake_vd, origin_offset)
+                    p.Wake        = prop.Wake.shifted_copy(origin_offset)
             elif identical_flag and prop.Wake.wake_method=="Fidelity_Zero":
                 for p in props:
                     p.outputs = outputs
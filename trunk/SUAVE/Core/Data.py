@@ -26,8 +26,13 @@ t_table = str.maketrans( chars          + string.ascii_uppercase ,
                             '_'*len(chars) + string.ascii_lowercase )
 
 dictgetitem = dict.__getitem__
+dictget = dict.get
 objgetattrib = object.__getattribute__
 
+# attribute names of each Data class, so setting a key does not have to fail an object lookup first
+class_attributes = {}
+missing = object()
+
 # ----------------------------------------------------------------------
 #   Data
 # ----------------------------------------------------------------------        
@@ -49,7 +54,7 @@ class Data(dict):
         """ Retrieves an attribute set by a key k
     
             Assumptions:
-            Does a try if it is a dict, but if that fails treats it as an object
+            Looks for k in the dict first, if it is not there treats it as an object
     
             Source:
             N/A
@@ -63,16 +68,16 @@ class Data(dict):
             Properties Used:
             N/A
             """         
-        try:
-            return dictgetitem(self,k)
-        except:
+        v = dictget(self,k,missing)
+        if v is missing:
             return objgetattrib(self,k)
-
+        return v
+    
     def __setattr__(self, k, v):
         """ An override of the standard __setattr_ in Python.
             
             Assumptions:
-            This one tries to treat k as an object, if that fails it treats it as a key.
+            This one treats k as an object if it is an attribute, otherwise it treats it as a key.
     
             Source:
             N/A
@@ -87,18 +92,16 @@ class Data(dict):
             Properties Used:
             N/A    
         """
-        try:
-            objgetattrib(self, k)
-        except:
-            self[k] = v
-        else:          
+        if is_attribute(self,k):
             object.__setattr__(self, k, v) 
+        else:          
+            self[k] = v
             
     def __delattr__(self, k):
         """ An override of the standard __delattr_ in Python. This deletes whatever is called by k
             
             Assumptions:
-            This one tries to treat k as an object, if that fails it treats it as a key.
+            This one treats k as an object if it is an attribute, otherwise it treats it as a key.
     
             Source:
             N/A
@@ -112,12 +115,10 @@ class Data(dict):
             Properties Used:
             N/A    
         """        
-        try:
-            objgetattrib(self, k)
-        except:
-            del self[k]
-        else:
+        if is_attribute(self,k):
             object.__delattr__(self, k)
+        else:
+            del self[k]
     
     def __defaults__(self):
         """ A stub for all classes that come later
@@ -851,4 +852,35 @@ class Data(dict):
         # do the update!
         do_operation(self,other,result)    
     
-        return result
\ No newline at end of file
+        return result
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Core
+def is_attribute(data,k):
+    """ Checks if k is an object attribute of a Data() rather than a key, without doing a failed attribute lookup.
+
+        Assumptions:
+        The attribute names of a class are cached the first time one of its instances is set. Class
+        attributes added after that are treated as keys.
+
+        Source:
+        N/A
+
+        Inputs:
+        data
+        k
+
+        Outputs:
+        True if k is found as an object attribute
+
+        Properties Used:
+        N/A
+        """
+    klass      = type(data)
+    attributes = dictget(class_attributes,klass)
+    if attributes is None:
+        attributes = class_attributes[klass] = frozenset(dir(klass))
+    return k in attributes or k in objgetattrib(data,'__dict__')
@@ -0,0 +1,174 @@
+## @ingroup Core
+# Data_Layout.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+from .Arrays import array_type, matrix_type
+
+from warnings import warn
+
+# ----------------------------------------------------------------------
+#   Data Layout
+# ----------------------------------------------------------------------
+
+## @ingroup Core
+class Data_Layout(object):
+    """ A precompiled version of Data.pack_array and Data.unpack_array for vector output. The nested
+        dictionary is walked once to find the key, rank, shape and offset of every packable value.
+        Afterwards packing and unpacking are a flat loop over those entries with no recursion,
+        type checking or concatenation.
+
+        Assumptions:
+        The structure of the data, and the shapes of the contained values, do not change between calls.
+        The layout is rebuilt whenever it is used with a different data object.
+
+        Source:
+        N/A
+    """
+
+    def __init__(self):
+        """ Initializes an empty layout, it is built on first use
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        self.data    = None
+        self.entries = []
+        self.size    = 0
+
+    def build(self,data):
+        """ Walks the data in the same order as Data.pack_array and records where each value is packed
+
+            Assumptions:
+            will only pack int, float, np.array and np.matrix (max rank 2)
+
+            Source:
+            N/A
+
+            Inputs:
+            data   [Data]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+
+        # valid types for output
+        valid_types = ( int, float,
+                        array_type,
+                        matrix_type )
+
+        entries = []
+        index   = [0]
+
+        # the walking function
+        def do_build(D):
+            for k,v in D.items():
+                try:
+                    rank = v.ndim
+                except:
+                    rank = 0
+
+                # type checking
+                if isinstance(v, dict):
+                    do_build(v) # recursion!
+                    continue
+                elif not isinstance(v,valid_types): continue
+                elif rank > 2: continue
+
+                if rank == 0:
+                    shape = ()
+                    n     = 1
+                else:
+                    shape = v.shape
+                    n     = v.size
+
+                entries.append((D,k,rank,shape,index[0],index[0]+n))
+                index[0] += n
+
+        do_build(data)
+
+        self.data    = data
+        self.entries = entries
+        self.size    = index[0]
+
+    def pack(self,data):
+        """ Maps the data dict to a 1D vector, same as Data.pack_array()
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            data   [Data]
+
+            Outputs:
+            vector [array]
+
+            Properties Used:
+            N/A
+        """
+        if data is not self.data:
+            self.build(data)
+
+        vector = np.empty(self.size)
+        for D,k,rank,shape,start,end in self.entries:
+            vector[start:end] = np.ravel(D[k],order='F')
+
+        return vector
+
+    def unpack(self,data,M):
+        """ Unpacks a 1D vector into the data dict in place, same as Data.unpack_array()
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            data   [Data]
+            M      [array]
+
+            Outputs:
+            data   [Data]
+
+            Properties Used:
+            N/A
+        """
+        if data is not self.data:
+            self.build(data)
+
+        for D,k,rank,shape,start,end in self.entries:
+            if rank == 0:
+                D[k] = M[start]
+            elif rank == 1:
+                D[k][:] = M[start:end]
+            else:
+                D[k][:,:] = np.reshape(M[start:end],shape,order='F')
+
+        # check
+        if not M.shape[-1] == self.size: warn('did not unpack all values',RuntimeWarning)
+
+        return data
@@ -7,6 +7,7 @@
 #   Imports
 # ----------------------------------------------------------------------
 import numpy as np
+import hashlib
  
 def interp2d(x,y,xp,yp,zp,fill_value= None):
     """
@@ -18,9 +19,12 @@ def interp2d(x,y,xp,yp,zp,fill_value= None):
         xp, yp: 1D arrays of points specifying grid points where function values
             are provided.
         zp: 2D array of function values. For a function `f(x, y)` this must
-            satisfy `zp[i, j] = f(xp[i], yp[j])`
+            satisfy `zp[i, j] = f(xp[i], yp[j])`. Several functions on the same
+            grid can be stacked along trailing dimensions, `zp[i, j, k]`, and
+            are interpolated together.
     Returns:
-        1D array `z` satisfying `z[i] = f(x[i], y[i])`.
+        1D array `z` satisfying `z[i] = f(x[i], y[i])`, with the trailing
+        dimensions of `zp` appended.
     """
     #if xp.ndim != 1 or yp.ndim != 1:
         #raise ValueError("xp and yp must be 1D arrays")
@@ -29,6 +33,15 @@ def interp2d(x,y,xp,yp,zp,fill_value= None):
 
     ix = np.clip(np.searchsorted(xp, x, side="right"), 1, len(xp) - 1)
     iy = np.clip(np.searchsorted(yp, y, side="right"), 1, len(yp) - 1)
+    
+    # broadcast the query points over stacked functions
+    extra = (None,)*(np.ndim(zp) - 2)
+    x     = np.asarray(x)[(Ellipsis,) + extra]
+    y     = np.asarray(y)[(Ellipsis,) + extra]
+    xp_1  = xp[ix - 1][(Ellipsis,) + extra]
+    xp_2  = xp[ix][(Ellipsis,) + extra]
+    yp_1  = yp[iy - 1][(Ellipsis,) + extra]
+    yp_2  = yp[iy][(Ellipsis,) + extra]
 
     # Using Wikipedia's notation (https://en.wikipedia.org/wiki/Bilinear_interpolation)
     z_11 = zp[ix - 1, iy - 1]
@@ -36,15 +49,15 @@ def interp2d(x,y,xp,yp,zp,fill_value= None):
     z_12 = zp[ix - 1, iy]
     z_22 = zp[ix, iy]
 
-    z_xy1 = (xp[ix] - x) / (xp[ix] - xp[ix - 1]) * z_11 + (x - xp[ix - 1]) / (
-        xp[ix] - xp[ix - 1]
+    z_xy1 = (xp_2 - x) / (xp_2 - xp_1) * z_11 + (x - xp_1) / (
+        xp_2 - xp_1
     ) * z_21
-    z_xy2 = (xp[ix] - x) / (xp[ix] - xp[ix - 1]) * z_12 + (x - xp[ix - 1]) / (
-        xp[ix] - xp[ix - 1]
+    z_xy2 = (xp_2 - x) / (xp_2 - xp_1) * z_12 + (x - xp_1) / (
+        xp_2 - xp_1
     ) * z_22
 
-    z = (yp[iy] - y) / (yp[iy] - yp[iy - 1]) * z_xy1 + (y - yp[iy - 1]) / (
-        yp[iy] - yp[iy - 1]
+    z = (yp_2 - y) / (yp_2 - yp_1) * z_xy1 + (y - yp_1) / (
+        yp_2 - yp_1
     ) * z_xy2
 
     if fill_value is not None:
@@ -54,3 +67,75 @@ def interp2d(x,y,xp,yp,zp,fill_value= None):
         z = np.where(oob, fill_value, z)
 
     return z
+
+def hash_data(*values):
+    """ Returns a stable hash of nested Data, dictionaries, sequences, arrays and scalars. Unlike the built in hash
+    the result is the same across processes and sessions, so it can key caches that are saved to disk.
+
+    Assumptions:
+    Dictionaries are hashed in their insertion order. Functions and classes are hashed by their name only. Other
+    objects are hashed by their type and attributes, or by their repr if they have none.
+
+    Source:
+    N/A
+
+    Inputs:
+    values   [Data, dict, list, tuple, array, scalar]
+
+    Outputs:
+    key      [string]
+
+    Properties Used:
+    N/A
+    """
+
+    hasher = hashlib.sha1()
+    parents = set()
+
+    def do_hash(value):
+        # an object that contains itself
+        if id(value) in parents:
+            hasher.update(b'<cycle>;')
+            return
+        if isinstance(value,(dict,list,tuple)) or hasattr(value,'__dict__'):
+            parents.add(id(value))
+            do_hash_contents(value)
+            parents.discard(id(value))
+        else:
+            do_hash_contents(value)
+        hasher.update(b';')
+
+    def do_hash_contents(value):
+        if isinstance(value,dict):
+            hasher.update(b'{')
+            for k,v in value.items():
+                do_hash(k)
+                do_hash(v) # recursion!
+            hasher.update(b'}')
+        elif isinstance(value,(list,tuple)):
+            hasher.update(b'[')
+            for v in value:
+                do_hash(v)
+            hasher.update(b']')
+        elif isinstance(value,(np.ndarray,np.generic)):
+            value = np.ascontiguousarray(value)
+            hasher.update(str((value.dtype.str,value.shape)).encode())
+            if value.dtype.hasobject:
+                do_hash(value.tolist())
+            else:
+                hasher.update(value.tobytes())
+        elif value is None or isinstance(value,(bool,int,float,complex,str,bytes)):
+            hasher.update(repr(value).encode())
+        elif isinstance(value,type) or (callable(value) and hasattr(value,'__qualname__')):
+            hasher.update((str(getattr(value,'__module__',None)) + '.' + value.__qualname__).encode())
+        elif hasattr(value,'__dict__'):
+            hasher.update(type(value).__qualname__.encode())
+            do_hash(vars(value))
+        else:
+            # the repr may hold the address of the object, which misses the cache rather than hitting a wrong entry
+            hasher.update((type(value).__qualname__ + repr(value)).encode())
+
+    for value in values:
+        do_hash(value)
+
+    return hasher.hexdigest()
@@ -5,6 +5,7 @@ from .Arrays import *
 
 from .Data             import Data
 from .DataOrdered      import DataOrdered
+from .Data_Layout      import Data_Layout
 from .Diffed_Data      import Diffed_Data, diff
 from .Container        import Container
 from .ContainerOrdered import ContainerOrdered
@@ -0,0 +1,161 @@
+## @ingroup Input_Output-SUAVE
+# archive_binary.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+import types
+import json
+import struct
+from collections import OrderedDict
+
+# ----------------------------------------------------------------------
+#  Format
+# ----------------------------------------------------------------------
+
+# the file starts with the magic string and the length of the JSON index, the raw
+# array buffers follow the index, each aligned so they can be memory-mapped
+binary_magic     = b'SUAVEBIN'
+binary_alignment = 64
+array_tag        = '__ndarray__'
+
+# ----------------------------------------------------------------------
+#  Method
+# ----------------------------------------------------------------------
+## @ingroup Input_Output-SUAVE
+def archive_binary(data,filename):
+    """Saves a SUAVE data structure in a binary file. The tree and the small values are kept in a JSON
+    index at the start of the file and every numpy array is written as a raw buffer, so arrays do not
+    have to be converted to text and can be memory-mapped when loaded.
+
+    Assumptions:
+    Data must be numpy arrays, strings, booleans, floats, ints, or lists.
+    Functions are ignored and all other data raises an error.
+
+    Source:
+    N/A
+
+    Inputs:
+    data       SUAVE data structure
+    filename   <string> - file to be output
+
+    Outputs:
+    filename   File in the SUAVE binary format
+
+    Properties Used:
+    N/A
+    """
+
+    # Build the index and collect the arrays
+    arrays = []
+    index  = OrderedDict()
+    for k in data.keys():
+        index[k] = build_index_r(data[k],arrays)
+
+    # Serialize the index, the array offsets are relative to the first buffer
+    index_string = json.dumps(index).encode('utf-8')
+    data_start   = aligned(len(binary_magic) + 8 + len(index_string))
+
+    # Write the file
+    f = open(filename,'wb')
+    f.write(binary_magic)
+    f.write(struct.pack('<Q',len(index_string)))
+    f.write(index_string)
+    position = len(binary_magic) + 8 + len(index_string)
+    for offset, array in arrays:
+        f.write(b'\0'*(data_start + offset - position))
+        array.tofile(f)
+        position = data_start + offset + array.nbytes
+    f.close()
+
+    return
+
+## @ingroup Input_Output-SUAVE
+def build_index_r(v,arrays):
+    """Builds the index of a SUAVE data structure for the binary format. This is the recursive step.
+    Arrays are appended to the list of buffers and replaced by their dtype, shape and offset.
+
+    Assumptions:
+    Data must be numpy arrays, strings, booleans, floats, ints, or lists.
+    Functions are ignored and all other data raises an error.
+
+    Source:
+    N/A
+
+    Inputs:
+    v        value in a data structure
+    arrays   list of (offset, array) of the buffers written so far
+
+    Outputs:
+    ret      value based on type of v
+
+    Properties Used:
+    N/A
+    """
+    tv = type(v) # Get value type
+
+    if isinstance(v,np.ndarray):
+        if v.dtype.hasobject:
+            ret = v.tolist()
+        else:
+            array  = np.ascontiguousarray(v)
+            offset = 0
+            if arrays:
+                last_offset, last_array = arrays[-1]
+                offset = aligned(last_offset + last_array.nbytes)
+            arrays.append((offset,array))
+            ret = OrderedDict()
+            ret[array_tag] = [array.dtype.str,list(array.shape),offset]
+    elif isinstance(v,np.generic):
+        ret = v.item()
+    elif (tv == str) or (tv == bool):
+        ret = v
+    elif tv == type(None):
+        ret = None
+    elif (tv == float) or (tv == int):
+        ret = v
+    elif tv == types.FunctionType: # Functions cannot be stored
+        ret = None
+    elif tv == list:
+        ret = v
+
+    else:
+        # Assume other data types are SUAVE data types and check
+        try:
+            keys = v.keys()
+        except:
+            if callable(tv):
+                return None
+            else:
+                raise TypeError('Unexpected data type in SUAVE data structure')
+        # Recursively assign values
+        ret = OrderedDict()
+        for k in keys:
+            ret[k] = build_index_r(v[k],arrays)
+
+    return ret
+
+## @ingroup Input_Output-SUAVE
+def aligned(position):
+    """Rounds a position in the file up to the alignment of the array buffers.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    position   <int> - bytes from the start of the file
+
+    Outputs:
+    position   <int> - aligned bytes from the start of the file
+
+    Properties Used:
+    N/A
+    """
+    return -(-position//binary_alignment)*binary_alignment
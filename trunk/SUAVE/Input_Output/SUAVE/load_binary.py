@@ -0,0 +1,158 @@
+## @ingroup Input_Output-SUAVE
+# load_binary.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import json
+import struct
+from SUAVE.Core import Data, DataOrdered
+import numpy as np
+from collections import OrderedDict
+
+from .archive_binary import binary_magic, array_tag, aligned
+
+# ----------------------------------------------------------------------
+#  Method
+# ----------------------------------------------------------------------
+
+## @ingroup Input_Output-SUAVE
+def load_binary(filename,branch=None,mmap_mode='r'):
+    """Converts a file saved with archive_binary into a SUAVE data structure. Only the index is read
+    from the file, the arrays of the loaded branch are memory-mapped so they are read from disk when
+    they are used.
+
+    Assumptions:
+    The file was a previously saved SUAVE data structure.
+
+    Source:
+    N/A
+
+    Inputs:
+    filename   <string> - file to be loaded
+    branch     <string> - dotted path of the part of the data structure to load, e.g.
+                          'segments.cruise.conditions', the whole data structure by default
+    mmap_mode  <string> - numpy memory map mode of the arrays, None reads them into memory
+
+    Outputs:
+    data       SUAVE data structure
+
+    Properties Used:
+    N/A
+    """
+
+    # Read the index
+    f = open(filename,'rb')
+    magic = f.read(len(binary_magic))
+    if magic != binary_magic:
+        f.close()
+        raise ValueError(filename + ' is not a SUAVE binary archive')
+    index_length = struct.unpack('<Q',f.read(8))[0]
+    index_string = f.read(index_length)
+    f.close()
+    index      = json.loads(index_string.decode('utf-8'),object_pairs_hook=OrderedDict)
+    data_start = aligned(len(binary_magic) + 8 + index_length)
+
+    # Find the branch
+    if branch is not None:
+        for k in branch.split('.'):
+            if (type(index) != OrderedDict) or (array_tag in index) or (k not in index):
+                raise KeyError(branch + ' is not in ' + filename)
+            index = index[k]
+        if (type(index) != OrderedDict) or (array_tag in index):
+            return build_binary_data_r(index,filename,data_start,mmap_mode)
+
+    # Convert to SUAVE data structure
+    data = Data()
+    for k in index.keys():
+        data[str(k)] = build_binary_data_r(index[k],filename,data_start,mmap_mode)
+
+    return data
+
+## @ingroup Input_Output-SUAVE
+def build_binary_data_r(v,filename,data_start,mmap_mode):
+    """Builds a SUAVE data structure based on the index of a binary file. This is the recursive step.
+
+    Assumptions:
+    The index was created based on a previously saved SUAVE data structure.
+
+    Source:
+    N/A
+
+    Inputs:
+    v           generic value of the index
+    filename    <string> - file being loaded
+    data_start  <int>    - position of the first array buffer
+    mmap_mode   <string> - numpy memory map mode of the arrays
+
+    Outputs:
+    ret         value converted to needed format
+
+    Properties Used:
+    N/A
+    """
+    tv = type(v) # Get value type
+
+    if tv == OrderedDict and array_tag in v:
+        dtype, shape, offset = v[array_tag]
+        ret = read_array(filename,np.dtype(dtype),tuple(shape),data_start + offset,mmap_mode)
+    elif tv == OrderedDict:
+        # Recursively assign values
+        ret = DataOrdered()
+        for k in v.keys():
+            ret[str(k)] = build_binary_data_r(v[k],filename,data_start,mmap_mode)
+    elif tv == list:
+        ret = np.array(v)
+    elif (tv == str):
+        ret = str(v)
+    elif (tv == bool):
+        ret = v
+    elif tv == type(None):
+        ret = None
+    elif (tv == float) or (tv == int):
+        ret = v
+    else:
+        raise TypeError('Data type not expected in SUAVE binary structure')
+
+    return ret
+
+## @ingroup Input_Output-SUAVE
+def read_array(filename,dtype,shape,offset,mmap_mode):
+    """Reads an array buffer of a binary file.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    filename    <string> - file being loaded
+    dtype       numpy data type of the array
+    shape       <tuple>  - shape of the array
+    offset      <int>    - position of the buffer in the file
+    mmap_mode   <string> - numpy memory map mode, None reads the array into memory
+
+    Outputs:
+    array       numpy array
+
+    Properties Used:
+    N/A
+    """
+    count = int(np.prod(shape))
+    if count == 0:
+        return np.zeros(shape,dtype=dtype)
+
+    if mmap_mode is None:
+        f = open(filename,'rb')
+        f.seek(offset)
+        array = np.fromfile(f,dtype=dtype,count=count).reshape(shape)
+        f.close()
+    else:
+        # a plain view of the map, the map stays open while the array is used
+        array = np.memmap(filename,dtype=dtype,mode=mmap_mode,offset=offset,shape=shape).view(np.ndarray)
+
+    return array
@@ -9,6 +9,8 @@ from .create_avl_datastructure import translate_avl_wing, translate_avl_body , p
 from .purge_files              import purge_files
 from .read_results             import read_results
 from .run_analysis             import run_analysis
+from .run_analysis_pool        import run_analysis_pool
+from .cache_results            import compute_cache_files, load_cached_results, save_cached_results
 from .translate_data           import translate_conditions_to_cases, translate_results_to_conditions
 from .write_geometry           import write_geometry
 from .write_mass_file          import write_mass_file
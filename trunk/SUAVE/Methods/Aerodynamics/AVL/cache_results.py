@@ -0,0 +1,143 @@
+## @ingroup Methods-Aerodynamics-AVL
+# cache_results.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+import os
+from SUAVE.Core                                      import Data, hash_data
+from SUAVE.Methods.Aerodynamics.AVL.write_input_deck import make_case_command
+
+## @ingroup Methods-Aerodynamics-AVL
+def compute_cache_files(avl_object,trim_aircraft,control_surfaces,cache_directory):
+    """ Finds the files that the parsed results of each run case are cached in. Each file is keyed
+    by a hash of the input files AVL reads for the case: the geometry file and its airfoil files,
+    the mass file, the run case in the batch file and the commands of the case in the input deck.
+    Case numbers and result filenames are left out, so the same case in another batch gives the
+    same file.
+
+    Assumptions:
+        The input files have been written in the current folder
+
+    Source:
+        None
+
+    Inputs:
+        avl_object
+        trim_aircraft              [boolean]
+        control_surfaces           [boolean]
+        cache_directory            [string] absolute path of the result cache
+
+    Outputs:
+        avl_object.current_status.cases[:].cache_file   [string]
+
+    Properties Used:
+        N/A
+    """
+    cases = avl_object.current_status.cases
+
+    # geometry, with the airfoil files it points to
+    with open(avl_object.settings.filenames.features,'r') as f:
+        geometry_lines = f.read().splitlines()
+    airfoils = []
+    for line, next_line in zip(geometry_lines[:-1],geometry_lines[1:]):
+        if line.strip() == 'AFILE' and os.path.isfile(next_line.strip()):
+            with open(next_line.strip(),'r') as f:
+                airfoils.append(f.read())
+
+    with open(avl_object.settings.filenames.mass_file,'r') as f:
+        mass_text = f.read()
+
+    # the run cases, without the line holding the case number and tag
+    with open(avl_object.current_status.batch_file,'r') as f:
+        run_blocks = f.read().split(' ---------------------------------------------\n')[1:]
+
+    for case, run_block in zip(cases,run_blocks):
+        run_lines = [line for line in run_block.splitlines() if not line.startswith(' Run case')]
+
+        # the case command starts with the case number and ends with the result filenames
+        command = make_case_command(avl_object,case,trim_aircraft,control_surfaces)
+        command = command[len(str(case.index)):].replace(case.tag,'')
+
+        key = hash_data(geometry_lines,airfoils,mass_text,run_lines,command)
+        case.cache_file = os.path.join(cache_directory,'avl_' + key + '.res')
+
+    return
+
+## @ingroup Methods-Aerodynamics-AVL
+def load_cached_results(avl_object):
+    """ Loads the parsed results of the current cases from the cache
+
+    Assumptions:
+        The batch is only skipped when every one of its cases is cached
+
+    Source:
+        None
+
+    Inputs:
+        avl_object
+
+    Outputs:
+        results        - as read_results, None if the cache is off or a case is missing
+
+    Properties Used:
+        avl_object.settings.result_cache_directory
+        avl_object.current_status.cases[:].cache_file
+    """
+    if avl_object.settings.result_cache_directory is None:
+        return None
+
+    cases = avl_object.current_status.cases
+    for case in cases:
+        if not os.path.isfile(case.cache_file):
+            return None
+
+    results = Data()
+    for case in cases:
+        case_res     = SUAVE.Input_Output.SUAVE.load(case.cache_file)
+        case_res.tag = case.tag
+        results.append(case_res)
+
+    return results
+
+## @ingroup Methods-Aerodynamics-AVL
+def save_cached_results(avl_object,results):
+    """ Saves the parsed results of the current cases in the cache
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Inputs:
+        avl_object
+        results        - from read_results
+
+    Outputs:
+        None
+
+    Properties Used:
+        avl_object.settings.result_cache_directory
+        avl_object.current_status.cases[:].cache_file
+    """
+    if avl_object.settings.result_cache_directory is None:
+        return
+
+    # the cache files are absolute paths, the results may be saved from the run folder
+    cases     = avl_object.current_status.cases
+    directory = os.path.dirname(cases[0].cache_file)
+    if not os.path.isdir(directory):
+        os.makedirs(directory,exist_ok=True)
+
+    # write to a temporary file first so that a process reading the cache never sees a partial file
+    for case in cases:
+        temp_file = case.cache_file + '.' + str(os.getpid()) + '.tmp'
+        SUAVE.Input_Output.SUAVE.archive(results[case.tag],temp_file)
+        os.replace(temp_file,case.cache_file)
+
+    return
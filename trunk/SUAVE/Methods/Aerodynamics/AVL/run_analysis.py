@@ -16,11 +16,13 @@ import subprocess
 import os
 from SUAVE.Methods.Aerodynamics.AVL.read_results import read_results
 from SUAVE.Methods.Aerodynamics.AVL.purge_files  import purge_files
+from SUAVE.Methods.Aerodynamics.AVL.cache_results import load_cached_results, save_cached_results
 from SUAVE.Core                                  import redirect
 
 ## @ingroup Methods-Aerodynamics-AVL
 def run_analysis(avl_object,print_output):
-    """ This calls the AVL executable and runs an analysis
+    """ This calls the AVL executable and runs an analysis, unless the results of all the cases
+    are in the result cache
 
     Assumptions:
         None
@@ -37,8 +39,11 @@ def run_analysis(avl_object,print_output):
     Properties Used:
         N/A
     """    
-    call_avl(avl_object,print_output)
-    results = read_results(avl_object)
+    results = load_cached_results(avl_object)
+    if results is None:
+        call_avl(avl_object,print_output)
+        results = read_results(avl_object)
+        save_cached_results(avl_object,results)
 
     return results
 
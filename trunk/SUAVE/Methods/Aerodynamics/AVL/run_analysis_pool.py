@@ -0,0 +1,129 @@
+## @ingroup Methods-Aerodynamics-AVL
+# run_analysis_pool.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os
+import subprocess
+from shutil import rmtree
+from concurrent.futures import ThreadPoolExecutor
+from SUAVE.Methods.Aerodynamics.AVL.read_results import read_results
+from SUAVE.Methods.Aerodynamics.AVL.cache_results import load_cached_results, save_cached_results
+from SUAVE.Core                                  import redirect
+
+## @ingroup Methods-Aerodynamics-AVL
+def run_analysis_pool(avl_object,batches,number_of_workers=None):
+    """ Runs several AVL batches concurrently, each in its own folder, then reads the results of
+    every batch and removes the folders. The AVL executables are separate processes, so a pool
+    of threads that wait on them is enough to keep several cores busy. Batches whose cases are all
+    in the result cache are not run.
+
+    Assumptions:
+        The input files of each batch have been written in its folder, and the batches are
+        independent of each other
+
+    Source:
+        None
+
+    Inputs:
+        avl_object             - the AVL analysis, geometry and settings
+        batches                - list of Data() with
+          folder               - folder holding the input files of the batch
+          deck_file            - name of the input deck
+          features             - name of the geometry file
+          cases                - the run cases of the batch
+        number_of_workers      - AVL processes running at once, defaults to the number of cores
+
+    Outputs:
+        results                - list of the results of read_results of each batch
+
+    Properties Used:
+        N/A
+    """
+    try:
+        # the cache and read_results work on the cases stored in the analysis
+        results = []
+        for batch in batches:
+            avl_object.current_status.cases = batch.cases
+            results.append(load_cached_results(avl_object))
+        pending = [i for i, res in enumerate(results) if res is None]
+
+        if number_of_workers is None:
+            number_of_workers = os.cpu_count()
+        number_of_workers = max(min(number_of_workers,len(pending)),1)
+
+        with ThreadPoolExecutor(max_workers=number_of_workers) as pool:
+            exit_status = list(pool.map(lambda i: call_avl_in_folder(avl_object,batches[i]),pending))
+
+        # read_results works in the current folder
+        for i in pending:
+            avl_object.current_status.cases = batches[i].cases
+            with redirect.folder(batches[i].folder,force=False):
+                results[i] = read_results(avl_object)
+            save_cached_results(avl_object,results[i])
+
+    finally:
+        if not avl_object.settings.keep_files:
+            for batch in batches:
+                rmtree(batch.folder,ignore_errors=True)
+
+    return results
+
+## @ingroup Methods-Aerodynamics-AVL
+def call_avl_in_folder(avl_object,batch):
+    """ Calls the AVL executable on one batch without changing the working folder or the standard
+    streams of the process, so it can run alongside other batches
+
+    Assumptions:
+        String log and error filenames are written in the folder of the batch
+
+    Source:
+        None
+
+    Inputs:
+        avl_object
+        batch                  - see run_analysis_pool
+
+    Outputs:
+        exit_status
+
+    Properties Used:
+        N/A
+    """
+    avl_regression_flag = avl_object.settings.regression_flag
+    if avl_regression_flag:
+        return 0
+
+    log_file = avl_object.settings.filenames.log_filename
+    err_file = avl_object.settings.filenames.err_filename
+    avl_call = avl_object.settings.filenames.avl_bin_name
+
+    # a relative path to the binary would not be found from the batch folder
+    if os.sep in avl_call:
+        avl_call = os.path.abspath(avl_call)
+
+    if isinstance(log_file,str):
+        stdout = open(os.path.join(batch.folder,log_file),'w')
+    elif avl_object.settings.print_output:
+        stdout = None
+    else:
+        stdout = subprocess.DEVNULL
+    if isinstance(err_file,str):
+        stderr = open(os.path.join(batch.folder,err_file),'w')
+    else:
+        stderr = None
+
+    try:
+        with open(os.path.join(batch.folder,batch.deck_file),'r') as commands:
+            avl_run = subprocess.Popen([avl_call,batch.features],cwd=batch.folder,stdin=commands,stdout=stdout,stderr=stderr)
+            avl_run.wait()
+    finally:
+        for stream in [stdout,stderr]:
+            if hasattr(stream,'close'):
+                stream.close()
+
+    return avl_run.returncode
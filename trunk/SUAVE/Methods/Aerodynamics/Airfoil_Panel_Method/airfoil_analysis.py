@@ -16,6 +16,7 @@ from .hess_smith      import hess_smith
 from .thwaites_method import thwaites_method
 from .heads_method    import heads_method
 from .aero_coeff      import aero_coeff 
+from .surface_stations import gather_stations
 
 # ----------------------------------------------------------------------
 # airfoil_analysis.py
@@ -514,12 +515,9 @@ def concatenate_surfaces(X_BOT,X_TOP,FUNC_BOT_SURF,FUNC_TOP_SURF,npanel,ncases,n
     Properties Used:
     N/A  
     '''  
-    FUNC = np.zeros((npanel,ncases,ncpts))  
-    
-    for case in range(ncases):
-        for cpt in range(ncpts):   
-            top_func          = FUNC_TOP_SURF[:,case,cpt][X_TOP[:,case,cpt].mask == False] 
-            bot_func          = FUNC_BOT_SURF[:,case,cpt][X_BOT[:,case,cpt].mask == False]                  
-            FUNC[:,case,cpt]  = np.concatenate([bot_func[::-1],top_func])
+    # the stations of the bottom surface from the trailing edge followed by those of the top surface 
+    FUNC_SURF    = np.concatenate([np.flip(FUNC_BOT_SURF,axis = 0),FUNC_TOP_SURF], axis = 0)
+    MASK_SURF    = np.concatenate([np.flip(np.ma.getmaskarray(X_BOT),axis = 0),np.ma.getmaskarray(X_TOP)], axis = 0)
+    order, valid = gather_stations(MASK_SURF)
+    FUNC         = np.take_along_axis(FUNC_SURF,order[:npanel],axis = 0)
     return FUNC
-    
\ No newline at end of file
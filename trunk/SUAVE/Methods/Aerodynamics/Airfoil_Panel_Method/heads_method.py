@@ -9,8 +9,8 @@
 # ----------------------------------------------------------------------
 from SUAVE.Core import Data 
 import numpy as np
-from scipy.interpolate import interp1d
-from scipy.integrate import odeint  
+
+from .surface_stations import gather_stations, scatter_stations, replace_jumps, march_stations
 # ----------------------------------------------------------------------
 # heads_method.py 
 # ----------------------------------------------------------------------   
@@ -25,7 +25,7 @@ def heads_method(npanel,ncases,ncpts,DEL_0,THETA_0,DELTA_STAR_0, TURBULENT_SURF,
     Journal of fluid mechanics 107 (1981): 297-338.
 
     Assumptions:
-    None  
+    The boundary layer velocity and its derivative are linear between the stations
 
     Inputs: 
     ncases         - number of cases                                                             [unitless]
@@ -56,103 +56,70 @@ def heads_method(npanel,ncases,ncpts,DEL_0,THETA_0,DELTA_STAR_0, TURBULENT_SURF,
     N/A
     """   
      
-    # Initialize vectors 
-    X_H          = np.zeros((npanel,ncases,ncpts))
-    THETA_H      = np.zeros_like(X_H)
-    DELTA_STAR_H = np.zeros_like(X_H)
-    H_H          = np.zeros_like(X_H)
-    CF_H         = np.zeros_like(X_H) 
-    RE_THETA_H   = np.zeros_like(X_H)
-    RE_X_H       = np.zeros_like(X_H)
-    DELTA_H      = np.zeros_like(X_H)       
- 
+    # gather the stations on the turbulent surface so that all cases are processed together 
+    order, valid = gather_stations(np.ma.getmaskarray(TURBULENT_COORD))
+    valid        = valid & (TURBULENT_SURF != 0.0)
+    with np.errstate(divide='ignore',invalid='ignore'):
+        ReL_div_L = RE_L/TURBULENT_SURF 
+    x_i          = np.take_along_axis(TURBULENT_COORD.data,order,axis=0)
+    Ve_i         = np.take_along_axis(VE_I.data,order,axis=0)
+    dVe_i        = np.take_along_axis(DVE_I.data,order,axis=0) 
+    
+    with np.errstate(divide='ignore',invalid='ignore',over='ignore'):
+        H_0          = DELTA_STAR_0 / THETA_0
+        H1_0         = getH1(np.atleast_1d(H_0))
+        H1_0         = np.where(np.isnan(H1_0),(DEL_0 - DELTA_STAR_0) / THETA_0,H1_0)
+        Ve_0         = Ve_i[0] - (Ve_i[1] - Ve_i[0])/(x_i[1] - x_i[0])*x_i[0]
+    y0           = np.array([THETA_0,Ve_0*THETA_0*H1_0])
+    
+    # integrate every case along its stations
+    with np.errstate(divide='ignore',invalid='ignore',over='ignore'):
+        y        = march_stations(odefcn,y0,x_i,valid,[Ve_i,dVe_i],args=[ReL_div_L])
+    
+        # Compute momentum thickness, theta 
+        theta        = extrapolate_nans(y[0],x_i,valid)
+        Ve_theta_H1  = extrapolate_nans(y[1],x_i,valid)
+        
+        # find theta values that do not converge and replace them with neighbor
+        theta        = replace_jumps(theta,valid,tol)
+        Ve_theta_H1  = replace_jumps(Ve_theta_H1,valid,tol)
           
-    for case in range(ncases):
-        for cpt in range(ncpts):  
-            # length of tubulent surface  
-            l = TURBULENT_SURF[case,cpt] 
-            if l == 0.0:
-                pass
-            else: 
-                theta_0      = THETA_0[case,cpt] 
-                Re_L         = RE_L[case,cpt] 
-                nu           = l/Re_L    
-                x_i          = TURBULENT_COORD.data[:,case,cpt][TURBULENT_COORD.mask[:,case,cpt] ==False] 
-                Ve_i         = VE_I.data[:,case,cpt][TURBULENT_COORD.mask[:,case,cpt] ==False]
-                dVe_i        = DVE_I.data[:,case,cpt][TURBULENT_COORD.mask[:,case,cpt] ==False]  
-                del_0        = DEL_0[case,cpt]
-                del_star_0   = DELTA_STAR_0[case,cpt]
-                H_0          = del_star_0 / theta_0
-                H1_0         = getH1(np.atleast_1d(H_0))[0]
-                if np.isnan(H1_0):
-                    H1_0     = (del_0 - del_star_0) / theta_0 
-                y0           = [theta_0, getVe(0,x_i,Ve_i)*theta_0*H1_0]     
-                y            = odeint(odefcn,y0,x_i,args=(Re_L/l, x_i, Ve_i, dVe_i))  
-                
-                # Compute momentum thickness, theta 
-                theta            = y[:,0]  
-                ind              = np.where(~np.isnan(theta))[0]
-                first, last      = ind[0], ind[-1]
-                theta[:first]    = theta[first]
-                dtheta_dx        = (theta[last]-theta[last-1])/(x_i[last]-x_i[last-1])
-                theta[last + 1:] = theta[last] + dtheta_dx*(x_i[last + 1:]-x_i[last])
-                
-                Ve_theta_H1            = y[:,1]  
-                ind                    = np.where(~np.isnan(Ve_theta_H1))[0]
-                first, last            = ind[0], ind[-1]
-                Ve_theta_H1[:first]    = Ve_theta_H1[first]
-                dVe_theta_H1_dx        = (Ve_theta_H1[last]-Ve_theta_H1[last-1])/(x_i[last]-x_i[last-1])
-                Ve_theta_H1[last + 1:] = Ve_theta_H1[last] + dVe_theta_H1_dx*(x_i[last + 1:]-x_i[last])
-                
-                # find theta values that do not converge and replace them with neighbor
-                idx1         = np.where(abs((theta[1:] - theta[:-1])/theta[:-1]) > tol )[0]
-                if len(idx1)> 1: 
-                    np.put(theta,idx1 + 1, theta[idx1])    
-                idx1         = np.where(abs((Ve_theta_H1[1:] - Ve_theta_H1[:-1])/Ve_theta_H1[:-1]) >tol)[0]
-                if len(idx1)> 1: 
-                    np.put(Ve_theta_H1,idx1 + 1, Ve_theta_H1[idx1])    
-                  
-                # Compute mass flow shape factor, H1
-                H1           = Ve_theta_H1/(theta*Ve_i)
-                
-                # Compute H 
-                H            = getH(np.atleast_1d(H1)) 
-                H[H<0]       = 1E-6    # H cannot be negative 
-                # find H values that do not converge and replace them with neighbor
-                idx1               = np.where(abs((H[1:] - H[:-1])/H[:-1]) >tol)[0]
-                if len(idx1)> 1: 
-                    np.put(H,idx1 + 1, H[idx1])     
-                
-                # Compute Reynolds numbers based on momentum thickness  
-                Re_theta     = Re_L/l * Ve_i*theta 
-                
-                # Compute Reynolds numbers based on distance along airfoil
-                Re_x         = Ve_i* x_i / nu
-                
-                # Compute skin friction 
-                cf           = abs( getcf(np.atleast_1d(Re_theta),np.atleast_1d(H))) 
-                
-                # Compute displacement thickness
-                del_star     = H*theta   
-                
-                # Compute boundary layer thickness 
-                delta        = theta*H1 + del_star 
-                
-                # Reynolds number at x=0 cannot be negative (give nans)
-                Re_x[0]      = 1E-5                
+        # Compute mass flow shape factor, H1
+        H1           = Ve_theta_H1/(theta*Ve_i)
+        
+        # Compute H 
+        H            = getH(np.atleast_1d(H1)) 
+        H[H<0]       = 1E-6    # H cannot be negative 
+        # find H values that do not converge and replace them with neighbor
+        H            = replace_jumps(H,valid,tol)
+        
+        # Compute Reynolds numbers based on momentum thickness  
+        Re_theta     = ReL_div_L * Ve_i*theta 
+        
+        # Compute Reynolds numbers based on distance along airfoil
+        Re_x         = ReL_div_L * Ve_i* x_i 
+        
+        # Compute skin friction 
+        cf           = abs( getcf(np.atleast_1d(Re_theta),np.atleast_1d(H))) 
+        
+        # Compute displacement thickness
+        del_star     = H*theta   
+        
+        # Compute boundary layer thickness 
+        delta        = theta*H1 + del_star
+        
+    # Reynolds number at x=0 cannot be negative (give nans)
+    Re_x[0]      = 1E-5                
     
-                # Find where matrices are not masked 
-                indices = np.where(TURBULENT_COORD.mask[:,case,cpt] == False)
-                
-                # Store results 
-                np.put(X_H[:,case,cpt],indices,x_i )
-                np.put(THETA_H[:,case,cpt],indices,theta)
-                np.put(DELTA_STAR_H[:,case,cpt],indices,del_star)
-                np.put(H_H[:,case,cpt],indices,H)
-                np.put(CF_H[:,case,cpt],indices ,cf)
-                np.put(RE_THETA_H[:,case,cpt],indices,Re_theta)
-                np.put(RE_X_H[:,case,cpt],indices,Re_x)
-                np.put(DELTA_H[:,case,cpt],indices,delta) 
+    # Store results on the panels 
+    X_H          = scatter_stations(order,valid,x_i)
+    THETA_H      = scatter_stations(order,valid,theta)
+    DELTA_STAR_H = scatter_stations(order,valid,del_star)
+    H_H          = scatter_stations(order,valid,H)
+    CF_H         = scatter_stations(order,valid,cf)
+    RE_THETA_H   = scatter_stations(order,valid,Re_theta)
+    RE_X_H       = scatter_stations(order,valid,Re_x)
+    DELTA_H      = scatter_stations(order,valid,delta)
 
     RESULTS = Data(
         X_H          = X_H,      
@@ -205,7 +172,7 @@ def getH1(H) :
     H1[idx1] = 3.3 + 1.5501*(H[idx1] - 0.6778)**-3.064
     return H1 
 
-def odefcn(y,x,ReL_div_L, x_i, Ve_i, dVe_i): 
+def odefcn(y,x,Ve,dVe,ReL_div_L): 
     """ Computes boundary layer functions using SciPy ODE solver 
     Assumptions:
     None
@@ -214,10 +181,9 @@ def odefcn(y,x,ReL_div_L, x_i, Ve_i, dVe_i):
     Inputs:  
     y           - initial conditions of functions               [unitless]
     x           - new x values at which to solve ODE            [unitless]
+    Ve          - boundary layer velocity at x                  [m/s]
+    dVe         - derivative of bounday layer velocity at x     [m/s-m]
     ReL_div_L   - ratio of Reynolds number to length of surface [unitless]
-    x_i         - intial array of x values                      [unitless]
-    Ve_i        - intial boundary layer velocity                [m/s]
-    dVe_i       - initial derivative of bounday layer velocity  [m/s-m]
 
     Outputs:  
     f           - 2D function of momentum thickness and the product of 
@@ -227,60 +193,44 @@ def odefcn(y,x,ReL_div_L, x_i, Ve_i, dVe_i):
     """    
     theta       = y[0]
     Ve_theta_H1 = y[1]  
-
-    if theta == 0:
-        H1 = Ve_theta_H1 / (theta + 1e-6) / getVe(x,x_i,Ve_i)
-    else:
-        H1 = Ve_theta_H1 / theta / getVe(x,x_i,Ve_i)
-
+    H1          = Ve_theta_H1 / np.where(theta == 0,theta + 1e-6,theta) / Ve
     H           = getH(np.atleast_1d(H1))
     Re_theta    = ReL_div_L * theta
     cf          = getcf(np.atleast_1d(Re_theta),np.atleast_1d(H))
-    dydx_1      = 0.5*cf-(theta/getVe(x,x_i,Ve_i))*(2+H)*getdVe(x, x_i, dVe_i)
-    dydx_2      = getVe(x,x_i,Ve_i)*0.0306*(H1 - 3)**-0.6169 
-    f           = [dydx_1,dydx_2] 
+    dydx_1      = 0.5*cf-(theta/Ve)*(2+H)*dVe
+    dydx_2      = Ve*0.0306*(H1 - 3)**-0.6169 
+    f           = np.array([dydx_1,dydx_2])
     return f 
 
-def getVe(x,x_i,Ve_i):
-    """ Interpolates the bounday layer velocity over a new dimension of x 
+def extrapolate_nans(FUNC,x_i,valid):
+    """ Replaces the values where the integration failed, before the first valid value with that value
+    and after the last valid value with a linear extrapolation of the last two
     Assumptions:
     None
     Source:
     None
     Inputs: 
-    x         - new x dimension                    [unitless]
-    x_i       - old x dimension                    [unitless]
-    Ve_i      - old boundary layer velocity values [m/s] 
+    FUNC      - gathered station values                [unitless]
+    x_i       - gathered station coordinates           [unitless]
+    valid     - gathered stations that are on surface  [boolean]
 
     Outputs:  
-    Ve        - new boundary layer velocity values [m/s]
+    FUNC      - gathered station values                [unitless]
     Properties Used:
     N/A 
-    """    
-    Ve_func = interp1d(x_i,Ve_i,fill_value = "extrapolate")
-    Ve      = Ve_func(x)
-    return Ve 
-
-def getdVe(x,x_i,dVe_i):
-    """ Interpolates the derivatives of the bounday layer velocity over a new dimension of x
-
-    Assumptions:
-    None
-    Source:
-    None
-    Inputs: 
-    x         - new x dimension                                  [unitless]
-    x_i       - old x dimension                                  [unitless]
-    dVe_i     - old derivative of boundary layer velocity values [m/s-m] 
-
-    Outputs:  
-    dVe       - new derivative of boundary layer velocity values [m/s-m]
-    Properties Used:
-    N/A 
-    """        
-    dVe_func = interp1d(x_i,dVe_i,fill_value = "extrapolate")
-    dVe      = dVe_func(x)
-    return dVe  
+    """
+    index  = np.arange(len(FUNC))[:,None,None]*np.ones_like(FUNC,dtype=int)
+    good   = valid & ~np.isnan(FUNC)
+    first  = np.min(np.where(good,index,len(FUNC)-1),axis=0)[None]
+    last   = np.max(np.where(good,index,0),axis=0)[None]
+    prev   = np.maximum(last - 1,0)
+    f_0    = np.take_along_axis(FUNC,first,axis=0)
+    f_n    = np.take_along_axis(FUNC,last,axis=0)
+    x_n    = np.take_along_axis(x_i,last,axis=0)
+    slope  = (f_n - np.take_along_axis(FUNC,prev,axis=0))/(x_n - np.take_along_axis(x_i,prev,axis=0))
+    FUNC   = np.where(index < first,f_0,FUNC)
+    FUNC   = np.where(index > last,f_n + slope*(x_i - x_n),FUNC)
+    return FUNC
 
 def getcf(Re_theta,H): 
     """ Computes the skin friction coefficient, cf
@@ -9,6 +9,7 @@
 import SUAVE
 from SUAVE.Core import Units
 import numpy as np
+from scipy.linalg import lu_factor, lu_solve
 
 from .panel_geometry import panel_geometry
 from .infl_coeff  import infl_coeff
@@ -21,6 +22,8 @@ from .velocity_distribution import velocity_distribution
 ## @ingroup Methods-Aerodynamics-Airfoil_Panel_Method
 def hess_smith(x_coord,y_coord,alpha,Re,npanel):
     """Computes the incompressible, inviscid flow over an airfoil of  arbitrary shape using the Hess-Smith panel method.  
+    The matrix of influence coefficients is assembled and factored once for all cases that have the same panels, 
+    and the right hand sides of their angles of attack are solved together.
 
     Assumptions:
     None
@@ -56,19 +59,42 @@ def hess_smith(x_coord,y_coord,alpha,Re,npanel):
     # generate panel geometry data for later use   
     l,st,ct,xbar,ybar,norm = panel_geometry(x_coord,y_coord,npanel,ncases,ncpts) 
     
-    # compute matrix of aerodynamic influence coefficients
-    ainfl         = infl_coeff(x_coord,y_coord,xbar,ybar,st,ct,npanel,ncases,ncpts) # ncases x ncpts x npanel+1 x npanel+1
-    
     # compute right hand side vector for the specified angle of attack 
     b_2d          = np.zeros((npanel+1,ncases, ncpts))
     b_2d[:-1,:,:] = st*np.cos(alpha_2d) - np.sin(alpha_2d)*ct
     b_2d[-1,:,:]  = -(ct[0,:,:]*np.cos(alpha_2d[-1,:,:]) + st[0,:,:]*np.sin(alpha_2d[-1,:,:]))-(ct[-1,:,:]*np.cos(alpha_2d[-1,:,:]) +st[-1,:,:]*np.sin(alpha_2d[-1,:,:]))
-      
-    # solve matrix system for vector of q_i and gamma  
-    qg_T          = np.linalg.solve(ainfl,np.swapaxes(b_2d.T,0,1))
-    qg            = np.swapaxes(qg_T.T,1,2) 
     
-    # compute the tangential velocity distribution at the midpoint of panels 
-    vt            = velocity_distribution(qg,x_coord,y_coord,xbar,ybar,st,ct,alpha_2d,npanel)
+    # cases with the same panels share the matrix of aerodynamic influence coefficients 
+    ncols         = ncases*ncpts 
+    nodes         = np.concatenate([x_coord,y_coord]).reshape(2*(npanel+1),ncols)
+    _, first, geometry = np.unique(nodes.T,axis=0,return_index=True,return_inverse=True)
+    
+    x_cols        = x_coord.reshape(npanel+1,ncols)
+    y_cols        = y_coord.reshape(npanel+1,ncols)
+    xbar_cols     = xbar.reshape(npanel,ncols)
+    ybar_cols     = ybar.reshape(npanel,ncols)
+    st_cols       = st.reshape(npanel,ncols)
+    ct_cols       = ct.reshape(npanel,ncols)
+    alpha_cols    = alpha_2d.reshape(npanel,ncols)
+    b_cols        = b_2d.reshape(npanel+1,ncols)
+    vt            = np.zeros((npanel,ncols))
+    
+    for g in range(len(first)):
+        col       = first[g]
+        cols      = np.where(geometry == g)[0]
+        geo       = [x_cols[:,col,None,None],y_cols[:,col,None,None],xbar_cols[:,col,None,None],ybar_cols[:,col,None,None],
+                     st_cols[:,col,None,None],ct_cols[:,col,None,None]]
+        
+        # compute matrix of aerodynamic influence coefficients and factor it once
+        ainfl     = infl_coeff(*geo,npanel,1,1)[0,0] # npanel+1 x npanel+1
+        lu_piv    = lu_factor(ainfl)
+        
+        # solve matrix system for vector of q_i and gamma of all angles of attack at once 
+        qg        = lu_solve(lu_piv,b_cols[:,cols])
+        
+        # compute the tangential velocity distribution at the midpoint of panels 
+        vt[:,cols]= velocity_distribution(qg[:,:,None],*geo,alpha_cols[:,cols,None],npanel)[:,:,0]
+    
+    vt            = vt.reshape(npanel,ncases,ncpts)
     
     return  xbar,ybar,vt,norm 
\ No newline at end of file
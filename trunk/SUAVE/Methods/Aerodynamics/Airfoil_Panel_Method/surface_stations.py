@@ -0,0 +1,178 @@
+## @ingroup Methods-Aerodynamics-Airfoil_Panel_Method
+# surface_stations.py
+
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+import numpy as np
+from scipy.integrate import odeint
+
+# ----------------------------------------------------------------------
+# gather_stations
+# ----------------------------------------------------------------------
+## @ingroup Methods-Aerodynamics-Airfoil_Panel_Method
+def gather_stations(mask):
+    """ Finds the order that moves the stations of a surface that are not masked to the start of every
+    case and control point, so that all cases can be marched along the surface together
+
+    Assumptions:
+    The stations keep the order they have on the surface
+
+    Source:
+    None
+
+    Inputs:
+    mask      - stations that are not on the surface, size (npanel,ncases,ncpts)  [boolean]
+
+    Outputs:
+    order     - index of the panel of each gathered station                       [unitless]
+    valid     - gathered stations that are on the surface                         [boolean]
+
+    Properties Used:
+    N/A
+    """
+    mask   = np.asarray(mask)
+    order  = np.argsort(mask,axis=0,kind='stable')
+    count  = np.sum(~mask,axis=0)
+    valid  = np.arange(mask.shape[0])[:,None,None] < count
+    return order, valid
+
+## @ingroup Methods-Aerodynamics-Airfoil_Panel_Method
+def scatter_stations(order,valid,values):
+    """ Puts gathered station values back on the panels they came from, the masked panels are zero
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    order     - index of the panel of each gathered station                       [unitless]
+    valid     - gathered stations that are on the surface                         [boolean]
+    values    - gathered station values                                           [multiple units]
+
+    Outputs:
+    FUNC      - station values on the panels                                      [multiple units]
+
+    Properties Used:
+    N/A
+    """
+    FUNC = np.zeros_like(values)
+    np.put_along_axis(FUNC,order,np.where(valid,values,0.),axis=0)
+    return FUNC
+
+## @ingroup Methods-Aerodynamics-Airfoil_Panel_Method
+def replace_jumps(FUNC,valid,tol):
+    """ Replaces the values that jump by more than the tolerance from the previous station with the value of
+    the previous station. As in the station by station solution, nothing is replaced on a surface with a single jump.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    FUNC      - gathered station values, modified in place                        [multiple units]
+    valid     - gathered stations that are on the surface                         [boolean]
+    tol       - boundary layer error correction tolerance                         [unitless]
+
+    Outputs:
+    FUNC      - gathered station values                                           [multiple units]
+
+    Properties Used:
+    N/A
+    """
+    with np.errstate(divide='ignore',invalid='ignore'):
+        jump = (abs((FUNC[1:] - FUNC[:-1])/FUNC[:-1]) > tol) & valid[1:]
+    jump     = jump & (np.sum(jump,axis=0) > 1)
+    FUNC[1:][jump] = FUNC[:-1][jump]
+    return FUNC
+
+## @ingroup Methods-Aerodynamics-Airfoil_Panel_Method
+def march_stations(odefcn,y0,x_i,valid,station_values,args=()):
+    """ Integrates the boundary layer functions of every case and control point with odeint along the gathered
+    stations. Each case is integrated on its own, as a case that fails would spoil a combined solution and the 
+    steps of one would change the accuracy of the others. The station values are interpolated as interp1d does,
+    without building an interpolant at every call of odefcn
+
+    Assumptions:
+    The station values are linear between the stations and are extrapolated past the ends of the surface
+
+    Source:
+    None
+
+    Inputs:
+    odefcn         - derivatives of the functions, odefcn(y,x,*station_values,*args)  [unitless]
+    y0             - initial values of the functions, size (nfunc,ncases,ncpts)      [unitless]
+    x_i            - gathered station coordinates                                    [unitless]
+    valid          - gathered stations that are on the surface                        [boolean]
+    station_values - gathered values that odefcn needs at each station                [multiple units]
+    args           - values of each case that odefcn needs, size (ncases,ncpts)      [multiple units]
+
+    Outputs:
+    y              - functions at the stations, nan off the surface, 
+                     size (nfunc,npanel,ncases,ncpts)                                 [unitless]
+
+    Properties Used:
+    N/A
+    """
+    npanel  = len(x_i)
+    shape   = np.shape(x_i)[1:]
+    nfunc   = len(y0)
+    ncol    = int(np.prod(shape))
+    
+    # flatten the cases
+    x_i     = np.reshape(x_i,(npanel,ncol))
+    values  = [np.reshape(value,(npanel,ncol)) for value in station_values]
+    args    = [np.reshape(np.broadcast_to(arg,shape),ncol) for arg in args]
+    y0      = np.reshape(y0,(nfunc,ncol))
+    nsta    = np.reshape(np.sum(valid,axis=0),ncol)
+    y       = np.full((nfunc,npanel,ncol),np.nan)
+    
+    for col in np.where(nsta > 0)[0]:
+        n        = nsta[col]
+        x        = x_i[:n,col]
+        ind      = np.argsort(x,kind='mergesort')
+        x_sorted = x[ind]
+        v_sorted = [value[:n,col][ind] for value in values]
+        col_args = [arg[col] for arg in args]
+        
+        def func(y,x):
+            at_x = [interpolate_stations(x,x_sorted,value) for value in v_sorted]
+            return np.ravel(odefcn(y,x,*at_x,*col_args))
+        
+        y[:,:n,col] = odeint(func,y0[:,col],x).T 
+    
+    return np.reshape(y,(nfunc,npanel) + shape)
+
+## @ingroup Methods-Aerodynamics-Airfoil_Panel_Method
+def interpolate_stations(x,x_i,f_i):
+    """ Linearly interpolates and extrapolates station values in the same way, and with the same round off, as
+    interp1d with fill_value = "extrapolate"
+
+    Assumptions:
+    The stations are sorted
+
+    Source:
+    None
+
+    Inputs:
+    x         - coordinate to interpolate to                 [unitless]
+    x_i       - station coordinates                          [unitless]
+    f_i       - station values                               [multiple units]
+
+    Outputs:
+    f         - value at x, size (1)                         [multiple units]
+
+    Properties Used:
+    N/A
+    """
+    hi    = np.clip(np.searchsorted(x_i,np.atleast_1d(x)),1,len(x_i)-1)
+    lo    = hi - 1
+    slope = (f_i[hi] - f_i[lo]) / (x_i[hi] - x_i[lo])
+    f     = slope*(x - x_i[lo]) + f_i[lo]
+    return f
@@ -9,8 +9,8 @@
 # ----------------------------------------------------------------------
 from SUAVE.Core import Data 
 import numpy as np
-from scipy.interpolate import interp1d
-from scipy.integrate import odeint 
+
+from .surface_stations import gather_stations, scatter_stations, replace_jumps, march_stations
 
 # ----------------------------------------------------------------------
 # thwaites_method
@@ -25,7 +25,7 @@ def thwaites_method(npanel,ncases,ncpts,L,RE_L,X_I,VE_I, DVE_I,tol,THETA_0):
     Aeronautical Quarterly 1.3 (1949): 245-280.
     
     Assumptions:
-    None  
+    The boundary layer velocity is linear between the stations  
 
     Inputs:  
     npanel         - number of points on surface                                                 [unitless]
@@ -55,79 +55,64 @@ def thwaites_method(npanel,ncases,ncpts,L,RE_L,X_I,VE_I, DVE_I,tol,THETA_0):
     N/A
     """
     
-    # Initialize vectors 
-    X_T          = np.zeros((npanel,ncases,ncpts))
-    THETA_T      = np.zeros_like(X_T)
-    DELTA_STAR_T = np.zeros_like(X_T)
-    H_T          = np.zeros_like(X_T)
-    CF_T         = np.zeros_like(X_T)
-    RE_THETA_T   = np.zeros_like(X_T)
-    RE_X_T       = np.zeros_like(X_T)
-    DELTA_T      = np.zeros_like(X_T)  
-      
-    for case in range(ncases):
-        for cpt in range(ncpts):    
-            # compute laminar boundary layer properties  
-            l           = L[case,cpt]
-            theta_0     = THETA_0 
-            Re_L        = RE_L[case,cpt]
-            nu          = l/Re_L    
-            x_i         = X_I.data[:,case,cpt][X_I.mask[:,case,cpt] ==False]
-            Ve_i        = VE_I.data[:,case,cpt][VE_I.mask[:,case,cpt] ==False]
-            dVe_i       = DVE_I.data[:,case,cpt][DVE_I.mask[:,case,cpt] ==False] 
-            y0          = theta_0**2 * getVe(0,x_i,Ve_i)**6   
-            theta2_Ve6  = odeint(odefcn, y0,x_i , args=(nu, x_i, Ve_i))  
-            
-            # Compute momentum thickness, theta 
-            theta       = np.sqrt(theta2_Ve6[:,0]/ Ve_i**6)
-            
-            # find theta values that do not converge and replace them with neighbor
-            idx1        = np.where(abs((theta[1:] - theta[:-1])/theta[:-1]) > tol)[0] 
-            if len(idx1)> 1:  
-                np.put(theta,idx1 + 1, theta[idx1])
-            
-            # Thwaites separation criteria 
-            lambda_val  = theta**2 * dVe_i / nu 
-            
-            # Compute H 
-            H           = getH(lambda_val)
-            H[H<0]      = 1E-6   # H cannot be negative 
-            # find H values that do not converge and replace them with neighbor
-            idx1        = np.where(abs((H[1:] - H[:-1])/H[:-1]) >tol)[0]
-            if len(idx1)> 1: 
-                np.put(H,idx1 + 1, H[idx1]) 
-            
-            # Compute Reynolds numbers based on momentum thickness  
-            Re_theta    = Ve_i * theta / nu
-            
-            # Compute Reynolds numbers based on distance along airfoil
-            Re_x        = Ve_i * x_i/ nu
-            
-            # Compute skin friction 
-            cf          = abs(getcf(lambda_val ,Re_theta)) 
-            
-            # Compute displacement thickness
-            del_star    = H*theta   
-            
-            # Compute boundary layer thickness 
-            delta       = 5.2*x_i/np.sqrt(Re_x)
-            delta[0]    = 0   
-            
-            # Reynolds number at x=0 cannot be negative 
-            Re_x[0]     = 1E-5
-            
-            # Find where matrices are not masked 
-            indices = np.where(X_I.mask[:,case,cpt] == False)
-            
-            # Store results 
-            np.put(X_T[:,case,cpt],indices,x_i)
-            np.put(THETA_T[:,case,cpt],indices,theta)
-            np.put(DELTA_STAR_T[:,case,cpt],indices,del_star)
-            np.put(H_T[:,case,cpt],indices,H)
-            np.put(CF_T[:,case,cpt],indices ,cf)
-            np.put(RE_THETA_T[:,case,cpt],indices,Re_theta)
-            np.put(RE_X_T[:,case,cpt],indices,Re_x)
-            np.put(DELTA_T[:,case,cpt],indices,delta)
+    # gather the stations on the surface so that all cases are processed together 
+    order, valid = gather_stations(np.ma.getmaskarray(X_I))
+    nu           = np.ma.getdata(L)/RE_L 
+    x_i          = np.take_along_axis(X_I.data,order,axis=0)
+    Ve_i         = np.take_along_axis(VE_I.data,order,axis=0)
+    dVe_i        = np.take_along_axis(DVE_I.data,order,axis=0)
+    
+    with np.errstate(divide='ignore',invalid='ignore'):
+        Ve_0     = Ve_i[0] - (Ve_i[1] - Ve_i[0])/(x_i[1] - x_i[0])*x_i[0]
+    y0           = np.array([THETA_0**2 * Ve_0**6])
+    
+    # integrate every case along its stations
+    theta2_Ve6   = march_stations(odefcn,y0,x_i,valid,[Ve_i],args=[nu])[0]
+    
+    with np.errstate(divide='ignore',invalid='ignore'): 
+        # Compute momentum thickness, theta 
+        theta       = np.sqrt(theta2_Ve6/ Ve_i**6)
+        
+        # find theta values that do not converge and replace them with neighbor
+        theta       = replace_jumps(theta,valid,tol)
+        
+        # Thwaites separation criteria 
+        lambda_val  = theta**2 * dVe_i / nu 
+        
+        # Compute H 
+        H           = getH(lambda_val)
+        H[H<0]      = 1E-6   # H cannot be negative 
+        # find H values that do not converge and replace them with neighbor
+        H           = replace_jumps(H,valid,tol)
+        
+        # Compute Reynolds numbers based on momentum thickness  
+        Re_theta    = Ve_i * theta / nu
+        
+        # Compute Reynolds numbers based on distance along airfoil
+        Re_x        = Ve_i * x_i/ nu
+        
+        # Compute skin friction 
+        cf          = abs(getcf(lambda_val ,Re_theta)) 
+        
+        # Compute displacement thickness
+        del_star    = H*theta   
+        
+        # Compute boundary layer thickness 
+        delta       = 5.2*x_i/np.sqrt(Re_x)
+    delta[0]    = 0   
+    
+    # Reynolds number at x=0 cannot be negative 
+    Re_x[0]     = 1E-5
+    
+    # Store results on the panels 
+    X_T          = scatter_stations(order,valid,x_i)
+    THETA_T      = scatter_stations(order,valid,theta)
+    DELTA_STAR_T = scatter_stations(order,valid,del_star)
+    H_T          = scatter_stations(order,valid,H)
+    CF_T         = scatter_stations(order,valid,cf)
+    RE_THETA_T   = scatter_stations(order,valid,Re_theta)
+    RE_X_T       = scatter_stations(order,valid,Re_x)
+    DELTA_T      = scatter_stations(order,valid,delta)
     
     RESULTS = Data(
         X_T          = X_T,      
@@ -165,7 +150,7 @@ def getH(lambda_val ):
     H[idx1] = 2.61 - 3.75*lambda_val[idx1]  + 5.24*lambda_val[idx1]**2   
     return H 
     
-def odefcn(y,x, nu,x_i,Ve_i):
+def odefcn(y,x,Ve,nu):
     """ Computes boundary layer functions using SciPy ODE solver 
 
     Assumptions:
@@ -177,9 +162,8 @@ def odefcn(y,x, nu,x_i,Ve_i):
     Inputs: 
     y           - initial conditions of functions    [unitless]
     x           - new x values at which to solve ODE [unitless]
+    Ve          - boundary layer velocity at x       [m/s]
     nu          - kinematic viscosity                [m^2/s]
-    x_i         - intial array of x values           [unitless]
-    Ve_i        - intial boundary layer velocity     [m/s]
     
     Outputs:  
     dydx        - expression for the momentum thickness and velocity (theta**2/Ve**6)
@@ -187,57 +171,9 @@ def odefcn(y,x, nu,x_i,Ve_i):
     Properties Used:
     N/A 
     """        
-    dydx = 0.45*getVe(x,x_i,Ve_i)**5*nu
+    dydx = np.array([0.45*Ve**5*nu])
     return dydx 
     
-def getVe(x,x_i,Ve_i):
-    """ Interpolates the bounday layer velocity over a new dimension of x 
-
-    Assumptions:
-    None
-
-    Source:
-    None
-
-    Inputs: 
-    x         - new x dimension                    [unitless]
-    x_i       - old x dimension                    [unitless]
-    Ve_i      - old boundary layer velocity values [m/s] 
-    
-    Outputs:  
-    Ve        - new boundary layer velocity values [m/s]
-
-    Properties Used:
-    N/A 
-    """
-    Ve_func = interp1d(x_i,Ve_i, axis=0,fill_value = "extrapolate")
-    Ve      = Ve_func(x)
-    return Ve  
-
-def getdVe(x,x_i,dVe_i):
-    """ Interpolates the derivatives of the bounday layer velocity over a new dimension of x 
-
-    Assumptions:
-    None
-
-    Source:
-    None
-
-    Inputs: 
-    x         - new x dimension                                   [unitless]
-    x_i       - old x dimension                                   [unitless]
-    dVe_i     - old derivative of boundary layer velocity values  [m/s-m]
-    
-    Outputs:  
-    dVe       - new derivative of boundary layer velocity values  [m/s-m]
-
-    Properties Used:
-    N/A 
-    """
-    dVe_func = interp1d(x_i,dVe_i,fill_value = "extrapolate")
-    dVe      = dVe_func(x)
-    return dVe 
-
 def getcf(lambda_val , Re_theta):
     """ Computes the skin friction coefficient, cf
 
@@ -46,8 +46,9 @@ def velocity_distribution(qg,x,y,xbar,ybar,st,ct,alpha_2d,npanel):
     N/A
     """  
     
-    nalpha           = len(alpha_2d[0,:,0])
-    ncpts            = len(alpha_2d[0,0,:])
+    # the panels may be shared by all angles of attack  
+    nalpha           = len(x[0,:,0])
+    ncpts            = len(x[0,0,:])
     
     # flow tangency boundary condition - source distribution  
     vt_2d = ct *np.cos(alpha_2d) + st*np.sin(alpha_2d)
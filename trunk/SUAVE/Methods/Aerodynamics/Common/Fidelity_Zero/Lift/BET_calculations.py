@@ -5,16 +5,18 @@
 # Modified:       
 import numpy as np
 
+from SUAVE.Core import Data
 from SUAVE.Core.Utilities import interp2d
 
 
 ## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
-def compute_airfoil_aerodynamics(beta,c,r,R,B,Wa,Wt,a,nu,airfoils,a_loc,ctrl_pts,Nr,Na,tc,use_2d_analysis):
+def compute_airfoil_aerodynamics(beta,c,r,R,B,Wa,Wt,a,nu,airfoils,a_loc,ctrl_pts,Nr,Na,tc,use_2d_analysis,fused_polars=None):
     """
     Cl, Cdval = compute_airfoil_aerodynamics( beta,c,r,R,B,
                                               Wa,Wt,a,nu,
                                               airfoils,a_loc
-                                              ctrl_pts,Nr,Na,tc,use_2d_analysis )
+                                              ctrl_pts,Nr,Na,tc,use_2d_analysis,
+                                              fused_polars )
 
     Computes the aerodynamic forces at sectional blade locations. If airfoil
     geometry and locations are specified, the forces are computed using the
@@ -46,6 +48,7 @@ def compute_airfoil_aerodynamics(beta,c,r,R,B,Wa,Wt,a,nu,airfoils,a_loc,ctrl_pts
        Na                         Number of azimuthal blade stations              [-]
        tc                         Thickness to chord                              [-]
        use_2d_analysis            Specifies 2d disc vs. 1d single angle analysis  [Boolean]
+       fused_polars               fused polars of the airfoils, optional          [-]
 
     Outputs:
        Cl                       Lift Coefficients                         [-]
@@ -61,29 +64,8 @@ def compute_airfoil_aerodynamics(beta,c,r,R,B,Wa,Wt,a,nu,airfoils,a_loc,ctrl_pts
     # If propeller airfoils are defined, use airfoil surrogate
     if a_loc is not None:  
         # Compute blade Cl and Cd distribution from the airfoil data 
-        if use_2d_analysis:
-            # return the 2D Cl and CDval of shape (ctrl_pts, Nr, Na)
-            Cl      = np.zeros((ctrl_pts,Nr,Na))
-            Cdval   = np.zeros((ctrl_pts,Nr,Na))
-            for jj,airfoil in enumerate(airfoils):
-                pd              = airfoil.polars
-                Cl_af           = interp2d(Re,alpha,pd.reynolds_numbers, pd.angle_of_attacks, pd.lift_coefficients) 
-                Cdval_af        = interp2d(Re,alpha,pd.reynolds_numbers, pd.angle_of_attacks, pd.drag_coefficients)
-                locs            = np.where(np.array(a_loc) == jj )
-                Cl[:,locs,:]    = Cl_af[:,locs,:]
-                Cdval[:,locs,:] = Cdval_af[:,locs,:]
-        else:
-            # return the 1D Cl and CDval of shape (ctrl_pts, Nr)
-            Cl      = np.zeros((ctrl_pts,Nr))
-            Cdval   = np.zeros((ctrl_pts,Nr))
-
-            for jj,airfoil in enumerate(airfoils):
-                pd            = airfoil.polars
-                Cl_af         = interp2d(Re,alpha,pd.reynolds_numbers, pd.angle_of_attacks, pd.lift_coefficients)
-                Cdval_af      = interp2d(Re,alpha,pd.reynolds_numbers, pd.angle_of_attacks, pd.drag_coefficients)
-                locs          = np.where(np.array(a_loc) == jj )
-                Cl[:,locs]    = Cl_af[:,locs]
-                Cdval[:,locs] = Cdval_af[:,locs]
+        # return the 2D Cl and CDval of shape (ctrl_pts, Nr, Na) or the 1D Cl and CDval of shape (ctrl_pts, Nr)
+        Cl, Cdval = interpolate_airfoil_polars(airfoils,a_loc,Re,alpha,fused_polars)
     else:
         # Estimate Cl max
         tc_1 = tc*100
@@ -160,4 +142,193 @@ def compute_inflow_and_tip_loss(r,R,Wa,Wt,B,et1=1,et2=1,et3=1):
     
     F = Ftip #* Fhub
     # F[F<1e-6] = 1e-6
-    return lamdaw, F, piece
\ No newline at end of file
+    return lamdaw, F, piece
+
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def compile_airfoil_polars(airfoil):
+    """
+    Compiles the lift and drag polars of an airfoil into a regular grid interpolant, which is stored on the
+    airfoil and reused until its polars are replaced.
+
+    Assumptions:
+    The polar arrays are not modified in place once compiled
+
+    Source:
+    N/A
+
+    Inputs:
+       airfoil.polars.
+         reynolds_numbers         Reynolds numbers of the polars                  [-]
+         angle_of_attacks         angles of attack of the polars                  [rad]
+         lift_coefficients        lift coefficients, (Reynolds numbers, AoA)      [-]
+         drag_coefficients        drag coefficients, (Reynolds numbers, AoA)      [-]
+
+    Outputs:
+       interpolant.
+         reynolds_numbers         grid of Reynolds numbers                        [-]
+         angle_of_attacks         grid of angles of attack                        [rad]
+         coefficients             lift and drag coefficients, stacked last        [-]
+
+    """
+    polars      = airfoil.polars
+    interpolant = airfoil.polar_interpolant
+
+    sources = ['reynolds_numbers','angle_of_attacks','lift_coefficients','drag_coefficients']
+    if interpolant is not None and all(interpolant.sources[k] is polars[k] for k in sources):
+        return interpolant
+
+    interpolant                  = Data()
+    interpolant.sources          = Data()
+    for k in sources:
+        interpolant.sources[k]   = polars[k]
+    interpolant.reynolds_numbers = np.asarray(polars.reynolds_numbers,dtype=float)
+    interpolant.angle_of_attacks = np.asarray(polars.angle_of_attacks,dtype=float)
+    interpolant.coefficients     = np.stack([polars.lift_coefficients,polars.drag_coefficients],axis=-1)
+
+    airfoil.polar_interpolant    = interpolant
+
+    return interpolant
+
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def compile_rotor_airfoil_polars(rotor):
+    """
+    Fuses the polars of the airfoils of a rotor, which are stored on the rotor next to the interpolants of its
+    airfoils and reused until any of them is recompiled.
+
+    Assumptions:
+    See fuse_airfoil_polars
+
+    Source:
+    N/A
+
+    Inputs:
+       rotor.
+         Airfoils                 airfoils of the blade                           [-]
+         airfoil_polar_stations   airfoil index of each radial section            [-]
+         fused_polar_interpolant  fused polars of the last evaluation             [-]
+
+    Outputs:
+       fused                      fused polars, None without airfoil polars       [-]
+
+    """
+    if rotor.airfoil_polar_stations is None:
+        return None
+
+    fused                         = fuse_airfoil_polars(rotor.Airfoils,rotor.fused_polar_interpolant)
+    rotor.fused_polar_interpolant = fused
+
+    return fused
+
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def fuse_airfoil_polars(airfoils,fused=None):
+    """
+    Fuses the compiled polars of the airfoils of a blade into one table, with the airfoils stacked on the third
+    axis. A table that was fused from the same compiled polars is returned as is.
+
+    Assumptions:
+    Airfoils with different polar grids are resampled on the union of the grids, which reproduces the
+    bilinear interpolation of each airfoil exactly
+
+    Source:
+    N/A
+
+    Inputs:
+       airfoils                   airfoils of the blade                           [-]
+       fused                      fused polars to reuse, optional                 [-]
+
+    Outputs:
+       fused.
+         reynolds_numbers         grid of Reynolds numbers                        [-]
+         angle_of_attacks         grid of angles of attack                        [rad]
+         coefficients             lift and drag coefficients, (Reynolds numbers,
+                                  AoA, airfoils, lift and drag)                   [-]
+
+    """
+    interpolants = [compile_airfoil_polars(airfoil) for airfoil in airfoils]
+
+    # each airfoil compiles its own interpolant, so the same interpolants are the same airfoils and polars
+    if fused is not None and len(fused.interpolants) == len(interpolants) and \
+       all(a is b for a,b in zip(fused.interpolants,interpolants)):
+        return fused
+
+    xp = interpolants[0].reynolds_numbers
+    yp = interpolants[0].angle_of_attacks
+    if all(np.array_equal(i.reynolds_numbers,xp) and np.array_equal(i.angle_of_attacks,yp) for i in interpolants):
+        zp = np.stack([i.coefficients for i in interpolants],axis=2)
+    else:
+        xp     = np.unique(np.concatenate([i.reynolds_numbers for i in interpolants]))
+        yp     = np.unique(np.concatenate([i.angle_of_attacks for i in interpolants]))
+        xg, yg = np.meshgrid(xp,yp,indexing='ij')
+        zp     = np.stack([interp2d(xg,yg,i.reynolds_numbers,i.angle_of_attacks,i.coefficients) for i in interpolants],axis=2)
+
+    fused                  = Data()
+    fused.interpolants     = interpolants
+    fused.reynolds_numbers = xp
+    fused.angle_of_attacks = yp
+    fused.coefficients     = zp
+
+    return fused
+
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def interpolate_airfoil_polars(airfoils,a_loc,Re,alpha,fused_polars=None):
+    """
+    Cl, Cdval = interpolate_airfoil_polars(airfoils,a_loc,Re,alpha,fused_polars)
+
+    Interpolates the lift and drag polars of all the airfoils of a blade in one bilinear interpolation. Each
+    blade section looks up the polars of its own airfoil through the airfoil index map.
+
+    Assumptions:
+    See fuse_airfoil_polars
+
+    Source:
+    N/A
+
+    Inputs:
+       airfoils                   airfoils of the blade                           [-]
+       a_loc                      airfoil index of each radial section, or of
+                                  each blade element                              [-]
+       Re                         Reynolds numbers, radial sections on axis 1,
+                                  or axis 0 for a single blade                    [-]
+       alpha                      angles of attack, same shape as Re              [rad]
+       fused_polars               fused polars of the airfoils, optional          [-]
+
+    Outputs:
+       Cl                         lift coefficients                               [-]
+       Cdval                      drag coefficients                               [-]
+
+    """
+    fused = fuse_airfoil_polars(airfoils,fused_polars)
+    xp    = fused.reynolds_numbers
+    yp    = fused.angle_of_attacks
+    zp    = fused.coefficients
+
+    # airfoil of every section
+    a_loc = np.asarray(a_loc)
+    if np.ndim(Re) > 1 and np.ndim(a_loc) == 1:
+        a_loc = a_loc.reshape((1,-1) + (1,)*(np.ndim(Re) - 2))
+    a_loc = np.broadcast_to(a_loc,np.shape(Re))
+
+    ix = np.clip(np.searchsorted(xp, Re, side="right"), 1, len(xp) - 1)
+    iy = np.clip(np.searchsorted(yp, alpha, side="right"), 1, len(yp) - 1)
+
+    x    = np.asarray(Re)[...,None]
+    y    = np.asarray(alpha)[...,None]
+    xp_1 = xp[ix - 1][...,None]
+    xp_2 = xp[ix][...,None]
+    yp_1 = yp[iy - 1][...,None]
+    yp_2 = yp[iy][...,None]
+
+    z_11 = zp[ix - 1, iy - 1, a_loc]
+    z_21 = zp[ix, iy - 1, a_loc]
+    z_12 = zp[ix - 1, iy, a_loc]
+    z_22 = zp[ix, iy, a_loc]
+
+    z_xy1 = (xp_2 - x) / (xp_2 - xp_1) * z_11 + (x - xp_1) / (xp_2 - xp_1) * z_21
+    z_xy2 = (xp_2 - x) / (xp_2 - xp_1) * z_12 + (x - xp_1) / (xp_2 - xp_1) * z_22
+    z     = (yp_2 - y) / (yp_2 - yp_1) * z_xy1 + (y - yp_1) / (yp_2 - yp_1) * z_xy2
+
+    return z[...,0], z[...,1]
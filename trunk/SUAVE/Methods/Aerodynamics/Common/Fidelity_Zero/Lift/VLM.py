@@ -11,7 +11,8 @@
 
 # package imports 
 import numpy as np 
-from SUAVE.Core import Data
+from scipy.linalg import lu_factor, lu_solve
+from SUAVE.Core import Data, hash_data
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_wing_induced_velocity      import compute_wing_induced_velocity
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.generate_vortex_distribution       import generate_vortex_distribution 
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_RHS_matrix                 import compute_RHS_matrix 
@@ -93,6 +94,9 @@ def VLM(conditions,settings,geometry):
     settings.discretize_control_surfaces       [Boolean], set to True to generate control surface panels
     settings.use_VORLAX_matrix_calculation     [boolean]
     settings.floating_point_precision          [np.float16/32/64]
+    settings.influence_matrix_memory_budget    [bytes], optional, evaluates the induced velocities in blocks
+    settings.influence_matrix_cache_size       [Unitless], optional, number of factored AIC matrices kept
+    settings.influence_matrix_cache            [Data], optional, where the factored AIC matrices are kept
        
     conditions.aerodynamics.angle_of_attack    [radians]
     conditions.aerodynamics.side_slip_angle    [radians]
@@ -120,6 +124,7 @@ def VLM(conditions,settings,geometry):
         alpha_i                                [radians] , Induced angle of each strip in each wing (array of numpy arrays)
         CP                                     [Unitless], Pressure coefficient of each panel
         gamma                                  [Unitless], Vortex strengths of each panel
+        influence_matrix_memory                [bytes]   , Estimated peak memory of the induced velocity matrices, 0 if cached
 
     
     Properties Used:
@@ -244,30 +249,24 @@ def VLM(conditions,settings,geometry):
     RHS     = rhs.RHS*1
     ONSET   = rhs.ONSET*1
 
-    # Build induced velocity matrix, C_mn
+    # Build induced velocity matrix, C_mn, and factor the AIC matrix
     # This is not affected by AoA, so we can use unique mach numbers only
     m_unique, inv = np.unique(mach,return_inverse=True)
     m_unique      = np.atleast_2d(m_unique).T
-    C_mn_small, s, RFLAG_small, EW_small = compute_wing_induced_velocity(VD,m_unique,compute_EW=True)
+    factors       = factor_influence_matrix(VD,m_unique,delta[0],phi[0],settings,RHS.dtype)
     
-    C_mn  = C_mn_small[inv,:,:,:]
-    RFLAG = RFLAG_small[inv,:]
-    EW    = EW_small[inv,:,:]
+    s     = factors.s
+    RFLAG = factors.RFLAG[inv,:]
+    EW_LE = factors.EW_LE[inv,:,:]
 
     # Turn off sonic vortices when Mach>1
     RHS = RHS*RFLAG
-    
-    # Build Aerodynamic Influence Coefficient Matrix
-    use_VORLAX_induced_velocity = settings.use_VORLAX_matrix_calculation
-    if not use_VORLAX_induced_velocity:
-        A =   np.multiply(C_mn[:,:,:,0],np.atleast_3d(np.sin(delta)*np.cos(phi))) \
-            + np.multiply(C_mn[:,:,:,1],np.atleast_3d(np.cos(delta)*np.sin(phi))) \
-            - np.multiply(C_mn[:,:,:,2],np.atleast_3d(np.cos(phi)*np.cos(delta)))   # validated from book eqn 7.42 
-    else:
-        A = EW
 
-    # Compute vortex strength
-    GAMMA  = np.linalg.solve(A,RHS)
+    # Compute vortex strength, one back substitution for all the conditions at each Mach number
+    GAMMA  = np.zeros(np.shape(RHS),dtype=factors.dtype)
+    for i_mach, lu_piv in enumerate(factors.LU):
+        cases        = inv==i_mach
+        GAMMA[cases] = lu_solve(lu_piv,RHS[cases].T).T
 
     # ---------------------------------------------------------------------------------------
     # STEP 11: Compute Pressure Coefficient
@@ -403,7 +402,7 @@ def VLM(conditions,settings,geometry):
     # ONLY PERFORMED FOR COSINE CHORDWISE SPACING (LAX = 0).    
     # ** TO DO ** Add cosine spacing (earlier in VLM) to properly capture the magnitude of these earlier.
     # Right now, this computation still happens with linear spacing, though its effects are underestimated.
-    CLE = compute_rotation_effects(VD, settings, EW, GAMMA, len_mach, X, CHORD, XLE, XBAR, 
+    CLE = compute_rotation_effects(VD, settings, EW_LE, GAMMA, len_mach, X, CHORD, XLE, XBAR, 
                                    rhs, COSINP, SINALF, PITCH, ROLL, YAW, STB, RNMAX)    
     
     # Leading edge suction multiplier. See documentation. This is a negative integer if used
@@ -517,6 +516,7 @@ def VLM(conditions,settings,geometry):
     results.alpha_i        =  alpha_i  
     results.CP             =  np.array(CP    , dtype=precision)
     results.gamma          =  np.array(GAMMA , dtype=precision)
+    results.influence_matrix_memory = factors.memory
     results.VD             = VD
     results.V_distribution = rhs.V_distribution
     results.V_x            = rhs.Vx_ind_total
@@ -525,10 +525,119 @@ def VLM(conditions,settings,geometry):
     VD.vlm_outputs = results
     return results
 
+# ----------------------------------------------------------------------
+#  Factor the AIC matrix
+# ----------------------------------------------------------------------
+def factor_influence_matrix(VD,m_unique,delta,phi,settings,dtype):
+    """ This builds and LU factors the aerodynamic influence coefficient matrix at each Mach number. The
+    matrix does not depend on the angle of attack, sideslip or rotation rates, so a factorization serves 
+    every condition at the same Mach number.
+    
+    If settings.influence_matrix_cache_size is set, the factorizations are kept in 
+    settings.influence_matrix_cache, keyed by the panel geometry, so later calls at the same Mach number skip 
+    the induced velocities and the factorization. The least recently used factorization is dropped first.
+    
+    Assumptions:
+    None
+    
+    Source:
+    N/A
+    
+    Inputs:
+    VD                                         [Data]
+    m_unique         unique Mach numbers       [Unitless]
+    delta            mean camber surface angle [radians]
+    phi              dihedral angle            [radians]
+    settings.floating_point_precision          [np.float16/32/64]
+    settings.use_VORLAX_matrix_calculation     [boolean]
+    dtype            precision of the solve    [np.dtype]
+    
+    Outputs:
+    factors.
+        LU           LU factors and pivots     [list]
+        RFLAG        sonic vortex flag         [boolean]
+        EW_LE        leading edge rows of EW   [Unitless]
+        s            semispan of the vortices  [m]
+        memory       estimated peak memory     [bytes]
+        dtype        precision of the solve    [np.dtype]
+    
+    Properties Used:
+    N/A
+    """
+    precision     = settings.floating_point_precision
+    use_VORLAX    = settings.use_VORLAX_matrix_calculation
+    keys          = settings.keys()
+    memory_budget = settings.influence_matrix_memory_budget if ('influence_matrix_memory_budget' in keys) else None
+    cache_size    = settings.influence_matrix_cache_size if ('influence_matrix_cache_size' in keys) else 0
+    LE_ind        = VD.leading_edge_indices
+    
+    # A is factored in at least the precision of the RHS, as np.linalg.solve does
+    dtype = np.result_type(dtype,precision)
+    
+    # Find the factorizations that are cached
+    entries = [None]*len(m_unique)
+    if cache_size:
+        if settings.get('influence_matrix_cache') is None:
+            settings.influence_matrix_cache = Data()
+        cache    = settings.influence_matrix_cache
+        geometry = hash_data(VD.XAH,VD.YAH,VD.ZAH,VD.XBH,VD.YBH,VD.ZBH,VD.XC,VD.YC,VD.ZC,VD.chord_lengths,
+                             VD.panels_per_strip,VD.leading_edge_indices,VD.trailing_edge_indices,delta,phi,
+                             np.dtype(precision).str,np.dtype(dtype).str,use_VORLAX)
+        tags     = [geometry + '_' + repr(float(m)) for m in m_unique[:,0]]
+        for i, tag in enumerate(tags):
+            if tag in cache:
+                # move to the back of the line
+                entries[i] = cache.pop(tag)
+                cache[tag] = entries[i]
+    
+    # Build and factor the rest
+    missing = [i for i, entry in enumerate(entries) if entry is None]
+    memory  = 0
+    if len(missing)>0:
+        C_mn, s, RFLAG, EW, induced_memory = compute_wing_induced_velocity(VD,m_unique[missing],compute_EW=True,\
+                                                                          precision=precision,memory_budget=memory_budget,\
+                                                                          return_memory=True)
+        memory = induced_memory.peak
+    
+        # Build Aerodynamic Influence Coefficient Matrix
+        if not use_VORLAX:
+            A =   np.multiply(C_mn[:,:,:,0],np.atleast_3d(np.sin(delta)*np.cos(phi))) \
+                + np.multiply(C_mn[:,:,:,1],np.atleast_3d(np.cos(delta)*np.sin(phi))) \
+                - np.multiply(C_mn[:,:,:,2],np.atleast_3d(np.cos(phi)*np.cos(delta)))   # validated from book eqn 7.42 
+        else:
+            A = EW
+        
+        for j, i in enumerate(missing):
+            entry       = Data()
+            entry.LU    = lu_factor(np.array(A[j],dtype=dtype),overwrite_a=True,check_finite=False)
+            entry.RFLAG = RFLAG[j]
+            entry.EW_LE = EW[j][LE_ind,:]
+            entry.s     = s
+            entries[i]  = entry
+            
+            if cache_size:
+                cache[tags[i]] = entry
+        
+        # drop the least recently used
+        if cache_size:
+            while len(cache) > cache_size:
+                cache.pop(next(iter(cache.keys())))
+    
+    # Pack
+    factors        = Data()
+    factors.LU     = [entry.LU for entry in entries]
+    factors.RFLAG  = np.array([entry.RFLAG for entry in entries])
+    factors.EW_LE  = np.array([entry.EW_LE for entry in entries])
+    factors.s      = entries[0].s
+    factors.memory = memory
+    factors.dtype  = dtype
+    
+    return factors
+
 # ----------------------------------------------------------------------
 #  CLE rotation effects helper function
 # ----------------------------------------------------------------------
-def compute_rotation_effects(VD, settings, EW_small, GAMMA, len_mach, X, CHORD, XLE, XBAR, 
+def compute_rotation_effects(VD, settings, EW_LE, GAMMA, len_mach, X, CHORD, XLE, XBAR, 
                              rhs, COSINP, SINALF, PITCH, ROLL, YAW, STB, RNMAX):
     """ This computes the effects of the freestream and aircraft rotation rate on 
     CLE, the induced flow at the leading edge
@@ -548,8 +657,8 @@ def compute_rotation_effects(VD, settings, EW_small, GAMMA, len_mach, X, CHORD,
     ##    return 0 #CLE not calculated till later for linear spacing
     
     # Computate rotational effects (pitch, roll, yaw rates) on LE suction
-    # pick leading edge strip values for EW and reshape GAMMA -> gamma accordingly
-    EW    = EW_small[: ,LE_ind, :]
+    # EW_LE holds the leading edge strip values for EW, reshape GAMMA -> gamma accordingly
+    EW    = EW_LE
     n_tot_strips = EW.shape[1]
     gamma = np.array(np.split(np.repeat(GAMMA, n_tot_strips, axis=0), len_mach))
     CLE = (EW*gamma).sum(axis=2)
@@ -9,11 +9,14 @@
 #  Imports
 # ----------------------------------------------------------------------
 
+# SUAVE imports
+from SUAVE.Core import Data
+
 # package imports 
 import numpy as np 
 
 ## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
-def compute_wing_induced_velocity(VD,mach,compute_EW=False):
+def compute_wing_induced_velocity(VD,mach,compute_EW=False,precision=np.float32,memory_budget=None,return_memory=False):
     """ This computes the induced velocities at each control point of the vehicle vortex lattice 
 
     Assumptions: 
@@ -21,6 +24,9 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     
     Outside of a call to the VLM() function itself, EW does not need to be computed, as C_mn 
     provides the same information in the body-frame. 
+    
+    The control points and Mach numbers are evaluated in blocks, so only the outputs are full size. With a 
+    memory budget the blocks are sized so the estimated peak memory stays within it.
 
     Source:  
     1. Miranda, Luis R., Robert D. Elliot, and William M. Baker. "A generalized vortex 
@@ -29,16 +35,19 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     2. VORLAX Source Code
 
     Inputs: 
-    VD       - vehicle vortex distribution                    [Unitless] 
-    mach                                                      [Unitless] 
+    VD            - vehicle vortex distribution                    [Unitless] 
+    mach                                                           [Unitless] 
+    compute_EW    - compute the VORLAX normalwash matrix            [boolean]
+    precision     - floating point precision of the matrices       [np.float32/64]
+    memory_budget - memory available, None evaluates in one block  [bytes]
+    return_memory - also return the memory estimate                [boolean]
     
     Outputs:                                
     C_mn     - total induced velocity matrix                  [Unitless] 
     s        - semispan of the horshoe vortex                 [m] 
-    t        - tangent of the horshoe vortex                  [-] 
-    CHORD    - chord length for a panel                       [m] 
     RFLAG    - sonic vortex flag                              [boolean] 
-    ZETA     - tangent incidence angle of the chordwise strip [-] 
+    EW       - VORLAX normalwash matrix                       [Unitless] 
+    memory   - estimated peak memory and block sizes          [Data], if return_memory
 
     Properties Used:
     N/A
@@ -46,35 +55,22 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     # unpack  
     LE_ind       = VD.leading_edge_indices
     TE_ind       = VD.trailing_edge_indices
+    RNMAX        = VD.panels_per_strip
+    CHORD        = VD.chord_lengths
     n_cp         = VD.n_cp
     n_mach       = len(mach)
-    mach         = np.array(mach,dtype=np.float32)
+    mach         = np.array(mach,dtype=precision)
 
     # Control points from the VLM 
-    XAH   = np.array(np.atleast_2d(VD.XAH*1.),dtype=np.float32)
-    YAH   = np.array(np.atleast_2d(VD.YAH*1.),dtype=np.float32)
-    ZAH   = np.array(np.atleast_2d(VD.ZAH*1.),dtype=np.float32)
-    XBH   = np.array(np.atleast_2d(VD.XBH*1.),dtype=np.float32)
-    YBH   = np.array(np.atleast_2d(VD.YBH*1.),dtype=np.float32)
-    ZBH   = np.array(np.atleast_2d(VD.ZBH*1.),dtype=np.float32)
-    XA1   = np.array(np.atleast_2d(VD.XA1*1.),dtype=np.float32)
-    YA1   = np.array(np.atleast_2d(VD.YA1*1.),dtype=np.float32)
-    ZA1   = np.array(np.atleast_2d(VD.ZA1*1.),dtype=np.float32)
-    XB1   = np.array(np.atleast_2d(VD.XB1*1.),dtype=np.float32)
-    YB1   = np.array(np.atleast_2d(VD.YB1*1.),dtype=np.float32)
-    ZB1   = np.array(np.atleast_2d(VD.ZB1*1.),dtype=np.float32)
-    XA2   = np.array(np.atleast_2d(VD.XA2*1.),dtype=np.float32)
-    YA2   = np.array(np.atleast_2d(VD.YA2*1.),dtype=np.float32)
-    ZA2   = np.array(np.atleast_2d(VD.ZA2*1.),dtype=np.float32)
-    XB2   = np.array(np.atleast_2d(VD.XB2*1.),dtype=np.float32)
-    YB2   = np.array(np.atleast_2d(VD.YB2*1.),dtype=np.float32)
-    ZB2   = np.array(np.atleast_2d(VD.ZB2*1.),dtype=np.float32)
-    XC    = np.array(np.atleast_2d(VD.XC*1.),dtype=np.float32)
-    YC    = np.array(np.atleast_2d(VD.YC*1.),dtype=np.float32)
-    ZC    = np.array(np.atleast_2d(VD.ZC*1.),dtype=np.float32)
-    XA_TE = np.array(np.atleast_2d(VD.XA_TE*1.),dtype=np.float32)
-    XB_TE = np.array(np.atleast_2d(VD.XB_TE*1.),dtype=np.float32)
-    
+    XAH   = np.array(np.atleast_2d(VD.XAH*1.),dtype=precision)
+    YAH   = np.array(np.atleast_2d(VD.YAH*1.),dtype=precision)
+    ZAH   = np.array(np.atleast_2d(VD.ZAH*1.),dtype=precision)
+    XBH   = np.array(np.atleast_2d(VD.XBH*1.),dtype=precision)
+    YBH   = np.array(np.atleast_2d(VD.YBH*1.),dtype=precision)
+    ZBH   = np.array(np.atleast_2d(VD.ZBH*1.),dtype=precision)
+    XC    = np.array(np.atleast_2d(VD.XC*1.),dtype=precision)
+    YC    = np.array(np.atleast_2d(VD.YC*1.),dtype=precision)
+    ZC    = np.array(np.atleast_2d(VD.ZC*1.),dtype=precision)
     
     # Panel Dihedral Angle, using AH and BH location
     D      = np.sqrt((YAH-YBH)**2+(ZAH-ZBH)**2)
@@ -87,17 +83,9 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     # ------------------------------------------------------------------------------------------- 
     # If YBH is negative, flip A and B, ie negative side of the airplane. Vortex order flips
     boolean = YAH>YBH
-    XA1[boolean], XB1[boolean] = XB1[boolean], XA1[boolean]
-    YA1[boolean], YB1[boolean] = YB1[boolean], YA1[boolean]
-    ZA1[boolean], ZB1[boolean] = ZB1[boolean], ZA1[boolean]
-    XA2[boolean], XB2[boolean] = XB2[boolean], XA2[boolean]
-    YA2[boolean], YB2[boolean] = YB2[boolean], YA2[boolean]
-    ZA2[boolean], ZB2[boolean] = ZB2[boolean], ZA2[boolean]    
     XAH[boolean], XBH[boolean] = XBH[boolean], XAH[boolean]
     YAH[boolean], YBH[boolean] = YBH[boolean], YAH[boolean] 
     ZAH[boolean], ZBH[boolean] = ZBH[boolean], ZAH[boolean]
-
-    XA_TE[boolean], XB_TE[boolean] = XB_TE[boolean], XA_TE[boolean]
     
     # These vortices will use AH and BH, rather than the typical location
     xa = XAH
@@ -126,95 +114,176 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     x1bar = (xb - xc)
     y1bar = (yb - yc)*costheta + (zb - zc)*sintheta
     
-    xobar = (xo - xc)
-    yobar = (yo - yc)*costheta + (zo - zc)*sintheta
-    zobar =-(yo - yc)*sintheta + (zo - zc)*costheta
-    
-    # COMPUTE COORDINATES OF RECEIVING POINT WITH RESPECT TO END POINTS OF SKEWED LEG.
-    shape   = np.shape(xobar)
-    shape_0 = shape[0]
-    shape_1 = shape[1]
+    # semispan and tangent of the sending vortices
     s       = np.abs(y1bar)
     t       = x1bar/y1bar  
-    s       = np.repeat(s,shape_0,axis=0)
-    t       = np.repeat(t,shape_0,axis=0)
-    
-    X1 = xobar + t*s # In a planar case XC-XAH
-    Y1 = yobar + s   # In a planar case YC-YAH
-    X2 = xobar - t*s # In a planar case XC-XBH
-    Y2 = yobar - s   # In a planar case YC-YBH
     
     # The cutoff hardcoded into vorlax
     CUTOFF = 0.8
     
-    # CALCULATE AXIAL DISTANCE BETWEEN PROJECTION OF RECEIVING POINT ONTO HORSESHOE PLANE AND EXTENSION OF SKEWED LEG.
-    XTY = xobar - t*yobar
-    
     # The notation in this method is flipped from the paper
     B2 = np.atleast_3d(mach**2-1.)
     
-    # SET VALUES OF NUMERICAL TOLERANCE CONSTANTS.
-    TOL    = s /500.0
-    TOLSQ  = TOL *TOL
-    TOLSQ2 = 2500.0 *TOLSQ
-    ZSQ    = zobar *zobar
-    YSQ1   = Y1 *Y1
-    YSQ2   = Y2 *Y2
-    RTV1   = YSQ1 + ZSQ
-    RTV2   = YSQ2 + ZSQ
-    XSQ1   = X1 *X1
-    XSQ2   = X2 *X2
-    
     # Split the vectors into subsonic and supersonic
-    sub      = (B2<0)[:,0,0]
-    B2_sub   = B2[sub,:,:]
-    RO1_sub  = B2_sub*RTV1
-    RO2_sub  = B2_sub*RTV2
-    
-    # ZERO-OUT PERTURBATION VELOCITY COMPONENTS
-    U = np.zeros((n_mach,shape_0,shape_1),dtype=np.float32)
-    V = np.zeros((n_mach,shape_0,shape_1),dtype=np.float32)
-    W = np.zeros((n_mach,shape_0,shape_1),dtype=np.float32)    
-    
-    if np.sum(sub)>0:
-        # COMPUTATION FOR SUBSONIC HORSESHOE VORTEX
-        U[sub], V[sub], W[sub] = subsonic(zobar,XSQ1,RO1_sub,XSQ2,RO2_sub,XTY,t,B2_sub,ZSQ,TOLSQ,X1,Y1,X2,Y2,RTV1,RTV2)   
-
-    
-    # COMPUTATION FOR SUPERSONIC HORSESHOE VORTEX. some values computed in a preprocessing section in VLM
-    sup         = (B2>=0)[:,0,0]
-    B2_sup      = B2[sup,:,:]
-    RO1_sup     = B2[sup,:,:]*RTV1
-    RO2_sup     = B2[sup,:,:]*RTV2
-    RNMAX       = VD.panels_per_strip
-    CHORD       = VD.chord_lengths
-    CHORD       = np.repeat(CHORD,shape_0,axis=0)
-    RFLAG       = np.ones((n_mach,shape_1),dtype=np.int8)
+    sub = np.where((B2<0)[:,0,0])[0]
+    sup = np.where((B2>=0)[:,0,0])[0]
     
-    if np.sum(sup)>0:
-        U[sup], V[sup], W[sup], RFLAG[sup,:] = supersonic(zobar,XSQ1,RO1_sup,XSQ2,RO2_sup,XTY,t,B2_sup,ZSQ,TOLSQ,TOL,TOLSQ2,\
-                                                    X1,Y1,X2,Y2,RTV1,RTV2,CUTOFF,CHORD,RNMAX,n_cp,TE_ind,LE_ind)
-         
-    
-    # Rotate into the vehicle frame and pack into a velocity matrix
-    C_mn = np.stack([U, V*costheta - W*sintheta, V*sintheta + W*costheta],axis=-1)
+    # DETERMINE IF THE TRANSVERSE VORTEX LEGS ARE SONIC, only for the supersonic Mach numbers
+    RFLAG = np.ones((n_mach,n_cp),dtype=np.int8)
+    sonic = None
+    if len(sup)>0:
+        RFLAG[sup,:], sonic = sonic_vortices(t*t,B2[sup],n_cp,TE_ind,LE_ind)
     
+    # Size the blocks of Mach numbers and control points
+    memory = induced_velocity_memory(n_cp,n_mach,precision,memory_budget,compute_EW)
     
+    # The outputs
+    C_mn = np.zeros((n_mach,n_cp,n_cp,3),dtype=precision)
     if compute_EW == True:
-        # Calculate the W velocity in the VORLAX frame for later calcs
-        # The angles are Dihedral angle of the current panel - dihedral angle of the influencing panel
-        COS1   = np.cos(DL.T - DL)
-        SIN1   = np.sin(DL.T - DL) 
-        WEIGHT = 1
-        
-        EW = (W*COS1-V*SIN1)*WEIGHT
+        EW = np.zeros((n_mach,n_cp,n_cp),dtype=precision)
     else:
         # Assume that this function is being used outside of VLM, EW is not needed
         EW = np.nan
+    
+    for regime in [sub,sup]:
+        for m_start in range(0,len(regime),memory.mach_block):
+            machs  = regime[m_start:m_start+memory.mach_block]
+            B2_blk = B2[machs]
+            
+            for r_start in range(0,n_cp,memory.row_block):
+                rows = slice(r_start,min(r_start+memory.row_block,n_cp))
+                
+                # rotated receiving points
+                xobar = (xo[rows] - xc)
+                yobar = (yo[rows] - yc)*costheta + (zo[rows] - zc)*sintheta
+                zobar =-(yo[rows] - yc)*sintheta + (zo[rows] - zc)*costheta
+                
+                # COMPUTE COORDINATES OF RECEIVING POINT WITH RESPECT TO END POINTS OF SKEWED LEG.
+                shape_0 = np.shape(xobar)[0]
+                s_blk   = np.repeat(s,shape_0,axis=0)
+                t_blk   = np.repeat(t,shape_0,axis=0)
+                
+                X1 = xobar + t_blk*s_blk # In a planar case XC-XAH
+                Y1 = yobar + s_blk       # In a planar case YC-YAH
+                X2 = xobar - t_blk*s_blk # In a planar case XC-XBH
+                Y2 = yobar - s_blk       # In a planar case YC-YBH
+                
+                # CALCULATE AXIAL DISTANCE BETWEEN PROJECTION OF RECEIVING POINT ONTO HORSESHOE PLANE AND EXTENSION OF SKEWED LEG.
+                XTY = xobar - t_blk*yobar
+                
+                # SET VALUES OF NUMERICAL TOLERANCE CONSTANTS.
+                TOL    = s_blk /500.0
+                TOLSQ  = TOL *TOL
+                TOLSQ2 = 2500.0 *TOLSQ
+                ZSQ    = zobar *zobar
+                YSQ1   = Y1 *Y1
+                YSQ2   = Y2 *Y2
+                RTV1   = YSQ1 + ZSQ
+                RTV2   = YSQ2 + ZSQ
+                XSQ1   = X1 *X1
+                XSQ2   = X2 *X2
+                RO1    = B2_blk*RTV1
+                RO2    = B2_blk*RTV2
+                
+                if regime is sub:
+                    # COMPUTATION FOR SUBSONIC HORSESHOE VORTEX
+                    U, V, W = subsonic(zobar,XSQ1,RO1,XSQ2,RO2,XTY,t_blk,B2_blk,ZSQ,TOLSQ,X1,Y1,X2,Y2,RTV1,RTV2)
+                else:
+                    # COMPUTATION FOR SUPERSONIC HORSESHOE VORTEX
+                    CHORD_blk = np.repeat(CHORD,shape_0,axis=0)
+                    U, V, W   = supersonic(zobar,XSQ1,RO1,XSQ2,RO2,XTY,t_blk,B2_blk,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV1,RTV2,\
+                                           CUTOFF,CHORD_blk,RNMAX,sonic,m_start,r_start)
+                    
+                U = U.astype(precision,copy=False)
+                V = V.astype(precision,copy=False)
+                W = W.astype(precision,copy=False)
+                
+                # Rotate into the vehicle frame and pack into a velocity matrix
+                C_mn[machs,rows,:,0] = U
+                C_mn[machs,rows,:,1] = V*costheta - W*sintheta
+                C_mn[machs,rows,:,2] = V*sintheta + W*costheta
+                
+                if compute_EW == True:
+                    # Calculate the W velocity in the VORLAX frame for later calcs
+                    # The angles are Dihedral angle of the current panel - dihedral angle of the influencing panel
+                    COS1   = np.cos(DL.T[rows] - DL)
+                    SIN1   = np.sin(DL.T[rows] - DL) 
+                    WEIGHT = 1
+                    
+                    EW[machs,rows,:] = (W*COS1-V*SIN1)*WEIGHT
         
+    if return_memory:
+        return C_mn, s, RFLAG, EW, memory
 
     return C_mn, s, RFLAG, EW
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def induced_velocity_memory(n_cp,n_mach,precision=np.float32,memory_budget=None,compute_EW=False):
+    """ This sizes the blocks of Mach numbers and control points that compute_wing_induced_velocity evaluates
+    at once, and estimates the peak memory used. The outputs are always full size, the budget left after them
+    goes to the temporary arrays of a block. All Mach numbers are kept in a block for as long as one control
+    point fits, after that the Mach numbers are split too. A budget that does not fit one control point and one
+    Mach number raises a ValueError.
+
+    Assumptions: 
+    The temporaries of a block are about 17 arrays of the size of the block plus 25 arrays of the size of a 
+    single Mach number, as measured for the supersonic evaluation
+
+    Source:  
+    N/A
+
+    Inputs: 
+    n_cp          - number of control points                       [-]
+    n_mach        - number of Mach numbers                         [-]
+    precision     - floating point precision of the matrices       [np.float32/64]
+    memory_budget - memory available, None evaluates in one block  [bytes]
+    compute_EW    - compute the VORLAX normalwash matrix            [boolean]
     
+    Outputs:                                
+    memory.
+      mach_block  - Mach numbers per block                         [-]
+      row_block   - control points per block                       [-]
+      outputs     - memory of the outputs                          [bytes]
+      peak        - estimated peak memory                          [bytes]
+
+    Properties Used:
+    N/A
+    """
+    itemsize = np.dtype(precision).itemsize
+    
+    # outputs: C_mn and EW
+    outputs = (3 + int(compute_EW))*n_mach*n_cp*n_cp*itemsize
+    
+    # temporaries of one control point, the first part is per Mach number
+    per_mach = 17*n_cp*itemsize
+    per_row  = 25*n_cp*itemsize
+    
+    if memory_budget is None:
+        mach_block = n_mach
+        row_block  = n_cp
+    else:
+        available = memory_budget - outputs
+        row_block = int(available // (per_row + n_mach*per_mach))
+        if row_block >= 1:
+            mach_block = n_mach
+            row_block  = min(row_block,n_cp)
+        else:
+            mach_block = int(min(max((available - per_row)//per_mach,1),n_mach))
+            row_block  = 1
+    
+    mach_block = max(mach_block,1)
+    
+    memory            = Data()
+    memory.mach_block = mach_block
+    memory.row_block  = row_block
+    memory.outputs    = outputs
+    memory.peak       = outputs + row_block*(per_row + mach_block*per_mach)
+    
+    if memory_budget is not None and memory.peak > memory_budget:
+        raise ValueError('The induced velocity matrices do not fit in the memory budget')
+    
+    return memory
+
 def subsonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,X1,Y1,X2,Y2,RTV1,RTV2):
     """  This computes the induced velocities at each control point 
     of the vehicle vortex lattice for subsonic mach numbers
@@ -285,9 +354,10 @@ def subsonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,X1,Y1,X2,Y2,RTV1,RTV2):
     
     return U, V, W
 
-def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV1,RTV2,CUTOFF,CHORD,RNMAX,n_cp,TE_ind, LE_ind):
+def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV1,RTV2,CUTOFF,CHORD,RNMAX,sonic,m_start,r_start):
     """  This computes the induced velocities at each control point 
-    of the vehicle vortex lattice for supersonic mach numbers
+    of the vehicle vortex lattice for supersonic mach numbers. The control points and Mach numbers can be
+    a block of the full lattice, starting at r_start and m_start.
 
     Assumptions: 
     Trailing vortex legs infinity are alligned to freestream
@@ -318,17 +388,14 @@ def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV
     CUTOFF       coefficient                                  [-]
     CHORD        chord length for a panel                     [m] 
     RNMAX        number of chordwise panels                   [-]
-    n_cp         number of control points                     [-]
-    TE_ind       indices of the trailing edge                 [-]
-    LE_ind       indices of the leading edge                  [-]
-    
-
+    sonic        sonic vortex rows and normalwash entries     [-]
+    m_start      first supersonic Mach number of the block    [-]
+    r_start      first control point of the block             [-]
     
     Outputs:           
     U       X velocity        [unitless]
     V       Y velocity        [unitless]
     W       Z velocity        [unitless]
-    RFLAG   sonic vortex flag [boolean] 
 
     Properties Used:
     N/A
@@ -419,11 +486,71 @@ def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV
     V[in_plane] = 0.
     W[in_plane] = W_in
     
+    # COMPUTE THE GENERALIZED PRINCIPAL PART OF THE VORTEX-INDUCED VELOCITY INTEGRAL, WWAVE.
+    # FROM LINE 2647 VORLAX, the IR .NE. IRR means that we're looking at vortices that affect themselves
+    n_mach  = shape[0]
+    n_rows  = shape[1]
+    local   = np.arange(n_rows)
+    diag    = local + r_start
+    T2_diag = T2[local,diag]
+    COX     = CHORD[local,diag] /RNMAX[diag]
+    B2_diag = B2[:,:,0]
+    WWAVE   = np.zeros((n_mach,n_rows),dtype=W.dtype)
+    wave    = np.broadcast_to(B2_diag>T2_diag,(n_mach,n_rows))
+    WWAVE[wave] = (- 0.5 *np.sqrt(B2_diag -T2_diag)/COX)[wave] 
+
+    W[:,local,diag] = W[:,local,diag] + WWAVE
+    
+    # IF CONTROL POINT BELONGS TO A SONIC HORSESHOE VORTEX, AND THE
+    # SENDING ELEMENT IS SUCH HORSESHOE, THEN MODIFY THE NORMALWASH
+    # COEFFICIENTS IN SUCH A WAY THAT THE STRENGTH OF THE SONIC VORTEX
+    # WILL BE THE AVERAGE OF THE STRENGTHS OF THE HORSESHOES IMMEDIATELY
+    # IN FRONT OF AND BEHIND IT.
+    FLAG_bool, targets = sonic
+    
+    # Zero out the row
+    W[FLAG_bool[m_start:m_start+n_mach,r_start:r_start+n_rows]] = 0. # Default to zero
+    
+    # The self velocity goes to 2, the panels before and after go to -1
+    for (m, i, j), value in targets:
+        in_block = (m>=m_start) & (m<m_start+n_mach) & (i>=r_start) & (i<r_start+n_rows)
+        W[m[in_block]-m_start,i[in_block]-r_start,j[in_block]] = value
+
+    return U, V, W
+
+def sonic_vortices(T2,B2,n_cp,TE_ind,LE_ind):
+    """  This finds the sonic vortices, whose transverse leg is swept parallel to the Mach line, and the 
+    normalwash entries that are replaced for them.
+
+    Assumptions: 
+    None
+
+    Source:  
+    1. Miranda, Luis R., Robert D. Elliot, and William M. Baker. "A generalized vortex 
+    lattice method for subsonic and supersonic flow applications." (1977). (NASA CR)
+    
+    2. VORLAX Source Code
+
+    Inputs: 
+    T2           tangent of the horshoe vortex squared        [-] 
+    B2           mach^2-1 (-beta2), supersonic only           [-] 
+    n_cp         number of control points                     [-]
+    TE_ind       indices of the trailing edge                 [-]
+    LE_ind       indices of the leading edge                  [-]
+    
+    Outputs:           
+    RFLAG   sonic vortex flag                                 [boolean] 
+    sonic   sonic vortex rows and normalwash entries          [-]
+
+    Properties Used:
+    N/A
+    """      
+    
     # DETERMINE IF TRANSVERSE VORTEX LEG OF HORSESHOE ASSOCIATED TO THE
     # CONTROL POINT UNDER CONSIDERATION IS SONIC (SWEPT PARALLEL TO MACH
     # LINE)? IF SO THEN RFLAG = 0.0, OTHERWISE RFLAG = 1.0.
-    size   = shape[1]
-    n_mach = shape[0]    
+    size   = n_cp
+    n_mach = np.shape(B2)[0]
     T2S = np.atleast_2d(T2[0,:])*np.ones((n_mach,1))
     T2F = np.zeros((n_mach,size))
     T2A = np.zeros((n_mach,size))
@@ -449,51 +576,16 @@ def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV
     
     FLAG_bool          = np.zeros_like(TRANS,dtype=bool)
     FLAG_bool[TRANS<0] = True
-    FLAG_bool          = np.reshape(FLAG_bool,(n_mach,size,-1))
     
-
-    # COMPUTE THE GENERALIZED PRINCIPAL PART OF THE VORTEX-INDUCED VELOCITY INTEGRAL, WWAVE.
-    # FROM LINE 2647 VORLAX, the IR .NE. IRR means that we're looking at vortices that affect themselves
-    WWAVE   = np.zeros(shape,dtype=np.float32)
-    COX     = CHORD /RNMAX
-    eye     = np.eye(n_cp,dtype=np.int8)
-    T2      = np.broadcast_to(T2,shape)*eye
-    B2_full = np.broadcast_to(B2,shape)*eye
-    COX     = np.broadcast_to(COX,shape)*eye
-    WWAVE[B2_full>T2] = - 0.5 *np.sqrt(B2_full[B2_full>T2] -T2[B2_full>T2] )/COX[B2_full>T2] 
-
-    W = W + WWAVE    
+    # The self velocity of a sonic vortex and the entries just before and after it in the flattened matrix
+    FLAG_ind  = np.where(FLAG_bool)
+    total     = n_mach*size*size
+    flat_self = FLAG_ind[0]*size*size + FLAG_ind[1]*size + FLAG_ind[1]
+    targets   = []
+    for flat, value in [(flat_self,2.),(flat_self-1,-1.),(flat_self+1,-1.)]:
+        targets.append((np.unravel_index(flat % total,(n_mach,size,size)),value))
     
-    # IF CONTROL POINT BELONGS TO A SONIC HORSESHOE VORTEX, AND THE
-    # SENDING ELEMENT IS SUCH HORSESHOE, THEN MODIFY THE NORMALWASH
-    # COEFFICIENTS IN SUCH A WAY THAT THE STRENGTH OF THE SONIC VORTEX
-    # WILL BE THE AVERAGE OF THE STRENGTHS OF THE HORSESHOES IMMEDIATELY
-    # IN FRONT OF AND BEHIND IT.
-    
-    # Zero out the row
-    FLAG_bool_rep     = np.broadcast_to(FLAG_bool,shape)
-    W[FLAG_bool_rep]  = 0. # Default to zero
-
-    # The self velocity goes to 2
-    FLAG_bool_split   = np.array(np.split(FLAG_bool.ravel(),n_mach))
-    FLAG_ind          = np.array(np.where(FLAG_bool_split))
-    squares           = np.zeros((size,size,n_mach))
-    squares[FLAG_ind[1],FLAG_ind[1],FLAG_ind[0]] = 1
-    squares           = np.ravel(squares,order='F')
-    
-    FLAG_bool_self    = np.where(squares==1)[0]
-    W                 = W.ravel()
-    W[FLAG_bool_self] = 2. # It's own value, -2
-    
-    # The panels before and after go to -1
-    FLAG_bool_bef = FLAG_bool_self - 1
-    FLAG_bool_aft = FLAG_bool_self + 1
-    W[FLAG_bool_bef] = -1.
-    W[FLAG_bool_aft] = -1.
-    
-    W = np.reshape(W,shape)
-
-    return U, V, W, RFLAG
+    return RFLAG, (FLAG_bool, targets)
 
 
 def supersonic_in_plane(RAD1,RAD2,Y1,Y2,TOL,XTY,CPI):
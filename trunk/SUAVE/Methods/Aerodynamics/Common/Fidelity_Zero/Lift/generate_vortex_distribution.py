@@ -11,8 +11,9 @@
 
 # package imports 
 import numpy as np
+import copy
 
-from SUAVE.Core import  Data
+from SUAVE.Core import  Data, hash_data
 from SUAVE.Components.Wings import All_Moving_Surface
 from SUAVE.Components.Fuselages import Fuselage
 from SUAVE.Components.Nacelles  import Nacelle
@@ -35,6 +36,16 @@ def generate_vortex_distribution(geometry,settings):
     
     Control surfaces are modelled as wings, but adapt their panel density 
     to that of the area in which they reside on their own wing.   
+    
+    If settings.vortex_distribution_cache_size is set, the vortex distributions
+    of recent geometries are kept in settings.vortex_distribution_cache, keyed
+    by a hash of the wings, fuselages, nacelles and discretization settings.
+    An identical geometry, like another configuration of the same vehicle,
+    gets a copy of the cached vortex distribution instead of a new one. The
+    least recently used vortex distribution is dropped first. A cache is only
+    shared by the analyses whose settings hold the same Data object, so the
+    configurations of a vehicle only reuse each other's vortex distributions
+    when one cache is set in the settings of each of their analyses.
 
     Assumptions: 
     Below is a schematic of the coordinates of an arbitrary panel  
@@ -78,6 +89,8 @@ def generate_vortex_distribution(geometry,settings):
     settings.wing_chordwise_vortices              - the number of vortices to be applied to only the wings
     settings.fuselage_spanwise_vortices           - the number of vortices to be applied to only the fuslages
     settings.fuselage_chordwise_vortices          - the number of vortices to be applied to only the fuselages 
+    settings.vortex_distribution_cache_size       [Unitless], optional, number of vortex distributions kept
+    settings.vortex_distribution_cache            [Data], optional, where the vortex distributions are kept
        
     Outputs:                                   
     VD - vehicle vortex distribution              [Unitless] 
@@ -95,7 +108,9 @@ def generate_vortex_distribution(geometry,settings):
     model_nacelle  = settings.model_nacelle
     precision      = settings.floating_point_precision
     
-    show_prints    = settings.verbose if ('verbose' in settings.keys()) else False
+    keys           = settings.keys()
+    show_prints    = settings.verbose if ('verbose' in keys) else False
+    cache_size     = settings.vortex_distribution_cache_size if ('vortex_distribution_cache_size' in keys) else 0
     
     # unpack discretization settings------------------------------------------
     n_sw_global    = settings.number_spanwise_vortices  
@@ -131,6 +146,24 @@ def generate_vortex_distribution(geometry,settings):
         #everything is already set up to use separate discretization
         pass
     
+    # ---------------------------------------------------------------------------------------
+    # Reuse the vortex distribution of an identical geometry
+    # ---------------------------------------------------------------------------------------
+    if cache_size:
+        if settings.get('vortex_distribution_cache') is None:
+            settings.vortex_distribution_cache = Data()
+        VD_cache = settings.vortex_distribution_cache
+        VD_key   = hash_data(geometry.wings,geometry.fuselages,geometry.nacelles,spc,model_fuselage,model_nacelle,
+                             precision,n_sw_wing,n_cw_wing,n_sw_fuse,n_cw_fuse,settings.discretize_control_surfaces)
+        if VD_key in VD_cache:
+            # move to the back of the line
+            VD = VD_cache.pop(VD_key)
+            VD_cache[VD_key] = VD
+            
+            VD = copy.deepcopy(VD)
+            geometry.vortex_distribution = VD
+            return VD
+    
     # ---------------------------------------------------------------------------------------
     # STEP 1: Define empty vectors for coordinates of panes, control points and bound vortices
     # ---------------------------------------------------------------------------------------
@@ -261,6 +294,14 @@ def generate_vortex_distribution(geometry,settings):
     
     VD = postprocess_VD(VD, settings)
     
+    # keep a copy for identical geometries
+    if cache_size:
+        VD_cache[VD_key] = copy.deepcopy(VD)
+        
+        # drop the least recently used
+        while len(VD_cache) > cache_size:
+            VD_cache.pop(next(iter(VD_cache.keys())))
+    
     # pack VD into geometry
     geometry.vortex_distribution = VD
     
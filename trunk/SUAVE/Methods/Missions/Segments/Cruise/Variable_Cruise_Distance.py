@@ -74,6 +74,67 @@ def unknown_cruise_distance(segment):
     return
 
 
+# --------------------------------------------------------------
+#   Segments - for sequential missions
+# --------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Cruise
+def initialize_segments_before_cruise(segment):
+    """Converges the segments before the cruise once, the cruise distance does not change them.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    segment.cruise_tag              [string]
+    segment.segments                [Data]
+
+    Outputs:
+    N/A
+
+    Properties Used:
+    N/A
+    """      
+    
+    for tag, sub_segment in segment.segments.items():
+        if tag == segment.cruise_tag:
+            break
+        sub_segment.evaluate()
+    
+    return
+
+
+## @ingroup Methods-Missions-Segments-Cruise
+def sequential_segments_from_cruise(segment):
+    """Converges the cruise and the segments after it one by one.
+
+    Assumptions:
+    The segments before the cruise are already converged
+
+    Source:
+    N/A
+
+    Inputs:
+    segment.cruise_tag              [string]
+    segment.segments                [Data]
+
+    Outputs:
+    N/A
+
+    Properties Used:
+    N/A
+    """      
+    
+    tags = list(segment.segments.keys())
+    for tag in tags[tags.index(segment.cruise_tag):]:
+        segment.segments[tag].evaluate()
+    
+    return
+
+
 # --------------------------------------------------------------
 #   Residuals - for Take Off Weight
 # --------------------------------------------------------------
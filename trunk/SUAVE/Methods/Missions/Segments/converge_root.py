@@ -11,7 +11,9 @@
 import scipy.optimize
 import numpy as np
 
+from SUAVE.Core import Data
 from SUAVE.Core.Arrays import array_type
+from SUAVE.Core.Data_Layout import Data_Layout
 
 # ----------------------------------------------------------------------
 #  Converge Root
@@ -30,30 +32,45 @@ def converge_root(segment):
     Inputs:
     segment                            [Data]
     segment.settings.root_finder       [Data]
+    segment.settings.warm_start        [Warm_Start_Cache]
     state.numerics.tolerance_solution  [Unitless]
+    state.numerics.solver_jacobian     [string]
 
     Outputs:
     state.unknowns                     [Any]
     segment.state.numerics.converged   [Unitless]
+    state.numerics.number_of_evaluations [Unitless]
 
     Properties Used:
     N/A
     """       
     
-    unknowns = segment.state.unknowns.pack_array()
+    # layouts of the packed unknowns and residuals, compiled on first use
+    segment.state._unknowns_layout  = Data_Layout()
+    segment.state._residuals_layout = Data_Layout()
     
     try:
         root_finder = segment.settings.root_finder
     except AttributeError:
         root_finder = scipy.optimize.fsolve 
+        
+    try:
+        warm_start = segment.settings.warm_start
+    except AttributeError:
+        warm_start = None
+    
+    segment.state.numerics.number_of_evaluations = 0
+    
+    # seed the unknowns with the last converged solution
+    warm_started = warm_start is not None and warm_start.seed(segment)
     
-    unknowns,infodict,ier,msg = root_finder( iterate,
-                                         unknowns,
-                                         args = segment,
-                                         xtol = segment.state.numerics.tolerance_solution,
-                                         maxfev = segment.state.numerics.max_evaluations,
-                                         epsfcn = segment.state.numerics.step_size,
-                                         full_output = 1)
+    ier, msg = solve(segment, root_finder)
+    
+    # a bad guess is no better than the user's, start again from there
+    if ier!=1 and warm_started:
+        warm_start.fallback(segment)
+        ier, msg = solve(segment, root_finder)
+        warm_started = False
     
     if ier!=1:
         print("Segment did not converge. Segment Tag: " + segment.tag)
@@ -63,6 +80,8 @@ def converge_root(segment):
     else:
         segment.state.numerics.converged = True
         segment.converged = True
+        if warm_start is not None:
+            warm_start.store(segment, warm_started)
                             
     return
     
@@ -70,6 +89,60 @@ def converge_root(segment):
 #  Helper Functions
 # ----------------------------------------------------------------------
 
+## @ingroup Methods-Missions-Segments
+def solve(segment, root_finder):
+    """Runs the root finder from the current unknowns.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    segment                            [Data]
+    state.numerics.tolerance_solution  [Unitless]
+    state.numerics.max_evaluations     [Unitless]
+    state.numerics.step_size           [Unitless]
+    state.numerics.solver_jacobian     [string]
+
+    Outputs:
+    ier                                [int]
+    msg                                [string]
+
+    Properties Used:
+    N/A
+    """
+    
+    unknowns = segment.state._unknowns_layout.pack(segment.state.unknowns)
+    
+    # forget the evaluations of the last solve, the initials may have changed since
+    segment.state._last_evaluation = Data()
+    segment.state._last_evaluation.unknowns          = None
+    segment.state._last_evaluation.residuals         = None
+    segment.state._last_evaluation.jacobian_unknowns = None
+    segment.state._last_evaluation.jacobian          = None
+    
+    # only fsolve is known to take a Jacobian
+    if segment.state.numerics.solver_jacobian == "sparse" and root_finder is scipy.optimize.fsolve:
+        unknowns,infodict,ier,msg = root_finder( iterate,
+                                             unknowns,
+                                             args = segment,
+                                             fprime = sparse_jacobian,
+                                             xtol = segment.state.numerics.tolerance_solution,
+                                             maxfev = segment.state.numerics.max_evaluations,
+                                             full_output = 1)
+    else:
+        unknowns,infodict,ier,msg = root_finder( iterate,
+                                             unknowns,
+                                             args = segment,
+                                             xtol = segment.state.numerics.tolerance_solution,
+                                             maxfev = segment.state.numerics.max_evaluations,
+                                             epsfcn = segment.state.numerics.step_size,
+                                             full_output = 1)
+    
+    return ier, msg
+
 ## @ingroup Methods-Missions-Segments
 def iterate(unknowns, segment):
     
@@ -83,6 +156,9 @@ def iterate(unknowns, segment):
 
     Inputs:
     state.unknowns                [Data]
+    state._unknowns_layout        [Data_Layout]
+    state._residuals_layout       [Data_Layout]
+    state._last_evaluation        [Data]
     segment.process.iterate       [Data]
 
     Outputs:
@@ -91,13 +167,145 @@ def iterate(unknowns, segment):
     Properties Used:
     N/A
     """       
+    last = segment.state.get('_last_evaluation')
+    
     if isinstance(unknowns,array_type):
-        segment.state.unknowns.unpack_array(unknowns)
+        # fsolve asks for the same point more than once in a row, the state is still that of the last call
+        if last is not None and last.unknowns is not None and np.array_equal(last.unknowns,unknowns):
+            return last.residuals*1.
+        segment.state._unknowns_layout.unpack(segment.state.unknowns,unknowns)
     else:
         segment.state.unknowns = unknowns
         
     segment.process.iterate(segment)
+    segment.state.numerics.number_of_evaluations += 1
+    
+    residuals = segment.state._residuals_layout.pack(segment.state.residuals)
+    
+    if last is not None and isinstance(unknowns,array_type):
+        last.unknowns  = unknowns*1.
+        last.residuals = residuals*1.
+        
+    return residuals 
+
+## @ingroup Methods-Missions-Segments
+def sparse_jacobian(unknowns, segment):
+    """Builds the Jacobian of the residuals with colored forward differences. The first time a segment is
+    solved every unknown is perturbed on its own, which also records the residuals that each unknown changes.
+    Unknowns that change no residual in common are then given the same color, and later solves of the
+    segment perturb all the unknowns of a color at once. The Jacobian is the same as with plain forward
+    differences, for one evaluation per color instead of one per unknown.
+
+    Assumptions:
+    A residual that did not change when an unknown was perturbed does not depend on it. If a perturbation
+    changes a residual outside of the recorded pattern, that color is perturbed again one unknown at a time
+    and the pattern is updated.
+
+    Source:
+    Curtis, A. R., Powell, M. J. D., and Reid, J. K., "On the Estimation of Sparse Jacobian Matrices",
+    IMA Journal of Applied Mathematics, Vol. 13, No. 1, 1974
+
+    Inputs:
+    unknowns                      [array]
+    state._jacobian_coloring      [Data]
+    state._last_evaluation        [Data]
+    state.numerics.step_size      [Unitless]
+
+    Outputs:
+    jacobian                      [array]
+    state._jacobian_coloring      [Data]
+
+    Properties Used:
+    N/A
+    """
+    
+    # fsolve checks the shape of the Jacobian at the first guess before it asks for it there again
+    last = segment.state.get('_last_evaluation')
+    if last is not None and last.jacobian_unknowns is not None and np.array_equal(last.jacobian_unknowns,unknowns):
+        return last.jacobian*1.
+    
+    # forward difference step sizes, same as MINPACK
+    step_size = segment.state.numerics.step_size
+    if step_size is None:
+        step_size = 0.
+    eps   = np.sqrt(max(step_size,np.finfo(float).eps))
+    steps = eps*np.abs(unknowns)
+    steps[steps==0.] = eps
+    
+    residuals = iterate(unknowns, segment)
+    jacobian  = np.zeros((len(residuals),len(unknowns)))
+    
+    # the pattern of the last solve, unless the problem changed size
+    coloring = segment.state.get('_jacobian_coloring')
+    if coloring is None or coloring.pattern.shape != jacobian.shape:
+        coloring = Data()
+        coloring.pattern = np.ones(jacobian.shape,dtype=bool)
+        coloring.colors  = np.arange(len(unknowns))
+    
+    for color in np.unique(coloring.colors):
+        members   = np.where(coloring.colors==color)[0]
+        perturbed = unknowns*1.
+        perturbed[members] += steps[members]
+        delta     = iterate(perturbed, segment) - residuals
+
+        if len(members) == 1:
+            jacobian[:,members[0]] = delta/steps[members[0]]
+            continue
+
+        # a residual moved that none of the members should move, the pattern is out of date
+        if np.any(delta[~np.any(coloring.pattern[:,members],axis=1)] != 0.):
+            for j in members:
+                perturbed     = unknowns*1.
+                perturbed[j] += steps[j]
+                jacobian[:,j] = (iterate(perturbed, segment) - residuals)/steps[j]
+            continue
+        
+        for j in members:
+            rows = coloring.pattern[:,j]
+            jacobian[rows,j] = delta[rows]/steps[j]
+    
+    # color the columns for the next solve
+    coloring.pattern = jacobian != 0.
+    coloring.colors  = color_columns(coloring.pattern)
+    segment.state._jacobian_coloring = coloring
     
-    residuals = segment.state.residuals.pack_array()
+    if last is not None:
+        last.jacobian_unknowns = unknowns*1.
+        last.jacobian          = jacobian*1.
         
-    return residuals 
\ No newline at end of file
+    return jacobian
+
+## @ingroup Methods-Missions-Segments
+def color_columns(pattern):
+    """Greedily colors the columns of a sparsity pattern so that no two columns of the same color share a row.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    pattern                       [array of bool]
+
+    Outputs:
+    colors                        [array of int]
+
+    Properties Used:
+    N/A
+    """
+    
+    colors = np.zeros(pattern.shape[1],dtype=int)
+    rows   = []
+    
+    for j in range(pattern.shape[1]):
+        for color, used in enumerate(rows):
+            if not np.any(used & pattern[:,j]):
+                break
+        else:
+            color = len(rows)
+            rows.append(np.zeros(pattern.shape[0],dtype=bool))
+        colors[j]   = color
+        rows[color] = rows[color] | pattern[:,j]
+    
+    return colors
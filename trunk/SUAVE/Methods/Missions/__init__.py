@@ -2,4 +2,6 @@
 # Mission methods contain the functions for setting up and solving a mission.
 # @ingroup Methods
 
-from . import Segments
\ No newline at end of file
+from . import Segments
+
+from .parallel_missions import evaluate_missions
@@ -0,0 +1,167 @@
+## @ingroup Methods-Missions
+# parallel_missions.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+
+import multiprocessing
+
+# ----------------------------------------------------------------------
+#  Evaluate Missions
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions
+def evaluate_missions(missions,number_of_processes=None):
+    """Evaluates independent missions concurrently in a pool of processes. Each mission is sent to a worker,
+    solved there, and the converged segment states are merged back into the original mission objects, so the
+    missions look exactly as if they had been evaluated one after another.
+
+    To run one mission under several vehicle configurations, set up one mission per configuration's analyses.
+
+    Assumptions:
+    The missions share no state with each other, and can be pickled. Only the segment states and convergence flags
+    are sent back from the workers, changes that a mission makes to its vehicle or analyses are lost.
+
+    Source:
+    N/A
+
+    Inputs:
+    missions              [Mission.Container() or list of Missions]
+    number_of_processes   [int], defaults to the number of cores; 1 evaluates in this process
+
+    Outputs:
+    results               [Data() keyed as the missions, or a list in the same order]
+
+    Properties Used:
+    N/A
+    """
+
+    if isinstance(missions,dict):
+        tags = list(missions.keys())
+        mission_list = [missions[tag] for tag in tags]
+    else:
+        tags = None
+        mission_list = list(missions)
+
+    if number_of_processes == 1 or len(mission_list) <= 1:
+        # nothing to gain from a pool
+        for mission in mission_list:
+            mission.evaluate()
+    else:
+        # no more workers than missions
+        if number_of_processes is None:
+            number_of_processes = multiprocessing.cpu_count()
+        pool = multiprocessing.Pool(min(number_of_processes,len(mission_list)))
+        try:
+            # map keeps the order of the missions
+            segment_results = pool.map(evaluate_mission,mission_list)
+        finally:
+            pool.close()
+            pool.join()
+
+        for mission, result in zip(mission_list,segment_results):
+            merge_segment_results(mission,result)
+
+    # pack the results the same way as Mission.Container.evaluate
+    if tags is None:
+        return mission_list
+
+    results = Data()
+    for tag, mission in zip(tags,mission_list):
+        results[tag] = mission
+
+    return results
+
+## @ingroup Methods-Missions
+def evaluate_mission(mission):
+    """Evaluates one mission in a worker process and returns only its segment states.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    mission               [Mission()]
+
+    Outputs:
+    results               [Data()]
+
+    Properties Used:
+    N/A
+    """
+
+    mission.evaluate()
+
+    return segment_results(mission)
+
+## @ingroup Methods-Missions
+def segment_results(segment):
+    """Collects the states and convergence flags of a segment and its sub segments. The analyses are left out so
+    that the vehicle is not sent back from the worker.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    segment               [Segment()]
+
+    Outputs:
+    results               [Data()]
+
+    Properties Used:
+    N/A
+    """
+
+    results = Data()
+    results.state    = segment.state
+    results.segments = Data()
+    if 'converged' in segment:
+        results.converged = segment.converged
+
+    if 'segments' in segment:
+        for tag, sub_segment in segment.segments.items():
+            results.segments[tag] = segment_results(sub_segment)
+
+    return results
+
+## @ingroup Methods-Missions
+def merge_segment_results(segment,results):
+    """Puts the states returned by a worker back into a segment and its sub segments.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    segment               [Segment()]
+    results               [Data()]
+
+    Outputs:
+    segment.state         [State()]
+    segment.conditions    [Conditions()]
+
+    Properties Used:
+    N/A
+    """
+
+    segment.state      = results.state
+    segment.conditions = results.state.conditions
+    if 'converged' in results:
+        segment.converged = results.converged
+
+    for tag, sub_results in results.segments.items():
+        merge_segment_results(segment.segments[tag],sub_results)
+
+    return
@@ -112,19 +112,9 @@ def noise_SAE(turbofan,segment,analyses,config,settings,ioprint = 0, filename =
 
     nsteps = len(noise_time)        
 
-    #Preparing matrix for noise calculation
-    sound_ambient       = np.zeros(nsteps)
-    density_ambient     = np.zeros(nsteps)
-    viscosity           = np.zeros(nsteps)
-    temperature_ambient = np.zeros(nsteps)
-    pressure_amb        = np.zeros(nsteps)
-    Mach_aircraft       = np.zeros(nsteps)
-
-    if type(Velocity_primary) == float:
-        Velocity_primary    = np.ones(nsteps)*Velocity_primary
-
-    if type(Velocity_secondary) == float:
-        Velocity_secondary  = np.ones(nsteps)*Velocity_secondary
+    # trajectory steps along the first axis, frequencies along the second
+    Velocity_primary   = np.ones(nsteps)*np.ravel(Velocity_primary)
+    Velocity_secondary = np.ones(nsteps)*np.ravel(Velocity_secondary)
 
     # ==============================================
     # Computing atmospheric conditions
@@ -153,237 +143,204 @@ def noise_SAE(turbofan,segment,analyses,config,settings,ioprint = 0, filename =
 
     """Starting the main program"""
 
-    #Arrays for the calculation of atmospheric attenuation
-    Acq = np.array((0, 0, 0, 0.1, 0.1, 0.1, 0.1, 0.1, 0.2, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.9, 1.2, 1.5, 1.9, 2.5, 2.9, 3.6, 4.9, 6.8))
-    Acf = np.array((0, 0, 0, 0, 0.1, 0.1, 0.1, 0.1, 0.1, 0.2, 0.2, 0.3, 0.4, 0.5, 0.6, 0.8, 1.0, 1.3, 1.8, 2.5, 3.0, 4.2, 6.1, 9.0))
-
     #Desired frequency range for noise evaluation
     frequency = settings.center_frequencies[5:] 
     num_f     = len(frequency)
 
-    # Defining each array before the main loop
-    B       = np.zeros(num_f)
-    theta_p = np.ones(num_f)*np.pi/2
-    theta_s = np.ones(num_f)*np.pi/2
-    theta_m = np.ones(num_f)*np.pi/2
-    EX_p    = np.zeros(num_f)
-    EX_s    = np.zeros(num_f)
-    EX_m    = np.zeros(num_f)
-    exc     = np.zeros(num_f)
-    SPL_p   = np.zeros(num_f)
-    SPL_s   = np.zeros(num_f)
-    SPL_m   = np.zeros(num_f)
-    PG_p    = np.zeros(num_f)
-    PG_s    = np.zeros(num_f)
-    PG_m    = np.zeros(num_f)
-
-    dspl_attenuation_p = np.zeros(num_f)
-    dspl_attenuation_s = np.zeros(num_f)
-    dspl_attenuation_m = np.zeros(num_f)
-
-    SPL_total_history     = np.zeros((nsteps,num_f))
-    SPL_primary_history   = np.zeros((nsteps,num_f))
-    SPL_secondary_history = np.zeros((nsteps,num_f))
-    SPL_mixed_history     = np.zeros((nsteps,num_f))
-
-    # Noise history in dBA
-    SPLt_dBA         = np.zeros((nsteps,num_f))
-    SPLt_dBA_history = np.zeros((nsteps,num_f))
-    SPLt_dBA_max     = np.zeros(nsteps)
-
-    # Start loop for each position of aircraft 
+    # Column vectors of the trajectory steps
+    Velocity_primary    = Velocity_primary[:,None]
+    Velocity_secondary  = Velocity_secondary[:,None]
+    Temperature_primary = Temperature_primary[:,None]
+    Temperature_secondary = Temperature_secondary[:,None]
+    Pressure_primary    = Pressure_primary[:,None]
+    Pressure_secondary  = Pressure_secondary[:,None]
+    sound_ambient_j     = sound_ambient[:,None]
+    density_ambient_j   = density_ambient[:,None]
+    pressure_amb_j      = pressure_amb[:,None]
+    distance            = np.reshape(distance_microphone,(nsteps,1))
+    theta               = np.reshape(angles,(nsteps,1))
+
+    # Jet Flow Parameters
+
+    #Primary and Secondary jets
+    Cpp = R_gas/(1-1/gamma_primary)
+    Cp  = R_gas/(1-1/gamma)
+
+    density_primary   = Pressure_primary/(R_gas*Temperature_primary-(0.5*R_gas*Velocity_primary**2/Cpp))
+    density_secondary = Pressure_secondary/(R_gas*Temperature_secondary-(0.5*R_gas*Velocity_secondary**2/Cp))
+
+    mass_flow_primary   = Area_primary*Velocity_primary*density_primary
+    mass_flow_secondary = Area_secondary*Velocity_secondary*density_secondary
+
+    #Mach number of the external flow - based on the aircraft velocity
+    Mach_aircraft   = Velocity_aircraft/sound_ambient
+    Mach_aircraft_j = Mach_aircraft[:,None]
+
+    #Calculation Procedure for the Mixed Jet Flow Parameters
+    Velocity_mixed = (mass_flow_primary*Velocity_primary+mass_flow_secondary*Velocity_secondary)/ \
+        (mass_flow_primary+mass_flow_secondary)
+    Temperature_mixed =(mass_flow_primary*Temperature_primary+mass_flow_secondary*Temperature_secondary)/ \
+        (mass_flow_primary+mass_flow_secondary)
+    density_mixed = pressure_amb_j/(R_gas*Temperature_mixed-(0.5*R_gas*Velocity_mixed**2/Cp))
+    Area_mixed = Area_primary*density_primary*Velocity_primary*(1+(mass_flow_secondary/mass_flow_primary))/ \
+        (density_mixed*Velocity_mixed)
+    Diameter_mixed = (4*Area_mixed/np.pi)**0.5
+
+    #**********************************************
+    # START OF THE NOISE PROCEDURE CALCULATIONS
+    #**********************************************
+
+    XBPR = np.clip(mass_flow_secondary/mass_flow_primary - 5.5,0,4)
+
+    #Auxiliary parameter defined as DVPS
+    DVPS = np.abs((Velocity_primary - (Velocity_secondary*Area_secondary+Velocity_aircraft*Area_primary)/\
+                   (Area_secondary+Area_primary)))
+    DVPS = np.maximum(DVPS,0.3)
+
+    # Calculation of the Strouhal number for each jet component (p-primary, s-secondary, m-mixed)
+    Str_p = frequency*Diameter_primary/(DVPS)  #Primary jet
+    Str_s = frequency*Diameter_mixed/(Velocity_secondary-Velocity_aircraft) #Secondary jet
+    Str_m = frequency*Diameter_mixed/(Velocity_mixed-Velocity_aircraft) #Mixed jet
+
+    #Calculation of the Excitation adjustment parameter
+    #Excitation Strouhal Number
+    excitation_Strouhal = (N1/60)*(Diameter_mixed/Velocity_mixed)
+    SX = np.where((excitation_Strouhal > 0.25) & (excitation_Strouhal < 0.5), 0.0,
+                  50*(excitation_Strouhal-0.25)*(excitation_Strouhal-0.5))
+
+    #Effectiveness
+    exps = np.exp(-SX)
+
+    #Spectral Shape Factor
+    exs = 5*exps*np.exp(-(np.log10(Str_m/(2*excitation_Strouhal+0.00001)))**2)
+
+    #Fan Duct Lenght Factor
+    exd = np.exp(0.6-(EXA)**0.5)
+
+    #Excitation source location factor (zk)
+    zk = 1-0.4*(exd)*(exps)    
+
+    # Call function noise source location for the calculation of theta, each step starts from the angles of the last
+    theta_p = np.zeros((nsteps,num_f))
+    theta_s = np.zeros((nsteps,num_f))
+    theta_m = np.zeros((nsteps,num_f))
+    thetaj  = Data()
+    thetaj.theta_p = np.ones(num_f)*np.pi/2
+    thetaj.theta_s = np.ones(num_f)*np.pi/2
+    thetaj.theta_m = np.ones(num_f)*np.pi/2
     for id in range(0,nsteps):
-
-        # Jet Flow Parameters
-
-        #Primary and Secondary jets
-        Cpp = R_gas/(1-1/gamma_primary)
-        Cp  = R_gas/(1-1/gamma)
-
-        density_primary   = Pressure_primary[id]/(R_gas*Temperature_primary[id]-(0.5*R_gas*Velocity_primary[id]**2/Cpp))
-        density_secondary = Pressure_secondary[id]/(R_gas*Temperature_secondary[id]-(0.5*R_gas*Velocity_secondary[id]**2/Cp))
-
-        mass_flow_primary   = Area_primary*Velocity_primary[id]*density_primary
-        mass_flow_secondary = Area_secondary*Velocity_secondary[id]*density_secondary
-
-        #Mach number of the external flow - based on the aircraft velocity
-        Mach_aircraft[id] = Velocity_aircraft/sound_ambient[id]
-
-        #Calculation Procedure for the Mixed Jet Flow Parameters
-        Velocity_mixed = (mass_flow_primary*Velocity_primary[id]+mass_flow_secondary*Velocity_secondary[id])/ \
-            (mass_flow_primary+mass_flow_secondary)
-        Temperature_mixed =(mass_flow_primary*Temperature_primary[id]+mass_flow_secondary*Temperature_secondary[id])/ \
-            (mass_flow_primary+mass_flow_secondary)
-        density_mixed = pressure_amb[id]/(R_gas*Temperature_mixed-(0.5*R_gas*Velocity_mixed**2/Cp))
-        Area_mixed = Area_primary*density_primary*Velocity_primary[id]*(1+(mass_flow_secondary/mass_flow_primary))/ \
-            (density_mixed*Velocity_mixed)
-        Diameter_mixed = (4*Area_mixed/np.pi)**0.5
-
-        #**********************************************
-        # START OF THE NOISE PROCEDURE CALCULATIONS
-        #**********************************************
-
-        XBPR = mass_flow_secondary/mass_flow_primary - 5.5
-        if XBPR<0:
-            XBPR=0
-        elif XBPR>4:
-            XBPR=4
-
-        #Auxiliary parameter defined as DVPS
-        DVPS = np.abs((Velocity_primary[id] - (Velocity_secondary[id]*Area_secondary+Velocity_aircraft*Area_primary)/\
-                       (Area_secondary+Area_primary)))
-        if DVPS<0.3:
-            DVPS=0.3
-
-        # Calculation of the Strouhal number for each jet component (p-primary, s-secondary, m-mixed)
-        Str_p = frequency*Diameter_primary/(DVPS)  #Primary jet
-        Str_s = frequency*Diameter_mixed/(Velocity_secondary[id]-Velocity_aircraft) #Secondary jet
-        Str_m = frequency*Diameter_mixed/(Velocity_mixed-Velocity_aircraft) #Mixed jet
-
-        #Calculation of the Excitation adjustment parameter
-        #Excitation Strouhal Number
-        excitation_Strouhal = (N1/60)*(Diameter_mixed/Velocity_mixed)
-        if (excitation_Strouhal > 0.25 and excitation_Strouhal < 0.5):
-            SX = 0.0
-        else:
-            SX = 50*(excitation_Strouhal-0.25)*(excitation_Strouhal-0.5)
-
-        #Effectiveness
-        exps = np.exp(-SX)
-
-        #Spectral Shape Factor
-        exs = 5*exps*np.exp(-(np.log10(Str_m/(2*excitation_Strouhal+0.00001)))**2)
-
-        #Fan Duct Lenght Factor
-        exd = np.exp(0.6-(EXA)**0.5)
-
-        #Excitation source location factor (zk)
-        zk = 1-0.4*(exd)*(exps)    
-
-        #Main loop for the desired polar angles
-
-        theta = angles[id]
-
-        # Call function noise source location for the calculation of theta
-        thetaj = noise_source_location(B,Xo,zk,Diameter_primary,theta_p,Area_primary,Area_secondary,distance_microphone[id],
-                                       Diameter_secondary,theta,theta_s,theta_m,Diameter_mixed,Velocity_primary[id],
-                                       Velocity_secondary[id],Velocity_mixed,Velocity_aircraft,sound_ambient[id],Str_m,Str_s)
-
-        # Loop for the frequency array range
-        for i in range(0,num_f):
-            #Calculation of the Directivity Factor
-            if (theta_m[i] <=1.4):
-                exc[i] = sound_ambient[id]/Velocity_mixed
-            elif (theta_m[i]>1.4):
-                exc[i] =(sound_ambient[id]/Velocity_mixed)*(1-(1.8/np.pi)*(theta_m[i]-1.4))
-
-            #Acoustic excitation adjustment (EX)
-            EX_m[i] = exd*exs[i]*exc[i]   #mixed component - dependant of the frequency
-
-        EX_p = +5*exd*exps   #primary component - no frequency dependance
-        EX_s = 2*sound_ambient[id]/(Velocity_secondary[id]*(zk)) #secondary component - no frequency dependance    
-
-        distance_primary   = distance_microphone[id] 
-        distance_secondary = distance_microphone[id] 
-        distance_mixed     = distance_microphone[id]
-
-        #Noise attenuation due to Ambient Pressure
-        dspl_ambient_pressure = 20*np.log10(pressure_amb[id]/pressure_isa)
-
-        #Noise attenuation due to Density Gradientes
-        dspl_density_p = 20*np.log10((density_primary+density_secondary)/(2*density_ambient[id]))
-        dspl_density_s = 20*np.log10((density_secondary+density_ambient[id])/(2*density_ambient[id]))
-        dspl_density_m = 20*np.log10((density_mixed+density_ambient[id])/(2*density_ambient[id]))
-
-        #Noise attenuation due to Spherical divergence
-        dspl_spherical_p = 20*np.log10(Diameter_primary/distance_primary)
-        dspl_spherical_s = 20*np.log10(Diameter_mixed/distance_secondary)
-        dspl_spherical_m = 20*np.log10(Diameter_mixed/distance_mixed)
-
-        # Noise attenuation due to Geometric Near-Field
-        if near_field ==0:
-            dspl_geometric_p = 0.0
-            dspl_geometric_s = 0.0
-            dspl_geometric_m = 0.0
-        elif near_field ==1:
-            dspl_geometric_p = -10*np.log10(1+(2*Diameter_primary+(Diameter_primary*sound_ambient[id]/frequency))/distance_primary)
-            dspl_geometric_s = -10*np.log10(1+(2*Diameter_mixed+(Diameter_mixed*sound_ambient[id]/frequency))/distance_secondary)
-            dspl_geometric_m = -10*np.log10(1+(2*Diameter_mixed+(Diameter_mixed*sound_ambient[id]/frequency))/distance_mixed)
-
-        # Noise attenuation due to Acoustic Near-Field
-        if near_field ==0:
-            dspl_acoustic_p = 0.0;
-            dspl_acoustic_s = 0.0;
-            dspl_acoustic_m = 0.0;
-        elif near_field ==1:
-            dspl_acoustic_p = 10*np.log10(1+0.13*(sound_ambient[id]/(distance_primary*frequency))**2)
-            dspl_acoustic_s = 10*np.log10(1+0.13*(sound_ambient[id]/(distance_secondary*frequency))**2)
-            dspl_acoustic_m = 10*np.log10(1+0.13*(sound_ambient[id]/(distance_mixed*frequency))**2)
-
-        # Atmospheric attenuation coefficient
-        if tunnel==0:
-            f_primary   = frequency/(1-Mach_aircraft[id]*np.cos(theta_p))
-            f_secondary = frequency/(1-Mach_aircraft[id]*np.cos(theta_s))
-            f_mixed     = frequency/(1-Mach_aircraft[id]*np.cos(theta_m))
-            Aci         = Acf + ((temperature_ambient[id]-0)-15)/10*(Acq-Acf)    
-
-            Ac_primary   = np.interp(f_primary,frequency,Aci)
-            Ac_secondary = np.interp(f_secondary,frequency,Aci)
-            Ac_mixed     = np.interp(f_mixed,frequency,Aci)
-
-                #Atmospheric attenuation
-            delta_atmo = atmospheric_attenuation(distance_primary)
-
-            dspl_attenuation_p = -delta_atmo 
-            dspl_attenuation_s = -delta_atmo 
-            dspl_attenuation_m = -delta_atmo 
-
-        elif tunnel==1: #These corrections are not applicable for jet rigs or static conditions
-            dspl_attenuation_p = np.zeros(num_f)
-            dspl_attenuation_s = np.zeros(num_f)
-            dspl_attenuation_m = np.zeros(num_f)
-            EX_m = np.zeros(num_f)
-            EX_p = 0
-            EX_s = 0
-
-        # Calculation of the total noise attenuation (p-primary, s-secondary, m-mixed components)
-        DSPL_p = dspl_ambient_pressure+dspl_density_p+dspl_geometric_p+dspl_acoustic_p+dspl_attenuation_p+dspl_spherical_p
-        DSPL_s = dspl_ambient_pressure+dspl_density_s+dspl_geometric_s+dspl_acoustic_s+dspl_attenuation_s+dspl_spherical_s
-        DSPL_m = dspl_ambient_pressure+dspl_density_m+dspl_geometric_m+dspl_acoustic_m+dspl_attenuation_m+dspl_spherical_m
-
-
-        # Calculation of interference effects on jet noise
-        ATK_m   = angle_of_attack_effect(AOA,Mach_aircraft[id],theta_m)
-        INST_s  = jet_installation_effect(Xe,Ye,Ce,theta_s,Diameter_mixed)
-        Plug    = external_plug_effect(Velocity_primary[id],Velocity_secondary[id], Velocity_mixed, Diameter_primary,Diameter_secondary,
-                                       Diameter_mixed, Plug_diameter, sound_ambient[id], theta_p,theta_s,theta_m)
-
-        GPROX_m = ground_proximity_effect(Velocity_mixed,sound_ambient[id],theta_m,engine_height,Diameter_mixed,frequency)
-
-        # Calculation of the sound pressure level for each jet component
-        SPL_p = primary_noise_component(SPL_p,Velocity_primary[id],Temperature_primary[id],R_gas,theta_p,DVPS,sound_ambient[id],
-                                        Velocity_secondary[id],Velocity_aircraft,Area_primary,Area_secondary,DSPL_p,EX_p,Str_p) + Plug.PG_p
-
-        SPL_s = secondary_noise_component(SPL_s,Velocity_primary[id],theta_s,sound_ambient[id],Velocity_secondary[id],
-                                          Velocity_aircraft,Area_primary,Area_secondary,DSPL_s,EX_s,Str_s) + Plug.PG_s + INST_s
-
-        SPL_m = mixed_noise_component(SPL_m,Velocity_primary[id],theta_m,sound_ambient[id],Velocity_secondary[id],
-                                      Velocity_aircraft,Area_primary,Area_secondary,DSPL_m,EX_m,Str_m,Velocity_mixed,XBPR) + \
-            Plug.PG_m + ATK_m + GPROX_m
-
-        # Sum of the Total Noise
-        SPL_total = 10 * np.log10(10**(0.1*SPL_p)+10**(0.1*SPL_s)+10**(0.1*SPL_m))
-
-        # Store the SPL history     
-        SPL_total_history[id][:]     = SPL_total[:]
-        SPL_primary_history[id][:]   = SPL_p[:]
-        SPL_secondary_history[id][:] = SPL_s[:]
-        SPL_mixed_history[id][:]     = SPL_m[:]
-
-        # Calculation of dBA based on the sound pressure time history
-        SPLt_dBA                = dbA_noise(SPL_total)
-        SPLt_dBA_history[id][:] = dbA_noise(SPL_total)
-        SPLt_dBA_max[id]        = max(SPLt_dBA)
+        thetaj = noise_source_location(None,Xo,zk[id],Diameter_primary,thetaj.theta_p,Area_primary,Area_secondary,distance[id],
+                                       Diameter_secondary,theta[id],thetaj.theta_s,thetaj.theta_m,Diameter_mixed[id],Velocity_primary[id],
+                                       Velocity_secondary[id],Velocity_mixed[id],Velocity_aircraft,sound_ambient_j[id],Str_m[id],Str_s[id])
+        theta_p[id] = thetaj.theta_p
+        theta_s[id] = thetaj.theta_s
+        theta_m[id] = thetaj.theta_m
+
+    #Calculation of the Directivity Factor
+    exc = np.where(theta_m <= 1.4, sound_ambient_j/Velocity_mixed, (sound_ambient_j/Velocity_mixed)*(1-(1.8/np.pi)*(theta_m-1.4)))
+
+    #Acoustic excitation adjustment (EX)
+    EX_m = exd*exs*exc   #mixed component - dependant of the frequency
+    EX_p = +5*exd*exps   #primary component - no frequency dependance
+    EX_s = 2*sound_ambient_j/(Velocity_secondary*(zk)) #secondary component - no frequency dependance    
+
+    distance_primary   = distance 
+    distance_secondary = distance 
+    distance_mixed     = distance
+
+    #Noise attenuation due to Ambient Pressure
+    dspl_ambient_pressure = 20*np.log10(pressure_amb_j/pressure_isa)
+
+    #Noise attenuation due to Density Gradientes
+    dspl_density_p = 20*np.log10((density_primary+density_secondary)/(2*density_ambient_j))
+    dspl_density_s = 20*np.log10((density_secondary+density_ambient_j)/(2*density_ambient_j))
+    dspl_density_m = 20*np.log10((density_mixed+density_ambient_j)/(2*density_ambient_j))
+
+    #Noise attenuation due to Spherical divergence
+    dspl_spherical_p = 20*np.log10(Diameter_primary/distance_primary)
+    dspl_spherical_s = 20*np.log10(Diameter_mixed/distance_secondary)
+    dspl_spherical_m = 20*np.log10(Diameter_mixed/distance_mixed)
+
+    # Noise attenuation due to Geometric Near-Field
+    if near_field ==0:
+        dspl_geometric_p = 0.0
+        dspl_geometric_s = 0.0
+        dspl_geometric_m = 0.0
+    elif near_field ==1:
+        dspl_geometric_p = -10*np.log10(1+(2*Diameter_primary+(Diameter_primary*sound_ambient_j/frequency))/distance_primary)
+        dspl_geometric_s = -10*np.log10(1+(2*Diameter_mixed+(Diameter_mixed*sound_ambient_j/frequency))/distance_secondary)
+        dspl_geometric_m = -10*np.log10(1+(2*Diameter_mixed+(Diameter_mixed*sound_ambient_j/frequency))/distance_mixed)
+
+    # Noise attenuation due to Acoustic Near-Field
+    if near_field ==0:
+        dspl_acoustic_p = 0.0;
+        dspl_acoustic_s = 0.0;
+        dspl_acoustic_m = 0.0;
+    elif near_field ==1:
+        dspl_acoustic_p = 10*np.log10(1+0.13*(sound_ambient_j/(distance_primary*frequency))**2)
+        dspl_acoustic_s = 10*np.log10(1+0.13*(sound_ambient_j/(distance_secondary*frequency))**2)
+        dspl_acoustic_m = 10*np.log10(1+0.13*(sound_ambient_j/(distance_mixed*frequency))**2)
+
+    # Atmospheric attenuation coefficient
+    if tunnel==0:
+        #Atmospheric attenuation
+        delta_atmo = atmospheric_attenuation(distance_primary)
+
+        dspl_attenuation_p = -delta_atmo 
+        dspl_attenuation_s = -delta_atmo 
+        dspl_attenuation_m = -delta_atmo 
+
+    elif tunnel==1: #These corrections are not applicable for jet rigs or static conditions
+        dspl_attenuation_p = np.zeros(num_f)
+        dspl_attenuation_s = np.zeros(num_f)
+        dspl_attenuation_m = np.zeros(num_f)
+        EX_m = np.zeros(num_f)
+        EX_p = 0
+        EX_s = 0
+
+    # Calculation of the total noise attenuation (p-primary, s-secondary, m-mixed components)
+    DSPL_p = dspl_ambient_pressure+dspl_density_p+dspl_geometric_p+dspl_acoustic_p+dspl_attenuation_p+dspl_spherical_p
+    DSPL_s = dspl_ambient_pressure+dspl_density_s+dspl_geometric_s+dspl_acoustic_s+dspl_attenuation_s+dspl_spherical_s
+    DSPL_m = dspl_ambient_pressure+dspl_density_m+dspl_geometric_m+dspl_acoustic_m+dspl_attenuation_m+dspl_spherical_m
+
+
+    # Calculation of interference effects on jet noise
+    ATK_m   = angle_of_attack_effect(AOA,Mach_aircraft_j,theta_m)
+    INST_s  = jet_installation_effect(Xe,Ye,Ce,theta_s,Diameter_mixed)
+    Plug    = external_plug_effect(Velocity_primary,Velocity_secondary, Velocity_mixed, Diameter_primary,Diameter_secondary,
+                                   Diameter_mixed, Plug_diameter, sound_ambient_j, theta_p,theta_s,theta_m)
+
+    GPROX_m = ground_proximity_effect(Velocity_mixed,sound_ambient_j,theta_m,engine_height,Diameter_mixed,frequency)
+
+    # Calculation of the sound pressure level for each jet component
+    SPL_p = primary_noise_component(None,Velocity_primary,Temperature_primary,R_gas,theta_p,DVPS,sound_ambient_j,
+                                    Velocity_secondary,Velocity_aircraft,Area_primary,Area_secondary,DSPL_p,EX_p,Str_p) + Plug.PG_p
+
+    # the primary component is not evaluated in the highest band, which only carries the plug effect of the steps so far
+    SPL_p[:,-1] = np.cumsum(Plug.PG_p[:,-1])
+
+    SPL_s = secondary_noise_component(None,Velocity_primary,theta_s,sound_ambient_j,Velocity_secondary,
+                                      Velocity_aircraft,Area_primary,Area_secondary,DSPL_s,EX_s,Str_s) + Plug.PG_s + INST_s
+
+    SPL_m = mixed_noise_component(None,Velocity_primary,theta_m,sound_ambient_j,Velocity_secondary,
+                                  Velocity_aircraft,Area_primary,Area_secondary,DSPL_m,EX_m,Str_m,Velocity_mixed,XBPR) + \
+        Plug.PG_m + ATK_m + GPROX_m
+
+    # Sum of the Total Noise
+    SPL_total = 10 * np.log10(10**(0.1*SPL_p)+10**(0.1*SPL_s)+10**(0.1*SPL_m))
+
+    # Store the SPL history     
+    SPL_total_history     = SPL_total
+    SPL_primary_history   = SPL_p
+    SPL_secondary_history = SPL_s
+    SPL_mixed_history     = SPL_m
+
+    # Calculation of dBA based on the sound pressure time history
+    SPLt_dBA_history = dbA_noise(SPL_total)
+    SPLt_dBA_max     = np.max(SPLt_dBA_history,axis=1)
+
+    Velocity_primary   = Velocity_primary[:,0]
+    Velocity_secondary = Velocity_secondary[:,0]
 
     # Calculation of the Perceived Noise Level EPNL based on the sound time history
     PNL_total               =  pnl_noise(SPL_total_history)    
@@ -18,7 +18,8 @@ import numpy as np
 def noise_source_location(B,Xo,zk,Diameter_primary,theta_p,Area_primary,Area_secondary,distance_microphone,
                            Diameter_secondary,theta,theta_s,theta_m,Diameter_mixed,Velocity_primary,Velocity_secondary,
                            Velocity_mixed,Velocity_aircraft,sound_ambient,Str_m,Str_s):
-    """This function calculates the noise source location
+    """This function calculates the noise source location. The polar angles of all trajectory steps and
+    frequencies are converged at once, each one stops when its source location has converged.
     
     Assumptions:
         None
@@ -38,7 +39,7 @@ def noise_source_location(B,Xo,zk,Diameter_primary,theta_p,Area_primary,Area_sec
         Diameter_secondary        [m]
         theta                     [rad]
         theta_s                   [rad]
-        theta_m                   [rad]
+        theta_m                   [rad]  initial guesses, any shape that broadcasts with the inputs
         Diameter_mixed            [m]
         Velocity_primary          [m/s]
         Velocity_secondary        [m/s]
@@ -59,107 +60,74 @@ def noise_source_location(B,Xo,zk,Diameter_primary,theta_p,Area_primary,Area_sec
     """
     
     # P rimary jet source location
-    XJ = np.zeros(24)
+    def primary_location(theta_j):
+        return (zk*Diameter_primary)*(4.+4.*np.arctan((18.*theta_j/np.pi)-9.)+(Area_secondary/Area_primary))
     
-    for i in range(24):
-        residual = Diameter_primary
-        XJ[i]    = (zk*Diameter_primary)*(4.+4.*np.arctan((18.*theta_p[i]/np.pi)-9.)+(Area_secondary/Area_primary))
-        B[i]     = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
+    theta_p = source_angle(primary_location(theta_p),primary_location,Xo,theta,distance_microphone,Diameter_primary/200.)
         
-        if (B[i]>=0.):
-            theta_p[i]=np.arcsin(((B[i])**2.+1.)**(-0.5))
-        else:
-            theta_p[i]=np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-
-        XJ[i] = (zk*Diameter_primary)*(4.+4.*np.arctan((18.*theta_p[i]/np.pi)-9.)+(Area_secondary/Area_primary))
-        
-        while residual>(Diameter_primary/200.):
-            XJ_old = XJ[i]
-            theta1 = theta_p[i]
-            B[i]   = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-            
-            if B[i]>=0.:
-                theta_p[i] = np.arcsin(((B[i])**2.+1.)**(-0.5))
-            else:
-                theta_p[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-
-            theta2     = theta_p[i]
-            theta_p[i] = (theta1+theta2)/2.
-            XJ[i]      = (zk*Diameter_primary)*(4.+4.*np.arctan((18.*theta_p[i]/np.pi)-9.)+(Area_secondary/Area_primary))
-            residual   = np.abs(XJ_old-XJ[i])
-
-        # Secondary jet source location
-        residual = Diameter_secondary
-        XJ_old   = 0.0
-        XJ[i]    = (zk*Diameter_secondary)*(2.+1.6*np.arctan((4.5*theta_s[i]/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s[i])) \
+    # Secondary jet source location
+    def secondary_location(theta_j,Diameter):
+        return (zk*Diameter)*(2.+1.6*np.arctan((4.5*theta_j/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s)) \
             *  np.sqrt(1.+(0.7*Velocity_secondary/sound_ambient))*(Velocity_secondary/(Velocity_secondary-Velocity_aircraft))
+    
+    theta_s = source_angle(secondary_location(theta_s,Diameter_secondary),lambda theta_j: secondary_location(theta_j,Diameter_mixed),
+                           Xo,theta,distance_microphone,Diameter_mixed/200.)
         
-        B[i]     = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-        
-        if B[i]>=0.:
-            theta_s[i] = np.arcsin(((B[i])**2.+1.)**(-0.5))
-        else:
-            theta_s[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-            
-        XJ[i] = (zk*Diameter_mixed)*(2.+1.6*np.arctan((4.5*theta_s[i]/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s[i]))* \
-            np.sqrt(1.+(0.7*Velocity_secondary/sound_ambient))*(Velocity_secondary/(Velocity_secondary-Velocity_aircraft))
-        
-        while residual>(Diameter_mixed/200.):
-            XJ_old = XJ[i]
-            theta1 = theta_s[i]
-            B[i]   = (1/np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-            
-            if B[i]>=0.:
-                theta_s[i] = np.arcsin((B[i]**2.+1.)**(-0.5))
-            else:
-                theta_s[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-
-            theta2     = theta_s[i]
-            theta_s[i] = (theta1+theta2)/2.
-            XJ[i]      = (zk*Diameter_mixed)*(2.+1.6*np.arctan((4.5*theta_s[i]/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s[i]))* \
-                np.sqrt(1.+(0.7*Velocity_secondary/sound_ambient))*(Velocity_secondary/(Velocity_secondary-Velocity_aircraft))
-            
-            residual = np.abs(XJ_old-XJ[i])
-
-        #Mixed jet source location
-        residual = Diameter_mixed
-        XJ_old   = 0.
-        XJ[i] = (zk*Diameter_mixed)*(3.+np.exp(-Str_m[i])+(2.+1.1*np.arctan((18.*theta_m[i]/np.pi)-13.))+ \
-            (1.+0.5/np.sqrt(Str_m[i])))*np.sqrt(0.5+0.5*Velocity_mixed/sound_ambient) * \
+    #Mixed jet source location
+    def mixed_location(theta_j):
+        return (zk*Diameter_mixed)*(3.+np.exp(-Str_m)+(2.+1.1*np.arctan((18.*theta_j/np.pi)-13.))+ \
+            (1.+0.5/np.sqrt(Str_m)))*np.sqrt(0.5+0.5*Velocity_mixed/sound_ambient) * \
             (Velocity_mixed/(Velocity_mixed-Velocity_aircraft))
-        
-        B[i] = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-        if B[i]>=0.:
-            theta_m[i] = np.arcsin(((B[i])**2.+1.)**(-0.5))
-        else:
-            theta_m[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-
-        XJ[i]=(zk*Diameter_mixed)*(3.+np.exp(-Str_m[i])+(2.+1.1*np.arctan((18.*theta_m[i]/np.pi)-13.))+\
-            (1.+0.5/np.sqrt(Str_m[i])))*np.sqrt(0.5+0.5*Velocity_mixed/sound_ambient) \
-            *(Velocity_mixed/(Velocity_mixed-Velocity_aircraft))
-        
-        while residual>(Diameter_mixed/200.):
-            XJ_old = XJ[i]
-            theta1 = theta_m[i]
-            B[i]   = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-            
-            if B[i]>=0.:
-                theta_m[i] = np.arcsin(((B[i])**2.+1.)**(-0.5))
-            else:
-                theta_m[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-                
-            theta2     = theta_m[i]
-            theta_m[i] = (theta1+theta2)/2.
-            XJ[i]      = (zk*Diameter_mixed)*(3.+np.exp(-Str_m[i])+(2.+1.1*np.arctan((18.*theta_m[i]/np.pi)-13.))+\
-                (1.+0.5/np.sqrt(Str_m[i])))*np.sqrt(0.5+0.5*Velocity_mixed/sound_ambient) \
-                *(Velocity_mixed/(Velocity_mixed-Velocity_aircraft))
-            
-            residual   = abs(XJ_old-XJ[i])
-   
-   
+    
+    theta_m = source_angle(mixed_location(theta_m),mixed_location,Xo,theta,distance_microphone,Diameter_mixed/200.)
+    
     source_location = Data()
     source_location.theta_p = theta_p
     source_location.theta_s = theta_s
     source_location.theta_m = theta_m
     
-    return source_location
\ No newline at end of file
+    return source_location
+
+## @ingroup Methods-Noise-Fidelity_One-Engine
+def source_angle(XJ,source_location,Xo,theta,distance_microphone,tolerance):
+    """This function converges the polar angle of a jet noise source with the source location. Every step
+    averages the last angle with the angle seen from the new source location.
+    
+    Assumptions:
+        None
+
+    Source:
+        SAE ARP876D: Gas Turbine Jet Exhaust Noise Prediction
+
+    Inputs: 
+        XJ                        - initial source location               [m]
+        source_location           - source location of a polar angle      [m]
+        Xo                        - acoustic center of reference          [m]
+        theta                     - polar angle of the microphone         [rad]
+        distance_microphone       - distance to the microphone            [m]
+        tolerance                 - source location tolerance             [m]
+
+    Outputs: 
+        theta_j                   - polar angle of the source             [rad]
+    
+    Properties Used:
+        N/A 
+    
+    """
+    
+    def polar_angle(XJ):
+        B = (1./np.sin(theta))*(((Xo+XJ)/distance_microphone)+np.cos(theta))
+        return np.where(B>=0.,np.arcsin(((B)**2.+1.)**(-0.5)),np.pi-np.arcsin(((B)**2.+1.)**(-0.5)))
+    
+    theta_j = polar_angle(XJ)
+    XJ      = source_location(theta_j)
+    
+    # every angle takes at least one step
+    active  = np.ones(np.shape(XJ),dtype=bool)
+    while np.any(active):
+        XJ_old  = XJ
+        theta_j = np.where(active,(theta_j + polar_angle(XJ))/2.,theta_j)
+        XJ      = np.where(active,source_location(theta_j),XJ)
+        active  = active & (np.abs(XJ_old-XJ) > tolerance)
+    
+    return theta_j
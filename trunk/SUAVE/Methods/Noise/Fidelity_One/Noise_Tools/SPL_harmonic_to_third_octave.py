@@ -43,25 +43,35 @@ def SPL_harmonic_to_third_octave(SPL,f,settings):
     """  
     # unpack 
     cf               = settings.center_frequencies
-    lf               = settings.lower_frequencies
-    uf               = settings.upper_frequencies
+    lf               = np.asarray(settings.lower_frequencies)
+    uf               = np.asarray(settings.upper_frequencies)
     
     dim_cpt          = len(SPL[:,0,0,0])
     dim_mic          = len(SPL[0,:,0,0])
     dim_prop         = len(SPL[0,0,:,0])
     num_cf           = len(cf)
     num_f            = len(f[0,:])
-    SPL_third_octave = np.zeros((dim_cpt,dim_mic,dim_prop,num_cf)) 
     
-    # loop through 1/3 octave spectra and sum up components 
-    for i in range(dim_cpt):  
-        for j in range(num_cf):
-            SPL_in_range = np.empty(shape=[dim_mic,dim_prop,0 ])
-            for k in range(num_f):  
-                if (lf[j] <= f[i,k]) and (f[i,k] <= uf[j]):   
-                    SPL_in_range = np.concatenate((SPL_in_range,np.atleast_3d(SPL[i,:,:,k])), axis = 2) 
-                if len(SPL_in_range[0,0,:]) > 0:  
-                    SPL_in_range[SPL_in_range != 0]  
-                    SPL_third_octave[i,:,:,j] = SPL_arithmetic(SPL_in_range)   
+    # sort the spectrum frequencies of every control point so that each 1/3 octave band is a range of them
+    order            = np.argsort(f,axis=1,kind='stable')
+    f_sorted         = np.take_along_axis(f,order,axis=1)
+    p_prefs          = 10**(np.take_along_axis(SPL,order[:,None,None,:],axis=3)/10)
+    
+    # first and last frequencies in each band, band edges included
+    start            = np.sum(f_sorted[:,:,None] <  lf[None,None,:],axis=1)
+    end              = np.sum(f_sorted[:,:,None] <= uf[None,None,:],axis=1)
+    in_band          = end > start
+    
+    # sum up the components of all bands at once, a zero after the last frequency of every control point keeps the ranges inside it
+    p_prefs          = np.concatenate((p_prefs,np.zeros((dim_cpt,dim_mic,dim_prop,1))),axis=3)
+    p_prefs          = np.reshape(np.transpose(p_prefs,(1,2,0,3)),(dim_mic,dim_prop,dim_cpt*(num_f + 1)))
+    offset           = np.arange(dim_cpt)[:,None]*(num_f + 1)
+    indices          = np.reshape(np.stack((start + offset,end + offset),axis=2),-1)
+    p_sum            = np.add.reduceat(p_prefs,indices,axis=2)[:,:,::2]
+    p_sum            = np.transpose(np.reshape(p_sum,(dim_mic,dim_prop,dim_cpt,num_cf)),(2,0,1,3))
+    
+    # bands without components are left at zero
+    p_sum            = np.where(in_band[:,None,None,:],p_sum,1.)
+    SPL_third_octave = 10*np.log10(p_sum)
                     
     return SPL_third_octave
@@ -20,4 +20,6 @@ from .print_propeller_output                import print_propeller_output
 from .generate_microphone_points            import generate_building_microphone_points
 from .generate_microphone_points            import generate_ground_microphone_points
 from .compute_noise_evaluation_locations    import compute_ground_noise_evaluation_locations
-from .compute_noise_evaluation_locations    import compute_building_noise_evaluation_locations 
\ No newline at end of file
+from .compute_noise_evaluation_locations    import compute_building_noise_evaluation_locations
+from .microphone_culling                    import generate_probe_microphone_points
+from .microphone_culling                    import cull_microphones
\ No newline at end of file
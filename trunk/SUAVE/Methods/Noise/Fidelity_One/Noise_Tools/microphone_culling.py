@@ -0,0 +1,118 @@
+## @ingroup Methods-Noise-Fidelity_One-Noise_Tools
+# microphone_culling.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ---------------------------------------------------------------------
+import numpy as np
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.atmospheric_attenuation import atmospheric_attenuation
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.decibel_arithmetic      import SPL_arithmetic
+
+# ----------------------------------------------------------------------
+#  Probe Microphone Points
+# ---------------------------------------------------------------------
+## @ingroup Methods-Noise-Fidelity_One-Noise_Tools
+def generate_probe_microphone_points(ctrl_pts,number_of_points,distance):
+    """This computes microphone locations evenly spread on a sphere around the source. The levels on the
+    sphere give the directivity envelope of the source that is used to cull distant microphones. Vectors
+    point from observer/microphone to aircraft/source
+
+    Assumptions:
+        Points are placed on a Fibonacci lattice
+
+    Source:
+        N/A
+
+    Inputs:
+        ctrl_pts         - number of control points                     [unitless]
+        number_of_points - number of microphones on the sphere          [unitless]
+        distance         - radius of the sphere                         [meters]
+
+    Outputs:
+        probe_locations  - microphone locations, (ctrl_pts,number_of_points,3)   [meters]
+
+    Properties Used:
+        N/A
+    """
+    idx             = np.arange(number_of_points) + 0.5
+    z               = 1 - 2*idx/number_of_points
+    rho             = np.sqrt(1 - z**2)
+    psi             = np.pi*(1 + 5**0.5)*idx
+    directions      = np.vstack((rho*np.cos(psi),rho*np.sin(psi),z)).T
+    probe_locations = np.repeat(distance*directions[np.newaxis,:,:],ctrl_pts,axis=0)
+
+    return probe_locations
+
+# ----------------------------------------------------------------------
+#  Cull Microphones
+# ---------------------------------------------------------------------
+## @ingroup Methods-Noise-Fidelity_One-Noise_Tools
+def cull_microphones(probe_locations,probe_spectrum,microphone_locations,source_offset,settings):
+    """This finds the microphones that can hear the source above the culling floor. The loudest level
+    in each 1/3 octave band of the probes around the direction of a microphone is carried to the
+    microphone with spherical spreading and atmospheric attenuation, and the microphone is culled when
+    the total level stays below the floor at every control point.
+
+    Assumptions:
+        The source radiates no louder between the probes than the loudest probe within one probe spacing
+        plus the culling margin
+        Atmospheric attenuation is only applied to the bands covered by the SAE model
+
+    Source:
+        N/A
+
+    Inputs:
+        probe_locations       - microphone locations on the probe sphere, (ctrl_pts,num_probes,3)         [meters]
+        probe_spectrum        - 1/3 octave band spectrum on the probe sphere, (ctrl_pts,num_probes,num_cf)  [dB]
+        microphone_locations  - microphone locations, (ctrl_pts,num_mic,3)                                 [meters]
+        source_offset         - largest distance of a source from the origin of the microphone locations   [meters]
+        settings.
+            microphone_culling_floor  - lowest SPL that is evaluated                                        [dB]
+            microphone_culling_margin - allowance for the directivity between the probes                    [dB]
+
+    Outputs:
+        keep                  - microphones that are evaluated, (num_mic)                                   [boolean]
+        SPL_estimate          - highest estimated SPL at each microphone, (num_mic)                         [dB]
+
+    Properties Used:
+        N/A
+    """
+    floor          = settings.microphone_culling_floor
+    margin         = settings.microphone_culling_margin
+    ctrl_pts       = len(microphone_locations)
+    num_probes     = len(probe_locations[0])
+    num_cf         = probe_spectrum.shape[2]
+
+    # closest possible distance from the sources to the microphones
+    mic_distance   = np.linalg.norm(microphone_locations,axis=2)
+    distance       = np.maximum(mic_distance - source_offset,1E-6)
+    probe_distance = np.linalg.norm(probe_locations,axis=2)[:,:1]
+
+    # probes within one probe spacing of the direction of each microphone
+    spacing        = np.sqrt(4*np.pi/num_probes)
+    mic_dirs       = microphone_locations/np.maximum(mic_distance,1E-12)[:,:,None]
+    probe_dirs     = probe_locations/probe_distance[:,:,None]
+
+    SPL_estimate   = np.zeros_like(distance)
+    for cpt in range(ctrl_pts):
+        angle      = np.arccos(np.clip(np.dot(mic_dirs[cpt],probe_dirs[cpt].T),-1.,1.))
+        neighbours = angle <= np.maximum(spacing,np.min(angle,axis=1))[:,None]
+
+        # loudest band levels of the neighbouring probes
+        SPL_probe  = np.max(np.where(neighbours[:,:,None],probe_spectrum[cpt][None,:,:],-np.inf),axis=1) + margin
+
+        # spherical spreading from the probe sphere
+        dspl_spherical = 20*np.log10(distance[cpt]/probe_distance[cpt])[:,None]
+
+        # atmospheric attenuation beyond the probe sphere
+        dspl_attenuation          = np.zeros((len(distance[cpt]),num_cf))
+        dspl_attenuation[:,-24:]  = atmospheric_attenuation(np.maximum(distance[cpt] - probe_distance[cpt],0)[:,None])
+
+        SPL_estimate[cpt] = SPL_arithmetic(SPL_probe - dspl_spherical - dspl_attenuation,sum_axis=1)
+
+    SPL_estimate = np.max(SPL_estimate,axis=0)
+    keep         = SPL_estimate >= floor
+
+    return keep, SPL_estimate
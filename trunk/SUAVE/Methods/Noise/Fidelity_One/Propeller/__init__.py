@@ -3,6 +3,7 @@
 # @ingroup Methods-Noise
   
 from .propeller_mid_fidelity      import propeller_mid_fidelity 
+from .propeller_mid_fidelity_culled import propeller_mid_fidelity_culled
 from .compute_broadband_noise     import compute_broadband_noise
 from .compute_harmonic_noise      import compute_harmonic_noise
 from .compute_source_coordinates  import compute_point_source_coordinates
@@ -100,9 +100,6 @@ def compute_broadband_noise(freestream,angle_of_attack,bspv,
     delta_r[1:-1]      = (del_r[:-1]+ del_r[1:])/2
 
 
-    bstei   = 1      # bottom surface trailing edge index 
-    ustei   = -bstei # upper surface trailing edge index 
-
     if np.all(Omega == 0):
         res.p_pref_broadband                          = np.zeros((num_cpt,num_mic,num_rot,num_cf)) 
         res.SPL_prop_broadband_spectrum               = np.zeros_like(res.p_pref_broadband)
@@ -137,51 +134,19 @@ def compute_broadband_noise(freestream,angle_of_attack,bspv,
         if rotor.nonuniform_freestream: 
 
             # return the 1D Cl and CDval of shape (ctrl_pts, Nr)
-            theta_ls         = np.zeros((num_cpt,num_sec,num_azi))
-            delta_ls         = np.zeros((num_cpt,num_sec,num_azi))
-            delta_star_ls    = np.zeros((num_cpt,num_sec,num_azi))
-            Ue_Vinf_ls       = np.zeros((num_cpt,num_sec,num_azi))
-            cf_ls            = np.zeros((num_cpt,num_sec,num_azi))
-            dcp_dx_ls        = np.zeros((num_cpt,num_sec,num_azi))
-            theta_us         = np.zeros((num_cpt,num_sec,num_azi))
-            delta_us         = np.zeros((num_cpt,num_sec,num_azi))
-            delta_star_us    = np.zeros((num_cpt,num_sec,num_azi))
-            Ue_Vinf_us       = np.zeros((num_cpt,num_sec,num_azi))
-            cf_us            = np.zeros((num_cpt,num_sec,num_azi))
-            dcp_dx_us        = np.zeros((num_cpt,num_sec,num_azi))
-
-            for i_azi in range(num_azi):
-                for jj,airfoil in enumerate(airfoils):
-                    bl                            = airfoil.polars.boundary_layer
-                    local_aoa                     = alpha_blade[:,:,i_azi]
-                    local_Re                      = Re_blade[:,:,i_azi]
-
-                    theta_ls_data                 = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.theta_lower_surface[:,:,bstei])     
-                    delta_ls_data                 = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.delta_lower_surface[:,:,bstei])        
-                    delta_star_ls_data            = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.delta_star_lower_surface[:,:,bstei])   
-                    Ue_Vinf_ls_data               = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.Ue_Vinf_lower_surface[:,:,bstei])      
-                    cf_ls_data                    = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.cf_lower_surface[:,:,bstei])           
-                    dcp_dx_ls_data                = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.dcp_dx_lower_surface[:,:,bstei])       
-                    theta_us_data                 = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.theta_upper_surface[:,:,ustei])        
-                    delta_us_data                 = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.delta_upper_surface[:,:,ustei])       
-                    delta_star_us_data            = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.delta_star_upper_surface[:,:,ustei])   
-                    Ue_Vinf_us_data               = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.Ue_Vinf_upper_surface[:,:,ustei])   
-                    cf_us_data                    = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.cf_upper_surface[:,:,ustei])          
-                    dcp_dx_us_data                = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.dcp_dx_upper_surface[:,:,ustei])      
-                    locs                          = np.where(np.array(a_loc) == jj )
-
-                    theta_ls[:,locs,i_azi]        = theta_ls_data[:,locs]
-                    delta_ls[:,locs,i_azi]        = delta_ls_data[:,locs]
-                    delta_star_ls[:,locs,i_azi]   = delta_star_ls_data[:,locs]
-                    Ue_Vinf_ls[:,locs,i_azi]      = Ue_Vinf_ls_data[:,locs]
-                    cf_ls[:,locs,i_azi]           = cf_ls_data[:,locs]
-                    dcp_dx_ls[:,locs,i_azi]       = dcp_dx_ls_data[:,locs]
-                    theta_us[:,locs,i_azi]        = theta_us_data[:,locs]
-                    delta_us[:,locs,i_azi]        = delta_us_data[:,locs]
-                    delta_star_us[:,locs,i_azi]   = delta_star_us_data[:,locs]
-                    Ue_Vinf_us[:,locs,i_azi]      = Ue_Vinf_us_data[:,locs]
-                    cf_us[:,locs,i_azi]           = cf_us_data[:,locs]
-                    dcp_dx_us[:,locs,i_azi]       = dcp_dx_us_data[:,locs]
+            BL               = boundary_layer_properties(airfoils,a_loc,Re_blade,alpha_blade)
+            theta_ls         = BL[:,:,:,0]
+            delta_ls         = BL[:,:,:,1]
+            delta_star_ls    = BL[:,:,:,2]
+            Ue_Vinf_ls       = BL[:,:,:,3]
+            cf_ls            = BL[:,:,:,4]
+            dcp_dx_ls        = BL[:,:,:,5]
+            theta_us         = BL[:,:,:,6]
+            delta_us         = BL[:,:,:,7]
+            delta_star_us    = BL[:,:,:,8]
+            Ue_Vinf_us       = BL[:,:,:,9]
+            cf_us            = BL[:,:,:,10]
+            dcp_dx_us        = BL[:,:,:,11]
 
             blade_chords_3d           = np.tile(np.tile(blade_chords[None,:],(num_cpt,1))[:,:,None],(1,1,num_azi))
             dP_dX_ls                  = dcp_dx_ls*(0.5*rho_blade*U_blade**2)/blade_chords_3d
@@ -201,50 +166,21 @@ def compute_broadband_noise(freestream,angle_of_attack,bspv,
             upper_surface_dp_dx       = dP_dX_us
 
         else:
-            theta_ls         = np.zeros((num_cpt,num_sec))
-            delta_ls         = np.zeros((num_cpt,num_sec))
-            delta_star_ls    = np.zeros((num_cpt,num_sec))
-            Ue_Vinf_ls       = np.zeros((num_cpt,num_sec))
-            cf_ls            = np.zeros((num_cpt,num_sec))
-            dcp_dx_ls        = np.zeros((num_cpt,num_sec))
-            theta_us         = np.zeros((num_cpt,num_sec))
-            delta_us         = np.zeros((num_cpt,num_sec))
-            delta_star_us    = np.zeros((num_cpt,num_sec))
-            Ue_Vinf_us       = np.zeros((num_cpt,num_sec))
-            cf_us            = np.zeros((num_cpt,num_sec))
-            dcp_dx_us        = np.zeros((num_cpt,num_sec))
             local_aoa        = alpha_blade[:,:,0]
             local_Re         = Re_blade[:,:,0]
-
-            for jj,airfoil in enumerate(airfoils):
-                bl                       = airfoil.polars.boundary_layer
-                theta_ls_data           = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.theta_lower_surface[:,:,bstei])     
-                delta_ls_data           = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.delta_lower_surface[:,:,bstei])        
-                delta_star_ls_data      = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.delta_star_lower_surface[:,:,bstei])   
-                Ue_Vinf_ls_data         = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.Ue_Vinf_lower_surface[:,:,bstei])      
-                cf_ls_data              = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.cf_lower_surface[:,:,bstei])           
-                dcp_dx_ls_data          = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.dcp_dx_lower_surface[:,:,bstei])       
-                theta_us_data           = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.theta_upper_surface[:,:,ustei])        
-                delta_us_data           = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.delta_upper_surface[:,:,ustei])       
-                delta_star_us_data      = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.delta_star_upper_surface[:,:,ustei])   
-                Ue_Vinf_us_data         = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.Ue_Vinf_upper_surface[:,:,ustei])   
-                cf_us_data              = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.cf_upper_surface[:,:,ustei])          
-                dcp_dx_us_data          = interp2d(local_Re,local_aoa,bl.reynolds_numbers, bl.angle_of_attacks, bl.dcp_dx_upper_surface[:,:,ustei])      
-
-                locs                    = np.where(np.array(a_loc) == jj )
-
-                theta_ls[:,locs]        = theta_ls_data[:,locs]
-                delta_ls[:,locs]        = delta_ls_data[:,locs]
-                delta_star_ls[:,locs]   = delta_star_ls_data[:,locs]
-                Ue_Vinf_ls[:,locs]      = Ue_Vinf_ls_data[:,locs]
-                cf_ls[:,locs]           = cf_ls_data[:,locs]
-                dcp_dx_ls[:,locs]       = dcp_dx_ls_data[:,locs]
-                theta_us[:,locs]        = theta_us_data[:,locs]
-                delta_us[:,locs]        = delta_us_data[:,locs]
-                delta_star_us[:,locs]   = delta_star_us_data[:,locs]
-                Ue_Vinf_us[:,locs]      = Ue_Vinf_us_data[:,locs]
-                cf_us[:,locs]           = cf_us_data[:,locs]
-                dcp_dx_us[:,locs]       = dcp_dx_us_data[:,locs]
+            BL               = boundary_layer_properties(airfoils,a_loc,local_Re,local_aoa)
+            theta_ls         = BL[:,:,0]
+            delta_ls         = BL[:,:,1]
+            delta_star_ls    = BL[:,:,2]
+            Ue_Vinf_ls       = BL[:,:,3]
+            cf_ls            = BL[:,:,4]
+            dcp_dx_ls        = BL[:,:,5]
+            theta_us         = BL[:,:,6]
+            delta_us         = BL[:,:,7]
+            delta_star_us    = BL[:,:,8]
+            Ue_Vinf_us       = BL[:,:,9]
+            cf_us            = BL[:,:,10]
+            dcp_dx_us        = BL[:,:,11]
 
             blade_chords_2d           = np.tile(blade_chords[None,:],(num_cpt,1))
             dP_dX_ls                  = dcp_dx_ls*(0.5*rho_blade[:,:,0]*(U_blade[:,:,0]**2))/blade_chords_2d
@@ -355,3 +291,56 @@ def compute_broadband_noise(freestream,angle_of_attack,bspv,
         
     return
 
+
+## @ingroup Methods-Noise-Fidelity_One-Propeller
+def boundary_layer_properties(airfoils,a_loc,Re,aoa):
+    '''This interpolates the trailing edge boundary layer properties of the blade sections from the 
+    boundary layer tables of their airfoils. The twelve properties of an airfoil are stacked into one table
+    and looked up together for all the sections, and azimuths, that use the airfoil.
+    
+    Assumptions:
+        None
+        
+    Source: 
+        N/A
+    
+    Inputs:  
+        airfoils                   - airfoils of the rotor                                     [None]
+        a_loc                      - airfoil index of each blade section                       [None]
+        Re                         - Reynolds number, sections along the second dimension      [Unitless]
+        aoa                        - angle of attack, same shape as Re                         [rad]
+    
+    Outputs 
+        BL                         - stacked along the last dimension in the order:            [None]
+                                     theta, delta, delta_star, Ue_Vinf, cf and dcp_dx of the 
+                                     lower surface, then of the upper surface
+        
+    Properties Used:
+        N/A   
+    '''
+    
+    bstei   = 1      # bottom surface trailing edge index 
+    ustei   = -bstei # upper surface trailing edge index 
+    
+    a_loc   = np.array(a_loc)
+    BL      = np.zeros(np.shape(Re) + (12,))
+    
+    for jj,airfoil in enumerate(airfoils):
+        bl    = airfoil.polars.boundary_layer
+        table = np.stack([bl.theta_lower_surface[:,:,bstei],
+                          bl.delta_lower_surface[:,:,bstei],
+                          bl.delta_star_lower_surface[:,:,bstei],
+                          bl.Ue_Vinf_lower_surface[:,:,bstei],
+                          bl.cf_lower_surface[:,:,bstei],
+                          bl.dcp_dx_lower_surface[:,:,bstei],
+                          bl.theta_upper_surface[:,:,ustei],
+                          bl.delta_upper_surface[:,:,ustei],
+                          bl.delta_star_upper_surface[:,:,ustei],
+                          bl.Ue_Vinf_upper_surface[:,:,ustei],
+                          bl.cf_upper_surface[:,:,ustei],
+                          bl.dcp_dx_upper_surface[:,:,ustei]],axis=-1)
+        
+        locs       = np.where(a_loc == jj)[0]
+        BL[:,locs] = interp2d(Re[:,locs],aoa[:,locs],bl.reynolds_numbers,bl.angle_of_attacks,table)
+    
+    return BL
@@ -20,7 +20,7 @@ from SUAVE.Methods.Noise.Fidelity_One.Propeller.compute_broadband_noise        i
 #  Medium Fidelity Frequency Domain Methods for Acoustic Noise Prediction
 # -------------------------------------------------------------------------------------
 ## @ingroup Methods-Noise-Fidelity_One-Propeller
-def propeller_mid_fidelity(rotors,aeroacoustic_data,segment,settings):
+def propeller_mid_fidelity(rotors,aeroacoustic_data,segment,settings,microphone_locations=None):
     ''' This computes the acoustic signature (sound pressure level, weighted sound pressure levels,
     and frequency spectrums of a system of rotating blades (i.e. propellers and lift_rotors)          
         
@@ -35,6 +35,8 @@ def propeller_mid_fidelity(rotors,aeroacoustic_data,segment,settings):
         segment                 - flight segment data structure                       [None] 
         aeroacoustic_data       - data structure of acoustic data                     [None]
         settings                - accoustic settings                                  [None]
+        microphone_locations    - microphone locations, defaults to the total 
+                                  microphone locations of the segment                 [m]
                                
     Outputs:
         Results.    
@@ -56,7 +58,8 @@ def propeller_mid_fidelity(rotors,aeroacoustic_data,segment,settings):
     
     # unpack 
     conditions           = segment.state.conditions
-    microphone_locations = conditions.noise.total_microphone_locations
+    if microphone_locations is None:
+        microphone_locations = conditions.noise.total_microphone_locations
     angle_of_attack      = conditions.aerodynamics.angle_of_attack 
     velocity_vector      = conditions.frames.inertial.velocity_vector
     freestream           = conditions.freestream  
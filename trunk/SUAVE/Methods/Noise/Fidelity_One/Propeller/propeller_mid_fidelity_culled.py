@@ -0,0 +1,140 @@
+## @ingroup Methods-Noise-Fidelity_One-Propeller
+# propeller_mid_fidelity_culled.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+from SUAVE.Core import Data
+import numpy as np
+from SUAVE.Methods.Noise.Fidelity_One.Propeller.propeller_mid_fidelity      import propeller_mid_fidelity
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.microphone_culling        import generate_probe_microphone_points
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.microphone_culling        import cull_microphones
+
+# results of propeller_mid_fidelity that do not depend on the microphones
+microphone_independent_results = ['blade_passing_frequencies','one_third_frequency_spectrum']
+
+# -------------------------------------------------------------------------------------
+#  Medium Fidelity Frequency Domain Methods with Microphone Culling
+# -------------------------------------------------------------------------------------
+## @ingroup Methods-Noise-Fidelity_One-Propeller
+def propeller_mid_fidelity_culled(rotors,aeroacoustic_data,segment,settings):
+    ''' This computes the acoustic signature of a system of rotating blades at a large number of
+    microphones. The rotors are first evaluated on a probe sphere, the microphones that cannot hear
+    the rotors above the culling floor are culled and the rest are evaluated in batches.
+
+    Assumptions:
+    The results of culled microphones are zero
+
+    Source:
+    None
+
+    Inputs:
+        rotors                  - data structure of rotors                            [None]
+        segment                 - flight segment data structure                       [None]
+        aeroacoustic_data       - data structure of acoustic data                     [None]
+        settings                - accoustic settings                                  [None]
+            microphone_culling_probe_distance  - radius of the probe sphere           [m]
+            microphone_culling_probe_points    - number of microphones on the sphere  [unitless]
+            microphone_batch_size              - microphones evaluated at once        [unitless]
+
+    Outputs:
+        Results                 - results of propeller_mid_fidelity at every microphone
+        Results.microphone_culling.
+            number_of_microphones          - total microphones                        [unitless]
+            number_of_probe_points         - microphones on the probe sphere          [unitless]
+            number_evaluated               - microphones evaluated                    [unitless]
+            number_culled                  - microphones culled                       [unitless]
+            evaluation_savings             - fraction of microphone evaluations saved [unitless]
+            SPL_estimate                   - highest estimated SPL at each microphone [dB]
+
+    Properties Used:
+        N/A
+    '''
+
+    # unpack
+    conditions           = segment.state.conditions
+    microphone_locations = conditions.noise.total_microphone_locations
+    ctrl_pts             = len(microphone_locations)
+    num_mic              = len(microphone_locations[0])
+    probe_distance       = settings.microphone_culling_probe_distance
+    num_probes           = settings.microphone_culling_probe_points
+    batch_size           = settings.microphone_batch_size
+    if batch_size is None:
+        batch_size = num_mic
+
+    # directivity envelope of the rotors
+    probe_locations = generate_probe_microphone_points(ctrl_pts,num_probes,probe_distance)
+    probe_noise     = propeller_mid_fidelity_batches(rotors,aeroacoustic_data,segment,settings,probe_locations,batch_size)
+
+    # cull the microphones that are too far to hear the rotors
+    source_offset       = np.max([np.linalg.norm(rotor.origin[0]) for rotor in rotors])
+    keep, SPL_estimate  = cull_microphones(probe_locations,probe_noise.SPL_1_3_spectrum,microphone_locations,source_offset,settings)
+    mic_idx             = np.where(keep)[0]
+
+    # evaluate the remaining microphones, culled microphones are zero
+    Results = Data()
+    for key, value in probe_noise.items():
+        if key in microphone_independent_results:
+            Results[key] = value
+        else:
+            Results[key] = np.zeros((ctrl_pts,num_mic) + np.shape(value)[2:])
+
+    if len(mic_idx) > 0:
+        mic_noise = propeller_mid_fidelity_batches(rotors,aeroacoustic_data,segment,settings,microphone_locations[:,mic_idx,:],batch_size)
+        for key, value in mic_noise.items():
+            if key not in microphone_independent_results:
+                Results[key][:,mic_idx] = value
+
+    # savings
+    culling                        = Data()
+    culling.number_of_microphones  = num_mic
+    culling.number_of_probe_points = num_probes
+    culling.number_evaluated       = len(mic_idx)
+    culling.number_culled          = num_mic - len(mic_idx)
+    culling.evaluation_savings     = 1. - (len(mic_idx) + num_probes)/num_mic
+    culling.SPL_estimate           = SPL_estimate
+    Results.microphone_culling     = culling
+
+    return Results
+
+## @ingroup Methods-Noise-Fidelity_One-Propeller
+def propeller_mid_fidelity_batches(rotors,aeroacoustic_data,segment,settings,microphone_locations,batch_size):
+    ''' This evaluates propeller_mid_fidelity for a few microphones at a time, so the memory used by the
+    broadband noise does not grow with the number of microphones.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+        rotors                  - data structure of rotors                            [None]
+        segment                 - flight segment data structure                       [None]
+        aeroacoustic_data       - data structure of acoustic data                     [None]
+        settings                - accoustic settings                                  [None]
+        microphone_locations    - microphone locations, (ctrl_pts,num_mic,3)          [m]
+        batch_size              - microphones evaluated at once                       [unitless]
+
+    Outputs:
+        Results                 - results of propeller_mid_fidelity at every microphone
+
+    Properties Used:
+        N/A
+    '''
+    num_mic = len(microphone_locations[0])
+    Results = Data()
+    for start in range(0,num_mic,batch_size):
+        batch_locations = microphone_locations[:,start:start+batch_size,:]
+        batch_noise     = propeller_mid_fidelity(rotors,aeroacoustic_data,segment,settings,microphone_locations=batch_locations)
+        for key, value in batch_noise.items():
+            if key in microphone_independent_results:
+                Results[key] = value
+            else:
+                if start == 0:
+                    Results[key] = np.zeros((len(value),num_mic) + np.shape(value)[2:])
+                Results[key][:,start:start+batch_size] = value
+
+    return Results
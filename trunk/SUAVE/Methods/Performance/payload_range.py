@@ -3,12 +3,15 @@
 #
 # Created:  Apr 2014, T. Orra
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
-from SUAVE.Core import Units
+import SUAVE
+from SUAVE.Core import Units, Data
+import copy
 import time
 import numpy as np
 
@@ -17,9 +20,13 @@ import numpy as np
 # ----------------------------------------------------------------------
 
 ## @ingroup Methods-Performance
-def payload_range(vehicle,mission,cruise_segment_tag,reserves=0.):
+def payload_range(vehicle,mission,cruise_segment_tag,reserves=0.,number_of_processes=None):
     """Calculates a vehicle's payload range diagram. Includes plotting.
 
+    Each point of the diagram is one converged mission, with the cruise distance solved as an extra unknown so
+    that the vehicle lands with its target fuel burned. The max fuel point is solved first, the max payload and
+    ferry points are then solved in parallel starting from its solution. The mission passed in is not changed.
+
     Assumptions:
     Constant altitude cruise
 
@@ -37,6 +44,8 @@ def payload_range(vehicle,mission,cruise_segment_tag,reserves=0.):
     mission.segments[0].analyses.weights.
       vehicle.mass_properties.takeoff     [kg]
     cruise_segment_tag                    <string>
+    reserves                              [kg]
+    number_of_processes                   [int], defaults to the number of cores
 
     Outputs:
     payload_range.
@@ -100,70 +109,40 @@ def payload_range(vehicle,mission,cruise_segment_tag,reserves=0.):
     FUEL    = [ min(TOW[1] - OEW - MaxPLD,MaxFuel) , MaxFuel                , MaxFuel       ]
     PLD     = [ MaxPLD                             , MTOW - MaxFuel - OEW   , 0.            ]
 
-    # allocating Range array
-    R       = [0,0,0]
+    # one variable cruise distance mission per point, each lands with its target fuel burned
+    points = []
+    for i in range(len(TOW)):
+        point = variable_range_mission(mission,cruise_segment_tag)
+        point.segments[0].analyses.weights.vehicle.mass_properties.takeoff = TOW[i]
+        point.target_landing_weight = TOW[i] - FUEL[i] + reserves
+        points.append(point)
 
     # evaluate the mission
     if iprint:
         print('\n\n\n .......... PAYLOAD RANGE DIAGRAM CALCULATION ..........\n')
 
-    # loop for each point of Payload Range Diagram
-    for i in range(len(TOW)):
-##    for i in [2]:
-        if iprint:
-            print(('   EVALUATING POINT : ' + str(i+1)))
-
-        # Define takeoff weight
-        mission.segments[0].analyses.weights.vehicle.mass_properties.takeoff = TOW[i]
-
-        # Evaluate mission with current TOW
-        results = mission.evaluate()
-        segment = results.segments[cruise_segment_tag]
-
-        # Distance convergency in order to have total fuel equal to target fuel
-        #
-        # User don't have the option of run a mission for a given fuel. So, we
-        # have to iterate distance in order to have total fuel equal to target fuel
-        #
-
-        maxIter = 10 # maximum iteration limit
-        tol = 1.     # fuel convergency tolerance
-        err = 9999.  # error to be minimized
-        iter = 0     # iteration count
-
-        while abs(err) > tol and iter < maxIter:
-            iter = iter + 1
-
-            # Current total fuel burned in mission
-            TotalFuel  = TOW[i] - results.segments[-1].conditions.weights.total_mass[-1,0]
+    # the max fuel point neighbours the other two, solve it first from the user's guesses
+    warm_start = SUAVE.Analyses.Mission.Warm_Start_Cache()
+    warm_start.attach(points[1])
+    points[1].evaluate()
 
-            # Difference between burned fuel and target fuel
-            missingFuel = FUEL[i] - TotalFuel - reserves
+    # then solve the other points at once, each warm started from the max fuel point
+    for i in [0,2]:
+        copy.deepcopy(warm_start).attach(points[i])
+    SUAVE.Methods.Missions.evaluate_missions([points[0],points[2]],number_of_processes)
 
-            # Current distance and fuel consuption in the cruise segment
-            CruiseDist = np.diff( segment.conditions.frames.inertial.position_vector[[0,-1],0] )[0]        # Distance [m]
-            CruiseFuel = segment.conditions.weights.total_mass[0,0] - segment.conditions.weights.total_mass[-1,0]    # [kg]
-            # Current specific range (m/kg)
-            CruiseSR    = CruiseDist / CruiseFuel        # [m/kg]
-
-            # Estimated distance that will result in total fuel burn = target fuel
-            DeltaDist  =  CruiseSR *  missingFuel
-            mission.segments[cruise_segment_tag].distance = (CruiseDist + DeltaDist)
-
-            # running mission with new distance
-            results = mission.evaluate()
-            segment = results.segments[cruise_segment_tag]
-
-            # Difference between burned fuel and target fuel
-            err = ( TOW[i] - results.segments[-1].conditions.weights.total_mass[-1,0] ) - FUEL[i] + reserves
+    # allocating Range array
+    R = [0,0,0]
 
-            if iprint:
-                print(('     iter: ' +str('%2g' % iter) + ' | Target Fuel: '   \
-                  + str('%8.0F' % FUEL[i]) + ' (kg) | Current Fuel: ' \
-                  + str('%8.0F' % (err+FUEL[i]))+' (kg) | Residual : '+str('%8.0F' % err)))
+    for i in range(len(TOW)):
+        if iprint:
+            landed = points[i].segments[-1].state.conditions.weights.total_mass[-1,0]
+            print(('   POINT : ' + str(i+1) + ' | Target Fuel: ' \
+              + str('%8.0F' % FUEL[i]) + ' (kg) | Current Fuel: ' \
+              + str('%8.0F' % (TOW[i] - landed + reserves)) + ' (kg) | Converged : ' + str(points[i].converged)))
 
         # Allocating resulting range in ouput array.
-        R[i] = ( results.segments[-1].conditions.frames.inertial.position_vector[-1,0] ) * Units.m / Units.nautical_mile      #Distance [nm]
+        R[i] = ( points[i].segments[-1].state.conditions.frames.inertial.position_vector[-1,0] ) * Units.m / Units.nautical_mile      #Distance [nm]
 
     # Inserting point (0,0) in output arrays
     R.insert(0,0)
@@ -172,6 +151,7 @@ def payload_range(vehicle,mission,cruise_segment_tag,reserves=0.):
     TOW.insert(0,0)
 
     # packing results
+    payload_range = Data()
     payload_range.range     = np.multiply(R,1.0*Units.nautical_mile / Units.m) # [m]
     payload_range.payload   = PLD
     payload_range.fuel      = FUEL
@@ -217,8 +197,8 @@ def payload_range(vehicle,mission,cruise_segment_tag,reserves=0.):
         import pandas as pd
         import plotly.express as px
 
-        col = 'Payload (kg)'
-        row = 'Range ('+unit+')'
+        col = 'Range (nm)'
+        row = 'Payload (kg)'
         
         df = pd.DataFrame({col:R,row:PLD})
         
@@ -226,3 +206,51 @@ def payload_range(vehicle,mission,cruise_segment_tag,reserves=0.):
         fig.show()
 
     return payload_range
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Performance
+def variable_range_mission(mission,cruise_segment_tag):
+    """Copies the segments of a mission into a variable cruise distance mission that lands at a given weight.
+    Missions that solve all their segments at once become a Given_Weight mission, the others keep converging one
+    segment at a time in a Given_Weight_Sequential mission.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    mission                               [Mission()]
+    cruise_segment_tag                    <string>
+
+    Outputs:
+    vary_mission                          [Variable_Range_Cruise.Given_Weight_Sequential() or Given_Weight()]
+
+    Properties Used:
+    N/A
+    """
+
+    Variable_Range_Cruise = SUAVE.Analyses.Mission.Variable_Range_Cruise
+
+    # copy the whole mission at once so the segments keep sharing their analyses
+    mission = copy.deepcopy(mission)
+
+    if isinstance(mission,(Variable_Range_Cruise.Given_Weight,Variable_Range_Cruise.Given_Weight_Sequential)):
+        mission.cruise_tag = cruise_segment_tag
+        return mission
+
+    if isinstance(mission,SUAVE.Analyses.Mission.All_At_Once):
+        vary_mission = Variable_Range_Cruise.Given_Weight()
+    else:
+        vary_mission = Variable_Range_Cruise.Given_Weight_Sequential()
+    vary_mission.tag        = mission.tag
+    vary_mission.cruise_tag = cruise_segment_tag
+
+    for segment in mission.segments.values():
+        vary_mission.append_segment(segment)
+
+    return vary_mission
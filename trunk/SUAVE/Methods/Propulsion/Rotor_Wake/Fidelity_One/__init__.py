@@ -3,4 +3,5 @@
 # @ingroup Methods-Propulsion-Rotor_Wake
 
 from .compute_fidelity_one_inflow_velocities  import compute_fidelity_one_inflow_velocities 
-from .compute_wake_induced_velocity           import compute_wake_induced_velocity
\ No newline at end of file
+from .compute_wake_induced_velocity           import compute_wake_induced_velocity
+from .tree_code_induced_velocity              import tree_code_induced_velocity
\ No newline at end of file
@@ -9,6 +9,7 @@
 # ----------------------------------------------------------------------
 from SUAVE.Core import Data
 from SUAVE.Methods.Propulsion.Rotor_Wake.Fidelity_One.compute_wake_induced_velocity import compute_wake_induced_velocity
+from SUAVE.Methods.Propulsion.Rotor_Wake.Fidelity_One.tree_code_induced_velocity import tree_code_induced_velocity
 
 # package imports
 import numpy as np
@@ -34,6 +35,8 @@ def compute_fidelity_one_inflow_velocities( wake, prop ):
     VD                       = prop.vortex_distribution
     omega                    = prop.inputs.omega
     init_timestep_offset     = wake.wake_settings.initial_timestep_offset
+    block_size               = wake.induced_velocity_block_size if ('induced_velocity_block_size' in wake.keys()) else None
+    tree_tolerance           = wake.induced_velocity_tree_tolerance if ('induced_velocity_tree_tolerance' in wake.keys()) else None
 
     # use results from prior bevw iteration
     prop_outputs  = prop.outputs
@@ -82,7 +85,10 @@ def compute_fidelity_one_inflow_velocities( wake, prop ):
         # Compute induced velocities at blade from the helical fixed wake
         VD.Wake_collapsed = WD
         
-        V_ind   = compute_wake_induced_velocity(WD, VD, cpts, azi_start_idx=i)
+        if tree_tolerance is None:
+            V_ind = compute_wake_induced_velocity(WD, VD, cpts, azi_start_idx=i, block_size=block_size)
+        else:
+            V_ind = tree_code_induced_velocity(WD, VD, cpts, azi_start_idx=i, tolerance=tree_tolerance)
         
         # velocities in vehicle frame
         u       = V_ind[:,:,0]   # velocity in vehicle x-frame
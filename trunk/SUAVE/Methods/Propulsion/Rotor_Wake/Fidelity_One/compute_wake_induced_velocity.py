@@ -12,18 +12,21 @@
 import numpy as np 
 
 ## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
-def compute_wake_induced_velocity(WD,VD,cpts,azi_start_idx=0,sigma=0.11,suppress_root=False):  
+def compute_wake_induced_velocity(WD,VD,cpts,azi_start_idx=0,sigma=0.11,suppress_root=False,block_size=None):  
     """ This computes the velocity induced by the Fidelity One semi-prescribed vortex wake (PVW)
-    on lifting surface control points
+    on lifting surface control points. The evaluation points are taken in blocks so that the
+    memory used does not grow with the number of evaluation points.
 
     Assumptions:  
     
     Source:   
     
     Inputs: 
-    WD     - helical wake distribution points               [Unitless] 
-    VD     - vortex distribution points on lifting surfaces [Unitless] 
-    cpts   - control points in segment                      [Unitless] 
+    WD         - helical wake distribution points               [Unitless] 
+    VD         - vortex distribution points on lifting surfaces [Unitless] 
+    cpts       - control points in segment                      [Unitless] 
+    block_size - evaluation points per block, by default sized 
+                 to about 2**20 filament and point pairs        [Unitless] 
 
     Properties Used:
     N/A
@@ -35,52 +38,65 @@ def compute_wake_induced_velocity(WD,VD,cpts,azi_start_idx=0,sigma=0.11,suppress
     
     dtype = np.float64
 
-    # expand vortex points
-    WXA1  = np.tile(WD.XA1.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))
-    WYA1  = np.tile(WD.YA1.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))     
-    WZA1  = np.tile(WD.ZA1.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))
-    WXA2  = np.tile(WD.XA2.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))
-    WYA2  = np.tile(WD.YA2.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))
-    WZA2  = np.tile(WD.ZA2.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))
+    # vortex points, broadcast against the evaluation points
+    WXA1  = WD.XA1.astype(dtype)[azi_start_idx,:,:,None]
+    WYA1  = WD.YA1.astype(dtype)[azi_start_idx,:,:,None]
+    WZA1  = WD.ZA1.astype(dtype)[azi_start_idx,:,:,None]
+    WXA2  = WD.XA2.astype(dtype)[azi_start_idx,:,:,None]
+    WYA2  = WD.YA2.astype(dtype)[azi_start_idx,:,:,None]
+    WZA2  = WD.ZA2.astype(dtype)[azi_start_idx,:,:,None]
                 
-    WXB1  = np.tile(WD.XB1.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))
-    WYB1  = np.tile(WD.YB1.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))
-    WZB1  = np.tile(WD.ZB1.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))
-    WXB2  = np.tile(WD.XB2.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))
-    WYB2  = np.tile(WD.YB2.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))
-    WZB2  = np.tile(WD.ZB2.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))
-    GAMMA = np.tile(WD.GAMMA.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))
-    
-    # expand evaluation points
-    XC    = np.tile(VD.XC.astype(dtype)[None,None,:],(cpts,num_vortex_pts,1))
-    YC    = np.tile(VD.YC.astype(dtype)[None,None,:],(cpts,num_vortex_pts,1))
-    ZC    = np.tile(VD.ZC.astype(dtype)[None,None,:],(cpts,num_vortex_pts,1))
+    WXB1  = WD.XB1.astype(dtype)[azi_start_idx,:,:,None]
+    WYB1  = WD.YB1.astype(dtype)[azi_start_idx,:,:,None]
+    WZB1  = WD.ZB1.astype(dtype)[azi_start_idx,:,:,None]
+    WXB2  = WD.XB2.astype(dtype)[azi_start_idx,:,:,None]
+    WYB2  = WD.YB2.astype(dtype)[azi_start_idx,:,:,None]
+    WZB2  = WD.ZB2.astype(dtype)[azi_start_idx,:,:,None]
+    GAMMA = WD.GAMMA.astype(dtype)[azi_start_idx,:,:,None]
+    
+    # evaluation points
+    XC    = VD.XC.astype(dtype)
+    YC    = VD.YC.astype(dtype)
+    ZC    = VD.ZC.astype(dtype)
+    
+    if block_size is None:
+        block_size = (2**20)//max(cpts*num_vortex_pts,1)
+    block_size = max(int(block_size),1)
     
     # -------------------------------------------------------------------------------------------
     # Compute velocity induced by horseshoe vortex segments on every control point by every panel
     # -------------------------------------------------------------------------------------------     
     # Create empty data structure
-    V_ind = np.zeros((cpts,VD.n_cp,3))
-     
-    # compute influence of bound vortices 
-    _ , res_C_AB = vortex(XC, YC, ZC, WXA1, WYA1, WZA1, WXB1, WYB1, WZB1,sigma,GAMMA,bv=True,WD=WD) 
-    C_AB         = res_C_AB.transpose(1,3,0,2) 
-    
-    # compute influence of right vortex segment
-    _ , res_C_BC = vortex(XC, YC, ZC, WXB1, WYB1, WZB1, WXB2, WYB2, WZB2,sigma,GAMMA)
-    C_BC         = res_C_BC.transpose(1,3,0,2) 
-    
-    # compute influence of bottom vortex segment
-    _ , res_C_CD = vortex(XC, YC, ZC, WXB2, WYB2, WZB2, WXA2, WYA2, WZA2,sigma,GAMMA) 
-    C_CD         = res_C_CD.transpose(1,3,0,2) 
-    
-    # compute influence of left vortex segment 
-    _ , res_C_DA = vortex(XC, YC, ZC, WXA2, WYA2, WZA2, WXA1, WYA1, WZA1,sigma,GAMMA) 
-    C_DA         = res_C_DA.transpose(1,3,0,2) 
-    
-    # Add all the influences together
-    V_ind =  row_reduction_summation(C_AB) + row_reduction_summation(C_BC)  + row_reduction_summation(C_CD) + row_reduction_summation(C_DA)   
+    V_ind = np.zeros((cpts,num_eval_pts,3))
     
+    for start in range(0,num_eval_pts,block_size):
+        block = slice(start,min(start+block_size,num_eval_pts))
+        X     = XC[None,None,block]
+        Y     = YC[None,None,block]
+        Z     = ZC[None,None,block]
+     
+        # compute influence of bound vortices 
+        _ , res_C_AB = vortex(X, Y, Z, WXA1, WYA1, WZA1, WXB1, WYB1, WZB1,sigma,GAMMA,bv=True,WD=WD) 
+        V_block      = row_reduction_summation(res_C_AB.transpose(1,3,0,2))
+        del res_C_AB
+        
+        # compute influence of right vortex segment
+        _ , res_C_BC = vortex(X, Y, Z, WXB1, WYB1, WZB1, WXB2, WYB2, WZB2,sigma,GAMMA)
+        V_block     += row_reduction_summation(res_C_BC.transpose(1,3,0,2))
+        del res_C_BC
+        
+        # compute influence of bottom vortex segment
+        _ , res_C_CD = vortex(X, Y, Z, WXB2, WYB2, WZB2, WXA2, WYA2, WZA2,sigma,GAMMA) 
+        V_block     += row_reduction_summation(res_C_CD.transpose(1,3,0,2))
+        del res_C_CD
+        
+        # compute influence of left vortex segment 
+        _ , res_C_DA = vortex(X, Y, Z, WXA2, WYA2, WZA2, WXA1, WYA1, WZA1,sigma,GAMMA) 
+        V_block     += row_reduction_summation(res_C_DA.transpose(1,3,0,2))
+        del res_C_DA
+        
+        # Add all the influences together
+        V_ind[:,block,:] = V_block
 
     return V_ind
   
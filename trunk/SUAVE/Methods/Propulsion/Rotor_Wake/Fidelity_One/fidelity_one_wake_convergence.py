@@ -4,6 +4,7 @@
 # Created:  Feb 2022, R. Erhard
 # Modified: 
 
+from SUAVE.Core import Data
 from SUAVE.Methods.Propulsion.Rotor_Wake.Fidelity_One.compute_fidelity_one_inflow_velocities import compute_fidelity_one_inflow_velocities
 from SUAVE.Methods.Propulsion.Rotor_Wake.Fidelity_One.generate_fidelity_one_wake_shape import generate_fidelity_one_wake_shape
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.BET_calculations import compute_inflow_and_tip_loss
@@ -40,6 +41,20 @@ def fidelity_one_wake_convergence(wake,rotor,wake_inputs):
     R  = rotor.tip_radius
     B  = rotor.number_of_blades    
     
+    # reuse the wake of the last evaluation of this rotor
+    reuse = wake.reuse_converged_wake if ('reuse_converged_wake' in wake.keys()) else False
+    key   = converged_wake_key(wake,rotor,wake_inputs)
+    cache = wake.converged_wake if reuse else None
+    if reuse and cache is not None and same_key(cache.key,key):
+        if wake.verbose:
+            print("\tReusing converged wake shape...")
+        rotor.outputs.disc_axial_induced_velocity = cache.disc_axial_induced_velocity
+        rotor.vortex_distribution                 = cache.rotor_vortex_distribution
+        rotor.wake_skew_angle                     = cache.wake_skew_angle
+        rotor.start_angle                         = cache.start_angle
+        wake.vortex_distribution                  = cache.vortex_distribution
+        return cache.vortex_distribution, cache.va, cache.vt
+    
     # converge on va for a semi-prescribed wake method
     va_diff, ii = 1, 0
     tol = wake.axial_velocity_convergence_tolerance
@@ -47,6 +62,10 @@ def fidelity_one_wake_convergence(wake,rotor,wake_inputs):
         if wake.verbose:
             print("\tConverging on semi-prescribed wake shape...")
         ii_max = wake.maximum_convergence_iteration
+        
+        # start from the inflow of the last converged wake
+        if reuse and cache is not None and np.shape(cache.disc_axial_induced_velocity) == np.shape(rotor.outputs.disc_axial_induced_velocity):
+            rotor.outputs.disc_axial_induced_velocity = cache.disc_axial_induced_velocity
     else:
         if wake.verbose:
             print("\tGenerating fully-prescribed wake shape...")
@@ -77,7 +96,77 @@ def fidelity_one_wake_convergence(wake,rotor,wake_inputs):
                 print("Semi-prescribed vortex wake did not converge on axial inflow used for wake shape.")
             break
         
-    # save converged wake:
-    wake, rotor  = generate_fidelity_one_wake_shape(wake,rotor)
+    # save converged wake, a reused wake keeps the last shape of a converged loop as it is
+    if not (reuse and va_diff <= tol):
+        wake, rotor  = generate_fidelity_one_wake_shape(wake,rotor)
+    
+    if reuse:
+        cache                             = Data()
+        cache.key                         = key
+        cache.disc_axial_induced_velocity = rotor.outputs.disc_axial_induced_velocity
+        cache.rotor_vortex_distribution   = rotor.vortex_distribution
+        cache.wake_skew_angle             = rotor.wake_skew_angle
+        cache.start_angle                 = rotor.start_angle
+        cache.vortex_distribution         = wake.vortex_distribution
+        cache.va                          = va
+        cache.vt                          = vt
+        wake.converged_wake               = cache
+    
+    return wake.vortex_distribution, va, vt
+
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
+def converged_wake_key(wake,rotor,wake_inputs):
+    """
+    Collects the inputs that set the wake of a rotor, a wake with the same inputs is the same wake.
+    
+    Assumptions:
+    The rotor geometry only changes the wake through the circulation of the first blade element pass
+    
+    Source:
+    N/A
+    
+    Inputs:
+    wake        - rotor wake
+    rotor       - rotor
+    wake_inputs - inputs passed from the BET rotor spin function
+    
+    Outputs:
+    key         - list of the inputs
+    
+    Properties Used:
+    None
+    """  
+    settings = wake.wake_settings
+    outputs  = rotor.outputs
+    key      = [settings.number_rotor_rotations, settings.number_steps_per_rotation, settings.initial_timestep_offset,
+                wake.semi_prescribed_converge, wake.maximum_convergence_iteration, wake.axial_velocity_convergence_tolerance,
+                outputs.omega, outputs.velocity, outputs.disc_circulation, outputs.disc_axial_induced_velocity,
+                rotor.inputs.pitch_command, rotor.inputs.y_axis_rotation, rotor.origin, rotor.orientation_euler_angles,
+                wake_inputs.velocity_axial, wake_inputs.velocity_tangential, wake_inputs.radius_distribution]
+    
+    return [np.array(value,dtype=float) for value in key]
+
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
+def same_key(key_1,key_2):
+    """
+    Checks if two wakes have the same inputs.
+    
+    Assumptions:
+    None
+    
+    Source:
+    N/A
+    
+    Inputs:
+    key_1, key_2 - lists of the inputs
+    
+    Outputs:
+    same         - [bool]
+    
+    Properties Used:
+    None
+    """  
+    if len(key_1) != len(key_2):
+        return False
     
-    return wake.vortex_distribution, va, vt
\ No newline at end of file
+    return all(np.shape(a) == np.shape(b) and np.array_equal(a,b) for a, b in zip(key_1,key_2))
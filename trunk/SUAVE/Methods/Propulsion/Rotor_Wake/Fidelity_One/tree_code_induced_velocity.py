@@ -0,0 +1,302 @@
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
+# tree_code_induced_velocity.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+from SUAVE.Core import Data
+from SUAVE.Methods.Propulsion.Rotor_Wake.Fidelity_One.compute_wake_induced_velocity import vortex
+
+# package imports
+import numpy as np
+
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
+def tree_code_induced_velocity(WD,VD,cpts,azi_start_idx=0,sigma=0.11,suppress_root=False,tolerance=0.3,leaf_size=32,block_size=None):
+    """ This computes the velocity induced by the Fidelity One semi-prescribed vortex wake (PVW)
+    on lifting surface control points with a Barnes-Hut tree code. The vortex segments of the wake
+    are sorted into an octree. Clusters of segments that are far from an evaluation point are
+    replaced by their first two moments, the others are summed directly with the same regularized
+    kernel as compute_wake_induced_velocity.
+
+    Assumptions:
+    A cluster is far when its radius is less than the tolerance times its distance to the point, and
+    the point is far enough that the regularization of its segments is negligible. The error of the
+    far clusters is of the order of the tolerance squared.
+
+    Source:
+    Barnes, J. and Hut, P., "A hierarchical O(N log N) force-calculation algorithm", Nature, 1986.
+
+    Inputs:
+    WD         - helical wake distribution points               [Unitless]
+    VD         - vortex distribution points on lifting surfaces [Unitless]
+    cpts       - control points in segment                      [Unitless]
+    tolerance  - opening angle of the tree, 0 sums directly     [Unitless]
+    leaf_size  - largest number of segments in a leaf           [Unitless]
+    block_size - evaluation points per block                    [Unitless]
+
+    Outputs:
+    V_ind      - induced velocity at the evaluation points      [Unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    num_eval_pts = VD.n_cp
+    dtype        = np.float64
+    XC           = np.stack([VD.XC,VD.YC,VD.ZC],axis=-1).astype(dtype)
+
+    if block_size is None:
+        block_size = 2**12
+    block_size = max(int(block_size),1)
+
+    # ignore the row of panels corresponding to the lifting line of the rotor
+    lifting_line = np.zeros(np.shape(WD.reshaped_wake.XA1[0,0,:,:,:]),dtype=bool)
+    lifting_line[:,:,0] = True
+    bound        = ~np.reshape(lifting_line,-1)
+
+    V_ind = np.zeros((cpts,num_eval_pts,3))
+
+    for i in range(cpts):
+        A1    = np.stack([WD.XA1[azi_start_idx,i],WD.YA1[azi_start_idx,i],WD.ZA1[azi_start_idx,i]],axis=-1).astype(dtype)
+        A2    = np.stack([WD.XA2[azi_start_idx,i],WD.YA2[azi_start_idx,i],WD.ZA2[azi_start_idx,i]],axis=-1).astype(dtype)
+        B1    = np.stack([WD.XB1[azi_start_idx,i],WD.YB1[azi_start_idx,i],WD.ZB1[azi_start_idx,i]],axis=-1).astype(dtype)
+        B2    = np.stack([WD.XB2[azi_start_idx,i],WD.YB2[azi_start_idx,i],WD.ZB2[azi_start_idx,i]],axis=-1).astype(dtype)
+        GAMMA = WD.GAMMA[azi_start_idx,i].astype(dtype)
+
+        # the bound, right, bottom and left segments of every vortex ring
+        P1    = np.concatenate([A1[bound],B1,B2,A2])
+        P2    = np.concatenate([B1[bound],B2,A2,A1])
+        G     = np.concatenate([GAMMA[bound],GAMMA,GAMMA,GAMMA])
+
+        tree  = build_segment_tree(P1,P2,G,leaf_size)
+
+        for start in range(0,num_eval_pts,block_size):
+            block          = slice(start,min(start+block_size,num_eval_pts))
+            V_ind[i,block] = evaluate_segment_tree(tree,XC[block],sigma,tolerance)
+
+    return V_ind
+
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
+def build_segment_tree(P1,P2,GAMMA,leaf_size=32):
+    """ Sorts vortex segments into an octree along a Morton curve and computes the moments of every node.
+    Every node holds a contiguous range of the sorted segments, its children hold the parts of the range
+    in each of its octants.
+
+    Assumptions:
+    The far field of a segment is that of a vortex element at its midpoint
+
+    Source:
+    Barnes, J. and Hut, P., "A hierarchical O(N log N) force-calculation algorithm", Nature, 1986.
+
+    Inputs:
+    P1, P2     - start and end points of the segments, size (n_segments,3)   [Unitless]
+    GAMMA      - circulation of the segments                                 [Unitless]
+    leaf_size  - largest number of segments in a leaf                        [Unitless]
+
+    Outputs:
+    tree       - sorted segments and the nodes of the octree                 [Data]
+
+    Properties Used:
+    N/A
+    """
+
+    bits     = 10
+    n_seg    = len(GAMMA)
+    mid      = (P1 + P2)/2
+    strength = GAMMA[:,None]*(P2 - P1)
+    half     = np.linalg.norm(P2 - P1,axis=-1)/2
+
+    # sort the segments along a Morton curve through the cube around their midpoints
+    lo    = np.min(mid,axis=0)
+    span  = np.max(np.max(mid,axis=0) - lo)
+    span  = span if span > 0. else 1.
+    cells = np.minimum(((mid - lo)/span*2**bits).astype(np.int64),2**bits - 1)
+    code  = np.zeros(n_seg,dtype=np.int64)
+    for b in range(bits):
+        for axis in range(3):
+            code |= ((cells[:,axis] >> b) & 1) << (3*b + axis)
+    order    = np.argsort(code,kind='stable')
+    code     = code[order]
+
+    # split the nodes with too many segments level by level
+    starts      = [np.array([0])]
+    ends        = [np.array([n_seg])]
+    parents     = [np.array([-1])]
+    level_start = np.array([0])
+    level_ids   = np.array([0])
+    level_split = np.array([n_seg > leaf_size])
+    n_nodes     = 1
+    for level in range(1,bits + 1):
+        if not np.any(level_split):
+            break
+        prefix      = code >> 3*(bits - level)
+        group_start = np.flatnonzero(np.r_[True,prefix[1:] != prefix[:-1]])
+        group_end   = np.r_[group_start[1:],n_seg]
+
+        # keep the groups inside the nodes that are split
+        parent      = np.searchsorted(level_start,group_start,side='right') - 1
+        keep        = level_split[parent]
+        ids         = np.full(len(group_start),-1)
+        ids[keep]   = n_nodes + np.arange(np.sum(keep))
+        n_nodes    += np.sum(keep)
+
+        starts.append(group_start[keep])
+        ends.append(group_end[keep])
+        parents.append(level_ids[parent[keep]])
+
+        level_split       = np.zeros(len(group_start),dtype=bool)
+        level_split[keep] = (group_end[keep] - group_start[keep]) > leaf_size
+        level_start       = group_start
+        level_ids         = ids
+
+    start  = np.concatenate(starts)
+    end    = np.concatenate(ends)
+    parent = np.concatenate(parents)
+
+    # the children of a node are contiguous and numbered in the order of their parents
+    child_ids   = np.flatnonzero(parent >= 0)
+    n_children  = np.bincount(parent[child_ids],minlength=n_nodes)
+    first_child = np.full(n_nodes,-1)
+    opened      = n_children > 0
+    first_child[opened] = child_ids[np.searchsorted(parent[child_ids],np.flatnonzero(opened))]
+
+    # moments of the nodes about the centroid of their midpoints
+    counts   = end - start
+    offsets  = np.r_[0,np.cumsum(counts)[:-1]]
+    elements = np.repeat(start - offsets,counts) + np.arange(np.sum(counts))
+    seg      = order[elements]
+    center   = np.add.reduceat(mid[seg],offsets,axis=0)/counts[:,None]
+    total    = np.add.reduceat(strength[seg],offsets,axis=0)
+    moment   = np.add.reduceat(strength[seg][:,:,None]*(mid[seg] - np.repeat(center,counts,axis=0))[:,None,:],offsets,axis=0)
+    radius   = np.maximum.reduceat(np.linalg.norm(mid[seg] - np.repeat(center,counts,axis=0),axis=-1) + half[seg],offsets)
+    length   = np.maximum.reduceat(2*half[seg],offsets)
+
+    tree             = Data()
+    tree.P1          = P1[order]
+    tree.P2          = P2[order]
+    tree.GAMMA       = GAMMA[order]
+    tree.start       = start
+    tree.end         = end
+    tree.first_child = first_child
+    tree.n_children  = n_children
+    tree.center      = center
+    tree.strength    = total
+    tree.moment      = moment
+    tree.radius      = radius
+    tree.length      = length
+
+    return tree
+
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
+def evaluate_segment_tree(tree,X,sigma,tolerance):
+    """ Walks the octree of the vortex segments for a set of evaluation points. All pairs of points and nodes
+    of a level of the tree are handled at once: far nodes are evaluated from their moments, near leaves are
+    summed directly and the other near nodes are opened.
+
+    Assumptions:
+    The regularization of a far segment is negligible when the regularization radius of the kernel is ten
+    times larger than sigma
+
+    Source:
+    Low-Speed Aerodynamics, Second Edition by Joseph katz, Allen Plotkin
+
+    Inputs:
+    tree       - octree of the vortex segments                  [Data]
+    X          - evaluation points, size (n_points,3)           [Unitless]
+    sigma      - regularization radius                          [Unitless]
+    tolerance  - opening angle of the tree                      [Unitless]
+
+    Outputs:
+    V_ind      - induced velocity at the evaluation points      [Unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    n_pts = len(X)
+    V_ind = np.zeros((n_pts,3))
+
+    # pairs of points and nodes, starting from the root
+    pts   = np.arange(n_pts)
+    nodes = np.zeros(n_pts,dtype=np.int64)
+
+    while len(pts):
+        r    = X[pts] - tree.center[nodes]
+        d    = np.linalg.norm(r,axis=-1)
+        gap  = d - tree.radius[nodes]
+        far  = (tree.radius[nodes] < tolerance*d) & (gap > 0.) & (np.square(gap) > 100*np.square(sigma)*tree.length[nodes])
+
+        # far nodes: vortex element and its first moment
+        if np.any(far):
+            r_f   = r[far]
+            d_f   = d[far][:,None]
+            A     = tree.strength[nodes[far]]
+            M     = tree.moment[nodes[far]]
+            w     = np.stack([M[:,1,2] - M[:,2,1],M[:,2,0] - M[:,0,2],M[:,0,1] - M[:,1,0]],axis=-1)
+            Mr    = np.einsum('ijk,ik->ij',M,r_f)
+            V_far = (np.cross(A,r_f)/d_f**3 - w/d_f**3 + 3*np.cross(Mr,r_f)/d_f**5)/(4*np.pi)
+            for axis in range(3):
+                V_ind[:,axis] += np.bincount(pts[far],weights=V_far[:,axis],minlength=n_pts)
+
+        near = ~far
+        leaf = near & (tree.n_children[nodes] == 0)
+
+        # near leaves: direct sum over their segments, about 2**20 pairs at a time
+        if np.any(leaf):
+            counts = tree.end[nodes[leaf]] - tree.start[nodes[leaf]]
+            splits = np.searchsorted(np.cumsum(counts),np.arange(1,np.sum(counts)//2**20 + 1)*2**20)
+            for pts_l, nodes_l in zip(np.split(pts[leaf],splits),np.split(nodes[leaf],splits)):
+                V_ind += direct_segment_sum(tree,X,pts_l,nodes_l,sigma)
+
+        # other near nodes: open them
+        opened   = near & ~leaf
+        counts   = tree.n_children[nodes[opened]]
+        offsets  = np.cumsum(counts) - counts
+        nodes    = np.repeat(tree.first_child[nodes[opened]] - offsets,counts) + np.arange(np.sum(counts))
+        pts      = np.repeat(pts[opened],counts)
+
+    return V_ind
+
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
+def direct_segment_sum(tree,X,pts,nodes,sigma):
+    """ Sums the velocities induced by all segments of a set of leaves on the paired evaluation points.
+
+    Assumptions:
+    None
+
+    Source:
+    Low-Speed Aerodynamics, Second Edition by Joseph katz, Allen Plotkin
+
+    Inputs:
+    tree       - octree of the vortex segments                  [Data]
+    X          - evaluation points, size (n_points,3)           [Unitless]
+    pts        - evaluation point of each pair                  [Unitless]
+    nodes      - leaf of each pair                              [Unitless]
+    sigma      - regularization radius                          [Unitless]
+
+    Outputs:
+    V_ind      - induced velocity at the evaluation points      [Unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    n_pts    = len(X)
+    V_ind    = np.zeros((n_pts,3))
+    if len(pts) == 0:
+        return V_ind
+
+    counts   = tree.end[nodes] - tree.start[nodes]
+    offsets  = np.cumsum(counts) - counts
+    seg      = np.repeat(tree.start[nodes] - offsets,counts) + np.arange(np.sum(counts))
+    pts_d    = np.repeat(pts,counts)
+    P1       = tree.P1[seg]
+    P2       = tree.P2[seg]
+    _, V_dir = vortex(X[pts_d,0],X[pts_d,1],X[pts_d,2],P1[:,0],P1[:,1],P1[:,2],P2[:,0],P2[:,1],P2[:,2],
+                      sigma,tree.GAMMA[seg])
+    for axis in range(3):
+        V_ind[:,axis] = np.bincount(pts_d,weights=V_dir[axis],minlength=n_pts)
+
+    return V_ind
@@ -3,4 +3,5 @@
 # @ingroup Methods-Propulsion-Rotor_Wake
 
 from .compute_fidelity_zero_induced_velocity   import compute_fidelity_zero_induced_velocity 
-from .compute_wake_contraction_matrix          import compute_wake_contraction_matrix
\ No newline at end of file
+from .compute_wake_contraction_matrix          import compute_wake_contraction_matrix
+from .fidelity_zero_batched_wake_convergence import fidelity_zero_batched_wake_convergence
@@ -0,0 +1,298 @@
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_Zero
+# fidelity_zero_batched_wake_convergence.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+from SUAVE.Core import Data
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.BET_calculations import compute_airfoil_aerodynamics,compute_inflow_and_tip_loss,\
+     fuse_airfoil_polars
+import numpy as np
+import scipy as sp
+
+# ----------------------------------------------------------------------
+#  Batched Wake Convergence
+# ----------------------------------------------------------------------
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_Zero
+def fidelity_zero_batched_wake_convergence(rotors,wake_inputs,maximum_iterations=50):
+    """
+    Evaluates the Fidelity Zero wake of several rotors at once. The blade elements of all the rotors
+    are concatenated along one axis and the circulation residual of every element is driven to zero
+    in the same vectorized Newton iteration, so the blade element, tip loss and airfoil polar
+    evaluations are shared by all the rotors.
+
+    Assumptions:
+    The residual of a blade element only depends on its own inflow angle, so each element is solved
+    with a scalar Newton iteration. Elements that do not converge are solved with fsolve as in
+    fidelity_zero_wake_convergence.
+
+    Source:
+    Drela, M. "Qprop Formulation", MIT AeroAstro, June 2006
+    http://web.mit.edu/drela/Public/web/qprop/qprop_theory.pdf
+
+    Inputs:
+       rotors              - list of SUAVE rotors
+       wake_inputs         - list of the wake inputs of each rotor, from compute_blade_element_inputs
+       maximum_iterations  - Newton iterations before the remaining elements are solved with fsolve
+
+    Outputs:
+       induced_velocities  - list of (va, vt) of each rotor
+          va               - axially-induced velocity from rotor wake
+          vt               - tangentially-induced velocity from rotor wake
+
+    Properties Used:
+    None
+    """
+    elements = concatenate_blade_elements(rotors,wake_inputs)
+    tol      = np.min([rotor.sol_tolerance for rotor in rotors])
+    PSI      = np.ones_like(elements.velocity_total)
+
+    # Newton iteration on the blade elements that have not converged
+    active = np.arange(len(PSI))
+    solved = np.zeros(len(PSI),dtype=bool)
+    for ii in range(maximum_iterations):
+        sub       = blade_element_subset(elements,active)
+        psi       = PSI[active]
+        h         = 1E-7*np.maximum(np.abs(psi),1.)
+        residual  = blade_element_residual(psi,sub)
+        dR_dpsi   = (blade_element_residual(psi + h,sub) - residual)/h
+        with np.errstate(divide='ignore',invalid='ignore'):
+            step  = np.clip(residual/dR_dpsi,-0.5,0.5)
+        finite    = np.isfinite(step[:,0])
+        psi_new   = psi - np.where(np.isfinite(step),step,0.)
+        converged = finite & (np.abs(step[:,0]) <= tol*np.maximum(np.abs(psi_new[:,0]),1.))
+
+        PSI[active]               = psi_new
+        solved[active[converged]] = True
+        active                    = active[finite & ~converged]
+        if len(active) == 0:
+            break
+
+    # solve the remaining elements as a single rotor would
+    failed = np.where(~solved)[0]
+    if len(failed) > 0:
+        sub = blade_element_subset(elements,failed)
+        PSI_final,infodict,ier,msg = sp.optimize.fsolve(blade_element_iteration,np.ones(len(failed)),args=(sub),
+                                                        xtol=tol,full_output = 1,band=(1,0))
+        if ier!=1:
+            print("Rotor BEVW did not converge to a solution (Stall)")
+        PSI[failed,0] = PSI_final
+
+    # induced velocities of the blade elements
+    Ua = elements.velocity_axial
+    Ut = elements.velocity_tangential
+    U  = elements.velocity_total
+    Wa = 0.5*Ua + 0.5*U*np.sin(PSI)
+    Wt = 0.5*Ut + 0.5*U*np.cos(PSI)
+    va = (Wa - Ua)[:,0]
+    vt = (Ut - Wt)[:,0]
+
+    # split the blade elements into the rotors
+    induced_velocities = []
+    for start, shape in zip(elements.rotor_start,elements.rotor_shape):
+        size = int(np.prod(shape))
+        induced_velocities.append((va[start:start+size].reshape(shape),vt[start:start+size].reshape(shape)))
+
+    return induced_velocities
+
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_Zero
+def concatenate_blade_elements(rotors,wake_inputs):
+    """
+    Concatenates the blade elements of several rotors into columns with one row per blade element.
+
+    Assumptions:
+    Either all the rotors or none of them have airfoil polars
+
+    Source:
+    N/A
+
+    Inputs:
+       rotors              - list of SUAVE rotors
+       wake_inputs         - list of the wake inputs of each rotor
+
+    Outputs:
+       elements            - blade element properties, (num_elements,1)
+       elements.airfoils   - airfoils of all the rotors
+       elements.fused_polars - fused polars of all the airfoils, built once per evaluation
+       elements.rotor_start, rotor_shape - first element and shape of the blade elements of each rotor
+
+    Properties Used:
+    None
+    """
+    keys = ['velocity_total','velocity_axial','velocity_tangential','twist_distribution','chord_distribution',
+            'radius_distribution','speed_of_sounds','dynamic_viscosities','tip_radius','number_of_blades',
+            'thickness_to_chord','airfoil_polar_stations']
+    columns  = dict((k,[]) for k in keys)
+    airfoils = []
+    starts   = []
+    shapes   = []
+    start    = 0
+    for rotor, wi in zip(rotors,wake_inputs):
+        shape  = np.shape(wi.velocity_total)
+        values = [wi.velocity_total,wi.velocity_axial,wi.velocity_tangential,wi.twist_distribution,
+                  wi.chord_distribution,wi.radius_distribution,wi.speed_of_sounds,wi.dynamic_viscosities,
+                  rotor.tip_radius,rotor.number_of_blades,rotor.thickness_to_chord]
+
+        # airfoils are numbered across all the rotors
+        if rotor.airfoil_polar_stations is not None:
+            values.append(np.asarray(rotor.airfoil_polar_stations,dtype=int) + len(airfoils))
+            airfoils.extend(rotor.Airfoils)
+        else:
+            values.append(np.zeros(wi.Nr,dtype=int))
+
+        for k, v in zip(keys,values):
+            columns[k].append(blade_element_column(v,shape,wi.Nr))
+
+        starts.append(start)
+        shapes.append(shape)
+        start += int(np.prod(shape))
+
+    elements = Data()
+    for k in keys:
+        elements[k] = np.concatenate(columns[k])
+    if len(airfoils) == 0:
+        elements.airfoil_polar_stations = None
+    elements.airfoils     = airfoils
+    elements.fused_polars = fuse_airfoil_polars(airfoils) if len(airfoils) > 0 else None
+    elements.rotor_start  = starts
+    elements.rotor_shape  = shapes
+
+    return elements
+
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_Zero
+def blade_element_column(value,shape,Nr):
+    """
+    Broadcasts a rotor property to the blade elements of the rotor and flattens it into a column.
+
+    Assumptions:
+    1-D properties are radial distributions
+
+    Source:
+    N/A
+
+    Inputs:
+       value  - rotor property, a scalar, a radial distribution or an array of the blade elements
+       shape  - shape of the blade elements, (ctrl_pts,Nr) or (ctrl_pts,Nr,Na)
+       Nr     - number of radial stations
+
+    Outputs:
+       column - property of each blade element, (num_elements,1)
+
+    Properties Used:
+    None
+    """
+    value = np.asarray(value)
+    if value.ndim == 1 and len(value) == Nr:
+        value = value.reshape((1,Nr) + (1,)*(len(shape) - 2))
+
+    return np.broadcast_to(value,shape).reshape((-1,1))
+
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_Zero
+def blade_element_subset(elements,idx):
+    """
+    Selects some of the blade elements.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+       elements - blade element properties, (num_elements,1)
+       idx      - indices of the selected elements
+
+    Outputs:
+       sub      - properties of the selected elements
+
+    Properties Used:
+    None
+    """
+    sub = Data()
+    for k, v in elements.items():
+        if isinstance(v,np.ndarray) and len(v) == len(elements.velocity_total):
+            sub[k] = v[idx]
+        else:
+            sub[k] = v
+
+    return sub
+
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_Zero
+def blade_element_residual(PSI,elements):
+    """
+    Computes the BEVW circulation residual of each blade element.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+       PSI        - inflow angle of the blade elements, (num_elements,1)   [rad]
+       elements   - blade element properties
+
+    Outputs:
+       Rsquiggly  - circulation residual, (num_elements,1)
+
+    Properties Used:
+    None
+    """
+    U     = elements.velocity_total
+    Ua    = elements.velocity_axial
+    Ut    = elements.velocity_tangential
+    beta  = elements.twist_distribution
+    c     = elements.chord_distribution
+    r     = elements.radius_distribution
+    a     = elements.speed_of_sounds
+    nu    = elements.dynamic_viscosities
+    R     = elements.tip_radius
+    B     = elements.number_of_blades
+    tc    = elements.thickness_to_chord
+    a_loc = elements.airfoil_polar_stations
+    n     = len(U)
+
+    # compute velocities
+    sin_psi      = np.sin(PSI)
+    cos_psi      = np.cos(PSI)
+    Wa           = 0.5*Ua + 0.5*U*sin_psi
+    Wt           = 0.5*Ut + 0.5*U*cos_psi
+    vt           = Ut - Wt
+
+    # compute blade airfoil forces and properties
+    Cl, Cdval, alpha, Ma, W = compute_airfoil_aerodynamics(beta,c,r,R,B,Wa,Wt,a,nu,elements.airfoils,a_loc,n,1,1,tc,False,
+                                                           elements.fused_polars)
+
+    # compute inflow velocity and tip loss factor
+    lamdaw, F, piece = compute_inflow_and_tip_loss(r,R,Wa,Wt,B)
+
+    # compute Newton residual on circulation
+    Gamma       = vt*(4.*np.pi*r/B)*F*(1.+(4.*lamdaw*R/(np.pi*B*r))*(4.*lamdaw*R/(np.pi*B*r)))**0.5
+    Rsquiggly   = Gamma - 0.5*W*c*Cl
+
+    return Rsquiggly
+
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_Zero
+def blade_element_iteration(PSI,elements):
+    """
+    Flat form of blade_element_residual for fsolve.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+       PSI        - inflow angle of the blade elements, (num_elements)   [rad]
+       elements   - blade element properties
+
+    Outputs:
+       Rsquiggly  - circulation residual, (num_elements)
+
+    Properties Used:
+    None
+    """
+    return blade_element_residual(np.reshape(PSI,(-1,1)),elements).flatten()
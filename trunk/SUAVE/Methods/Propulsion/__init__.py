@@ -5,6 +5,7 @@
 from . import Rotor_Wake
 from .ducted_fan_sizing import ducted_fan_sizing
 from .propeller_design import propeller_design
+from .spin_rotors import spin_rotors
 from .turbofan_emission_index import turbofan_emission_index
 from .electric_motor_sizing import size_from_kv, size_from_mass
 from .turbofan_sizing import turbofan_sizing
@@ -13,7 +13,8 @@
 # ----------------------------------------------------------------------
 import SUAVE
 from SUAVE.Core import Data
-from SUAVE.Core.Utilities import interp2d
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.BET_calculations import interpolate_airfoil_polars, \
+     compile_rotor_airfoil_polars
 import numpy as np
 import scipy as sp 
 from scipy.optimize import root 
@@ -154,16 +155,12 @@ def propeller_design(prop,number_of_stations=20):
             alpha0   = np.ones(N)*0.05
             
             # solve for optimal alpha to meet design Cl target
-            sol      = root(objective, x0 = alpha0 , args=(airfoils,a_loc,RE,Cl,N))
+            fused    = compile_rotor_airfoil_polars(prop)
+            sol      = root(objective, x0 = alpha0 , args=(airfoils,a_loc,RE,Cl,N,fused))
             alpha    = sol.x
             
             # query surrogate for sectional Cls at stations 
-            Cdval    = np.zeros_like(RE) 
-            for j,airfoil in enumerate(airfoils):                   
-                pd          = airfoil.polars
-                Cdval_af    = interp2d(RE,alpha,pd.reynolds_numbers, pd.angle_of_attacks, pd.drag_coefficients)
-                locs        = np.where(np.array(a_loc) == j )
-                Cdval[locs] = Cdval_af[locs]    
+            _, Cdval = interpolate_airfoil_polars(airfoils,a_loc,RE,alpha,fused)
                 
         else:    
             Cdval   = (0.108*(Cl**4)-0.2612*(Cl**3)+0.181*(Cl**2)-0.0139*Cl+0.0278)*((50000./RE)**0.2)
@@ -286,14 +283,9 @@ def propeller_design(prop,number_of_stations=20):
     return prop
 
     
-def objective(x,airfoils,a_loc,RE,Cl,N):
+def objective(x,airfoils,a_loc,RE,Cl,N,fused):
     # query surrogate for sectional Cls at stations 
-    Cl_vals          = np.zeros(N)       
-    for j,airfoil in enumerate(airfoils): 
-        pd            = airfoil.polars
-        Cl_af         = interp2d(RE,x,pd.reynolds_numbers, pd.angle_of_attacks, pd.lift_coefficients)
-        locs          = np.where(np.array(a_loc) == j )
-        Cl_vals[locs] = Cl_af[locs] 
+    Cl_vals, _       = interpolate_airfoil_polars(airfoils,a_loc,RE,x,fused)
         
     # compute Cl residual    
     Cl_residuals = Cl_vals - Cl 
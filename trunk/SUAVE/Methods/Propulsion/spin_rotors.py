@@ -0,0 +1,59 @@
+## @ingroup Methods-Propulsion
+# spin_rotors.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+from SUAVE.Methods.Propulsion.Rotor_Wake.Fidelity_Zero.fidelity_zero_batched_wake_convergence import fidelity_zero_batched_wake_convergence
+
+# ----------------------------------------------------------------------
+#  Spin Rotors
+# ----------------------------------------------------------------------
+## @ingroup Methods-Propulsion
+def spin_rotors(rotors,conditions):
+    """Analyzes several rotors given their geometry and operating conditions. The Fidelity Zero wakes of
+    the rotors are converged together in one vectorized pass over the blade elements of all the rotors,
+    the other rotors are spun one at a time.
+
+    Assumptions:
+    The rotors are independent, as in separate calls to spin
+
+    Source:
+    N/A
+
+    Inputs:
+    rotors          list of SUAVE rotors, with their inputs set
+    conditions      (see Rotor.spin)
+
+    Outputs:
+    results         list of the outputs of Rotor.spin of each rotor,
+                    (thrust_vector, torque, power, Cp, outputs, etap)
+
+    Properties Used:
+    N/A
+    """
+
+    results = [None]*len(rotors)
+
+    # rotors with Fidelity Zero wakes are batched, rotors with and without airfoil polars separately
+    groups = {}
+    for i, rotor in enumerate(rotors):
+        if rotor.Wake.wake_method == 'Fidelity_Zero':
+            groups.setdefault(rotor.airfoil_polar_stations is None,[]).append(i)
+        else:
+            results[i] = rotor.spin(conditions)
+
+    for idx in groups.values():
+        if len(idx) == 1:
+            results[idx[0]] = rotors[idx[0]].spin(conditions)
+            continue
+
+        group   = [rotors[i] for i in idx]
+        bets    = [rotor.compute_blade_element_inputs(conditions) for rotor in group]
+        induced = fidelity_zero_batched_wake_convergence(group,[bet.wake_inputs for bet in bets])
+        for i, rotor, bet, (va, vt) in zip(idx,group,bets,induced):
+            results[i] = rotor.compute_blade_element_loads(conditions,bet,va,vt)
+
+    return results
@@ -71,6 +71,7 @@ class Nexus(Data):
         self.evaluation_count       = 0
         self.force_evaluate         = False
         self.hard_bounded_inputs    = False
+        self.warm_start             = None
     
     def evaluate(self,x = None):
         """This function runs the problem you setup in SUAVE.
@@ -127,6 +128,12 @@ class Nexus(Data):
         
         self.evaluation_count += 1
         
+        # seed the mission solves with the last converged design
+        if self.warm_start is not None and self.missions is not None:
+            inputs = self.optimization_problem.inputs
+            self.warm_start.design_variables = np.array(inputs[:,1]/inputs[:,-2],dtype=float)
+            self.warm_start.attach(self.missions)
+        
         for key,step in nexus.procedure.items():
             if hasattr(step,'evaluate'):
                 self = step.evaluate(nexus)